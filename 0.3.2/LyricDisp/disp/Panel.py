@@ -1,6 +1,7 @@
 # coding=utf-8
 
 from xl import event,player
+from xl.player import asyncevent
 from xl.nls import gettext as _
 
 import gtk, gobject, gtk.gdk
@@ -43,9 +44,12 @@ class Panel(gtk.VBox):
         self.timeChange = 0
         self.isLrcFound = False
         
-        event.add_callback(self.playTrack, 'playback_track_start')
-        event.add_callback(self.stopTrack, 'playback_player_end')
-        event.add_callback(self.timeSeek, 'seek')
+        # searching lyrics can take a while, keep it out of the player
+        asyncevent.add_callback(self.playTrack, 'playback_track_start',
+                coalesce=True)
+        asyncevent.add_callback(self.stopTrack, 'playback_player_end',
+                coalesce=True)
+        asyncevent.add_callback(self.timeSeek, 'seek', coalesce=True)
         event.add_callback(self.colorChange, 'color_change')
         event.add_callback(self.nameChange, 'name_change')
         self.menu = gtk.Menu()
@@ -1,6 +1,7 @@
 # coding=utf-8
 
 from xl import event, player, settings
+from xl.player import asyncevent
 
 import gtk, gobject, gtk.gdk
 import os
@@ -181,9 +182,12 @@ class lrcWin:
 
         event.add_callback(self.colorChange, 'color_change')
         event.add_callback(self.colorChange, 'name_change')
-        event.add_callback(self.playTrack, 'playback_track_start')
-        event.add_callback(self.stopTrack, 'playback_player_end')
-        event.add_callback(self.timeSeek, 'seek')
+        # searching lyrics can take a while, keep it out of the player
+        asyncevent.add_callback(self.playTrack, 'playback_track_start',
+                coalesce=True)
+        asyncevent.add_callback(self.stopTrack, 'playback_player_end',
+                coalesce=True)
+        asyncevent.add_callback(self.timeSeek, 'seek', coalesce=True)
         
         self.ops = {'artist-title.lrc' : lambda art, tit, locname: '%s-%s' %(art, tit), \
                     'title-artist.lrc': lambda art, tit, locname: '%s-%s' %(tit, art), \
@@ -102,6 +102,9 @@ class Main(object):
             exaile.collection, exaile.player, exaile.queue, covers.MANAGER)
         self.panel_notebook = self.builder.get_object('panel_notebook')
         self.play_toolbar = self.builder.get_object('play_toolbar')
+        self.waveform_bar = None
+        if settings.get_option('gui/waveform_progressbar', True):
+            self._setup_waveform_bar(exaile.player)
 
         logger.info("Loading panels...")
         self.panels['collection'] = collection.CollectionPanel(self.main.window,
@@ -134,6 +137,40 @@ class Main(object):
         logger.info("Done loading main window...")
         Main._main = self
 
+    def _setup_waveform_bar(self, player):
+        """
+            Shows the waveform of the playing track instead of the plain
+            progress bar, if xlgui/waveform.py is installed
+        """
+        try:
+            from xlgui import waveform
+        except ImportError:
+            return
+        bar = self.builder.get_object('playback_progressbar')
+        if bar is None:
+            return
+        self.waveform_bar = waveform.replace(bar, player)
+        if self.waveform_bar is None:
+            return
+        # the main window's PlaybackProgressBar would go on listening
+        # to the player and updating the bar that is gone
+        progress_bar = getattr(self.main, 'progress_bar', None)
+        if progress_bar is not None:
+            if hasattr(progress_bar, 'destroy'):
+                progress_bar.destroy()
+            else:
+                for name, type in (
+                        ('playback_start', 'playback_player_start'),
+                        ('playback_toggle_pause', 'playback_toggle_pause'),
+                        ('playback_end', 'playback_player_end')):
+                    callback = getattr(progress_bar, name, None)
+                    if callback is not None:
+                        event.remove_callback(callback, type, player)
+            if getattr(progress_bar, 'timer_id', None):
+                glib.source_remove(progress_bar.timer_id)
+                progress_bar.timer_id = None
+        bar.destroy()
+
     def export_current_playlist(self, *e):
         pl = self.main.get_current_playlist ().playlist
         name = pl.get_name() + ".m3u"
@@ -25,16 +25,527 @@
 # from your version.
 
 
+"""
+    ID3 tags, with the charset of legacy tags detected.
 
+    Chinese and Japanese taggers used to write GBK, Big5 or Shift-JIS
+    into frames that claim to be latin-1. The charset is worked out
+    once per file from all such frames together: every candidate that
+    decodes them cleanly is scored by how common the characters it
+    yields are, and the best one wins if it is plausible enough. Files
+    too short to tell, or whose bytes are common characters in GB and
+    Big5 alike, take the charset found for the rest of their
+    directory. Decisions are cached per file, until it changes.
+
+    Set ``metadata/id3_charset_detection`` to False once a library has
+    been converted to UTF-8, and latin-1 frames are taken as they are.
+
+    Embedded covers can also be located without mutagen, which reads
+    every image of the tag into memory: find_pictures() only walks the
+    frame headers and returns where the images lie in the file.
+
+    Writing only touches frames whose values really change, and a file
+    is not saved at all if none do.
+"""
+
+import mmap
+import os
+import struct
+import threading
+
+from xl import settings
 from xl.metadata._base import BaseFormat
 from mutagen import id3
 
-_unicode=unicode
-def unicode(text):
-    for i in ['gbk', 'big5']:
-        try:text=text.encode('iso-8859-1').decode(i)
-        except:pass
-    return text
+# in order of preference when scores tie
+CHARSETS = ('utf-8', 'gbk', 'gb18030', 'big5', 'shift_jis')
+# below this the bytes stay latin-1
+MIN_CONFIDENCE = 0.5
+# below this the directory's charset is preferred, if there is one
+DIR_CONFIDENCE = 0.8
+# GB and Big5 readings scoring closer than this cannot be told apart
+AMBIGUITY = 0.1
+# weight of a byte pair that is a common character in both GB and Big5
+AMBIGUOUS_WEIGHT = 0.75
+# files and directories remembered
+CACHE_SIZE = 50000
+
+
+def _pair_weight(charset, lead, trail):
+    """
+        How common the double byte character `lead`, `trail` is in
+        `charset`, judging by the block it lies in, from 0.2 to 1; or
+        None if it is not a double byte character there.
+    """
+    if charset in ('gbk', 'gb18030'):
+        if 0xa1 <= trail <= 0xfe:
+            # GB2312 level 1 holds the 3755 most common hanzi
+            if 0xb0 <= lead <= 0xd6 or (lead == 0xd7 and trail <= 0xf9):
+                return 1.0
+            if 0xa1 <= lead <= 0xa9 or 0xd8 <= lead <= 0xf7:
+                return 0.6
+        if 0x81 <= lead <= 0xfe and 0x40 <= trail <= 0xfe and trail != 0x7f:
+            return 0.2 # GBK extensions
+        return None
+    if charset == 'big5':
+        if not (0x40 <= trail <= 0x7e or 0xa1 <= trail <= 0xfe):
+            return None
+        # the 5401 frequently used characters
+        if 0xa4 <= lead <= 0xc5 or (lead == 0xc6 and trail <= 0x7e):
+            return 1.0
+        if 0xa1 <= lead <= 0xa2 or (lead == 0xa3 and trail <= 0xbf):
+            return 0.6
+        if 0xc9 <= lead <= 0xf9:
+            return 0.3
+        return None
+    if charset == 'shift_jis':
+        if not (0x40 <= trail <= 0xfc and trail != 0x7f):
+            return None
+        # JIS level 1 kanji
+        if (lead == 0x88 and trail >= 0x9f) or 0x89 <= lead <= 0x97 or \
+                (lead == 0x98 and trail <= 0x72):
+            return 0.8
+        if 0x81 <= lead <= 0x9f or 0xe0 <= lead <= 0xef:
+            return 0.2
+        return None
+    return None
+
+
+def _weight(charset, char):
+    """
+        How likely `char` is to turn up in a tag written in `charset`,
+        from 0 to 1.
+    """
+    code = ord(char)
+    if 0xe000 <= code <= 0xf8ff or 0xff61 <= code <= 0xff9f:
+        # private use and half width katakana: what wrong guesses give
+        return 0.0
+    if charset == 'utf-8':
+        if code <= 0x9f or 0x300 <= code <= 0x36f:
+            # control characters and combining marks do not stand
+            # alone, but GBK and Big5 pairs can look like them
+            return 0.2
+        return 1.0
+    if charset == 'shift_jis' and 0x3040 <= code <= 0x30ff:
+        return 1.0 # kana
+    try:
+        encoded = char.encode(charset == 'gb18030' and 'gbk' or charset)
+    except UnicodeError:
+        return 0.2
+    if len(encoded) != 2:
+        return 0.2
+    lead, trail = ord(encoded[0]), ord(encoded[1])
+    weight = _pair_weight(charset, lead, trail)
+    if weight is None:
+        return 0.2
+    if charset == 'shift_jis':
+        return weight
+    if charset == 'big5':
+        other = 'gbk'
+    else:
+        other = 'big5'
+    if weight == 1.0 and _pair_weight(other, lead, trail) == 1.0:
+        # common either way: these bytes say nothing about the charset
+        return AMBIGUOUS_WEIGHT
+    if weight < 1.0 and other == 'big5':
+        # GBK also holds the traditional characters of Big5, outside
+        # of GB2312
+        try:
+            big5 = char.encode('big5')
+        except UnicodeError:
+            return weight
+        if len(big5) == 2 and \
+                _pair_weight('big5', ord(big5[0]), ord(big5[1])) == 1.0:
+            return 0.8
+    return weight
+
+
+def score(data, charset):
+    """
+        Returns how plausible it is that the byte string `data` is
+        text in `charset`, from 0 to 1, or None if it does not decode.
+    """
+    try:
+        text = data.decode(charset)
+    except UnicodeError:
+        return None
+    weights = [_weight(charset, c) for c in text if ord(c) >= 0x80]
+    if not weights:
+        return 1.0
+    return sum(weights) / len(weights)
+
+
+def _scores(data):
+    """
+        Returns {charset: score} for the charsets `data` decodes in.
+    """
+    scores = {}
+    for charset in CHARSETS:
+        value = score(data, charset)
+        if value is not None:
+            scores[charset] = value
+    return scores
+
+
+def _is_ambiguous(scores):
+    gb = max(scores.get('gbk'), scores.get('gb18030'))
+    big5 = scores.get('big5')
+    if gb is None or big5 is None:
+        return False
+    best = max(scores.itervalues())
+    return max(gb, big5) == best and min(gb, big5) >= MIN_CONFIDENCE and \
+            abs(gb - big5) < AMBIGUITY
+
+
+def ambiguous(data):
+    """
+        Returns whether the byte string `data` reads as plausible text
+        in both GB and Big5, so that its charset is anybody's guess.
+    """
+    try:
+        data.decode('ascii')
+        return False
+    except UnicodeError:
+        pass
+    return _is_ambiguous(_scores(data))
+
+
+def detect(data):
+    """
+        Returns the most plausible charset of the byte string `data`
+        and the confidence in it, or (None, 0) for plain ASCII. When
+        `data` reads as well in GB as in Big5 the confidence is kept
+        below DIR_CONFIDENCE, so that the charset of the directory
+        decides.
+    """
+    try:
+        data.decode('ascii')
+        return None, 0
+    except UnicodeError:
+        pass
+    scores = _scores(data)
+    best, confidence = None, 0
+    for charset in CHARSETS:
+        value = scores.get(charset)
+        if value is not None and value > confidence:
+            best, confidence = charset, value
+    if _is_ambiguous(scores):
+        confidence = min(confidence, MIN_CONFIDENCE)
+    return best, confidence
+
+
+class CharsetCache(object):
+    """
+        Remembers the charset of files, and which charsets their
+        directories hold.
+    """
+    def __init__(self, size=CACHE_SIZE):
+        self.size = size
+        self._lock = threading.Lock()
+        self._files = {}
+        self._dirs = {}
+
+    def _stamp(self, path):
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return (st.st_mtime, st.st_size)
+
+    def get(self, path):
+        """
+            Returns (found, charset) for `path`.
+        """
+        stamp = self._stamp(path)
+        self._lock.acquire()
+        try:
+            entry = self._files.get(path)
+            if entry is None or stamp is None or entry[0] != stamp:
+                return False, None
+            return True, entry[1]
+        finally:
+            self._lock.release()
+
+    def set(self, path, charset, confidence):
+        stamp = self._stamp(path)
+        if stamp is None:
+            return
+        directory = os.path.dirname(path)
+        self._lock.acquire()
+        try:
+            if len(self._files) >= self.size:
+                self._files.clear()
+            if len(self._dirs) >= self.size:
+                self._dirs.clear()
+            self._files[path] = (stamp, charset)
+            if charset is not None and confidence >= DIR_CONFIDENCE:
+                votes = self._dirs.setdefault(directory, {})
+                votes[charset] = votes.get(charset, 0) + 1
+        finally:
+            self._lock.release()
+
+    def get_dir(self, path):
+        """
+            Returns the charset most files next to `path` were
+            confidently found to have, or None.
+        """
+        self._lock.acquire()
+        try:
+            votes = self._dirs.get(os.path.dirname(path))
+            if not votes:
+                return None
+            return max(votes.iteritems(), key=lambda v: v[1])[0]
+        finally:
+            self._lock.release()
+
+    def clear(self):
+        self._lock.acquire()
+        try:
+            self._files.clear()
+            self._dirs.clear()
+        finally:
+            self._lock.release()
+
+
+_CACHE = CharsetCache()
+
+
+def _legacy_bytes(tags):
+    """
+        Returns the text of all frames of `tags` that claim to be
+        latin-1, as one byte string.
+    """
+    chunks = []
+    for frame in tags.itervalues():
+        if getattr(frame, 'encoding', None) != 0:
+            continue
+        text = getattr(frame, 'text', None)
+        if isinstance(text, basestring):
+            text = [text]
+        for value in text or ():
+            if isinstance(value, unicode):
+                try:
+                    chunks.append(value.encode('iso-8859-1'))
+                except UnicodeError:
+                    pass
+    return '\n'.join(chunks)
+
+
+def get_charset(path, tags):
+    """
+        Returns the charset the latin-1 frames of `tags`, read from
+        `path`, really are in, or None to leave them alone.
+    """
+    if not settings.get_option("metadata/id3_charset_detection", True):
+        return None
+    return detect_charset(path, tags)
+
+
+def detect_charset(path, tags):
+    """
+        Like get_charset(), but regardless of the
+        ``metadata/id3_charset_detection`` setting.
+    """
+    if path:
+        found, charset = _CACHE.get(path)
+        if found:
+            return charset
+    data = _legacy_bytes(tags)
+    charset, confidence = detect(data)
+    if charset is not None and confidence < DIR_CONFIDENCE and path:
+        guess = _CACHE.get_dir(path)
+        if guess is not None and guess != charset and \
+                score(data, guess) is not None:
+            charset, confidence = guess, DIR_CONFIDENCE
+    if confidence < MIN_CONFIDENCE:
+        charset = None
+    if path:
+        _CACHE.set(path, charset, confidence)
+    return charset
+
+
+def _syncsafe(data):
+    """
+        Returns the value of a 4 byte syncsafe integer.
+    """
+    value = 0
+    for c in data:
+        value = (value << 7) | (ord(c) & 0x7f)
+    return value
+
+
+def _stamp(f):
+    st = os.fstat(f.fileno())
+    return (st.st_mtime, st.st_size)
+
+
+class Picture(object):
+    """
+        An image embedded in an APIC frame, read from the file only
+        when it is needed.
+    """
+    __slots__ = ['path', 'offset', 'length', 'mime', 'type', 'desc',
+            'stamp']
+
+    def __init__(self, path, offset, length, mime, type, desc, stamp):
+        self.path = path
+        self.offset = offset
+        self.length = length
+        self.mime = mime
+        self.type = type
+        self.desc = desc
+        self.stamp = stamp
+
+    def _map(self):
+        f = open(self.path, 'rb')
+        try:
+            if _stamp(f) != self.stamp:
+                raise IOError("%s changed since it was scanned" % self.path)
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        finally:
+            f.close()
+
+    def read(self):
+        """
+            Returns the image data.
+        """
+        m = self._map()
+        try:
+            return m[self.offset:self.offset + self.length]
+        finally:
+            m.close()
+
+    def iter_chunks(self, size=65536):
+        """
+            Yields the image data in pieces of `size` bytes, for
+            decoders that can take it bit by bit.
+        """
+        m = self._map()
+        try:
+            for pos in xrange(self.offset, self.offset + self.length, size):
+                yield m[pos:min(pos + size, self.offset + self.length)]
+        finally:
+            m.close()
+
+
+def _parse_picture(path, f, offset, size, version, stamp):
+    """
+        Returns a Picture for the APIC (or PIC) frame body of `size`
+        bytes at `offset`, or None if it is malformed.
+    """
+    f.seek(offset)
+    head = f.read(min(size, 4096))
+    if len(head) < 4:
+        return None
+    encoding = ord(head[0])
+    if version == 2:
+        mime = head[1:4].lower()
+        mime = 'image/' + (mime == 'jpg' and 'jpeg' or mime)
+        i = 4
+    else:
+        i = head.find('\0', 1)
+        if i < 0:
+            return None
+        mime = head[1:i]
+        i += 1
+    if i >= len(head):
+        return None
+    type = ord(head[i])
+    i += 1
+    if encoding in (1, 2):
+        term = '\0\0'
+        end = i
+        while end + 1 < len(head) and head[end:end+2] != term:
+            end += 2
+        if end + 1 >= len(head):
+            return None
+    else:
+        term = '\0'
+        end = head.find(term, i)
+        if end < 0:
+            return None
+    codec = ('iso-8859-1', 'utf-16', 'utf-16-be', 'utf-8')[min(encoding, 3)]
+    try:
+        desc = head[i:end].decode(codec)
+    except UnicodeError:
+        desc = u''
+    start = end + len(term)
+    return Picture(path, offset + start, size - start, mime, type, desc,
+            stamp)
+
+
+def find_pictures(path):
+    """
+        Returns the images in the APIC frames of the ID3v2 tag of
+        `path` as Pictures, reading nothing but frame headers. Returns
+        None if the images cannot be located that way: the file has no
+        ID3v2 tag, or one that is unsynchronised, compressed, encrypted
+        or broken, and mutagen has to read it.
+    """
+    f = open(path, 'rb')
+    try:
+        header = f.read(10)
+        if len(header) < 10 or header[:3] != 'ID3':
+            return None
+        version, flags = ord(header[3]), ord(header[5])
+        if version not in (2, 3, 4) or flags & 0x80:
+            return None
+        if version == 2 and flags & 0x40:
+            return None # compressed, only defined for v2.2
+        end = 10 + _syncsafe(header[6:10])
+        pos = 10
+        if flags & 0x40 and version != 2: # extended header
+            ext = f.read(4)
+            if version == 4:
+                pos += _syncsafe(ext)
+            else:
+                pos += 4 + struct.unpack('>I', ext)[0]
+        stamp = _stamp(f)
+
+        if version == 2:
+            header_size, id_size, ids = 6, 3, ('PIC',)
+        else:
+            header_size, id_size, ids = 10, 4, ('APIC',)
+        pictures = []
+        while pos + header_size <= end:
+            f.seek(pos)
+            header = f.read(header_size)
+            if len(header) < header_size or header[0] == '\0':
+                break # padding
+            frame_id = header[:id_size]
+            if not frame_id.isalnum() or frame_id.upper() != frame_id:
+                return None
+            if version == 2:
+                size = struct.unpack('>I', '\0' + header[3:6])[0]
+                bad_flags = grouped = 0
+            elif version == 3:
+                size = struct.unpack('>I', header[4:8])[0]
+                bad_flags = ord(header[9]) & 0xc0
+                grouped = ord(header[9]) & 0x20
+            else:
+                size = _syncsafe(header[4:8])
+                bad_flags = ord(header[9]) & 0x0f
+                grouped = ord(header[9]) & 0x40
+            body = pos + header_size
+            pos = body + size
+            if pos > end:
+                return None
+            if frame_id not in ids:
+                continue
+            if bad_flags:
+                return None
+            if grouped:
+                # the group id comes before the data
+                body += 1
+                size -= 1
+            picture = _parse_picture(path, f, body, size, version, stamp)
+            if picture is None:
+                return None
+            pictures.append(picture)
+        return pictures
+    finally:
+        f.close()
+
 
 class ID3Format(BaseFormat):
     MutagenType = id3.ID3
@@ -66,43 +577,110 @@ class ID3Format(BaseFormat):
         "discnumber": "TPOS",
         "bpm": "TBPM",
         }
+    # frame id -> tag, for reading every frame in one go
+    _frame_tags = dict((v, k) for k, v in tag_mapping.iteritems())
     writable = True
     others = False # make this true once custom tag support actually works
+    # whether write_tags() changed a frame; None if unknown, so that
+    # save() always writes
+    _changed = None
 
-    def _get_tag(self, raw, t):
-        if not raw.tags: return []
-        if t not in self.tag_mapping.itervalues():
-            t = "TXXX:" + t
-        field = raw.tags.getall(t)
-        if len(field) <= 0:
-            return []
-        ret = []
+    def _get_charset(self, raw):
+        """
+            Returns the charset of the latin-1 frames of `raw`,
+            detected the first time it is needed.
+        """
+        cached = getattr(self, '_charset', None)
+        if cached is None or cached[0] is not raw.tags:
+            cached = self._charset = (raw.tags,
+                    get_charset(getattr(self, 'loc', None), raw.tags))
+        return cached[1]
+
+    def _decode(self, raw, frame, text):
+        """
+            Returns `text` from `frame` decoded in the right charset.
+        """
+        if frame.encoding != 0 or not isinstance(text, unicode):
+            return unicode(text)
+        charset = self._get_charset(raw)
+        if charset is None:
+            return text
+        try:
+            return text.encode('iso-8859-1').decode(charset)
+        except UnicodeError:
+            return text
+
+    def _frame_values(self, raw, frame):
+        """
+            Returns the values held by `frame` as unicode strings, or
+            the image data for APIC frames.
+        """
+        t = frame.FrameID
         if t == 'TDRC' or t == 'TDOR': # values are ID3TimeStamps
-            for value in field:
-                ret.extend([unicode(x) for x in value.text])
+            return [unicode(x) for x in frame.text]
         elif t == 'USLT': # Lyrics are stored in plain old strings
-            for value in field:
-                ret.append(unicode(value.text))
+            return [self._decode(raw, frame, frame.text)]
         elif t == 'WOAR': # URLS are stored in url not text
-            for value in field:
-                ret.extend([unicode(x.replace('\n','').replace('\r','')) \
-                        for x in value.url])
+            return [unicode(frame.url.replace('\n','').replace('\r',''))]
         elif t == 'APIC':
-            ret = [x.data for x in field]
+            return [frame.data]
         else:
-            for value in field:
-                try:
-                    ret.extend([unicode(x.replace('\n','').replace('\r','')) \
-                        for x in value.text])
-                except:
-                    pass
+            try:
+                return [self._decode(raw, frame,
+                    x.replace('\n','').replace('\r','')) \
+                    for x in frame.text]
+            except:
+                return []
+
+    def _get_tag(self, raw, t):
+        if not raw.tags: return []
+        if t not in self._frame_tags:
+            t = "TXXX:" + t
+        ret = []
+        for frame in raw.tags.getall(t):
+            ret.extend(self._frame_values(raw, frame))
         return ret
 
-    def _set_tag(self, raw, tag, data):
-        if tag not in self.tag_mapping.itervalues():
+    def read_tags(self, tags):
+        """
+            Reads the mapped tags in `tags` in one pass over the frames
+            of the file, leaving anything else to BaseFormat.
+        """
+        wanted = set(t for t in tags if t in self.tag_mapping)
+        td = {}
+        others = [t for t in tags if t not in wanted]
+        if others:
+            td = BaseFormat.read_tags(self, others)
+        raw = self._get_raw()
+        if not wanted or not getattr(raw, 'tags', None):
+            return td
+        reverse = self._frame_tags
+        for frame in raw.tags.itervalues():
+            tag = reverse.get(frame.FrameID)
+            if tag is None or tag not in wanted:
+                continue
+            values = self._frame_values(raw, frame)
+            if values:
+                td.setdefault(tag, []).extend(values)
+        return td
+
+    def _frame_id(self, tag):
+        if tag not in self._frame_tags:
             tag = "TXXX:" + tag
+        return tag
+
+    def _set_tag(self, raw, tag, data):
+        tag = self._frame_id(tag)
 
         if raw.tags is not None:
+            current = []
+            for frame in raw.tags.getall(tag):
+                current.extend(self._frame_values(raw, frame))
+            values = data
+            if not isinstance(values, list):
+                values = [values]
+            if current and current == [unicode(v) for v in values]:
+                return
             raw.tags.delall(tag)
 
         # FIXME: Properly set and retrieve multiple values
@@ -112,12 +690,27 @@ class ID3Format(BaseFormat):
         frame = id3.Frames[tag](encoding=3, text=data)
         if raw.tags is not None:
             raw.tags.add(frame)
+        self._changed = True
 
     def _del_tag(self, raw, tag):
-        if tag not in self.tag_mapping.itervalues():
-            tag = "TXXX:" + tag
-        if raw.tags is not None:
+        tag = self._frame_id(tag)
+        if raw.tags is not None and raw.tags.getall(tag):
             raw.tags.delall(tag)
+            self._changed = True
+
+    def write_tags(self, tagdict):
+        """
+            Writes `tagdict`, all of it in a single save, and only if
+            a frame changed.
+        """
+        self._changed = False
+        BaseFormat.write_tags(self, tagdict)
+
+    def save(self):
+        if self._changed is False:
+            return
+        BaseFormat.save(self)
+        self._changed = None
 
 # vim: et sts=4 sw=4
 
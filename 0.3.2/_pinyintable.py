@@ -0,0 +1,1037 @@
+# -*- coding: utf-8 -*-
+# Generated by tools/mkpinyin.py from the data of pypinyin
+# (MIT license) and OpenCC (Apache license 2.0). Do not edit.
+
+FIRST = 0x3400
+LAST = 0x9fff
+DIGITS = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/"
+
+SYLLABLES = (None,
+    'a1', 'a2', 'a5', 'ai1', 'ai2', 'ai3', 'ai4', 'an1', 'an2', 'an3',
+    'an4', 'ang1', 'ang2', 'ang3', 'ang4', 'ao1', 'ao2', 'ao3', 'ao4',
+    'ba1', 'ba2', 'ba3', 'ba4', 'ba5', 'bai1', 'bai2', 'bai3', 'bai4',
+    'bai5', 'ban1', 'ban3', 'ban4', 'ban5', 'bang1', 'bang3', 'bang4',
+    'bao1', 'bao2', 'bao3', 'bao4', 'bei1', 'bei3', 'bei4', 'bei5', 'ben1',
+    'ben3', 'ben4', 'beng1', 'beng2', 'beng3', 'beng4', 'beng5', 'bi1',
+    'bi2', 'bi3', 'bi4', 'bian1', 'bian3', 'bian4', 'bian5', 'biao1',
+    'biao3', 'biao4', 'bie1', 'bie2', 'bie3', 'bie4', 'bin1', 'bin3',
+    'bin4', 'bin5', 'bing1', 'bing3', 'bing4', 'bo1', 'bo2', 'bo3', 'bo4',
+    'bo5', 'bu1', 'bu2', 'bu3', 'bu4', 'ca1', 'ca3', 'ca4', 'cai1', 'cai2',
+    'cai3', 'cai4', 'can1', 'can2', 'can3', 'can4', 'cang1', 'cang2',
+    'cang4', 'cao1', 'cao2', 'cao3', 'cao4', 'ce4', 'cen1', 'cen2', 'ceng1',
+    'ceng2', 'ceng4', 'cha1', 'cha2', 'cha3', 'cha4', 'chai1', 'chai2',
+    'chai3', 'chai4', 'chan1', 'chan2', 'chan3', 'chan4', 'chang1',
+    'chang2', 'chang3', 'chang4', 'chang5', 'chao1', 'chao2', 'chao3',
+    'chao4', 'che1', 'che3', 'che4', 'chen1', 'chen2', 'chen3', 'chen4',
+    'cheng1', 'cheng2', 'cheng3', 'cheng4', 'chi1', 'chi2', 'chi3', 'chi4',
+    'chi5', 'chong1', 'chong2', 'chong3', 'chong4', 'chou1', 'chou2',
+    'chou3', 'chou4', 'chu1', 'chu2', 'chu3', 'chu4', 'chu5', 'chua1',
+    'chua4', 'chuai1', 'chuai2', 'chuai3', 'chuai4', 'chuan1', 'chuan2',
+    'chuan3', 'chuan4', 'chuang1', 'chuang2', 'chuang3', 'chuang4', 'chui1',
+    'chui2', 'chui3', 'chun1', 'chun2', 'chun3', 'chuo1', 'chuo4', 'ci1',
+    'ci2', 'ci3', 'ci4', 'cong1', 'cong2', 'cong4', 'cou4', 'cu1', 'cu2',
+    'cu4', 'cuan1', 'cuan2', 'cuan4', 'cui1', 'cui3', 'cui4', 'cui5',
+    'cun1', 'cun2', 'cun3', 'cun4', 'cuo1', 'cuo2', 'cuo3', 'cuo4', 'da1',
+    'da2', 'da3', 'da4', 'da5', 'dai1', 'dai3', 'dai4', 'dai5', 'dan1',
+    'dan3', 'dan4', 'dang1', 'dang3', 'dang4', 'dao1', 'dao2', 'dao3',
+    'dao4', 'de1', 'de2', 'de5', 'den4', 'deng1', 'deng3', 'deng4', 'di1',
+    'di2', 'di3', 'di4', 'dian1', 'dian3', 'dian4', 'diao1', 'diao3',
+    'diao4', 'die1', 'die2', 'die4', 'ding1', 'ding3', 'ding4', 'diu1',
+    'dong1', 'dong3', 'dong4', 'dou1', 'dou3', 'dou4', 'du1', 'du2', 'du3',
+    'du4', 'duan1', 'duan3', 'duan4', 'dui1', 'dui3', 'dui4', 'dun1',
+    'dun3', 'dun4', 'duo1', 'duo2', 'duo3', 'duo4', 'e1', 'e2', 'e3', 'e4',
+    'ei2', 'en1', 'en3', 'en4', 'eng1', 'er2', 'er3', 'er4', 'fa1', 'fa2',
+    'fa3', 'fa4', 'fan1', 'fan2', 'fan3', 'fan4', 'fang1', 'fang2', 'fang3',
+    'fang4', 'fang5', 'fei1', 'fei2', 'fei3', 'fei4', 'fen1', 'fen2',
+    'fen3', 'fen4', 'feng1', 'feng2', 'feng3', 'feng4', 'fiao4', 'fo2',
+    'fou2', 'fou3', 'fu1', 'fu2', 'fu3', 'fu4', 'fu5', 'ga1', 'ga2', 'ga3',
+    'ga4', 'gai1', 'gai3', 'gai4', 'gan1', 'gan3', 'gan4', 'gang1', 'gang3',
+    'gang4', 'gao1', 'gao3', 'gao4', 'ge1', 'ge2', 'ge3', 'ge4', 'gei3',
+    'gen1', 'gen2', 'gen3', 'gen4', 'geng1', 'geng3', 'geng4', 'gong1',
+    'gong3', 'gong4', 'gong5', 'gou1', 'gou3', 'gou4', 'gu1', 'gu2', 'gu3',
+    'gu4', 'gua1', 'gua3', 'gua4', 'guai1', 'guai3', 'guai4', 'guan1',
+    'guan3', 'guan4', 'guang1', 'guang3', 'guang4', 'guang5', 'gui1',
+    'gui3', 'gui4', 'gun3', 'gun4', 'guo1', 'guo2', 'guo3', 'guo4', 'ha1',
+    'ha2', 'ha3', 'hai1', 'hai2', 'hai3', 'hai4', 'hai5', 'han1', 'han2',
+    'han3', 'han4', 'han5', 'hang1', 'hang2', 'hang4', 'hao1', 'hao2',
+    'hao3', 'hao4', 'he1', 'he2', 'he4', 'hei1', 'hen2', 'hen3', 'hen4',
+    'heng1', 'heng2', 'heng4', 'hm5', 'hong1', 'hong2', 'hong3', 'hong4',
+    'hou1', 'hou2', 'hou3', 'hou4', 'hu1', 'hu2', 'hu3', 'hu4', 'hua1',
+    'hua2', 'hua4', 'huai2', 'huai4', 'huan1', 'huan2', 'huan3', 'huan4',
+    'huang1', 'huang2', 'huang3', 'huang4', 'hui1', 'hui2', 'hui3', 'hui4',
+    'hui5', 'hun1', 'hun2', 'hun4', 'huo1', 'huo2', 'huo3', 'huo4', 'ji1',
+    'ji2', 'ji3', 'ji4', 'jia1', 'jia2', 'jia3', 'jia4', 'jian1', 'jian3',
+    'jian4', 'jian5', 'jiang1', 'jiang3', 'jiang4', 'jiao1', 'jiao3',
+    'jiao4', 'jiao5', 'jie1', 'jie2', 'jie3', 'jie4', 'jin1', 'jin3',
+    'jin4', 'jing1', 'jing3', 'jing4', 'jing5', 'jiong1', 'jiong3', 'jiu1',
+    'jiu2', 'jiu3', 'jiu4', 'ju1', 'ju2', 'ju3', 'ju4', 'ju5', 'juan1',
+    'juan3', 'juan4', 'jue1', 'jue2', 'jue3', 'jun1', 'jun4', 'ka1', 'ka3',
+    'kai1', 'kai3', 'kai4', 'kan1', 'kan3', 'kan4', 'kang1', 'kang2',
+    'kang3', 'kang4', 'kao1', 'kao3', 'kao4', 'ke1', 'ke2', 'ke3', 'ke4',
+    'ken3', 'ken4', 'keng1', 'kong1', 'kong3', 'kong4', 'kou1', 'kou3',
+    'kou4', 'ku1', 'ku3', 'ku4', 'kua1', 'kua3', 'kua4', 'kuai3', 'kuai4',
+    'kuan1', 'kuan3', 'kuang1', 'kuang2', 'kuang3', 'kuang4', 'kui1',
+    'kui2', 'kui3', 'kui4', 'kun1', 'kun3', 'kun4', 'kun5', 'kuo4', 'la1',
+    'la2', 'la3', 'la4', 'la5', 'lai2', 'lai3', 'lai4', 'lan2', 'lan3',
+    'lan4', 'lang1', 'lang2', 'lang3', 'lang4', 'lang5', 'lao1', 'lao2',
+    'lao3', 'lao4', 'le1', 'le4', 'le5', 'lei1', 'lei2', 'lei3', 'lei4',
+    'lei5', 'leng1', 'leng2', 'leng3', 'leng4', 'li1', 'li2', 'li3', 'li4',
+    'lia3', 'lian2', 'lian3', 'lian4', 'liang2', 'liang3', 'liang4',
+    'liang5', 'liao1', 'liao2', 'liao3', 'liao4', 'lie3', 'lie4', 'lin1',
+    'lin2', 'lin3', 'lin4', 'ling2', 'ling3', 'ling4', 'ling5', 'liu1',
+    'liu2', 'liu3', 'liu4', 'lo5', 'long2', 'long3', 'long4', 'lou1',
+    'lou2', 'lou3', 'lou4', 'lu1', 'lu2', 'lu3', 'lu4', 'lu5', 'luan2',
+    'luan3', 'luan4', 'lun1', 'lun2', 'lun3', 'lun4', 'luo1', 'luo2',
+    'luo3', 'luo4', 'lv2', 'lv3', 'lv4', 'lve4', 'm2', 'ma1', 'ma2', 'ma3',
+    'ma4', 'ma5', 'mai2', 'mai3', 'mai4', 'man1', 'man2', 'man3', 'man4',
+    'mang1', 'mang2', 'mang3', 'mao1', 'mao2', 'mao3', 'mao4', 'me1', 'me5',
+    'mei2', 'mei3', 'mei4', 'men1', 'men2', 'men4', 'men5', 'meng1',
+    'meng2', 'meng3', 'meng4', 'meng5', 'mi1', 'mi2', 'mi3', 'mi4', 'mian2',
+    'mian3', 'mian4', 'miao1', 'miao2', 'miao3', 'miao4', 'mie1', 'mie4',
+    'min2', 'min3', 'min5', 'ming2', 'ming3', 'ming4', 'ming5', 'miu4',
+    'mo1', 'mo2', 'mo3', 'mo4', 'mo5', 'mou1', 'mou2', 'mou3', 'mu2', 'mu3',
+    'mu4', 'n2', 'n3', 'na2', 'na3', 'na4', 'nai2', 'nai3', 'nai4', 'nan1',
+    'nan2', 'nan3', 'nan4', 'nang1', 'nang2', 'nang3', 'nang4', 'nao1',
+    'nao2', 'nao3', 'nao4', 'ne4', 'ne5', 'nei3', 'nei4', 'nen4', 'neng2',
+    'neng4', 'ni1', 'ni2', 'ni3', 'ni4', 'nian1', 'nian2', 'nian3', 'nian4',
+    'niang2', 'niang4', 'niao3', 'niao4', 'nie1', 'nie2', 'nie4', 'nin2',
+    'nin3', 'nin5', 'ning2', 'ning3', 'ning4', 'niu1', 'niu2', 'niu3',
+    'niu4', 'nong2', 'nong3', 'nong4', 'nou2', 'nou3', 'nou4', 'nu2', 'nu3',
+    'nu4', 'nuan2', 'nuan3', 'nun2', 'nuo2', 'nuo3', 'nuo4', 'nv3', 'nv4',
+    'nve4', 'o1', 'o2', 'ou1', 'ou2', 'ou3', 'ou4', 'pa1', 'pa2', 'pa4',
+    'pai1', 'pai2', 'pai3', 'pai4', 'pan1', 'pan2', 'pan4', 'pang1',
+    'pang2', 'pang3', 'pang4', 'pao1', 'pao2', 'pao3', 'pao4', 'pei1',
+    'pei2', 'pei3', 'pei4', 'pen1', 'pen2', 'pen3', 'pen4', 'peng1',
+    'peng2', 'peng3', 'peng4', 'pi1', 'pi2', 'pi3', 'pi4', 'pian1', 'pian2',
+    'pian3', 'pian4', 'piao1', 'piao2', 'piao3', 'piao4', 'pie1', 'pie3',
+    'pie4', 'pin1', 'pin2', 'pin3', 'pin4', 'ping1', 'ping2', 'ping4',
+    'po1', 'po2', 'po3', 'po4', 'po5', 'pou1', 'pou2', 'pou3', 'pu1', 'pu2',
+    'pu3', 'pu4', 'pu5', 'qi1', 'qi2', 'qi3', 'qi4', 'qi5', 'qia1', 'qia2',
+    'qia3', 'qia4', 'qian1', 'qian2', 'qian3', 'qian4', 'qian5', 'qiang1',
+    'qiang2', 'qiang3', 'qiang4', 'qiao1', 'qiao2', 'qiao3', 'qiao4',
+    'qie1', 'qie2', 'qie3', 'qie4', 'qin1', 'qin2', 'qin3', 'qin4', 'qing1',
+    'qing2', 'qing3', 'qing4', 'qing5', 'qiong1', 'qiong2', 'qiu1', 'qiu2',
+    'qiu3', 'qiu4', 'qu1', 'qu2', 'qu3', 'qu4', 'qu5', 'quan1', 'quan2',
+    'quan3', 'quan4', 'quan5', 'que1', 'que2', 'que4', 'qun1', 'qun2',
+    'ran2', 'ran3', 'rang2', 'rang3', 'rang4', 'rao2', 'rao3', 'rao4',
+    're3', 're4', 'ren2', 'ren3', 'ren4', 'reng1', 'reng2', 'reng4', 'ri4',
+    'rong1', 'rong2', 'rong3', 'rong5', 'rou2', 'rou3', 'rou4', 'ru2',
+    'ru3', 'ru4', 'ru5', 'rua2', 'ruan2', 'ruan3', 'rui2', 'rui3', 'rui4',
+    'run2', 'run4', 'ruo2', 'ruo4', 'sa1', 'sa3', 'sa4', 'sai1', 'sai3',
+    'sai4', 'san1', 'san3', 'san4', 'san5', 'sang1', 'sang3', 'sang4',
+    'sao1', 'sao3', 'sao4', 'se1', 'se4', 'sen1', 'seng1', 'sha1', 'sha2',
+    'sha3', 'sha4', 'sha5', 'shai1', 'shai3', 'shai4', 'shan1', 'shan3',
+    'shan4', 'shang1', 'shang3', 'shang4', 'shang5', 'shao1', 'shao2',
+    'shao3', 'shao4', 'she1', 'she2', 'she3', 'she4', 'shen1', 'shen2',
+    'shen3', 'shen4', 'sheng1', 'sheng2', 'sheng3', 'sheng4', 'shi1',
+    'shi2', 'shi3', 'shi4', 'shi5', 'shou1', 'shou3', 'shou4', 'shou5',
+    'shu1', 'shu2', 'shu3', 'shu4', 'shua1', 'shua3', 'shua4', 'shuai1',
+    'shuai3', 'shuai4', 'shuan1', 'shuan4', 'shuang1', 'shuang3', 'shuang4',
+    'shui2', 'shui3', 'shui4', 'shui5', 'shun3', 'shun4', 'shuo1', 'shuo4',
+    'si1', 'si3', 'si4', 'song1', 'song2', 'song3', 'song4', 'sou1', 'sou3',
+    'sou4', 'su1', 'su2', 'su4', 'suan1', 'suan3', 'suan4', 'sui1', 'sui2',
+    'sui3', 'sui4', 'sun1', 'sun3', 'suo1', 'suo3', 'suo4', 'suo5', 'ta1',
+    'ta2', 'ta3', 'ta4', 'ta5', 'tai1', 'tai2', 'tai3', 'tai4', 'tai5',
+    'tan1', 'tan2', 'tan3', 'tan4', 'tang1', 'tang2', 'tang3', 'tang4',
+    'tao1', 'tao2', 'tao3', 'tao4', 'te4', 'teng1', 'teng2', 'teng4', 'ti1',
+    'ti2', 'ti3', 'ti4', 'tian1', 'tian2', 'tian3', 'tian4', 'tiao1',
+    'tiao2', 'tiao3', 'tiao4', 'tiao5', 'tie1', 'tie2', 'tie3', 'tie4',
+    'ting1', 'ting2', 'ting3', 'tong1', 'tong2', 'tong3', 'tong4', 'tou1',
+    'tou2', 'tou3', 'tou4', 'tu1', 'tu2', 'tu3', 'tu4', 'tu5', 'tuan1',
+    'tuan2', 'tuan3', 'tuan4', 'tui1', 'tui2', 'tui3', 'tui4', 'tun1',
+    'tun2', 'tun3', 'tun4', 'tuo1', 'tuo2', 'tuo3', 'tuo4', 'wa1', 'wa2',
+    'wa3', 'wa4', 'wa5', 'wai1', 'wai3', 'wai4', 'wan1', 'wan2', 'wan3',
+    'wan4', 'wang1', 'wang2', 'wang3', 'wang4', 'wei1', 'wei2', 'wei3',
+    'wei4', 'wei5', 'wen1', 'wen2', 'wen3', 'wen4', 'wen5', 'weng1',
+    'weng3', 'weng4', 'wo1', 'wo3', 'wo4', 'wu1', 'wu2', 'wu3', 'wu4',
+    'wu5', 'xi1', 'xi2', 'xi3', 'xi4', 'xia1', 'xia2', 'xia3', 'xia4',
+    'xian1', 'xian2', 'xian3', 'xian4', 'xian5', 'xiang1', 'xiang2',
+    'xiang3', 'xiang4', 'xiao1', 'xiao2', 'xiao3', 'xiao4', 'xiao5', 'xie1',
+    'xie2', 'xie3', 'xie4', 'xin1', 'xin2', 'xin3', 'xin4', 'xin5', 'xing1',
+    'xing2', 'xing3', 'xing4', 'xing5', 'xiong1', 'xiong2', 'xiong3',
+    'xiong4', 'xiu1', 'xiu2', 'xiu3', 'xiu4', 'xu1', 'xu2', 'xu3', 'xu4',
+    'xu5', 'xuan1', 'xuan2', 'xuan3', 'xuan4', 'xue1', 'xue2', 'xue3',
+    'xue4', 'xun1', 'xun2', 'xun4', 'ya1', 'ya2', 'ya3', 'ya4', 'ya5',
+    'yan1', 'yan2', 'yan3', 'yan4', 'yang1', 'yang2', 'yang3', 'yang4',
+    'yang5', 'yao1', 'yao2', 'yao3', 'yao4', 'ye1', 'ye2', 'ye3', 'ye4',
+    'ye5', 'yi1', 'yi2', 'yi3', 'yi4', 'yin1', 'yin2', 'yin3', 'yin4',
+    'yin5', 'ying1', 'ying2', 'ying3', 'ying4', 'yo1', 'yong1', 'yong2',
+    'yong3', 'yong4', 'you1', 'you2', 'you3', 'you4', 'you5', 'yu1', 'yu2',
+    'yu3', 'yu4', 'yu5', 'yuan1', 'yuan2', 'yuan3', 'yuan4', 'yue1', 'yue3',
+    'yue4', 'yun1', 'yun2', 'yun3', 'yun4', 'yun5', 'za1', 'za2', 'za3',
+    'zai1', 'zai3', 'zai4', 'zan1', 'zan2', 'zan3', 'zan4', 'zang1',
+    'zang3', 'zang4', 'zao1', 'zao2', 'zao3', 'zao4', 'ze2', 'ze4', 'ze5',
+    'zei2', 'zen1', 'zen3', 'zen4', 'zen5', 'zeng1', 'zeng3', 'zeng4',
+    'zha1', 'zha2', 'zha3', 'zha4', 'zhai1', 'zhai2', 'zhai3', 'zhai4',
+    'zhan1', 'zhan2', 'zhan3', 'zhan4', 'zhang1', 'zhang3', 'zhang4',
+    'zhang5', 'zhao1', 'zhao3', 'zhao4', 'zhao5', 'zhe1', 'zhe2', 'zhe3',
+    'zhe4', 'zhe5', 'zhen1', 'zhen3', 'zhen4', 'zheng1', 'zheng3', 'zheng4',
+    'zhi1', 'zhi2', 'zhi3', 'zhi4', 'zhi5', 'zhong1', 'zhong3', 'zhong4',
+    'zhou1', 'zhou2', 'zhou3', 'zhou4', 'zhu1', 'zhu2', 'zhu3', 'zhu4',
+    'zhua1', 'zhuai1', 'zhuai3', 'zhuan1', 'zhuan3', 'zhuan4', 'zhuang1',
+    'zhuang4', 'zhui1', 'zhui3', 'zhui4', 'zhun1', 'zhun3', 'zhun4',
+    'zhuo1', 'zhuo2', 'zhuo4', 'zhuo5', 'zi1', 'zi2', 'zi3', 'zi4', 'zi5',
+    'zong1', 'zong3', 'zong4', 'zong5', 'zou1', 'zou3', 'zou4', 'zu1',
+    'zu2', 'zu3', 'zuan1', 'zuan3', 'zuan4', 'zui1', 'zui3', 'zui4', 'zui5',
+    'zun1', 'zun3', 'zun4', 'zuo1', 'zuo2', 'zuo3', 'zuo4', 'zuo5',)
+
+READINGS = (
+    "NxQ4AAAAIRSETgAAAAAAAAAATbAAAAAAAAAAAAAAAAAASeAAAAAAAAAACWAAAAAAAAMBAAAA"
+    "DXAAAAAAS2SnAASrJeJXSUToSkU4DVSFMSOcAAKANYTdTfLWCLExAAAAAAVbEmASSEV7AAVI"
+    "D7QJTdNwIWI9LRVMPmAAAAAAS1AAAAPVHVDzL/QJTdJkTmAyAAAAAAIrKnTdJGHCTzJ2BxAA"
+    "AAAAG5S1G2OKAAVIAAGGSKQfTSG2HvKBJ8QmTSUwUiTzVcEbOFNOCPSEGGQnO7P9NwI7OsAA"
+    "AAIcNIQaPnTMMJQdAAKjThDxTzKrHvLkSgTtAAAACDExI8JGAAJ3AAHCAAAAAAAAN7AABYJM"
+    "FjKQAAFmQQAAAAKQKHN6PgJEAARwILECU5RCAAAABKG+D7FcCIAANmHeJsSpAALISgAAA4HT"
+    "QJAAFaAATvSnNUMqDuE7J4NUNUQlAZFFC1S4IwAAAAPSDvJEGoRKMtDoOiETNlTdVbOlHHAA"
+    "CPCSSHAAJ8DlJWHsQJSbULAAAAVLUoHHVqCeSgJGAACPSIHIAAHAAAEsCcAwHTAAAVJMITAA"
+    "SLBAHsI7SkAcTOJ7ArETJrAAAACDL/S5GXTzAAFzTdS6FcJoQxI4PgAAQSTUSPVqAAOBTfSH"
+    "U/HEGlIjTcICE5NnAHAAICCaSfCaRyAAAAGuQJTvAAHvUvS2PfAAPqIdPyGQFETKNyPVGoSH"
+    "EjMYDYEmFaAQE7LTS/TtGnAACFF4LAGoJGEdSYNGAAP/AAAAI4JYTdGgAAS2N2EZAAAATBAA"
+    "AAAAAALoR0SgQyGbRcLoLoTfU3AAAAAAAAAARnPkMBTYNNRMGEHvD6G4JsHjG+JZAAQ3JyAA"
+    "AAAAAAAAAAFPTIPeS9MhCxLwEOUTETSeTsETPbR5IMGjFPSMKJJ8HAGfVAAAAARnAAAdAHVV"
+    "NVFgDZApBMCZJGSbSyAAAAAAAAAAGbQ0C+IiI0VASdSHAANlUeSHAAAAC5HAG+QZTJS2M/Ou"
+    "AAAAAAF3TYSWS8GQV7TdC1AAI/SQQeOWTdVASHSQHmHAGFAAMcJGAAIrOuGFTJN1AATJGFH1"
+    "COLoG+AAA4SMR9S5RqTtNnS2LoA4GOHaATATAAAAU3QhHkAAV7BTHTAHUOC1EdAAAAAAAALo"
+    "JgKTEIAiA4AnAACcSOQ3B5AAAAEMRyE8EOTzTXIbR0ITAARyTRJjSmBSCNSeLoIwTaVkKHUs"
+    "SOF2SeAAHCJQTdHATfAADOTdSgGOTqH2B3QdQmU+AoKbIbB1I8AASKAASHNhLOT9AAJiE8Vk"
+    "AAFjHyDvGoIcAAFMQsAAPHIpLoE6FMNjAgHDIGSKT0VVPXCzSYHBL5SZTdTyTbTKPXOFGOOs"
+    "HuTtAASiMdNxB0AABTD5P/EaAAKPUAG/AANgSrMaCaMlMAHTTaEbEPAAAAAAEOAAAANlJ6Ny"
+    "QFBeD+SHExTdQTNiNCShRHSkTtArJkAAAAAAAAT+JEQaIsKINcVGTLSHJsSHO4EjAAR0EfTd"
+    "LRCIQkG/PpMuAIIPBsAASQVAAAAAExJKTBS2KiG2K+ToUoTdL3QmSHT+PpE6TdDPAAJIBjBb"
+    "HmJsQJLXATAKNYAADCC4AAOELgKDSiT8LEATPVKBAAAAItSHT8VAR9GpKdLkRsKgLoN2ULJK"
+    "U+VhF/S2GOS4VAKkCwFgAACwJuVMPjJRHiSfD3HVOWKLAAICTTLsTbIvTpTfTJQJAAJWTDKO"
+    "KvVzTzTdFgKhHvR5AAH4DuJiAASoDENfKjKdNoAARrDiAHAAA7L2JIHXTxCtV6BNGzTURYHC"
+    "AIJ4HBR0BLUCS2LgUAAAAWUzHjR0SgNPTbSgC1NyD/LlNPHBRWAAQBDuI0UoAAAATfBoHBG2"
+    "VhIrLQHmNpDVAAHTS1C4TrD9CNAAKtGwQQIBVsGOCJS/LbCPJIALK9P9SVTNGnDNNyI0E6EI"
+    "KLIvRgGEKMBMOCNNGEAAJkBEQ6UTNNULKgMeUpSXFJAANNAAJsAAUAETEDKsRyN7QFKsRNAA"
+    "KwTTHsJGITFJT3DSAAI0JmNYARA+ToKMDfAAARAASIE6DXHiOnRGN1ETNMHAHAGnHQVzA+Kb"
+    "AcR0TcATTzGMEISBLdDAAAJEJqLkGpJGAAJ7ExKhT0AAHmAAAAUoMlTcAAHCA3AAOQGvEhFP"
+    "IOHVO+AAP9RGT2VfA4IQJGGvTBMAAAUzR6SQNUTWKQAAAAPpAANeVYIeSFTjCpQyJIA1FeKL"
+    "SgE0JmUPU8CaKJJiAAThM4U8HHJuLnTdAAHCHAUjTzHhGsU/IjJZU/AuUhHjDZJSTdUwSSCP"
+    "C3COTKIvD+JkB1AARXBtAGCOAATlUzRKAARXBtTTVlAAMSNhJINnJrTLH4QHTdB0HeHMAAHb"
+    "AAD7AAHqGGDrAAAAGbAACNDvA4AATCJqAASeA4AAA4AASQOlBDEaHqAAU5ArETTzN2ULKgTd"
+    "P/AAAAAAPIQdK+HbA7OWBrBeD1AAAAAAAADpRHQaSnQAENSKQpAAQyPIHJVARyThAAAAGtVD"
+    "NPVkAASgSgUTRzAAAAQaUmLuAAAAShTdOPPpBvVcAAKkHAElMgAHEjASNpNRSbEtFFNeFORG"
+    "B0TvFLAvE8CcVMAAVIAAGJLpHsCRBvIHJUJGT0AATyGBJGGfFbICT5DiG2AAFwHeV7E8NlAq"
+    "CDC1KLGDSKNyGxAAAACWOyTIU+DiQtKYJZPkRZBcDzCDMmTaHkHCIoQ3T5AABZNMT0JIC4AA"
+    "AAAATyHAR1KhQQSeSzCPNyG2AATyNlP6P3EOJmAAMWQfVITgO3ErCET3TbG6O7TYKtEvGQAA"
+    "ThBmLdATEyJIB5B2J/DyGiJsAATdGnUeGiETG+QSLdSSJESSTLJiKYHWG/AAA6TzG+KoCWKD"
+    "AAI4HTR1TdS4SKBdIrTgSgUCJ3JZNWG+HHSAAAAAFPVJDzTqHBTNOeSIP0T0TbNXHAN4Q2Pi"
+    "NXK+HWKPTgFEM/S6KQEmTEFIQCGzT0FlFqJfETVhViA4RkAAJUAAAAISAAGBTeVJCUSRS7AA"
+    "NyMgFzEZFbNwGiI1JGCHOxVdSANFIFRdMlQtQaVcA/FkGiAABJVAD6EHVFLWJXNAHBKsR0CC"
+    "FgAiOcQhBSVkIaI0GGTkVAHTSoSeTBPHNWSdQJF+KiG5MpAAG2LDQCAvCVHTGyIsAAGlD8G+"
+    "F1TSBmFzHJHIDfHYKBG2KkBcJ8MsTPHmHmOBAANVPDAAHiG+T/DPS4SYEsBmTYAADkAANnG1"
+    "RbAANbSILcOtKbRTIsGMC3UlAQJ3KrAAE5AASeBMG2NsSeAAAABMNWNAHPHsIfQCHkETLoNV"
+    "DzDzAANMU9NNVXIMTyNnIMGQE6FZDqSSF0GQODGGRHBMPHA3JsTYLbChOyDxJsRLJJIBOyU4"
+    "CiJKKQAANVH0PPSYA4UeThSHPIQJOsOlCyJqJZBtAAGuAAAAHEAgGjD9AAJnHjHqIBQUJ4Uz"
+    "D2EFVMTKMWBtAAAAAAAATcAAAATtGzTTTTU/FbNOFWAAAAGhKiE6GiFwQjDoAATJAAAAN4AA"
+    "B6KwQpAoAIAAAASRAAAAAAKQIxLJArCFAAEpVHG/HSPpAAIgDzJsAAAAAAAATyQdB3KJKtGu"
+    "R3L9GuGfHbBMSRJGHYAAKMM0GMTNAASSQJR0CDSHHYBqGREtPFJZAAEINMNKT8BMAAG2DzTL"
+    "HmHQLKJUTyQ0Q1SEGcSZGOAAQ5U6AAGvE8AAAARaAAOSHPAASkAAAAT5HsGnAAAkK6AAFIR0"
+    "AAKVP/A7JqN1AAAAFPUzJ6MROWNyJUFbSRSKShAALkAAAAAASeJUE5DLVcAUV7UzVxGQHAAA"
+    "HHAAAAAAROSQTKQmQaDqHsANGESZHkRyAjVVLoQ4LGAAAATuKjAAAALGPbBsTIFWCUOiHENn"
+    "KOETJGCNUMGQHTLgAAFtGfFEAAAvQUSCHCSHNwGQR8SQHTG5MqPVCVU5AAUmP8G/QDU/AuAA"
+    "AAAAIwA4S7MeDVNMU9MqB2A4QJG+GTHeClHMLXFjEmAAAAQaDESHDiSQIVUzQXGjDEJsHqJs"
+    "NYMcU5AAJGBjNNAAAAQ0JZN2JJJrPnFcUzMZHYNrAAAAVkNIHXA+HJF1AABEUPJUJEJ3PXKj"
+    "HJDpArAAJJAASQM5OBJiVzAAHsPGS9AASgAAIsNNTbL/JET8AATcCMHCGISgIFVfGPSKN4F+"
+    "SLF+FyB0TBSzPYILSLPBTxTGNGVsTuViJJSPSOTcPBTLHQSHCOPgH4TgGSTdSHO7HYTYTsOB"
+    "TWJuIeU8AAAAAAAASdAADESvALSxBcCmUfAATdMpIMPZIvRYSHJZNMSBJKEAKYItR0EFITAF"
+    "UGG2TdK3ViEwMmAAA4JGJqJ4F+U4FCOBU3IGCJHiHsHCJZAAPOOBOlCzLZU9JmMZAAAAAoOW"
+    "SPI9SYE5N2AAO+U/QiOXQHTlKOLGA7AAPtQmGGO5OWAADlNIHOQjAAOELsJUDzDzVEAAJ7DZ"
+    "SHFzHALdTdLhTzRwF6UUTJDESQHPRLE8MgAATsNxTDBTA7PgUfTdA7AAEIIrTaBzCRS7S2Ty"
+    "SvAAAAAAQaF3AAAAAAJkSgCDHIQhMsUKS5SQLlAAAAAAAAAAKiHCL3GiGmRwTtUTA4KhNaSg"
+    "EjTdQhI9TqAAHYPUThHBAAQJAAAALGRwKlQJTdPDTdHAJ4TsKQUgQQVAA7JEAAAAAAAAAAAA"
+    "AANhFtSHU5ToLoHvSgTTSgU9LYAAP9JjCFKiOBDXPHAAAAAAQJSgBMD2VsAAPpPSGGQhFMAA"
+    "AAAALDKiTBKYHJDDHsGREsPeCCPYMDM9KJAAAAAAAATdCWAAIMAmI7IBPBKiQOFPMsTdSQLd"
+    "TkVLCwEyS2MzSEJQBgVqV4A7TUGsMRSvAAI8NtSbHOF4AAAATJS9VJGXTkSHAAAAJISRGsTe"
+    "AAJKPHBgArHIPpEjDuAAAXTyAAAALNI8TdDVAAB1B/FFHYLXAAAAAAJRK3TuAAJgGEAATrHY"
+    "COOQLzAAAAGdQ4AAAEFlA9BMNwAAPpCuG1B/E8GzETR1EuQiAAJyGRTqG1AATyVlTLNyUwHe"
+    "QdAAAAAAAAAAAARZJWHeUgSmGlAAS2AAAAAADENsK3AAUPAzCMAAAATLFPK3ArHpDzUwAASD"
+    "TLAAHsSPQdGFAADtHCHTH+VvAASgIqEhG+SKLoKgOEDBTfKiAAHsN1RGRtUyJFPOIISPUzU9"
+    "Q7PmArTYMwB3GlIEHfAICwNWArAUEuH/RfRfV5JZAAFzTIPgGgJUO+P/AAArOQEABMJLNXEs"
+    "HCVlGzGQJET3T8SvB2DpI7HXCSP/NJTTHLGrGuQpOeR9TkOJTfPgTfHsRbS5HDVCNlVMDvAA"
+    "TvAAAATbPfTdK3AAAAOBSYSDFXTlRDPfLbFXQaR/HkB2MzVcGiLRTJFfTzGfAAP9CMGlTPR8"
+    "SSM5OWJmI1PGSYUTGBEhGFB0UpAAQZVMLzGGTyVcTvJGG+SHSPB1JIAAP9HiNINyFbVhTyAA"
+    "AAOSLxKTAUHgAAS2M9A7KQAAAAAAAATbTyAAM9N1AnG2AAAAAABTKLImROSDJGJZAAHCHvVo"
+    "EOHsDVArAAAAAAAAAAImBEQOROS8AAAAAAAAAAEPAAAAQQA4RNO7BeROKkHWJ6AAAAUpA3HA"
+    "UXS4JGAAAAQQToPoAAAAERAAAAAATkNwJ2U5RbFhTzI8BMLVMuJKQnJIR3DaJGRDRkVIFISn"
+    "APEjMoBMRfPmTbBMNlRLFbRGGECJHTGuSpDuBwD7MqOiJUPbMJDrTyClOWH4QmC5MyCqJsRG"
+    "U8JGOsMSP9AADaGjTdSSSgJ2JgAAQiFHAAQiAAAAAATtLIAAFJHvCPFeRsJGJeJUSMApAKT0"
+    "HkOZTBVfDLBeUcToE8OiAASIPpHPHPSzUsAAAAP3CFEiHAU9AAFkSFAANlPpF+RfEAVhOEK+"
+    "E8JZHASvS6LETDHVJGDPOcT2J6PXJFJNFYSkSdNoNlCDTtBTIXOBAHNmNaCcMgIiTaFoPbMt"
+    "AAVIGwGzGjArAAAAUeHCFjSHFMBxKBVMRYVXSPIvAAAAAAVAAHSRF3SIAARYBdO5SPHVEwOD"
+    "AATUDfHEI8TJJqRXTkMsJ4JGBCAAKQAaGyAATUGPCxGQLuCWJGQnGsA4AUCDTPDPARS9AAVf"
+    "DOOFAiDLRsQaAmFFTJSHVMTFEjTvAIRXKbPUHYFjHCNfHPTJSKH3KkS7PGSBNVGuOQU5Q1Hs"
+    "SeNPANKVFjAAQpEhHmB3P6A4KQP8FjGcGoJ4GJHEN7FCGvBSFjExK+AHTlP6JNHTCPHTCVM+"
+    "CETJEBDrAAJNSSA9SpKcTYKiNPNPSBSgT0NUCJTTTjTNHAVkS4KsJlHzTTTKQSF0GyTkPbBt"
+    "JIAAS5ClCDLdN4KnG+TyUoGjBqA9NWSHHMIJKDKMUoA6G/HsLMA4PgP8K3JUKrK3SHB1N2HQ"
+    "G+SPS2LxRGGfT0AACRBMVvDvVbG/NUAASpG2PeIMAAEGTSTyAkHTU1HDPfDqD6C1E8KsU3U4"
+    "AATLNgGIFbNeJ8FqImOlEeDMTJFaHTFoF4QUSAU8LoDxIpQaDETDF1AAAADoAAKjHSKsHlTy"
+    "U3UwUhSmAAAeGQFgGbI0SFBLIFJsC+JITaNhPnAAS7HWNmG1QJCpEJJiAALQQiDYR0FGDPJG"
+    "BUSSMTImVJLkGpTkSSItK1AXAAFzA3E5G+TdJgTMTeHqG8CJD+ERAATKVXUhNOTyN9G8LoGw"
+    "HlPUAAAAMmKvBjJmJECoAADCPIDXNNAAIqJZJROSTyTdDwNOTbLfE5HITEEkOlSPAAAAA4Pe"
+    "NCLfVAQqQ3Q3OeTdJUALGQNwJGFyViQJT5TGBtRsHoRETuG2HIOjKLHlVfHjAIQQIoG6N8B4"
+    "EPIGLTBdQyS1HiGwNPHTKOTIAAU/RXAAAHMWBhQmEWG6NNCaQUVcL4ROPVJnA9JEKHShBoGn"
+    "KUFLJIDgUoVfAAAAVAAXDENxAAJiSPEsF4CJHiETCRT8GbTTTDTSRGUhTvS/TTICGuIvT8CF"
+    "AAAAPYAALsKvGaCoT/S4HYVcTxQhH4NwAACJHfS/U6CRMSNhAAN2IrTdOWP9NVP/AAEdAAKb"
+    "GoAAAAGBNhCcOBEIJGAXHVSzJ4AAT/VCGlTgAAU/NXAAFFHJVMVMINLoOlUTAOVAFcTdCMG/"
+    "VJI1OQOWU6LDBmAAAATbHsBBCJHvD+R0TdUzTJAAOwJyM9UvGET0DVUwEqPBJZQaN1KLTYAm"
+    "F0FmLJFPAAPeH/QUC1VIQdITNpSzEBBmGtC4OuU8NWHWVkR0AAAASKLDNIQEHmU3PNQpAeQa"
+    "NYR8OWJ4GjQFVCNIKrHWPNKiPpJZI8HMJAVADwAAOxFhEjKVQQHIQmSgIMSDEhJ4BbBqJZTa"
+    "C5T+KbT0VATcDYG+RzQiO7SgQFQCNVJeTdAAI9JEEsJUJYSSSbMHKgSPOGVSPyTJA7JZGbNN"
+    "JSAfA4GjGjAABmMgNwKvHiBTKTOxR1AAAAJEN8AAG5SWAAPgTkAALJGwHiTIAAOsRTSgUzKX"
+    "SKKHAAGwQiSbTYA4J2EhJGDDCeDgDpIZCaSPB3KgNYNyU5AAAAAAGlFFCOFqK+BMGoFYTSKQ"
+    "RwAAAAAAOcS9U6KsHMAAUpV5T8JUAAVIA4OQT0AACzEaTdKhNtAARwHCBSAABAEhT8JEEhN2"
+    "E7EZEQU6Q1T0HYNOHkIoCCAqLyTdS1K6TBE6AALpRCAyUgRyH/TRMKSYFYQmF0G2QXAATSDO"
+    "NPHXJ8KiKiHHJsEhMHKgHTE7BDGyQHTSLoHWJJBMHHQzJZVvPdTgDgCWBUKrTKIsCSHOPyN6"
+    "LoJ4AAPdJ4VKAACVHqHeEaTdOlBZOOE6IrQQTyTtDtJZVMQaM9UkHOCtBTILDJAAGFGFK7Gl"
+    "FaDoE6S7KgKTIxFkUwQaT0VmJEJsSDI7HBJGJEAAM/TORlRfMlAAUwFzAAS0LEOBR0U6D5R0"
+    "BMAAGuS7UIJGTKGwS/GjAnOFSYNCJSVFTdS2J4H+CcAALDGEB/JsUoQaE5GaUbNfQJM4FtAA"
+    "G4CaAAEZEZOiNOP/HkAATKAkTYVfLTCrAXBiQ0GGV5AXUzRlFXA4EbVMSFR4VAVIJsR4F1Ny"
+    "ImUGQFKjDqNPBjM0JIPdJiQJNPT5EySzHsDrMwFsLxOQU5FEMsQjB/CxGPVQK3BBNPPgA3Hs"
+    "P/AAFlLDG1SHEbSvK6AASIVAOnHkDzU1PQKcA4GGTySSMVLYBcBTAANOHCVcJsHvSSSHBZR5"
+    "U+ViIeC4Q3CcDoCxNxUzUeOZBFHASHVJHsFPG/DOCEQVOpSWGxNNVMQSBwR9H/H+FjFCEjC4"
+    "BjVAB2I7SvUlUzTyF0FaUIDXG+QEQkFhSKKHENATMsSFAGKbMsKbTOVABMTkRzOHIrTIB2N7"
+    "U4NIAAQdEsPoAADcDLQhQ2COQaHFP6GwJRAAAACEHYETFeE6EPAAETAwQpDrAADrBTRsUwJy"
+    "NNK+NYAAVkQEAATtVFQaAAQJBTSIHMBlE8QvCDE8EsSESHTOKxMXKMO9KbBkQ6HzAcSaSkNP"
+    "AAAAPPGuLwSZCFDXExTgANOFOUKHEjN1PfGQA7DVK3DmAAAAIWAABvEOTuGOAAFlS/I9HXNO"
+    "N1RwTaJQAAAATJTdTfNNUzSKTdTWSDU9VAGFCzE5CwM9ISCWAARgNwC4FLIPN1N1U9KdJGVF"
+    "QaU9FkJMGiImDtC3TjAAAANNVcBvKQEATeBxOlGUOiE5IqSpHHTdKUAAKLHCQTGGAAJGVhVt"
+    "TSFOJENOFcJGBIQTAAAAQJCYHHSeArS1HbNIJZSVV7DxCwNsLIUiJ7TbPPTyGnJEMLAAAAJE"
+    "AAAAPzAATdLuP9IOE8TaDlOEBmAAQyNnA+QQRzEJO7AHNPV2IVErAAThAAO4D+G2SgUTQiQm"
+    "VATdE6ERAAHvHDBtSQKJAAA4JZHTIdHEAACIIxSmEsJ5UgGQG/LcTkSbQvI1UTIbAANWHkMy"
+    "EhRKJXKgVcSeGlKgHSUDC5JGOEVKTfGGAATdJuT8OEJZLjT0MEAATdMETdNWSMCbTfKiSHLD"
+    "H2VtSMTJROQxSCQUTfCSVHKMT3MDKnURRsJEN1LDPeA4VfAkAAHqSWIbMRIWTBUhTSIeGzSH"
+    "ERTNQ6TtHsJEAAJECIHCGkUpE7B5FsHkKbB4QkK6SmJFTIQEPdTdBKC4GfRsDrG/FPGEBMSv"
+    "JeBcBcTdS5TJURGGTpVkAAH4TyNMU1J/AAAAPzHYFtNIJYAARDHLImTdToC3TKHTTAR1SRLs"
+    "E8FPAAK3VMLESRR4JGBcKrHHLdBzRqS2MDKFVxH3HwGJAAAAT0R1VKAAAATdAADvE6A3VLVh"
+    "PpSMLbAAHPTBCRL4OWVAO0AAPGT0AAHWAAJsGDBATdVzUpT0RsLbFsHsAyBcAAEPNPTRIdOh"
+    "GfTBSgAAIdAASeBMICDCS2AbMHVlAAQ0CbCNLkFtEySgDlRzHsIdUdOsEOJZKbAAF5KbJiAA"
+    "TmAAFtC+JEEAAAA9NVSHAADiDiSSJIAAPQSePdR1AAAAGRTtJsIqTlPbHqNPHIUAAANPAAJY"
+    "HAKDCpLgBEJGJZFICJS4SRGjA1VsDUDUG6OtCDQyAAMBVAJeEsHPFrSIJWS4OSQrMrSkPIVA"
+    "RlRLQ1TaSgMrTSTSMDGOOOThEiLITRRtT4SMVIT4PgKlSHHCQqEsS/LbC1KiA7AALBT0ETU/"
+    "OOS2J8G2TCLQGGHED+GoRNM8C+SHQDKgSkSFNwUqQqSpHiHmG6QyKHTLG/PkI8RsCDBeHVTv"
+    "G1UgQJFPLRSKAAEGCNRzUzF1B9CMUPG2JuJQI0ReGzSFATPUQOKFQkSkHaAJQaB1R1RUHCCF"
+    "CDT0SRShAAAAAALRAATLNyHLQCHvJQHkAAKIJUAACcCOSVNmKUPpByCOFiTyTeAAJeI0PpUz"
+    "PyGzAAAAETAAPBVmHsHvRSJmRzCRVMJUAAUzUvAATdCZLbBLQKTcGOTGGsKJKJN2I1GMVCKs"
+    "SQU5PoV5VMFgS7TdVASeHYBcAABTJLU9HCRsFtHjHbAHE8F0GhTLOiVAA/TbQUDzF0PcTCCH"
+    "PSNrAAAACxGbD7CIR0OcPoBXHAUDNNTIE8T0E6NCU9QjV5CCN2TvGQGhFzETHNT/RMDGRNE8"
+    "V5GjAABMUuHtQlHsE8GwCvTqCuQUCNNVBXSYKHBbNPHJA4G/U+VKN2UoHAA5AAJGJGT8N7CI"
+    "E8BvQoPgGKNlNNBMLDRMCaC+T8U9CFCcA4KbAVQ2KsJTEzCIN0Q6E6IiHIAAAAAAU5NyV7CP"
+    "IbJUArECSEAAVcJsQlAACaJMQ3IfB5HsROGuEsA4AASLSBHCN4IcGjNxQQBXAAN0MsMWRlTS"
+    "OWTAC+DzCPDLKdS6EOBBU1CaB3F0EFVqDnIoQvT8N7VKJZCEU4E8PUQ7IPAFAANwPpF/PHRp"
+    "UoJjHfJGAACvOWT8HsH6EiNNGbE6JqGbRfKsQ2HqNOU7NtFbQ2IvKQThJsT2HkMsAASeA7G4"
+    "VJOWO1SCBvIFPIMmKJSvAAC4IFVRB1P9CRQQArH0AAVAR1KsJZVuLoJZNPT8AATdSJCFAAOX"
+    "CFLzTtHCBMEmAAAAC9DqHOTyGQS2T0N1AAAcFXHeAATGPpTtQDTYBhTSPpTJPvJSC4T0BMQO"
+    "AATLI9JWQxEAT8HBAAT+AAAAHjHlCZCFFaSXSRAIFzTzI8AAROCFSnNyGKAADbBZDqTKVfAA"
+    "TjB1AAJEQUKAKAAAQmMeJmNMDLROETBcHTTbHADbHsA3I9TdCwCwNCJEUGQfNCC9HmS2EjAA"
+    "S2EbG8VJOFEdHoGDJLU9KiTxAABoKTTeKkROIbAAAAKiOWT0NaKgHkMrHXRxHCKbHJS/AoFG"
+    "B2JGJFNyELTmT/CFU/OFAAJ8HyFzT8G2MsBtEOB1O+PgPUSnTkPgCPTYGEEsTYTKVwQEHWEP"
+    "SSFrQpNlB2GEKdT8C+NYHXPIK9T2AAMlU8VACwTzK6KFHNNMQJM2Q2IVC+QQAAHSHJARHPTY"
+    "AATYJiUQAmJIAAGsJ7RzSRRABMU8VKApKbSfMHTsAASaJGUfKgAATWAAAAM/SfAAAAAAPIVb"
+    "AAPIHsHCHSAALkARCcSFFsSgRES/DcUmQjMlSeS2SSP/IRU8SDG7OnCjD/GsIiE8CjSQNnNj"
+    "IrAATGTjOBGICxVAAAR0TJSXTdLcU8CjAAPeD1VhHsS2T3AAAAS1DgQ2FRTbGbTaAAJFIMSR"
+    "QNSKS7AAAADoIoVFLhCJHJA4VSJZGOAkQmCMKBSSPxToN1AANIG2RzTcTYAACDGMBEAASSB1"
+    "G6AAGGC1U9NNIbOZAATjSsAAGjDDAAOBDpSFNxAATLJQA2AABEAAT2MEAmTlGbC1NUQyT0I7"
+    "AmAAHCE6SSBoGiO7AwNqTzRiAGGEDZFPDpG+MVAAVVJZKDKFJISYS+U5NCE8L2SKEIDZT/SS"
+    "TgPmEIAzGlErEsUDArEpSPPgKkUoUoUmG2E7RsK2NfJRAAKrGiGbTyNNEPANAAAXDrS7DrA4"
+    "VIMaQ/TbAAHEVAROSeDZQ6SgB7T4FsJMAyAAJsHAS7PpD/QEGjUAB2AiOWERR8AXEyTxU1Eu"
+    "FsBSFPEJGwEAQzBMNYJUJiR1UpIrQNLDA4RfVMDyBSHkNCSMR0NCDOEgB0GlUDAAAAAAAAAA"
+    "EhSgGbCNAmTfAAHZBMOiCXTjTaFDIeT/U4TFHjGhKsAZFPA7VbGOU4PbFVA4EOCwCfOyCJOE"
+    "CGKQMeRyMrE7VbNMJWTaKXSDNPDzCGSMGQO1FlGfAQE7NeG6MpTJP9SIKvIcFPAAATOxPzJm"
+    "U4G2B1AAJYLBGGEAHYKjEhETB9GbGbT0S/MZA1B9TuTbS/OsS2JGJGT5EIG+PBJANEGiF4BT"
+    "OjR1QEALTySUGXTNSYTSAAA4AAGXQqJeAAVMAASKULTdD+T3HiAABMQyTlAATbLfPQAvFeAf"
+    "K3FCEXPTAAVATPHJT5P3QyR0TCVATdOPPgGjLTTVHJQPTlAnGjGjTYAATPJISHEXEGUKVMTl"
+    "TlHXCpDZAAITTdTYHIEXLsC1NXS/BLKhP3K1JLNONOPjE6BMAzBBTcR1GsEhNNKOE8ANAOEt"
+    "NNODRfTdBMMuAVAAS5AAAAT0CNJqTbJGAALkSKSDAAI9NHVbVxVcB4ALEZT0JCE8UfG5CxQE"
+    "A1A4UfAAGQJGAAGGUGFiCJJmK3KiKFATUzVKGwEhDnRGAAEASBR1HCCPJWA9JiHILoJ2PVAA"
+    "FlLoTdIMRrRiNUBMH8JZFHFlF/IWGXIaUTRCIvA4GuNCTTRtQ0QPIPEIASHJK1IdITALKBNs"
+    "NeAAH9GOEOSPLEQTHVMpMLQAB5LoKHQAC3SPIiAADpNFQ6VsSAEsBaMmOtAAOZNNDLMTBMKH"
+    "VlC3IdHCIrAAKbKjMTJqVvHfJeTcR4JGJGUdVLG5PWCPSpRwD5G+MrGiKVCCKVB9HkL4AATd"
+    "OcJZTGAANPVfAAAkFaUTHVTyNnArAURfTMNfTuVAHVK3PaPINNPIKhFbTbFZFZRLE5S9TYRD"
+    "Q6K6JeBbJEPmJsG+DNMPJeHmUpHkU6VsSSVAAAAAImAAAAImSzFZERK8VEQyT3UmFZR8IvTy"
+    "QEUgF/GnUoB4JmB3VAR1S5URKsFyQHAAAAP9EPBoIVQvLVI0JrTbSgTKNrNHCWSQFsHTIqKb"
+    "TYAAJGThCvNxQvTyAAAADVECGbAASKAANNAAT3HAUAEmFaGJU5OBAAAAHVMqFHS5PZPeNgC1"
+    "DzBMDvRsC1U/AaSEAnD5AVRGAAFaHiF0C3TuT3I1HkE6LoERERSoH3TLRONGAyKvP3TLNNT3"
+    "BAAAS4GfGwTRHqIbETHAK3CSAnSFU5S2QaCPSHC5J/ILTLBcAAGRDlOERGT0SXLQP6EuNIJZ"
+    "ASGsTbGsKbTjI8TLAnDzJZPdHOJUHZHkQxMsFJSYRnCjDpGsTTJGKgGiPZHDTfRyAAMyJsJZ"
+    "TdBYPIGiPnReK3GnRBBJMmG5E5F5BTJEB3MqDLKbQUNdU+IZA2ARKbSSIORKRSR0SPAARSI1"
+    "B2LdLdJED6HmNYBMPFUeQrNYL0TdHbFGDpHIKVDPHIT0SgUHKLJEF2TAQaU1TPRUPJSKNeR1"
+    "TmCeN2RiAAU9REG2PJBWE6RBQaQaVcGEM9GQVVVIBMJeMDSHMcDrGPQ0RpQ0NNHCCNAXHYIC"
+    "JGHmN3ImFjNUNNSSHIPeHHAFGnUeUTTTUmHCBvTLHHAATKAAHORGLIT8AACNAAHQTRV6AAAA"
+    "AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA"
+    "AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAATaD1H9NM"
+    "PLSOGFRtUsOwPLSOG/BTTzKkFECXCXVQNkMpPgPgNxBJTYC5D5P9CJD4NxJMD4TuJMTJBKO2"
+    "F1HfFRTDNbVCHBHVExFtCnB2JWVcVLAURrDXR1VLHaJGHlM2E6TbTdLFSEHhHhReKSTdTaU9"
+    "SCUhGiEdI4TfM8MVNfGkFoCJCJTcTgTHKqHhNOTXSISUFEHhSOGlPmD9PfG/LMHDHmPeKPGi"
+    "KEJwVfOdS9TKE7O+LCFFQUTyDFU0NWVAFyFFJwJXTdHsI5KCTzU6PgPgEbCcTyIaTyT+GlNN"
+    "SEHaP/QQFWFWTGSdTGNNTGHARKRvH7DRHOGBTdB2GWK9TZSWHZRDJNSWHZTYNmBMTvSgDYJI"
+    "EOR0OOOOHAHARvTdPWOOI4D1UUHXNHCWAUUrHWHVBIOSC5E2OxJyBIBfUGPgQXUsE8SPSPRe"
+    "GbRGOQNVFGFOBMDVJbTcCAB5OqB5TbK+KZOQEiCATONWVEMrSBSEHJHGTTExBfOQRvEwDoEm"
+    "VCNOMgTyDxELSFTdSjH7TaHAAHSEHCE6EdSvHYMpDYE5QnVETsG9G2TzDET+OxR0ClCBTENY"
+    "PJB4JyBfTCSkR0VMUVSQL6BMFhLcLdSgAgS2JZVIPVN1C3AwPgE+MpTdP/TcU6DuGDKFDZVM"
+    "BTN1A3UuC2R1DoVMV6TvTOQzUpGQA4RfPSTyTdE6V7FeLuRGLcSPN2ToRkNVPhHxAlMgG0GR"
+    "I1SVFPTNAbEeKwHDEbBKHAGUG8FzN7Q5HPC3TdPfSnPVReH2U+FCIoTbCOIQFuJGTePgKhVJ"
+    "S2TvAIJsK6EZJyD7BvCMTCFaVFTaOcDHSMP/DVJ6QbHPU3BmNfITBxLuLzHXSEGfHeCKU5V7"
+    "CXNmJ6HkPpREPYRZBMLISYA7RYTzSKC+ERNyS0FwIOSEHvTdE7JLVtNhJGTqG6HbNYOyMfQI"
+    "E6SHJFE7M8AnTyNNSMSkSvTzDrCBCWVATKJHJGIoP9HISvE7G+HmSbMPHJA/CcEsE0TGAKAr"
+    "T0ShA3GkB4U9BKHiTSDEJHRsIoBfVmFRFrArQ3PmPmKZDgQiHsCtSpMmQnGhTcNMQ0FHHbHV"
+    "QNB7HTEmU+IGHqVkHmNYLbJyVbR/J3QAJCG6D5ViAvSEHmLFBZHIUlTVU+PBNqLuTjCINWTK"
+    "OiVECxHFHCR0TzBKOpQyRyMtTLExQnSBETSeCCPbH2DrV7BsRDArSgGwTTUpCXTITtHJS1Ue"
+    "C0E8A1VAVlKkHATcSgTBBXEDBmU3MJRJRJArUDJmHTR0EwB5FyQFVAQJSLE8T5OXJGL7UAHM"
+    "KBAkDsQmGOHTSHPINYHsBfCcOxArSbTqTSQkQTTOEdBKHDDUUHQnFjBECbL/BbI8DCToUPVl"
+    "AwQCATClTzUlVsPJCqHbCPPAGGUqNqTLDrSgJmArM0HXJKJsKHNVSPQkTkD7VSSXPINfHeRY"
+    "V2NISHI0B6FuJQNMCIB1R0G/BLG2CmRADZHPHiO9EwSSHkETHOHJRGJYBMFkSPQJSSHLKtTY"
+    "HYHGNhMsExVIAHOvTbHvLzB1TdDcHaS4ITHICcDXHPPAUHBeBEAJOcQdCWBxIrLcHXNYKbSE"
+    "LsNwLcB5JUI8J6IYAoT0A9UKVAP/TsGMNtCHJGQvR0JjCbB1OGPmG2JGJ2UKL/QnTKI7LOEZ"
+    "SFT/UIT3SrCRUwSrSPFuEIICEIKkRQB5EZEIEZHWRQP/TKTKPfAADbNVD8EtKOPVD8AAHZJF"
+    "GxOeRvLWN7JMTyAUFaJgSHGHIrFcQ1FrSmBINNHmDtVfEtTOHHPkHCTdHCB2HdKQOFLWT3KP"
+    "FIOFBmHdBmUHFmHeKQVIKQFgS1KkKiOXTfSfH2HuLzTbKgPgFrKbVDHmT2KvILJWE8SfKiBI"
+    "D5QfFIEyBIGlCRHsGlIZTXJBMUE6KtD7SRJUNUHHHbQEKURONMFkVZQAHbJLNtDvJZD7FHHI"
+    "TeC7AFJGCrKwVZDCP9ENHYJXJXLsSHEAHBEhEhEhE0HjCbU6ExK+U/E6ExM9ExHzGwHzFFDn"
+    "M9NXSrITRNAQCZG/DcGEGEUQDdDvDdOQOQCoEtNlTdG/H1NYDICaR5G/DYSnGoRrHsJET8JU"
+    "JeUTFICrE6CZN4DvPGKtJZVCMUBBHTHTMaJGPGBBB2HaFlFXDgCrIaIMEPEbVAPqN9O+C3IC"
+    "HTF0C3F0HzEPHCQ0HaJmJ3UTT2DNS8ICIkNWO+CrFmHJDNJEQxEsNEB2NNCrViFIRqBLG/EM"
+    "NrPID/HJHCBLTIHmG7PcHIENEDSCFmE8PcHJFODPHzCrCkB2RTJsJEMnPGMxIJHPFlNeHsGo"
+    "UeVcJIHmMpJeF0HPF0HJHJQlG7HCHJTdHJVAB1HIK1JEVKJGTGN9AgFaHDSFKFJUHYIFSeU/"
+    "D7VML6HTN2PQTdVJK3JGHYI0I0HqIKTNRiSbK6IWHTJUGQPgICHYFNBMKtCPIvTqTqKkICTA"
+    "HqNrJsBTKcCPI6H0KkD7S2S2H1SFTdTAR9PcI0K+JsM0PgG/NnHNB9N9SXTdHsEgHoRGHmDX"
+    "SeKFTATAJ7JGCDOGN9AlPOT+HfAoFeSFT+R4SrFEFEAlC4TdSrMlHjQqFPNIETMaE6FaDPHi"
+    "FaA3GoAqLRPhEkHiTbUCHNH7HNIWGiSMN1EhFzNlUMIWErGiTzFzIdG2DXF0JIJIQLEAHiHs"
+    "SKMrN1TaH/TKA6LdN1PeTCNVLhOsVsPZSEG2AgPgSKRtGnSeRtApVsVcSeDXKFLIDXHABMPv"
+    "BPIZA7BSUpHxJqTuJrSHFnSBSgHTHTR1ANNwU9KPThRyPQHAOBJvCOHpSgS2HXOBSFHAETNq"
+    "SHOwB6R0ETRCJGUzGFJGTFTDTLPUDqUgMWTENlTEVABmMWQyJEPUGhRCVxDNEsT3BmT3SUTK"
+    "JGHsPBDsCaHiHXARFzTLP9JGB6IrJGTJTKT3P9FaJWOZN4N4EaI8D/SSVQOwBbBbBbBbAHDV"
+    "TvBsHATuPyEiPiFqAVEcOpPgPmVcN3PkA7S2HFMUQFHAR1QFDzOlC5IKFjHmJbFmDdILU/HQ"
+    "UwAUD1IBQdCPPfTvNyNBTYGOP9QkCOI4DvG/JRGaKqSzKLCMFRS4TRVhGQHADxDJRGKvGhJG"
+    "RPSXUeSOTXJ6TDKCMJG7TaHuCXJYRaTfEsA3NpNpHVBTE4AYEJEtERGERCIFP5NOGbU9TgSD"
+    "SDB/LDS/SHCsD8R5GgGaSDFNTHHvJ6ETFPKTDTNOCJSDFNE5HQGaCOPZLDRaSETdDTMJJGAs"
+    "T3F3R7NaSCETPdHpMjR5LUJ9JbOETsDqVFPgVIRBSKTdNPM9VhFhC0R1S1GPLQE+MdTdSYPV"
+    "GiKxDPN4HlFHUCReEMNGMaBBE6TMGQUEGQF+HiTqE8DOVIRkHwFhHwV8BTJiD5LsQbP9SSG+"
+    "NPEbETFuUhSKTbJTVfKqKfU/TTG/VIFOPpUJSbIAGzIQGqQqSQETS6SvF3TLI1TaAEM6PXRG"
+    "GcSrEMRmF7UFTvD0MRSWAEFUIWTFDPSYA4G2LfGmSqITEOEtHCLzK5TnGOT3JkNGKLFOMGCM"
+    "PQJDLCVsGQIMSYSSI0BLUzUeJNAUKqJUQNE6BSGDGWFYP7FQTvTLFhFjAsGEQTCwTdAEHERN"
+    "SQRsJGSHQmV7NyCBSDUSTFD8NODpNpKBK3FcD9N4I0JMQUUSGuIyO+G/VtR/EzHYGkNPPkRz"
+    "PqB7EZJGNdAKUTTnLhTxQ3IqPBSHRhGiAFUuL3IDVcVcPJDrGWJWADBZSURaSER6DEPBFjNO"
+    "NOQqDZDZTYVhA3DECjGQTFNOUzEpJMSQMqO/InUTTjFnMLU0O7VSLoF3J1TJDoN7B2BLD3Iu"
+    "SbHkQmCPQyAJHfDZHwTpR1LIPIT0UzIlHSGfGFDzVFBxRnMBT0TeUDTRMFKkGjT/CmG2GuGu"
+    "SJGPG/IdVDRzPBS1GwENLoS4JNT0O2CMNfTLDXMkBbJETnUeRyKmTkMhBSIbSIT0HSJmIOUS"
+    "GlQyTSGRACSyNaO7ToQJGcSeAHQTKCBsGBH/DOO1CEOeQERiG/MXSCNXPgFPVfHSI2R8RlP/"
+    "CMGMQWAAF+QUNnLoGPU+OvK/FQLBDyAENaRFA4ARARJIVxUyK3QGQFQjDpNMHQCRHOHzQkPG"
+    "BjHDAFSbM0JmE+FjSYGiG2F3MJSPUTB5SzNADhKCKBGjI+D/E+QlTXAwTjOtHQKiSbGmKEOE"
+    "CjMlI0SbG/VLB+IdVySYP9GME7JQNfSHCcB2DZGSTCESV2EgCMGzUKCpC+DZT0RaBpHQTVSH"
+    "NPGMJISzDlGzTfNHHrNnTBLoJpP9TKTmDOUmMFVIHYLzT7SgNPETUSTaPgHQT5AEToHsITTz"
+    "MhDgE/GZEJDaShOtMpMrTeVyLsDpItQXG7OcGLSOTYEMMsCWHCHYGMQ0B5TAKRBUQ0JrG2BM"
+    "TsLoTfGlKSGaUzJEJeGCLMSYK1TLJGJqJiK1DZCHM5MrSXG+K1SKEOIOTJB1TjOHDtIkQaSY"
+    "HsCzGrG+VSLoSYBWJEB2BzJGTdJ1LMUDQHSJUaHHUDVLIrLoLLIsJhRzG0TeNyP/LpHIG0Sk"
+    "TeLHRTRTELH7T2HeMtT+C4GjG0T3ERF4IgC4RFRORzJyF4OCOUJZFkF4QcF4ROTvF4TfG6NJ"
+    "TzGET3JyN6TzNqF4ClRzT3N6IMNJT3T3TGRORORORTJ8G2TdGsJuJuRPTGRPREPcNIJsITTD"
+    "UHRzFOT0SCFyMrTbDrNVNVU5VcDcNUSOPGIZB6NNLoK3G/HEU/U/AfTATdNoKTHuOXRbEkAv"
+    "AvQhH2GqV7IFA4HaDrHZHCITDqHZHHQiJGAXSFEuVXM/AgQmIeN1QjU9RfFFM9DuFnLbQdMp"
+    "HdTOE2ATJsNxK9IBFgS/AVCNCDJZVME8GiVACtIjJjJjJqATDVMaKuSnD7HCGRJ7C1COI8FC"
+    "TeGhEGUwE6FuTSEOEOFzBtTNTfEdFgT3DzSeIDPKPjETBKDuGbTDIQDSHxDcHzGJLRAKSmSS"
+    "T5AiE5AXTdThGGS2CtNnFYAEAyElOBTqHvHDDrKDIxHpCJPGHWUzJUJUNJCJGmBTPeTAF3Hd"
+    "TXLhDoT0BTTDN7QQMqNqRsHmJzU6IGCTD5DVQkAKBaCcAyH2U+EOTdU+TdMeG/VZNNO5HmLb"
+    "IMICQmIeLdHHEGHXFIT0ETMmFkRQJCEoTENYIeALPVEPLRRNCJTeG5A4JKF3DzVSGhAnAnTy"
+    "DoKOHSOhTYFZH1VkTyGwETTSTLAoC1KTB6EBRfThEyVEHVHWGYFICvHIM9I8SXGvJAEFRqS4"
+    "HCHAITTkQXCJTqHzQJQJPeKiQZR9CJROQmOBVDJGVDAkOtUOEGQ2SFU8TAFPU5AHFaTJH2Q2"
+    "T3R3SgJgGAIwB5MmAzCFJsJrMHNYKTK3VQPzPnJnCNKJA9HbBmPpVAUsH3ToDuCGU+SKF3Nc"
+    "HYDrPJK+DCTLQZUbNWNbJLR1VXNeUbSzPIPIAVNIITD6EhOBK3EJEJV1DrPcEPEPQiDnK8Eu"
+    "GwQiDSTYVMHJATNbG/NeIDTdMqA4DuHLTXToS9QiIsHmGqDcOHNYTASSSJGRAHTDDfGMOhHY"
+    "I8IZJqTJQiR0GqJjJjOlJGJWOHB1TATJI7AXRqPgOOOzVUVUPZTaKFIAVMVUGjGjIfTaGjS2"
+    "IfPkKMV1PkTaU/FjCcHNEyArUiA7QNOCJZE8DNSOSuSgLQSOIbSHRpT5KPQJEMEMTYNrRpFg"
+    "FgNPKdKdTfG9CGDRUUQ1QfE5FqTRTMGIFMPdQpQfRKTKA3TbIPHDENGoIYT/HDAUEVJIGuDo"
+    "TKMcHqNNLGE0SeEwDtN6IbVqGuNPHyUeAtTdHMQsUOAuSHGxErDvTCAwDuATPRR9F9ATSFAT"
+    "HMJIENT9HMPgEwG+A4JuEOMCL5D2LFNVHHQXHhL8BvGNSPEjHBP8OcEpRxGbVTE8J+DXOQE5"
+    "HbTJGBR6VCMLECHCIFVETRHYT+KpE4CMT8VTLvTLLDShEuA3TyRgExRtElSET0FyECAVLaVG"
+    "VcUuDPLcT5RLSQU+EQKVK3NMA4PVNlEQGQS1EdU6KsAgK9E5JZVhVhPfOFPGTMKHHUFhP/Sp"
+    "R0VfHmPGM4OQTSD7HLPmHAFCSXGnHoHOFgI1HHHHTbLhU+G/G/SSGXFuHuIPTLKwJUMgETTv"
+    "TJBvPVTePeFzN7VfQARyGbRjJmTGOJHOJuM8SSPQJFCJSgKLE5QTKTR0ICCzCzRELiSnLITy"
+    "LDNELVHoPVVAGEDrVTERM5RZSSKkSDTJSEAETJTyP/TyRiJGSQHjN3VXNMSQVcD5B4JsAGEQ"
+    "EQJmKjC5NGHkNABZJZRsA+SYPnNOGzEjSAOjQiEpEpHTQ1LbN7HbG4HZNVDuSpGlRqIoA4Te"
+    "CVCzE8HbJyALIrIeTfTGHjJGDtSQGmGoTjB1PXRDDcTTSFLKCzHFRJS2T0RzDrOZKUDXOiNm"
+    "GzSBNWCvKnE8HUEDTbVEKTGwKjAITjS4HSRyKVT5U6NxPgSgRgJKKQOFP9MtR1RiC+GjASHT"
+    "AnSzRJFyCaTSMsSIT3TmOWOeCMJeKUMTASJ+FgIdNnHGO4U3T3HSOWKvTjHAQJLkSQQpMWIv"
+    "LRAmAHMsM5TdMyT0I7S5KGTaUqH4ToLdJEDpFyTIHXVQB5UTGDLXI2K1UyGlGlATLXNbKCM3"
+    "FhSENfRgUoKnSQSQK3JQJIGoFyDlU+SzTaGoSHIdOJSHTLB1HOKUEjEgSPTdG2HQE8PgA4PI"
+    "QQNbJJGsShLkD6TdBbAHLiLsJ+Q7CWHYC1TyM5OWOcLFTIQdTjNYLkT8TkKjA2J+PXSpLdEA"
+    "JfT2IsTLPyJZHPLiIsNVTjPyG2N7KhJEJuTJVKIsVjHTHsHsIHUAJ+ViDHQRE6ArVfSbSkKd"
+    "P/QcAlHCFhL5S9TvVRF/JuQRLPKqC5NVPnBeTDVfLcE5VfJES9BOOcLELoLoTjJuKjLsOXQX"
+    "FzUjNwTzPjAIRNQDRrObTTGbTbHaVYKiVLDcGbVkFrVID3RsTbAnPePeCTPXICS4PgTvGuTb"
+    "Q7PfSSFaCJODFaSYUGUhAnGBTLSYHDPXCFOWGxKiILIUBEQJBZUKHCT2HCTfKiILNqGRU3HJ"
+    "E8LsBKGsKVNoGET0PeLsHYLsVATzAnIULsNoK3BtHmFmNoGiSFJQPeLsUlPXR0SfIUG2JQHv"
+    "GsTdTbAnNmCTAnExDJEIP/TBDfJ7EIPkNBExVQE5PUICHLHLVQR1V1TBPpEIDfSaHTPPEaEa"
+    "EaFAHHPmCFPLPLK1E/B5JSSRSRIhTtRuTtJSJSTSKLRuRuRuFBTSEPIdVDHiFFFjFFRXFFFF"
+    "PdTgCOH8LbHXR0LlHkMsBqSKA1HjHVQ2N1Q0HVSCDwPdPfM9G/SgU4SgLbUoSHR0KIEQJoM9"
+    "Q0EsPoSgROJ6J6SJBqJ6HmSgHmHrJQHsPoSKCDRbLdPGRiSPJGETG2G2JiTdNOOQSFGGPVTz"
+    "CZQQNOOQT8AfTTANTESFHTETHANVEuRrNNBoNWNNBvHVN1FJSSATIrDfAUV7V7TOHmFIIBFf"
+    "S9M/JGQ6N1TJE6SyHFJaRfMqATDVIZT8N1GlNCKsALQ6JZCNM9D5GGIaSyKPRGS9TdA7GQAU"
+    "J4ETE8TBDzJsEWEZFCN6D7TbK9PeAIRzGsVAKiJFHCRGRzTvNTSMJFTSHQU6JuHOERERT0Se"
+    "BQNhOCExExLQJFTtSSOWDfPVCJROFYHvFNSMTfTzIxH3I0IoSROBIGCSCSQaJWGoHjIoNNKs"
+    "IeIeVsFkDCTETEFJJyJyJAHsEMU6F3TfD5GEU6R0SZMqTIQAHTAwVsIMD5UoFkTfVfUUGwTy"
+    "RoTNExNyTNQyTcVAPgUGTTETVMH1J7TKKUGEG/G/GuRDPcKTNYSFTyVkIrIBTJTJR0VkBtQQ"
+    "OWH/NmTyNNJnROEGSHR9BfDcOWHTHzJeSFQANeVfRzAwDsDLNXTqLoDLHBPeOpQCVkHNJQH4"
+    "B2DzBnD2RNJnUsUoUoARBjN1NaDCVyDfDfSIT0MgJiSXBqBLNmHOTII0UpJWJQJQHWDnEPV1"
+    "HQF0TSHOTSHsUmTdS9LQTYTYTbLoSRHASgIBSHDrATVyRyTbOWDfJaHTTzT8TgOfHTJGFyJi"
+    "JiDsOWSHHkB1TlIaTJRyLQN7B/DAJuDsDsLoTJTJTKIbTKCkITCkVFGvHZTBB+B+JUFaV6Ng"
+    "HmFbHmSCNLNLBvNyNyHBTcP/AUU9UuSXTbHXTCHqAUTCHWE6UCA4PgBTD1PvEgLoPdEtMNU/"
+    "SHGlDZRzUsQnDVK3MgMNQ+BLJIVAVHBMVADrK3TdTdM9NUHpOcPvDVU3P3NhU3PdODSIAiDV"
+    "FyCWM9UsOyRqDVRzB5PBNNUTF4KQEBGfU8SzKiRzSBE6TdAiM9DzFaMTGxQpKiHGQvGzVCPG"
+    "KJK+A9F4UTK+AiUsHaB2E6VAGiEgCpA4A4UrKiNeB0EuKbAiCWKrCaHTSRIrFHM9LfHHBKBK"
+    "SpFHTRGuTvTsHBFvMrRCUUFvVTK1NtA4NnELCpFzTFAcHVS2JqSEVTIOTjDqMaDuTDKpFXC3"
+    "E7RGMWEsSVTcVAQ5VASvECV7SYROFzIOKLRDTuBQBKCKIoA4HAAIPpH4ToRgQAPpNsT0TzKp"
+    "QEBmSUEsHiETFyJgPBJIIvQEVABTNsHiHiHXARIiJmThJSDVJsTdCaB1ROP9ShKpB6SEEsFv"
+    "IOITA4NbSgJXJXJQJqHCTlSPRCToJERCTgTBTJRDDpMQHJG0LFG0FbLhHyA7TdNPL1EwHlTK"
+    "TdUOA4TdTaEbOwPgEbPgPgFaDxTgGlE6GbSCRXCNHNAXPXDrUqHsQpE7DqKgSQGjB9L6HbU4"
+    "TbKhN6RqPNOpS4HbDvUqHNNbMmDZNbA4A4PUDZHIFgFOEcA4IJHIBDSYDZF3HNGbKgF3RqHs"
+    "HCHCFyDaJsJsRVG2VAG2G2TbTbTbTbT6T6PGSnR4RGTLTLT0CMBZA9DvBEMmTqMxUqTlCMCP"
+    "VcRgHAMWVCTdRvCDA3DoJZE6RwU6C9RwHbDVSHTCGUTNGpJ7GhRwCKVAS0HbROC5VBIoC5Di"
+    "MPSJD5HCB5VAC5VFIoT0SgHVHJPgHFA7GwE8TBR0MWTSRySHU6M0QyDiU6U6BBDiCRCDHPG2"
+    "HPGzKTJkSUAoN2ShSlA4TdI4OODdD3FDHCOPOOB3QjQtQtFFNPPgDIVARxKLSHEgTjQ3KsR5"
+    "VCCRSFHASESKHETsRtC4QAITT0A7VANNDECFQfRbNWLhG5SrLxIXSPShH4GiH0EwGpQfQCSE"
+    "MKB7CrHmTdAnB9KsMdV7UYTPHmAgL7LQU6MNBTQ+GlGlHmDPJIP9CWDrDVTbRNTtE5HAMlSp"
+    "T5LbFqE6SKA4TsNlS7C4BJGxS2CcA4PpSHQhTqVlEIK4U/TdPgLXTBPgSKI1GXIWK6U/SeJK"
+    "Q5GxDzGOIHFzGXSHHPPpP9GiNxTPG2G0CPHETbSrFqJYGzViS2COPLMDGVEVICD7Q2FaN6SH"
+    "NUT8MlIDDiG2ETScRITIHzBmLRUAKLTqTqT2MpIfNeT8T0ROHVSHUzJYQ0GGGONlQ0BTTdNY"
+    "G1SHArKHTaGWQCN6CKIaSFSFTsJEJNGuC4TdT8JGLpLRETOBS5NVSFKtC5ErApDiDEB7KYJG"
+    "HCFtFtSpDgNMIGQ3JySHH2F1LdNrCWEJF5UmHZRsT2HWHCIrT0G+GQN7QiQ0Q0LoRwCzGiG4"
+    "SHB6ShRzG2ETQUVlHHTqDuHmBdCJDiArNlBcDZFtEPLRUASWVXDzGwCxNwOMSmBmA6KtVkQy"
+    "NgCWArS4RyFPNVR0T0TyA4S4GuKtA4TdKkTqH0DcTeETCFKQNUICTyAHNlTKMBFGUAVlOtJC"
+    "EwTjIdIdOBFaT+QJQJNNTSQCGyHAFjHmCrLdSeHzU7TqBkTCPYBMH0T5SKG6TqTOJGO3QpTe"
+    "C1S2NYQfGvUAPYKwFdPUC5MxK+K+F4CPBdBcBcDCKtQtUqRIATPzKJFtOBUSHiG2HzJIMKQC"
+    "NnThJ7PJR1RTKHNVPUToNtH4DrU+JmHqNMNMT0M9JQC6TsCRVARICINPN1MmArBANwHOUbCP"
+    "JIM9IdG2NfCJThThSJSHDZQiEPEIEIQJHsBmSYEgEwI0I2CRGDNPSQKtHaJRSEBdHsC+SSQj"
+    "PaMpTdCcSPLQDZQjHaQAGGHPR1S4D6NnNnHmBkIDSgTjATKQTdJXO7HvGpKYIsAHJXTIIiSO"
+    "CPTzThDTKcAHKbEINNK2IrKYCWVAMBMBTITOBMVAIZIYTuE5JeKrCJG3B3KcIsGpS5OIB3HC"
+    "HmGrPUTdJKLJKgQnHsFKFKVUFOT8SFHHSzPpOWSKCJSAHVFOHHNaG+NaUpD7NMHEDzUWHEHB"
+    "U9H1HAIbFEDmUpNaFOHIHTT0HITKJsGiUpSKSKCyDVN2GlGlGlETPgQ0KPGlJGElQUA6DuHd"
+    "PKTbTcPIGlEpTKPjPlBYUeNyI4NHAUDQOREiOeUHReUsDwH5TxIMFGPVBsReFjILSFDkNVU+"
+    "OQIiKXO4TNLxAgCCOKSHNWAeHETyE6ATSHMpU/VAETDkUvCJHCTKIXA7B9HjR5GjT8HsAWNp"
+    "DYU7T/RrLTTdPmVNNFRKD9H7UzNFE7MZAVASUTRTIJJxNcUBGlAoBJU/MlLIBTMpQdTTU4Ue"
+    "TMAoGPLcTYDqCPMpHDK2KVCETDCVN1KtCcHDE6UgVLDXBwK9LeIjE7MZAgMOJVLBFpNWHmRh"
+    "AVReReASHjVbMUUuAcAcDqLcHmIiJjHINSToIrLsBLUTNVGTIiPgHTU7LqFbFbN7PwDHUCH9"
+    "TbSeBmGzM4VOPeLBAZCNFnVAIiEOEOU/NlALL1U5FPHQIRD7LBQ5JUUeJ6DzRiHsJTHlVAJu"
+    "TGR/QaSeLQDbHPU6HBGzSQTzAEReL/DNBMFYQzU5CJOqOqIFKUL1HjMmHITdREPGOgRsSeBs"
+    "EyHPSEHvHiRHIfG+ROVbNFJ6AUGGPNLmHoUUPpTWHsBSRrBTV3TYUiJ6QEReIzQSAiHIGuDf"
+    "R0RtNnMnPTJUKsKXE7AbHmDeSAAFHpT8VlCECtHTRNAvLDLgOoV5SBNMSPCJDsO4JxNtFIEM"
+    "PkDxNFDqUrG6HBQpNRNNMPPmNVJZTVTGHsU6JMFnTdG+PIU7J8BZQkCDBIHSQ0IIRWTKDNVF"
+    "HjQ4NWIEAZMMHSJrFoKyHTVADYKeBeO3FtMoT5MBHIU6HfHITyTJIbLJGaOZMsRyOtVqS4Kn"
+    "QyLmBsPgVlU5TaTBTpA5TNGuTKUKAKSzTGSBIACgHAQ0IkImCFHyHfHfROHSGzFWCUSYDzSd"
+    "T3NWTWBsUeApTSRyA0IsR6NpB0FOJnVlFWHPFgNpOWOBCVCgUoQSQRBMCcOWAkDKO3H/TSDf"
+    "U9L7IjHHQENzFMSRP8O1HYKrETCtMBPGQaUgQmMTAeDOJGQpGjVARiGnNVR6NcQ2U3ETSeMB"
+    "N7BtUhFPSEEXPUH5PUPmAbTSBGQEQhOsB2QTHfCRCoFoBJEyPtDrNPQEUiJJCICMFtJsJ4Jn"
+    "VlFEGlUeCqQoGoDCLEK1HLFyTlU+ARVALoKJB3IJCZPURTHPK0K1UzBeIFA9HNTSFgNVJSG/"
+    "TjHrM1M1IzEJSSOhF0UKTdSQCICIOqLQGdP9GGFwDOV2LgJXU7GzVUHPHBBiDYDYCDBLCCHr"
+    "E7JPAvE7NhBLDKVcVSR0NHNpEJLgGnSeJpHPC/QaGGNhR/HIFGToI7LNJrPIVcUTNHCzG/Db"
+    "O7BiNrNrGuHSNnISDXSeHwMrAZATHmTYETKaQFKgHBQdVcDfSoIsBUHlTWOdTYTYLcSBHTBG"
+    "LsFOVAVAIiK1HJSeJUQhAbQFJrJ8OKQxMSTOI9BUPmUKLgSRHvG7JGImGtTkJqJjNVNVUKNV"
+    "IrSPTjKTOHB0R9C/SePUJ2HvKgCMUKJuQhVwJGDsRiDbHPHsIsJGLNU9F0FzNMTBNHNHPiH9"
+    "TsFDTcFaFFAeEnU8NCDsILKtSFFkGQBmSbKhCcFPDpS2HQKtCFHiPVENTzCPARAcS2HQENJJ"
+    "LoA4B6DtEMTdFGOyIBTLEJG/RLSbEMHPHbTNSMKtPpAFNeAFU7DpU5E5PpJQN1SuTcHPPIHP"
+    "VcTdJJA4JESbSbR4S9NNNNUiBEHsUiIvErAeAeIrTzIrR0D+PZJSHFGjSeHFTzU3HQSBQ7D+"
+    "HWCPTfE7NaUoN2VcUoEFDNP9ShVcVcNnJWVcCcEFVLEkB2GJTyPdMgTtKVMWNNUmKOJ6MgMp"
+    "JeE5EmS5HZHZLcVsUwTcJePNHJTyTcNNVAEgMxEgUmITQQTySDHCHCHCG+OUDZHiU/URSeQ5"
+    "TBS2E+IkFHGGQdDrSzB2PeIZTNPeRxKsKsRaCvSET+ArANUUAfHTIePZGlEmGOF0B4S4KvG4"
+    "EtNoGiTdSHShTJUUEmQiPYHmTNUKBJSmTmS7NCU4JZCvGOKVV5K3A7S2G4UuVmPgPgT0EsDz"
+    "KPLdB6R3D5AGBJANVIJiSRIZQ7B+PeGxGxS6IbSzHPHYVAHYPKRGGcTLFCSWPFSaTYT9GzGE"
+    "GGHvRsSSIeVISHCJPcBQUzUzSFRsG2GOCFRsQ3VcVzVHNJHaSHPHLcSHNrNOHZFzU7TdVAAL"
+    "RsJWJNB4RwSaULEpS4FZTbSMT9GzS1KtIbTVTmPoR0PoNrKQLIHIL9ALTNCvTSQUNJKvHPHz"
+    "FMR9B7NPGOTLJGAHHCHCKYULSgGOK+K3C4LdUqG2AoGGS5ClJQSPQjHaM1JWRaSJTdHCGyDV"
+    "TYTYJGQiRGSaEsPXUwGOTdSWSmPVHPAoHbTLAHTYOcPoKbTATUNKJGCFIZDzJRTLG+JqSHOW"
+    "JiLNJ3JuPFQnTKVKT6T6N1TYFZTYGiGQPmBjBjPZKJBpBqQ0VzBdS2G2TgNlEtMqT8TuOiMm"
+    "EuE6JZErN2Q0MDQ7P8U5IwIwVxKvGvRxRaB+G/NMTjVkRxRGIwI0KbJiK+DmR1K3AuUfPpPp"
+    "K+VJOOAUNJEOEODdJGFzG/HfA3SxCJC3O+OeUDN7NVTyFFSCBsPGTBEhSFVhJFSpBYDGOQA9"
+    "ReDrUsKLCPTdFEFaECJENOPpFIQ6HTKjRtIoHhKLTNKBKoP/T3GJEsApHTD5FMTTSPCbCvMM"
+    "PmGoShCXVMCXQAAfQAHASBHYFgG/KOMqA4RwAPEkEuTdE6LISHGlTDD9SiU4TRJWOlESKTUw"
+    "F5U9C4UAGoPZPmURDrJGJqHICJQANaExUmSYSPIMM9QdSJU/FpSYHGHDFfAlK3TdTYTYPgLo"
+    "A3EPTbJZBJLcIjGQAgEhVCDVC1TOE5AbK7FFNMOFOZKQPOQAU1SMTvPVF0RhUhLILsTqDqVA"
+    "UeBtDZFhBTHiAQE6HIAUEPH/LGVMA4JfBxPGP/CcMdPgFpUeTTCIHiPgU9JfKTJGOWUhURA9"
+    "UpVAJiD7JqPZJGIrTqPpTBPwNPU3NMJGTbSVU5JGO7FlH1AtOPSbAbOPBKVfCWTdC3S1VJHJ"
+    "VzEZEaTuEdFbH9I1UmJUTeTPGQFTTdPgFPUFJuE6HTGXF0QqFuRzIWOcALAIHqTbVbIMVANw"
+    "RGO0O0GsHkHiS/EPVXTyUKAATjHTJfUpTDOJU3DcNMNfGoF0HMVTTBQTO+U3ApRCIiHbNDAv"
+    "E6OjRHHsSHIvJfExNMR5HuFGQJJLNyRETuKTAiJkMlVTDrS4ROUSAQFkA4DpGEVhU9OQArFY"
+    "HIGuRsL/HDQ6HCSYJ6G5PNBoEuQAKdSDJEJED+NoTlQTHjQxSgIfVcPmB0EjR0HbJEBESOE2"
+    "QqVAIoJIHIVbJZJENPBJJyC4NYKjNNNNBaF2B1DiErMPAkAkG4VkCJURHAJGMmT0T0FkHvD7"
+    "QmFIRwDrDNEhCIUpNOT2TKT0N6TdO8OPCtJANMVbE6H/IoVoVoUwFrEtEuPVNrLbRsF5JsGM"
+    "HSTcCWHlHkCJV5JLNaU+CtTDHjApHOVcVfBEMmD3CbB4KWGmHIFySKEANYDgF0DtJ2U9N+Kx"
+    "E7FXMoPITbRgO8EOTVE8R0RyEFHFVkHHTbPYSITLTKClHHCvTzGQUeSBMuA1TRG+SzOpTNIm"
+    "TJAuGzIbHVIbP9ExSdRgVAHJK+KQCbGlGjJKJARDLITyTtKTQCS7S7TOU3MuTYHAHTTYCbEL"
+    "TyVqRyKTQ0HAHTHzNxTkOaGwJmI4N7SUM6PfFEQiIsR3TyCHJ5HlPWCdA1SgHFTdUoE6MBKi"
+    "IvOWFjHJHlQXTTU3AjO+T3VhKvQJHGTSHTGyFHErUhNWKBQST3SgOWPeU9DCR3RDJeOWQmOB"
+    "UiP9PcQaH/SHFjNMFMFMQRMTQpFPCvDsL4HAP8FgCtNaBtNXGpKTS2FKFLVbRfNfTPDsHFH2"
+    "VzDfJiBEVJO0SIG/JIG2ToNYF5FEFERTGoNMO8DCMmTuGjHMGlGuF0LoTdFLH4FyFyBjKJHX"
+    "DpVTI4IwCFC4JESvNrPzEhRFFtUTQJI8JrJLKiJmB+QJH/CZQmA9JsHfU1UePmUqKHK1LkTP"
+    "Q6MmVMO+SHN7GXHHC4G/TINbS+TjEbTBU+NfVxC5NJPpGoIdU3V1T8PISHCvDuEdFGK1SENe"
+    "OJJYJeNfSSOnEhUoRfI1T+P6EJCIQmKbHkCJQJHsHsDuG2G/MASXRgLtOkVJRGUbEuNwOFGX"
+    "NWFhJfI2FLCaSJPcVhOzHAD8HZJrHKCdT3QaPmHLQiJXLzTgSIG2PGVzS5CIFHHkVzTdNnNJ"
+    "TJI7ExG1DcHCQQBOM9CJCbVNF0HAHUHFNrUjHINbDgTcA+QAPRJXJGBtKbTfQqQdKjNNRTBE"
+    "G+HCNVLcLsTaFMH2ThL4NsTKNNKiUwF0CvG/IbNADnCaFPKjTsVAGxNVI8I7OsJrJGDAJ7Kr"
+    "G2MHJ5VAFLEAT3JGEsVcQFJIHNCaNtVJJqTJJGVJCHHTETQHGpLoT0JiIqHRSRFyHlSYJZTj"
+    "HHTgTtTkSULzBMB1IrHlPyPURzC5N7N2BgHiT0J2JGDAJuDbHsTJIsIrVKI7JFAXLMT0JZFx"
+    "NYC3GrShTyTdNVMHSzB9CcNPH0TdHsSKS2GPT0IdIvIVP8SHAETaNMCeCONmIVH2IVH2CmPB"
+    "FlTeShSdTyNYSYTYFOSCQkHYMHGiQ0GrSzMhSJSbCePUPIGDCcTdETTyCzGrU/U8C2BTSENN"
+    "BTBTRnHmNWCNO7COO7VDQQQQJGUTTyJGFyDUETP+HHUzK3K3TRK3C9TMQ3PZDVPJS2TCPmBc"
+    "HsMzNUNyQJNrT/JKTdE4U+TYBcG4DXHADzU3T/R3CYBGQ0HYPJTfDvHiG2DBTdDXECHLJKBG"
+    "EAHHHHPmMHEFVMTeNtTdO+NhIASZTCDuG1G1FjNeG/TdMHG1EFTaSYSDFtK9KUKUAGHUEAT0"
+    "A3A4A4MqMqA4B1KOGMBZMqJTHDUmOtK+RhTBEaOWSRHkK8GMNyD+O+QjMeHkEMDEA1OwOwKQ"
+    "OtPmPmRhGQHJQaOwJ5K8KORGOXB6NJJtUmO5UmKbJrN2DzPgDoKsHsKLNPM1LFNPDdSPCkEt"
+    "TNLWBHE6PVD5NqNPTeSHGBTOAITGICNqTGD5DZJ7NrTOT9T9P2P4U7BITqDcP2I4LdRcEjFz"
+    "RCU9NyBEUUKkC/G2DvGGBvVcCnRrEjDRSHReKLNyNPPIM7GGNVSCSCTCP/OdFbHLCNSCRRHh"
+    "QlU9U/NVKiFjRuHaHaOlHuGbQfN8HAA7A7FHR6VCEkSrHsGkLwNPEuS2S2NpTbSBT+T3GKTK"
+    "PXCFDZTtELGlG+NMK+MDKTDPKkKiCRMVA3O+U/MgMUVWUCFeJeKTUTExMHJGJyBfExRzGlK3"
+    "KVPpHlUDReRfRfGQJGKhTbEcEsTtQ2VAUvFhUmTJP9IZHeHjSgNyTdHDVCN7M/G2KiAtUTVK"
+    "I4TsFhGbFFEeKPP/GiM9C2EjU9QJLuCIJZMcBLNPP/LbHkOsVMPZI9S7HsE6MUKtQfTMHBTq"
+    "FtAzS9JiJqDZJ4SgM/UTHZTfMTHTTYGzG0UHCJTeRzGhHJTNJUP/HCEZSnE6OrO7U/ThSDSJ"
+    "H9VJHNJ4J4ALD7Q0K6I9TaKhN7HWNCR0SZSgGbS2QJIWQqNlHmEaVFOeM9TBSrVAFuGsKvG8"
+    "RiNUMRSCN1JeTdHDHbNXHLHOU3PdVcBmEdG2HCJeB2G5GkLzTBHYJUNyR0U1HvGEAiKLVcTt"
+    "SHBMD+GuGbTdNJTlIsGOIxGFJFFXE6SDJKCwEyTdT0RGI0GAHYHDCRHeKUQNCIMgSSPYROIg"
+    "M8LoGGHZSYPULgRNTqSbSQREERQJRaHoBoQ0JGP3P/I9P3QpEAI2IoJIRzR/T+GuDpGWOnHJ"
+    "UrO7E6FtSpPkPxTECzUsTYIGSBGEReD5GQR/HjPUJLG4QaVbDuNlDiHqVfSHSZNNFjF5TIJW"
+    "QnVFMnGOB4PmNMEkU+JsLSHkQqC5I9U1M9EqQAQ3MsDZT0LbTxJsFHKiHbJZJyTfDEN2GpT0"
+    "LgPVA9CwGiT2IoG6NqTINXQ1KoU/TgBMAvT2R6OpEpNqT2IBHCPUT2O7JsViEATaHJKkMRSH"
+    "TyT2PXPYOZGuVLHIL9TyNyRDN2ECEhUeBMSBR/DrRyR3OcSgBmR1GQFJTKGbS7KhIBKOTjTK"
+    "TtGaKoPbKUUFG5LGFzCPETMRKTJKNPNPKTQ2C7RzBbRSKkG2K3SzHAMiHHHIGjE0SUTdThUp"
+    "PeHSU3GwQkTyA4KtPdRNPZTqHkD7RVHPHPNyTIQlJiG+T3LJAgTuN7VTJNB1SQCwLoVfRqPd"
+    "KITkImIdEyHJS2JmRzFEBLTkM/HYTLQmT3QUT3JITTKbVZCJICQfQZRiJdFeO3KvUhPeTdJ0"
+    "KANJRyJGUFSFSHR3NaUTPdQJAFNnQET+SyTeOWG6QJQVLdQXPdOeAEMUCcCaMVR8BfKrFPDs"
+    "GOGySKVfDpVASnE7HTGnFOVhQpQvQNA4HQG2F1TfFLJiVATLPUKITkCwJ7ItJuTSBEQhT0Sx"
+    "GlA4A9VAHNILPYPJDoKiARJrGkGiTsB2EjToF1KINsTyMxHCTEB+NMSJHCJsJmJiHXF4C5Jo"
+    "U+FENbJETKBjHQC4CwRTMHQvTXSIKiQmK3PJGGJIIsRiCNFFEyS5TaKJViKMH4J4MlPpUrUq"
+    "VUS2GuG9HJTIPzJQDDQyTPHLC5TlGbSxPpFtTkSYVnIeS2JKVARzMsT0HQM/DcG2HTSEMMHA"
+    "MSRzQJNWNWSHJsSKTCELGwKtOnQJI1U3C5TdU1RqPIQiB+TBIdTVPQROVJOrGSA4PGB1B1Po"
+    "RGNHJWRzO7O7CJHeCJGoHOI2CDFGDGGdP9PpMlGET+JgGdE6GOGQSQHJPGSKT1JrIrLuTyJX"
+    "KkURDaGuUTSgT0JFPgS9JZRtVfToG2BeJKDuTYATGsU3B1KJDYDZTdQQMsHmQaNnG/VcJILz"
+    "F3HYEuO7HAQNG2CbQaQAD2O7VLIqBEJIKhPdPpKiLuTkTkKbHYNNA4HCGMOcDESBQpTgTgEI"
+    "C1G+NtItHvAGNIVcRzBEFjNWTkBEIiEsBfKSHJR0J4ULJ7JGTsTPJrP/VATkEARwGzSgMTPX"
+    "A9B1K3JeHHNKO7CJFjBEG+SSJqNpGGTkOWJGHbSYTkQPR0SgGpS/VJJiIqEIEhGjIqPmJcTk"
+    "KgHCJKHJTkEwJWTdHHT8B1DVOGHIIrEhP0T2VcExPUI8IrC5N2ToNWEeFtHsTLGOTkOrULJu"
+    "TLJEKhPIQhDbHPB2TkGOAXVKIsIrLNRqJuTBSRTLFHTLT0G9A9KrFuDlGzSYSYGzGaJZUSVS"
+    "HhUhSgCPVcUFUFBeTNNPVCEuLxHeR4NHTdJqCsMpH0MUTJH0MYK+B/JSF0H7ELFuShVAFuFu"
+    "R0NdA8DPSMU6VKIBUwE6AVSgSgJbVbS7HmQkMcHeMaQdQdBJTORFPHVMUhDtR1PeJKCPGxVF"
+    "GiP8ItRCHPS2GXN8JUGuTNSvSvSRTfSCVFTSPgRyRGKrUFH0GaI2SMVKS6U6NCTIG0FuCDGz"
+    "H9HmEhPNTYG2AAQoHYONJUSHE6HeSgNJRCVcRERrGAMlIwTLS2ExCPOWGjSHPmGRTAIOHoSY"
+    "SHTIGGVUHvDrSgHASFTIJ6GETLGuKYHkDgArEuJYIeG6RaSHDESDGaB/E7SBHOC4E0M9NwOp"
+    "SHNwSkB9TLTLTdHsT0FKOEMqSuFKPZB7PNStLgFXR2CFGRIcVDEFSLGzE0JKS4SmGwHPHHA4"
+    "TjVLR0RSPHSHL9L9B1TIHeHeT0KVO+R1UfHYNwOZKTGuS2UwRyEhNyQQTNJUVLHSUSFlAlGj"
+    "T9LJPgJOA5FgRZQmB/PGEVBMGxSeSKSFSHUAGQGRSHT+SsLEPHNwTUTAKiJITkSEOWFaTLNd"
+    "JdSHA4A9C4JsHHPnTdJmMmQNTdQuHsVkUAGlTbVAARR1JfGGMHONHeKJIePJDBUbHHSHSHSH"
+    "TdSbCPGwB2TYQiOETLTBNeHvDlELPVHOEuP9JQT0JWRGPNEuEhTLTBItKUQoTdHeKYHcHPTk"
+    "T0TdS9IrQfUSBeQQSHOBVlJIG1VKSgJZRyTdSeUwG2DPLzIrOcSRGRTAHYCWDgTUGRItA9OW"
+    "JGK3AoOpJ7ImAQTAIZP8JQJGJqHsJRTLSHSgJiTYBbOHT8ItC5HsCSFtHnCDKgQnItVKIsJZ"
+    "DBT0UvUvMMU6MaCIT3AHR1GHHsHsE8TWAXDyTWTSVtPzEaMTCpH/UMDzNaToNbMwAfMUB+HH"
+    "MPEACoTyUfA5DzAjBMCoTuTuEATECILwLwM7HfK6QXK9I0OQKKEkKOK+FISFTLFOArP/HJFj"
+    "TvFOPZK9DqNVN9N7ViQtSHKLIFNVSEFkSHJEJENGG/FIU+AtN7CwEAHmHDHHExMtH/HkH+Ca"
+    "SKArJ4HVJ/OwR1KOEJRGNfHNSHJGEAJUMPMxBMSHCVRzIbCVN8N8AVEjNyHBBxVcALFOVUFv"
+    "KBTtH7BMGgTGTfGrVUT/IXLxDpIXVEK+ArMpHkTbPZMaSMRfGjJZEsMqLcTTTvFfS/HjDZBM"
+    "INSRLsGsGUHPGQUwHATCPGQaOWPkRGI1EASMPdITU6T0QRTyA4KLSHHqJESMTfQKIvArVATJ"
+    "O+JGGGSRHZMPEpSYAcNNLbA9ThIoJUHHNaIeTLF5VmKgB4TaVAU6TEKcBXC+PRJUDtJ2GjVk"
+    "F0R0ExR/T3SmVJKNR1CkSSRSTGLQSdHDGfA5TtTtKTBtTSQRBMKvGnT3QEKBT3DTT0PdGMNa"
+    "TdU3BfGMKJHbHMK3UqB1ARARGMDCAvHsA4A4GwNIJWS2RGTUJQP8SYPkEJHQFPHqEAG2ITSR"
+    "SgQZSRTALsA5G+L4KcJULRFvPkJqQZSSKgOGGrLRJ2SRNNHsS5KpVfJ7JqT0QJRvNyFAD1I4"
+    "AUG/GbDrCnFFHhTyNOTyB7KAGbSEE5R4HVTEBEA7AkT8HsKXHsRrHHKTDYM5R0GsSSNaJZDV"
+    "TdAJM9DuE6S5SJBLC2FfHFPONCC1H/OFPZPVTbVtHDKsPGJfA4U3U3HsEfJiHWHQHJJGFuSP"
+    "VFFbTISyTNS1J4QJVJNnTfTBAnEaSXTSSMGJFyCRS2AeMgI1DaTjGzR4ERCJDrSESDCJHvKT"
+    "ArRESSCcGES5TJNyS7IvJFSyE6JeTESHJZJEHYJJQUQUExRrDuM5UoO7KsT0HjCEIoKsPcRz"
+    "Q3CcV5AyCIGkNNETIeB4NNAyRsJsC5FsTKDvArJWNnMqMMOBVcNnEfHWNwEBHVG5TzKQKTCv"
+    "S4QySmDVOZKsHHR0OiGuSeCkHIVSB7JKN7SMEFT5TELRGjTjTyGwOlO7JePdOWQUTSR3SEU3"
+    "HYTkKAQpJeQmJGIvFyU5NaDKHsUvTSAHBEPmB5IeVQC4HXTaDDC4NNJEHaQUNyS5ARJJKXUq"
+    "TfTYTjR1JsSDDlSyUbTBN2DcJWJQNwQJGwFyNIHaEhHYJeG/G2HaAHA4BeN2URDaHPF2QjG2"
+    "GsO7QQQ2CbTyHYJqBEPnR6VyIrSJVfS5OiSBFEI7EAJGVAOZJEULNwQ0FyQOImJiJqJGULIt"
+    "TjKgSUNwFtDgULGsFlBMDzBMGlU+MyAgOGJGRkAASVNVAfMiEmDYR+MHAAAARmGjJZTbM9C1"
+    "AbHoB5CMAADcKcBTVXM9A5VIU3AAC1TjNPSQJnDrMHKbVQAzJYUdSEMsDXR+TjTKFFDVPYQ2"
+    "Q2GEB5PZNrPVB2B2OjPZQHPVTrPuJsE7TqAxE0LsQ2TtHFPVUfDuE6LIDsM8RCGoREU5UFKb"
+    "A4A4JgTBJeB7K9T+EjE6FXQ2HVHVN8R1E6Q2K9EMMUHLRiDPLIJeAuU4CcK9K9BmQ2FCA4DP"
+    "VAJ8NNJ8MSTaEgGoPRTyK9HvTdJePRDzCWGoDaVXG/RsHLCJB7RcI7G/BsJeDzRUJYHLHLCW"
+    "MsDzDzMrHTDZPmPmVATbLTLFD1A3HSJQFIFOHiVHSOPISzMEJGTNCHTtAUHVHsNNSLDEA4Td"
+    "JGVmCoExVMMcMqFFH/C0S8U9DYU4EdU/QvHjHAEsHjPGHDS5UhBKLoU8ToHbN7QvRFTbHSR0"
+    "G0QhTOCPVAGTTFKVD+HbSYRIRNKLMrSYQKE5JGVADLENSFO+I0PkGuSQTdAwUsFsQiEsJ/JW"
+    "CMHCQ3AICPA4A4KsFkEGEQR0TxDETFVKC+DXPYVDCPT0GfExImTNCFROTzF3R4GuIOHFTeTd"
+    "JoO5HsCPSHFrTdR3HACoAeG2JeBzPkMEDsDOBCQhUsA9PYC+J3TdVmCVUsUlQGO7OADxJoJo"
+    "K3NnTgTlGwE6JQJiNfJeI0SQEsDXThGRAFAeSQFrF0L1T0RzTdToMrI8JGPoDZJXDuJXIqBC"
+    "HCCMTOS6HSU6KSJGG+IqG/DsS6TlTgN2ToQhDsJ3JuJuBLBLFzAVEcDlEcAaAbNjHAUSUSKQ"
+    "DjMLHSGwFyC2JZFLK3HAHPMnFLAFERGOGGA4RsCWNYSHAFSaGOGyGOUTDDGOSaTYNAGOHPAH"
+    "SmGyJGMzGQHQMqFGMcVIHuNyDGOBUeFjHuHuVIUeFjUuEAKtNOTkTyApUuVCMiGQTkGQTdBL"
+    "RsGQAPUoTJHHGQTxIaEjFEDgMTE7NyPcDgJsUoKbJEHXS2HHMTFtAIJqS1VFDcAIFjJGK+D1"
+    "FHSzKLRxU+NPT4Q2SUEKShSKMUExELKsKvPbPgT+KkMSEmKoDXKTKQH3SSIJPgTMU6TTPVG+"
+    "DRU4IZHjPYTbPbKVK3VMU3U3KjPgT2DzLdViViB/UgS7BJKhJiQNRGKfD0DrLTKvS7CMIZHq"
+    "K6U5Q8TNTKK3VEK3U2U6KTQTPQGGGuDrCKDLHqERKISSSHIgIqHIPHQ3F2RsJCPgNwJUTEHZ"
+    "U6JEIqQQHqP3QND/A4MsK+G4LdJsTdHTBZVHTyG4KBSOSoGzF2UFCxHHKVEBGfS4Q4IbFLOl"
+    "KQS2EdSBKnCXIdKfR9ILDcCEH/QFSLNwK3KvKHEwUTUsTdDvIJK3P6C4JlCMKHMzCIFyKbRt"
+    "OmM1SHNfNIVLDnPXP6JRCDSQH3TYS2RGK6JWF0HJTYAHG2UmHIFjUwN2KTCXO5LtTATUG+Kb"
+    "KjM5KjI8IZHsS4KjG+JqKbJiFtKISJCcQnH3VLKOHWHWT0P8UTHsPfTcPXU9GfPXTlHlVFHP"
+    "DLEEAGHPUbT6AXPeD3NPG/VhFFSFUzIMFISKEhIZDcKAO+DXHsJGE5KsESG+H4U/NPH2HVBE"
+    "ETTGMpUzTJQQVQCBELRkTLHWExEdK3UgHjT0H/RfRfDqUlU3ETE6K9VMIkA5L6M8MlJZMcI4"
+    "NCBLNCPVUDAHJGJiRGTrJGIZCbIFN7VJIWFyETLQNUJsR0AHFRSSSnTJD7MlSHI1GbP8SMNe"
+    "NuRzNfTdIFSYOBB3IvGaTySYSMKMJ4TqCBCDSBJeTmKLOBTLO+IfT0CPGmJrCGHIMEQAVcIF"
+    "MmTIVXIGCJNNVmNtJWHuBLD3KsDvHHGRJsAHQQOBJAApTfEISENNJzRsDtLQArNPCGOiTJDz"
+    "D3EARfHTTjA6ICA4R1P8U3EFSMDcQyLRMoHIDrQkBtQ2NPELExS7OBOBKAFaLgQJERC1JeP9"
+    "QmAkGnMpR0O1I8DKQ2SMSHJIMTRzT/EGUzH/IkVQTSF1VQB1NPARMlJgJrH3CqCGTgI8A9NP"
+    "K1NPDCVkNtCzJyG/PII0N2UbDnHJSKJWD3QiGwMTUDNeDoJGHJHOSHUrNfEJHIT0VXGQICUT"
+    "I7HTCbTYOBDcTcHLMpMpT0M4ETAHH/HHT0OiKbMcC1BMTOKBBVSQIZI7I8VAJGJGEhOBMcTj"
+    "JGJiJiK3BMPyFtIrBVTJPgPgJFOSPUT8P/NNQXKBSgTRSPNNNNU/AwEIVEOQTaPeTvVAQ6E6"
+    "E8KiVtU9QMKVV7N1GlVMPWQQC1BxKgJ6TzSVSDQ5M0VMFzSMU9HCFNU3FNP3HYPYFCIfDrDf"
+    "G+QqNNFkFtVzJZJsBJHYDfU+JsB1A4U0GzTuSKTeVfG+U3E6T5SDSRTNU9TaKTP9DrArVcU3"
+    "TqHCFNQmP9KBQaE8S4NNT0SJG/P/B1DZF0QQJFLzKgDfJGOGT8QyULI9OZTzTyJESgNnGQRN"
+    "SyP9OORNVhBtFGTdSPBJLfNxNxVDEwGOT+H/KoU9HZA3U9T0KiIOAgMpLbJGTtVrMpBMJZK3"
+    "CLLfNnTMV5VAU9PnHmVhG8G/CIRGVAG8GQTeVfVAHSOPECTbVJG2LzE8SHFMIvE5TCP3J6If"
+    "FGHZQyCJROPNP3TGJzJsFkV5OPVaAkAcG/U9VAIfJAMmH/BJCWVzT0QHJ8SUTaSKA6HCE6Ms"
+    "MBHSVDVkS1CIDgR5SQVfT0HCS2U4VADgHGG/FMFMFjOWQQOYHCH4K+BdKTVAHCJsQHG/TlR5"
+    "NxO7GRTdGwNlHBQQSYNIHOVbVDV0J6QQLzO7G2OGMBT0M4HCRXR5CIG+IZJ6A9O7OGVbJEDA"
+    "S9RiHfNwSHNwIGTxPVHaTUCkVYRNI0NlUkTTA6AmTTBJRiVKHQNhDxSCFyTSVACoTUQ7HQCo"
+    "HeSYCJILDBR/DZIMH/VcSzQHFrIaD+VeTAR/RiTGTyHmNwTSTSQ7B+TzQ2DxHmJSSHSFIaCo"
+    "UuIVIVJiCIDEJQUSDBNhNwD+USJjNlJGCcPeE8NVCcGbNNGMPZEtPpKpN3UpVMJZJiBKHbHb"
+    "UqAbP/HvGbRGQCHbDxTdPpHbN3HTM8EDJEVRBqDlDGRnHbH2HbVKVKI4MmTyCNFFKLVKRrEB"
+    "G/HPAUQMHANoUwQSTEVXT3GlGJSbBoA4A3HITcD5PGPZDODpVKLDCMFhJGNlKtAlQ6P/E6Bm"
+    "AvEdDPVhDrJZUTL5E6FfEhHDFGEjPfKPNBQ0HHNwJiKtA5J4F0N1CNTeTUSRA3NwIiDmSZHW"
+    "N7QSOcEdIWVMRHG/DPGJBmVEILIoA4PDDaU6BmE5T+ROMMJEIvHlFsHIGERGSMVACJQMPgVM"
+    "V5SaPNRDBmTJFNITFFCWIWFKT+MHNVSaHINFIoVoA3A4A4FRQdFpTxHHDgFhCNU6NtPBVHJs"
+    "BMG/JWQMHvE6UfFhIGNWNVHvCtFsT2BmVsBNUTNlRhJ2DXSYOpHJS4A5QSSUSRM9U3SmGjTb"
+    "VMT6CvJ7SCD6P8HAHTGwSmKVEjClVSMtExVMGwNlGfNxKoNYFhIdPhJnT+GQQmT8CVFLErOp"
+    "U6FeLoNYSaDBJjMmEBJGA4VcCaPDCNVMNaJiIrHHBTJEG2A4DpC4TIMmBdVSMqMzD8T0KrRT"
+    "UTPDF0TbGlB2ILC+M9USG/FzQJJnBmJsLgQTDBDvQTI4EFVMSYBMKiPDDcJQDXDuE7HIKtId"
+    "DVHODlGwQSI0UISYJsPgUINQMPNNMPFGHmJsJsTJBNDaOvVNFeNVJIBTVIIqPhIrIdTyT8GM"
+    "U3QdQ0LoCWHATbNNQvVSVIEgQFVINZVcQvJsJqHIRhTkT0IqJiNlJIIrNVT8VCN2JIA5EFVv"
+    "JEP9J2TkT8VcT0KhDpEhPVUzPVMCGQI9SPVhLbDJUsNVUiA3AfSFO+H4OZEvA4DETiUzKhQg"
+    "GlAUJGFFHmNCK3C8UmVICMQJQ8JGSHQJGbRGVfBmT8VFJWVTAbIzEwEZN1GQJLSSE6JLBeHZ"
+    "JFT8JsHkNNDEAcUqJWVmHZF5GmOxOxQmA6OZKlGfS1VmGjHJUIC1JESgE5MBArFjSxFLQmNz"
+    "HDBiVTQmKgOxEwUPH4HNK1OxOxMBSHJLHNITBOGsPoVmSSMBRTLoJGV7DpLoQ8ItKiP9HfSK"
+    "FaU7HfTvHCBvVITBT6GbTxGQRrOQR5R4NyLDVfRLLxE3HCPmCwMpU5O+GbU/HAEtT+OQDYHW"
+    "QJEmQUDEHhUCAYHXE5VANMVhCWGbUCI9SKE6SgPVBLVMN1JZVMPQFHTOE6RfU4DVCcPdVCSQ"
+    "VtHdAgN2K3PpVzIZHZOQGJSgHTVJCWFnAbHsIZGjC3GsFXQpHTIOHPN7FDJ4S7AwSSE6FSD7"
+    "OWQ8TeI8SgHqS2FCDzRHP9HNSVG2HsU+HIHqCMKkU5J6CJNyPmAjRHSYGsNmFYSxQyRMSeGb"
+    "SKE6RCQNEIIfE5HZGlU9TJHeEyHCS2OPVkCEEOJGJ7JLCWN8PQNNNNVZNNRsNYSSPkRzNOQq"
+    "RsFIRwAwVXBZF5DEJyJfNOUpA4CzJZKjNMNlQ2VkF1VoSHVfSpJMHXEpOjKsT0VlEhJ7S2Tj"
+    "PLNQS2SUHHICSSOiKjG/EFCSDrKsKnT3SgAnP9NxA5GtFXC4KkR1E8R0RKFeKoSeJKVkA7UA"
+    "TeQyFlVAUACIB1DVSMT3VlSzPaRyFXS4TkHYTdVXLdAiFjMTVIHHC0N7PzUASMDCSHOWQpE8"
+    "T+CEFMOeGjUHQvSSQJU4VmQpGxBaA4E0C+JEQTTKSJVmI7HqNYKJU+J6K+MzJIKgS7VlG/PG"
+    "QQEhJ7AyTaO3K6TSNcG5SPHCPCSyOES7QQNeUbV6U9PIOxJWT0EgJQCzV1HJOLB2OkSyG2Go"
+    "VvSHNcUBDSPaG2SKO7HIHLGsURC4SgHPA4DZTdL0QQTdPESzHCBENXIrNITAVvNNMmTUK3I9"
+    "SeVvIZTsS2I7SPB1HPJqB1TjBYOHSPVxVvJ4JEDgIsI7JKP9HfTxGbVISPFOT6HARrIZHCOQ"
+    "R0T+GbCwMpO+FILDOQVmJyEtU/R4EmVMU5LxPmSSFHSgE6JKVtPVSKU9VCVIAgE6CcPQTdHZ"
+    "DVAjOWHTIOOLDzGJG2FSS7HNJ4HsHPRHFYSYHqSySKQOQpHCQyHCS2JZTjS2NOEpCzPLF1Pa"
+    "RzKjPkAwCWQqJfN8VkUpRsJ7VXVfICSUHHKkIsQyKoG/T9G2P9EOEFA7SSFeVXGtDrJ6A5Ks"
+    "T3HYE8OeU4E0DCFMB1JETdHHBEMxKJI7TjQTK6O3SeJQPIUbHLNXNeGsHPVvE4SgFIE4N/E4"
+    "NQBLM9SXUxFITjTjNtSOFtV1QiCINPR+TjI7QiJqFtRwRwFIRwGFJ2J2E6PVEdFhVLHjKOFj"
+    "KsFIAXFnQyHqE6PYTKUwVzFnVcT0VAAKEdIsPoP9MqKBJfAXEdJEB+R1A4HCUbCRJfG/HqKi"
+    "UwJ2MqG/G/JuTNKhNaDPKUTNTuTuEuAUFLTPFjNaUMFLJZTdVMDoSvNcTbSSOWODODNcGsQT"
+    "SSTdTQNaNWTyFXHTQlT3SHEhPGEuPGJJI7FXL2NdB3TzFcTdCRR8EtGbCPCPDEE6SMAuTdIj"
+    "TdMpJZJgVAN2SISeSVSHSHIANhG2GzSYPBGbHLDpDEErDgPBCPVMHIS4CPMtVkRrGzGfGQGR"
+    "GGARMxTdJIGfARJWMjNhAREgTdG2S4DgTUI1I1H9KQU0NNFfFfFfDzDzEZPrOiLGLGEDI8RC"
+    "VhFXCAGOT+AXMpTbP/N4HDHmG7CaI2JzHAQlMJJmL4HMMXUfJmG/I2G+TsK3GpEaTdD1TWDO"
+    "QCNnT+CODXDXGbFYU+MULoDXU4CDJZU6TuRlJQJiU+LsQ5EZTGQ+FlS2JIGOPcJUM7HZHmA3"
+    "DqF4R4S2M8C4D3LbRDHlC4IaJIIdC4JIR9IdJIJIC4ARPZQCRCIdLoU+DXLsNjLcRCRCJiT0"
+    "T0UwP/QJTdQJP/UwUwObTdI3G/NyIDBlFOBMGuGvCOOQSbOdVHT5ECFIOWFFBsSBB5FjU9GE"
+    "E5EqEuMdMYHHElVYTtLDAMIDOEFaT0R5TSNNMqNXSHSHEsIDHaQfPYVDUsSePYR1VIDzDYEs"
+    "AVBMN2Q2ArFlQcVhErU9LdM9ViE7MYU3SQV7MdHFPcU9AlK9N1GjH/COThSzTMJiD7HxJqHb"
+    "L6TIMVIRTbFuGAFOD7CMHOSrSrEZALGXMuLYViFyCJQ7U9DEKTSeDESeKFKFHASeLrITOsUO"
+    "NNLRKhLzJuRtBMR5RsSvHPHbTuGWDMJUPGREKTCwPYNXDjHoC+SvSkReMZCJLVNID+ReLlLR"
+    "MrFjJ2JGJJUsDEHSJMP1MqA9JyMuI8IdCtDZQ3LVHZLEImTYTIOQPYCzE7E7HjEqNaRtD7Mq"
+    "F4VkD3SBKTLbVSCPC7J2MJDrAISmLRPpPxLJUAVDOZETOtROTRHJR0HPTyHDEFA4B5E8SSLd"
+    "KkRlQvRYAjNXJ6RlPkQmQJVXFPTdBMJQHAMqSeFLJ6BGMHB5JsF4MVChA9HME5QmK1SHVQJ7"
+    "HOTmJ5VAS+DGJYRGMmLdCjJQDEFySYQuEhU+HOPIGiDEOnSUQPEwTjPGVNDYITLzRbJIA4To"
+    "HsCcTdHpImJJO3RbFjNNDEBGTALSSBUOSSA9SpIUImTIJqG+UCJ3N2UOJuLbUCCFNVSBFwUM"
+    "JWFvViHPLoCYHCFLCYKjLoVAVAFPHJDzU9SvQdU3HiSSTyBsTTTyCRSKSKHiTyTzSpHlHiSk"
+    "PSPTPUHhPgQhPmPgQ3QkNKNKFsGoQ4CmP6SMSEVFDdClPGTcEhMLQfEhAfClGJEmAeA3JqVC"
+    "HJBfJZVKUTEPBMSQFQClSMJqNwMWSHIPE6USEyJEPNTyIvRET0R0BMKcLhHjGwPjICA7K+Dz"
+    "DgAkBsTdQEBfBjJmDVS+TUCRDlDaNbJrTcHAHJG+KbNNJrJqB1PyFVJLHHHHO7TLE6M8TLTL"
+    "BkBkTdI4RCHOAHLFQ6HOHTMmRrTdBwKjKhFFNVT0T0PONvECGlNOKLViG2QNVASUMqE6RbR0"
+    "SDU9NPPGR4NYOOE6IJHVJqS2G/NnNNTJEtAUOlShHCGmGmEkSFHsFfU/T+NnASCaKQTEEsOT"
+    "GJC4TfTuA7TdNiR0JGMrETSSB5BfVMQHQyT5OFJZQdPODpKnNsJGTrH/K+ArAlFfKsTcTcHm"
+    "M2OpINLsLcBMBJPGSwTTSPAuGbTjUgD5HjDzLnFFGiM9KTE6PZFhA4R1E6VcKQEjHDKOKOAV"
+    "C1K3VfU/CNHCHZJiC4LkT3S9TkNwFPKvJGOWThFWNYByCFT0GLViJUSDHCFyC3HIC1FgFuKL"
+    "BtHOHOE6TyVJVfHLG0TeBtEdOVOcCRKMRGVENVVKTBGsE5N7FCDOHZSpCmBkHZEZALNfCNOP"
+    "HJQyGvM9JGHWI1PpVTDPHEOJA4BmNfG2HCDcViOWG4SnJ4TkTBHYQRTeKEGbVITUECR0JED+"
+    "E5OPTfGQA2BTT/DpROQNQNCJCFSDBBSHFYJGNIVMK3JGVTV5ReNyO+QTCFMmHlKTKbSpHZCB"
+    "PVHuTJRDTtDNFsGGTuDNHERvQJLxPNSSIxE6ERK3R6HTLIK+H2IoJIPeR/RQSPG+TtTkTjFc"
+    "CwKMKMC3RsHZDrN2D5HHVoFhIjJsHkR1HuLoIeGQNIUFFMF5E6JyB4CWQACtUpKXBaAVJERO"
+    "BLGGAoNpHpSHNnDqHSNIDcHXNfQdFXGnFhJZEpNnAIRwAyVHTIHjHHJXQjPmQ2DgGkNNGQDE"
+    "QqCvA4B5GsEsIoNMKbM9RyDZPBGsTKTbQ6NNRsBmLGU4RhHfQ+J2A4TdMSBPMZD3TkTkTkSY"
+    "OsNxH/SXRtTzTyE8JKS4S4LJBmR/CxSYTyA6KQAIETJ4TkIiIiHLKkV7V7VrAnOZSJTYAIN2"
+    "HHE6J7HZMiExGbGbGfTLRNVMVfSUOQFPNRNrKhGwPVNIFED6VIHJR0BMRyMLHCGjUOHDEFTU"
+    "QNC4N7RyU3IbRDG4SJPdNPIrVkTRT2KTT9PpDrVSFrOFS8B2HzIdGmHMJmR0MRTwQETePdCw"
+    "PeT9U3IxOcKbJGN/QMT3JGHlSHAkCaS0ROJeG+DtNYVrNCDLT2CaT0ISMTNINILDP8SIEuT+"
+    "U6HHHAOpBfEVKgGLQRU3KvQES2JeSIFjIvOWR9FEDNPdQmJ3OeQTS4ArTTF0A4VlF1V7Q6Bm"
+    "MgIrDZHCJEPVIwT0JZTkK3DxQ6KPRFCcMmAIJIC4SJM9NxHXCwHTRzRWBjT0TdVgJRA4JrS3"
+    "BTUqI7NbKJTJJZHCA9F1GFDpQJJsPUPJDpKrTAKJBMDrDLU1PVS7R1GjARKhJmC+VCBaNAHM"
+    "KiC4LkG2HqTfHJLePmTeF4CFGlO+ILNYJ/UMUTNbD8JJJYILAGA4JER0HANWPcEgKbMJB2Dt"
+    "TCHOOkOkI8TyNfCaGnHHKET+AlTtN2JsOJG2ETQyErHsVzEfOcEuIdP6OjTFSzE8HsDcSDD6"
+    "P9SYSKJiR3PNNNHHUAQRJZT0SMR+HAGbP/LzI8S4UAT0SIGOAmGLAHRyG2G2HCC1SURtKrTd"
+    "JAHLBePVNbJIH/T3DPQ0QlS8A4UmQRSPEhD2SgFjSgPoHJGLGaOsShTATUAcQFPoTAEIM5R0"
+    "LsCWKDOcMyQdHCURCFU3EaLcTkFMC5SYNNEdHIS2IbHAA6DxKiIrHYBgKoNwNlSRJQMJSQQJ"
+    "J5TdS2SfJETdIlI8HQDpU/ApQvTUK3GuA9EgQFQiRWNwNfR1JeG2MHFMUAAnJGPoCaAGJYUR"
+    "S4NpIqG+RhSFOkOkNNGXJqQHRXKbUAM9TzTAHCHdS4K1NxQHHdMmLoBOOGTdSRTyHkJJJJTg"
+    "NbTjJiRLGmT8JZN2TSEhKTGGIaIrHCDcKJI9I7GzExU9R1IbUpGpJEHCKgI8GqJ2G/IbJsHH"
+    "OsQvI7N8SYTdJuKXBAGiGkJrMEJ7P9SYNWCcGiSzDLE6SzSzJrGkTyGOHOHmF4AoTJUpUpIa"
+    "BESKPpCSNyDvHBNyD1PdSLHsUzPSTxGEVhGbGzKbFRQNSLBzPeTcKASWEkETAUCONVR4R4Ol"
+    "AkMqT8T8HuNNRGTgNNBcT3HsG0NnNNVETEGMK+RvEuEuGJFaURE8OEHVE6CMD9AoSRLbDVNx"
+    "TtUhM9CNTvGQGDHmJGE8OEUfFfMqMqSQVMDvBBBJFhUmN1PSRAJZFjDZFjTkJGCIN1K6FPC3"
+    "G0G0KLE8TNRiJUVJTaSQIiHOJGTdM9NMF8PSTbRwK3NwNlFzNwVAKHI1UzHELQP9NNSmHVNy"
+    "PNTqHERZCBArERGGPoS5ExPYPYE7SSUySDE6JEIvA4CaT2TuHTDZTJRDDuRZG0R/U9QAEpHj"
+    "KiNNNNT0HvImKcNaP9SHJyJGDzQ6QqIeGEGGT0AkEqMqRyEJTdT2QVN7NXOlLbNqR1JMF5Rq"
+    "D5ETAfDrRwBcTOTkF3B1D3ImH/HTSdRDKQSzKjTyHSPeS4GwTKA5OZRyE8T3KVR1E6OcSeTt"
+    "NyKOSLTjPdCSQlVJVkQyE8T3IbKbImEAGjNxDzJGR/T9N3LJJmCvOWTkHLAhIvMWP9SHC3SH"
+    "T3R8JIQEAeOWOWHASCSyGGNnTbA1GnQmTcECLGGQGjFyKAKvTdR4TkQtVCBfO3NNKIQ9PJPg"
+    "BjCMDrARJsR1VAQmCFMxN2MqTyHJJ2JmNoVCTgHLPvR4SYRtUzU1J/J/F3JeKOSHC4JEKISY"
+    "B8UqKMSXK3VxP9NxQtU+MmMmHPN2BAJQMTFzSJHBVQGwEqI0HsHsG2TfB1HOPILQSYSDCSTB"
+    "P9CaCIDaJFSgPITcHaDPB1NPC0SWPUJ3NnTkBzJGUWS4JIVKUTSdKMSgNNOWHIKcGMOcG+Vc"
+    "HTM5GPKrEhI8HTImKtJECxJGNxLoJqECSYVJJiJEJiExTVMqLMFjHoTjPoSHBcN2N7ECBcKH"
+    "N2HTVKVbS/GvMDMdMDSkVEKFEbHwKrSKSnTKH3T5N2JZS7PpSQRISXHSSQTEGjR1DgCRR1Dg"
+    "VYGXN2TaTaBSFGTyA+BuTbPGCHE5F1EtPtHTLDVCDYTdVEVCHVU/SeOEU9OQNmHWHuT3KVBz"
+    "ASLkGzOEHDRfJaDVAoMaTUV7A4PQQjHmGRS9SyU4TbMNBLDoRlE8F1VAVAOEMUTdKQReLDFe"
+    "S7UzN1ArT0SIKgBMBLE6COCOIOOQHNHEHJBMHTEZFOOcVJFyTeBYJUHxSqVTDaSzIeIELkPp"
+    "HEIfCJJFHoPVNFFPTdT0U4JeNyODHCTdBSVTP3O+ODJFJIJJIOHIE3B0A4IeQqT5JZCOB4CW"
+    "EMA+JMPMMeMeEpT2J3F5TKEAQ0VAHjTcNNF5FnIENMQ0QyE8CSSgA6DzIeEDSySyGRT5AlAn"
+    "E8TyRVTKGzArCbJ6MaDXT/QXFeDOGpOWT5OeLGHeQUAeRZCOO1LkTjHVNVGpIOJIIrJEU0Pd"
+    "J6TdDySgSPR1A+BjG/NcO8AlSUA4E6HIVSHIDEHADXUDEhBMSXSiBBOJKIIrASUTF0BlQQLz"
+    "B0JJA4HWDaPoQjA4IrE6OcU/EIPoRlPgAbSeBMCHIqJiSISPIrU0DVHlULPdHIMUTdIrTGSH"
+    "SHTUEzQiE8E1E8AXGQG/G/HJFrA7TLFyHsMvKQKiKiKrPgP/B0J2HsKiQ8JITUVAHuSIPHRy"
+    "SKQ3TyIsETEBNmMXHCKvTkFgN1UpHYFrDlHJJ2N4HHRzHsN1J2IsPXDpFrHJFrTLFyKiPgB0"
+    "IsHsHCSIDpQ3TyFgHYN4HPNyHWC8HsVACAHAFhDZVfDqPJGoN7FPPgHUFzFaCcHUG6NySmQJ"
+    "LbG/JsVAUeA4SmGjPJFaVAS9CcSHTbJGHsSHTLSHTJTJD3E8NyNyHQGaHCEjTCDxGdBzQrSz"
+    "HTTbOQTCTfPINPReHCTCTfEREtTGTRQDPXTfShHsSZLTCFTtU/SrEmSkB9PUTJOrVaS1TdTd"
+    "QJCMGPPVGQS2U4VMU8FgVfVhUmFjE8HIDzJZDqTPJGLQMUVIFHTdHmTUUhTbTbN3UwM9A4Su"
+    "N1AVDPVtQpVLC1UzTqS1TBTdGxGQPgBtSbPdGUBvFgFzN7G2HTGoFCSVRyPVVIRGKgUmKxET"
+    "GzTJSrFnEbBKQ7TbI8VJIWIPSCT0QvHCVAOQC+IwERIXEUPgREDZArB1TvIFNhNmPsAITzSb"
+    "CJHVSSSCSFFNQDBQG2HbP7U5P7EAGmB7P1HTICN1C5SZQQRwSQErCMQaTdLdTfDxMrVcB2CE"
+    "VYHCNMQiVXR0HjNsD6U8UTVoNVVcJNHJCcGMJ0PXA+GoMuTyDzSzMvPgS4PgG6GoETVEDrSe"
+    "E6NJRDHJNOT0VfVQSJG2TeAISQLICFEzVJTNTLGwS4FPMBNMK6TYR1SmQvVFPIHINAIdGxG+"
+    "FOTkKgSaKiSJNaCES/QyQJAkCNNVPgHMT3SgGRQpTSTSJpTyA9C6NsJEK1K1PJUzKzHIUTHS"
+    "JIJmBeMHF2SIVcARARHXUzTbGiHNKHB+GGGnB2SzUbO7SHUeEIU8LQIrERTjHsG/V2HPBOG2"
+    "VSSDUZUfPeNhQiUZNJPaS4USQiDbQQSRG/HQHaUpLMTaAGUmMsG1GoTdTdPIOIL4NXEIQaGl"
+    "VFGMAHTjHJT0HIG2EAUzS7ULI8PXR1B2JGTbA7UzTLETCWR1CWTUB1OITgIrCHSeLoGrULTd"
+    "DbUnTLEATJHCD3E8OQG/HTGdQrOIPINPReTCTdTCHCOQHMG2MHHmTGLTS1ERJ0SrQDEzPUEm"
+    "HsU8FjGPM9VtPeSuUhQJU4DqVFC1N1UwA4TdTbIWI8PgFnPdHAGzCJVJPVGoDZFgN7FzTBTd"
+    "U8FCSVBvG6S1VFHVSCTzNhSFFNTvG2IXP7QDEUNsVJVoMBEAVcErICR0TyP1PXDxB2JNVYQQ"
+    "QiPXTdK6CFDzGxHJSeS/TYR1ETT0S4B1VfAITLDrKgMuSzK1DbQJSgTSAkPgNVKiHXKHUzHI"
+    "KzQiUZNfIrNJHsTLNXUmCHFjNVGbSLHAGbGDGaSHSHG7JQGFEAJiD+HLNOPgJFDlRqA1PpSS"
+    "ExVAVATLTLPfCcGzRbTdRbTdHHAUGhETCaSXGuHHIDFCHmE5SHBEGMT0VJHDEuSHBMR3GsBE"
+    "DpVkEuTdVAAoBxALMqLDMpFfLDTvDvK3P/SvGsIeGQGMK3ALKQJELbA3TzHDRSKNMqSHTdHm"
+    "K3CZQiGrHsArU3T3E8BYFcQtTbGJRrM5G+EjQhFtUTVAEbVMPgA4VfEbF0MvA6KEDVPcIZEs"
+    "Q+TbCNKQGRA4JsJYG2FCMuVfHFS2UWHPFCUMHJTjTCU5PRBEBENyPRCnUMVFIqULC3CEPKQ3"
+    "MeFXSQKFHJQQE8QkC5C5VAG/UsEBHYSrCxT/AnUFIqE0BhG/PcTdVSE8FgOvUTJQTdAcCGRt"
+    "VAVXA9T9UdDZULTLNIPIRtTkHYFHSQUMA4EAPnTLPKS7JkFHUMArU3E8T3FcBYUTSQAcUsG+"
+    "VAEjQhM5A6FgVMFtEbHJAtPgQ+F0IZDVKQEsGRTbUWVAHFG2VfJYJsUMVfFCHYNyU5IqPRE8"
+    "EBG/PnPKC3A4VFFXMeDYIqE0VXE8VSOvUTTLULT9UdPITkFHCPSHPULJRGSKCIGRCIU0SMQm"
+    "VpVpJGHfE8UwFGNOPINwTgSRVfHsNoCNC0CHCHDzHjB9DoSKUmHsT8N1HACNCaFlS/VfQ6EO"
+    "JUFGQTC+SIUwQJTgHkHJOBQoCzDDJsN4DcNxVfQyN1CPGwNfNeHQUSQ0EaUKUKVsMLAoIOH/"
+    "EKHsE5CGHIEnU/QXT8AXNNT8NaRhQdTdLgJZKVAVDyIMRfHDC0MbNTVMHjDtU+E5MTHmPGBN"
+    "LbHmJGFTTbG/EPSRHOEPVJN7IRVPF0NwIcSVCPJsMuVAHEQ8BZHJDPNeA4SPEPG/HkHCPmRO"
+    "CcHbLoSYBTS9DGK9PmJLTqHPCWNeK6QaHJNNR/R0CyHTHALoHjLoJyJsJCGpHmCNRsN7QxBM"
+    "VsNlTcC+VkBZVkMoVAU6DtU+TyENELCmTqVDDrUgCGCjHJFlQmHlE6VsDzMuOZMBQyBuRYHI"
+    "DfDKNMQaNaLgDsQyHALoMTJdULA4CRJsJQC+QlDVQJSJIcG/U+NaDpMTVkJIAzUPLgBBRXHk"
+    "DlBrSPEhCaVCEJBLC+C+HsHsJYQYNeHrNJJPEJC/FtUSDPA4A4VKHmCaNhEKCWG/SET8LgJY"
+    "JUU+JGVAB1CaEFR1JiJYSPR1VuIrSgOGOrLoQaN2HAC/DLSJIbHsJYPVFaDXEtN1QzEOEOFa"
+    "IvOPJ3AGG/HkQnIGI2TKKUH4N1JmI2EOU+TLQzDgTjT0CBTGFzHuR1T8SkDVS4EjOQPGIXPm"
+    "RbCFDVETLDNNKOOiIXNWVRGaGiN2IZDqJZDVAQU4EjIWTOMlArFhFhMaVMOXETAVVGU/TSH/"
+    "TdVAPgM9EZFbHkHQFuJsHzN7VFUHVAPRJNT0PNTtRtTgUzRsE7NqVFLbJAUzUpJNVfGzRwCz"
+    "F5H2TcMmNYF1LgM9FsArJyMPJLOiOZHATNSQClC7CvFPTtGaPmE8VfE6R3AvUoTyR3QpFjU3"
+    "SMT3JsHOB+VRR1G5S+UzHQUpBRI1EuEgJWFPO7H2GsTcHAVXEZT0HJGaI7MgJGJGJqJYCBTG"
+    "FzS4DVOQVRETJyOiGaFhH/JqVGU/TdGiU4JGTSNqPgUHVAHQVFN7JsHQUzE7JNLgArGzF1Rw"
+    "JLCzVfC7E6HAR3PmMgT3SMLgJsUzJWShFhC1C1MsVzA7ImImC1S8AgA7A7A7S8A7AeC1A7A7"
+    "CFOdLzLzB2CzCzTaOSA5A5PeTxJQDPB0FFNVTxTxNPTCTbF6KFNMUCRxRQVYTkDPUAHYGJTG"
+    "EiSFDPERF/U1DPHYT4RzJICNCDLdQ6VATbHeHDCFDVEaDpNCVMDzUTQqPpRfN5HbG0D7TvKg"
+    "AzHCLFTbHTVVJUTCRZQDPgQqMWGhLdELHeS6TCBQTsSYNyRMVKNyDrDrROHbQ0D+TcU1RFFw"
+    "SFPgCKQJUSOCEyJIQVG0JFFjIoAvDNHsAzGuDUJsTtVFHYT0CyIbRyQ0TdDPT4J2A1MBTyDc"
+    "QOELQQTKClCNQyT0PeU3TtUAETA7F6ETSMGwNyDgDPRzLITbFgTSCYJeTCQaDrCNT4QJQaNX"
+    "KATSFtUqARPgBWCPQJUPUyELDrJmCNDKJWV1OLNVS6T0TbETJQHmPgA4TRKFSgQQF/UmQvEa"
+    "KoA5A5IjJET3TSJ2JFTdRDDnNOToPGGETyKLOcNwSHIZE5H7BEEkSnLDShPXAiT3DGG9SeAi"
+    "SCHmTtGEQdNxA4MpBJPQArRkDqVoTYJWIWFyVJPdIMT0FCGQNlVAHAGsGhSnHOSIFyL/IvHE"
+    "ITU8IvUATJCJD+SHJ6E7SDE6FNGNIvHEFYHvTlBMSKArJGT+BTSZNMMqNqF3VFQiVoM9IoLb"
+    "CETtBTSUDXHkToNeTaD8TKKTOpArETPmHqTzUAGfIbSUSUQEQmKvSHOdCcVfVoTYSCSUT+GO"
+    "ToA3KQB+E5JRTfVQGlNeTIUqKJNeS1DnA4TBA4UbRzU8KQPIJWNADXKbTYBlITExKbVoIZJJ"
+    "ULB1TsG/TLB1DLJZGrSHExULJGTuD1NyVcMgVITcFFTyHhTKVzKOU5S2D+U3EtT3E9UAQfQ1"
+    "NTRfC+GDFhQHNCCWUHKwI2CzCWTvRGU/SPHNCJThROHQKTIOQKI9NIVzGATLPDLjRzJsIsTI"
+    "QqMdUoCwQiVzVXC+IeQySQD/GjS1SoQjNyCwUANCH/QEKgN7CXDKUATrAPUhGAQmHNMzCGT0"
+    "JEUPI0TaHNBRHQSHQiEcLzTdJFHmTLTdLjOcTACWTLJZKgKgLjSkHQPDKgTLA7BZPgTvPgPg"
+    "JFVETXJNJEHWHWE/TcJRDdUuD1NCNyAUE7U3U+AUJwE7LFDxPINgILCnVhEiGnGnGGFINNKL"
+    "OUDrP/SKTdBwPdRPSHMCNVNyHJMsTWHWAWEkCFSnD9T8NVE5BTLDShERHsELFeTgNWAfOsOO"
+    "B9LxEtT/TcNnMpF3GbTfHuDxTdVCSJFEOUG9QfH7T3JqETNnENVfLcROPgKsFhH/JZBJP/Fj"
+    "BMMpT0P/V5BQTtQ2HFU3PfPgU+HmB0PdPdS7UuAoGQA4PZCaPeBMVMCPUCM/RGNWE6UkKPNV"
+    "E6JGT8MpTMAgBLHTFePpU6K9SJSJDrHDK+QjGsTcP9IZHxAqHJRGSnGbHPCOEbFRBJPgK6HD"
+    "TfHuVFCUSWRGK3I9G/T0S2OOV3VANwPICPSRSnN7MpRAVJSXKvIQTSSPSQSvHuBsI1HAMrOc"
+    "KhTaTeFuAKD4TuO7H+NWJuP9AEDxGGOlPgIFNySYUzSyUOQyDNFlGdVCRJJ6KTIvRtShT+Ar"
+    "SFQJT0B1D3BMGGHEGbC/ExB0RsVAP9S4GnTzQ6IZVcJ8SnNoPYGEJ8TWCaUdHjSSERKLNKJE"
+    "MUOlCJFNJFQtBIVMU5RNJfVzHmB6T4HJFIDxQqB5JyF5JZMpJsJENaNFHpKsVzMmALMpSSTD"
+    "VVI9ABIGQaIeEALWCtVfU6AtLoVmCwQiD3NNNWVXG/T0HXFsKOB4Q3SHJKQqFkDNPpU3JsKc"
+    "JsGmA+E/IoIDEkSGLGRtULGkDiSPMtG7JNEeKXHzTjDoJKF3SRECRORzVkE8OZHAETHuCGQy"
+    "UfGlTNEFSMTyIFPZGwR0E8UuBsNlPdGaIbQ3K6NeNeGfRJC4GsTYKsHJEDHJQAIbGjS4U0HT"
+    "U3A5VCVfSvTWKUMRAEHVNZKTQUDPAkSMJIQUH0JeTSTYL4R8OWQmQUNaJGP8CtBMMTDOA1O1"
+    "FIVfSCTkGyQ6JeHzQSO+QERtGOU5U5IvTdT3QnLoSIHDFOKAHoQDVtQUSOExR3LBJrQUMHVs"
+    "RTSvFtS7JKPkATKIK3J2A4R1JeDpOxVlTbJsARIFNaDCNMB5QlKJToB2ExHbA9PpJoSyC4Ji"
+    "ULHJBjJESOSHH4PzAzUtNZCIJsGnHANIG2NcM/JWO7SyOxCIIdP9JeLQGwM2QQEhNfN6TNQl"
+    "SXHsHOV1JQNlI0EISiUIG/HIVCDnTDTlEGHsL4UINJRAEhCID2PIHyHHEsQQJrHoG2T0JIVc"
+    "NeHJVcI7A4RAGsTYENF5DaHmEuDPArTdAHVkTCDxVMGXVXG/LoGQG+NqBETjIdLsSzHJHJNX"
+    "BuVAKrJEI7G/VwIZPKMmImEAP8CzJ7A9AoJrSTIUJiETJqShHJItBMHHTUB1SUHJSHFtBgLo"
+    "I8C/N2MUJ2VuJuUQLoHsQnVKIrHWE/TcU3D1UuM/JRRPNVCnPGOsEhDxKXMCTNBwSnFEBTQf"
+    "HmELB9VCLDArFIAfNWTUNmHuSCFeH7EkG9RLLxAWT0NWU6NWFjBLH/NBBQBMT8VuK+QjHFDu"
+    "TtRABMJZP8NVKPAoPgS7QXA4LbMpENSnH+I1EaKLTDTuCJHETWLQVADaRGJ6DxTeHzUfVJSJ"
+    "D3D4SPGnN7O+F7DxFRKvU6O7HPTaB2CUQlAKTfOcVMI0NKSDIoQtJKIFSYQUJFUdCaF3FNER"
+    "SyDNJ8ExShJfHyHIOlQxIvNoHjABNaU0MBDNKOAtNNDiICIeB4SHFkJ2CtVVHXVASPHpG7Me"
+    "QiD3HJHmKcVfNlTjHzNaP9ETBsNeVCEFQEGwGsAEECKUJoVfEsKTK3U5BMFPLoQnHoLoLBJe"
+    "FMAkTdHDBEOWA9QlKJJ2AzToHbDoVsS7JeB1HsJSNIJrEIIrNJC/NaDnG+I7GsVcJITdBuA9"
+    "ImB1SUUrB5HhASDzN1JRKgUrKXKBPwPHG+KXTJA4GGA4PGHyH7AwGbOnOySQSQHHKtSLP4D+"
+    "UfLSUmMlSNJZA7A4OnAHFrFPFPEdCcGdFyKtO6IfIxJ5RDPBHkT8T8B2N4JYB4PFIfTIR4TJ"
+    "ETG4T0R4GdAlGdN4TTR4AfALRzTeIiOBIrD/N7ExQ2LoQaHzGQOBCqFrD+NOIaQmFrMyH3SK"
+    "G2B2MsDcGsQaR4QXKXPwPHTJGGA4R6CqOnRzSQGbHHKtH4KYUfLSFyR4QaKtJ5HzEdFPGQIf"
+    "HfT8IvD/T0TIB4SKR4G4TJETB2IrN4G2IiOBGQQ2DPN/GFGsE8E8I4EISkNVSFFEVATeTND9"
+    "ETPZAfMeIFT/OiU/MqHaElTNTeU5HSCIETN1DqVtV7DuJaABRfRfApBJE8HCJsJjCFSnEPJo"
+    "K3HNPmEPSSEZFzTxFCPHHvNhSnCwE8A4SMPHPZVANHD9T5U5CaSSDfLoT/SRMeEsVoTdEIJy"
+    "TeHjCtCFMqJZQqSSJsPZSRTeVLTNOSSMCSTLTePpDoTyJiRyRyLoEIQOAKGwHSQOTgFETKGz"
+    "FPT/SFIbAHSKQmHCUsDfARSKTgOsOKJWRXDnHPQQQOATSREuLcEZG/DfSITgVAGzJjSHJGJG"
+    "JGVVGjU9QSHqLITdOBTLNnNVSsTFHAFkGsVAFgHqC1ToHjCaGiUDJ4TyCWDvQNGGSBPyFtCa"
+    "UDToG/SHCWJgJELIS9UDHAHATzTyS+LCE4O7K+R4EtMVT+JGCPTMJZI7AJAmSFDuDcGlSFDx"
+    "SzHCK+CFSYUhRDU5MgKTJZNMVFG+PBEpGbUmTeLbVMRbJWJZD7TjSFJZPyJZSMGbTeKFKFT/"
+    "JgKdBESFR1IiTfSITdAGDZQwSST0JsJiDVHAMVTNAXMpRzExSKHCKDKbKbI7JGG+AGEsDVJi"
+    "JZAHExJGAnGRGRGRBKNqNqHbQ1U3HbCINtHbHbDuHbQ1EpEpH+KgKlKlAoTYQ3G2TYFPD1Bt"
+    "NWOQDpECSFOQNnHYS8LxAWTgOrLDK3VtDPAgTdTUQqArHSGbMaTMBJTeFPQqHTSeAIAIGTFb"
+    "NTDPNfRCKHTmQNQ6NhS7IIAyQaPLBJIiHjInSgOZAiEYNxNxGQNhK+HjHHA5DoHHR3QpFeQa"
+    "ArSeMTFPA4IiQlJmF0NfS8G/HHHLB3DPGlSRNVEARlHHIrRzOQE6KVN9FPR0NhGEB7IiOaUA"
+    "PUR0FPAcQpFeUAFLA4R0QQEARlEARzOQE6GER0UAQpHhHhSPSgSPG/TeUDUAPOI4MmGwTjUA"
+    "MmAITeSWGlTYD2NsIbSXP6GDSzTbSzESQDIcNNGJT0RrAeELDpDXMUM/JaCDHaI9GQNeETER"
+    "R0SeIiPXTbTbF/EHTzM8I9E7HERKG2IbHEJ1RECITlT9GjGGHaRXRXM5IqRXVfVfCtD3IqQi"
+    "GGNVH/DES6NmTbOtQyERETTJR6H2TpVQTJSRSkTcT5O1DsDsHMIaI9I0MzRpKHC+TSGONfFk"
+    "TCTKG2B3OcKbBESRM5JqIsLoN7TYD2NsGDSXP6SzSzRrFkELNNAeQDGJT0JqJaNBHaHTHERE"
+    "GQTlHeH/TbM5G2RXGGTlTlH/QyTpETVQTJERLoKGDsO1GOI9B3OcM5N7ExA9FlE6SLUoA9Os"
+    "AVQdJUFlS7PNHmA9P9R0TNTSQEHzQEEgJeSIJgMxMxJeA9A9A9JQA9O7ExSvExTNUoA9OsHm"
+    "P9QETSJeMxA9A9EpEgEpEpPePeBbG/D3P/ReUmQRSWRbOQT0HqCPTgEjEjQRTgRLTbV7A4HU"
+    "QpAnC1RBP/AnPgEPGBOQQ3HPHEBJTSRGC1SWTOHqEaTLI5SHBbBLLVETBTHvD+QJTyPgTSG5"
+    "F5PgHJVXBJSSBTTYQiEpUqR1FsETL9UAGjGwRBG2HHGfAHQmEtR1FjBsQDQmBMFLSKIdJgQE"
+    "QqTYR3K1QmKHA4T0SvHXOxIdVSPICPDZTdG/OJCIToQpR1SWUmEtGBKbTLK1B1SWJ2ULLMPe"
+    "D3G/ReQmRbSKOQT0CPEjTgHJPgAnP/EPTbEaOJSWGQI5HPSHBJBLD+ETTyLVHvF5G5SSFsBs"
+    "IdFjQEB1TYK1BMJeSvHXKHOxVSLMPjIbF4SUEuBMLcA4BMROGDEpHHAIAHE8SPT9ShEuM4Sh"
+    "KAT0EyGGDpRfUzCNTBVMU9MgSkOUOsT/R4U+DZJ5TtBMAnHsRfTdN1R4N1HdNBUuT2MeVIHm"
+    "VML5HjMpUNHGJZU4QdE8TOPfA4RfRfP/JeKBMuQqVAOWQvD7TAN6PVHdEaGBBMVJTeJ4VFDZ"
+    "GBJeHkQCNmKLIvGGROS4RZHvESCKSmAFJsVVVFPUMuIeQqIoVkICNNNNTLEpO3TLFPTTSFMw"
+    "C4MwNWEpGwNWG7TyQyN7SMVkIbOZP9FlRfFyQENVCJVAJeMmQvSIBkEATLT3VoO3PINNVAPy"
+    "JsSIJ2UqK3ATBbA9C4N1A4VAT0SzGnBLQJSYJWUpEJJeRfBqDuHORATLJ2UmHZTdTYReM4VI"
+    "TLJiJ5QvSUHCPyHkSIGrJEA9KAT0RfTCCNN1OUBMJ5UNPfP/E8HjVoVMRfL5HGTdDVSYKBTe"
+    "HOGnJ4GBMuA9JECKTLSmNmHvNNNNICVVVkQJBbMwVAIbO3SFATJeNVPIA9J2C4B2VIHCPySU"
+    "FjR0R0R0TyFHTdAMRKHVAoArC0QzDqIMF/NeGfIRFPRYFYMuA4H/NUTyQPJmBMSYAjBMC0IU"
+    "BGK1JQJmSYEAUMQPQzBGIUJqFLFLNhH8NgI0O5A9IeIeDpEmSvOEKODZIeBGEfQ6MpVfEfOE"
+    "Q0AoA4KOE6EZOWN1FaSvIiHCMmVNPNQTQ0JGBGVkDpMmQAU6N7VkP6HIRgGjImHfNNJIU4BG"
+    "MmKBOwKHKHO9SzJUNVNVLMGsIiLsBGJUOGD+D+LSGdSKD+GFD+D+HfB7T0T0FPTLE7NnFyVk"
+    "JgFyPJT0FzKVHCNNFBIbG5AVNCKVSzTKSYJMT0RXNMRwJMR1FFCMMxA4K1HBSzCXTKUmTyDd"
+    "OOHTAUGbReDxHBS2ERETO+GJRbK3HVPXAfT3MqJrR4GjJqUCElEuLDTtMwK1GQSMN1GEMpJZ"
+    "RfBLNyM9E6A4C2R1HjDvAXTtF1MpLfSmQdAoE8UgHmFhPeD5DWQaHTPmGhSWEZALRzUwVJTh"
+    "JUJ4RGQzTdBKR0HOIMFySPFPG0I1E6H+SvENHuQyKkPNUgQTNmTyLVUzF1FYQHSDNyPGNHGu"
+    "Q6JFO+O+H+KbCJJEVpSHTqPVVfNNU6SWLVCwHCDvNlFkVHD5IoEsLbTdIeJsHiB4HZJyJZVo"
+    "JEKcVkVALfGkTyDqPdPVGuQyGfSmVJImVkUWA5A5GuN7UWRyRyTyCvOZDzGwJKTKNxNxHIA1"
+    "ETTNE8OtFGSLRgGjPgOpS4R3NYGOSCElO3JeKAPePdFrVfQvQZTSERTpNWNNR3OpPWJIARI4"
+    "GzKtHCQ6N1HHPVKHSINyA/HCHCVKHLSvVQToUqH4S+BAT0N1SXBLHPTBQJGwV1PIPIEgF0JW"
+    "TBKnSJUbSUEwFrGhITUWO3UmFGF0TmJFB5I7PoAHOcHCS2GlPoJGJUJGKrU3SWETJqFtJESP"
+    "TyDdHBTtRbJrElAUGQAXM9LfJqTtUgE8AXAoGhMqQdFyHTH+R0EZRGUWGhITHCHOSPUgSWTB"
+    "FYJEJIHHJFPeQ6F1O+GuHuHCTqNqJZNNVoEpIeB4FkLbLfDvHZPVPdVfEwDzA1B5QyR3RyOt"
+    "ETNxE8GwN7HLA5O3ARNNQZFrTSMWHHI4A/S+BAKHKtToR1SIF0PIJWV1GlFGJFUmFsLkTcE6"
+    "JGHfBRTLE7DvG/E0OeFFPdE0KvAnT2U9GlNnE5AeR4HHPdT0E4TRHsHsMrGrU5AnTLTDU8Ek"
+    "E0R4MHDVFOOcJZKrE6RfKsJGA6VAFOT2C1N2SYCMDZHjTTFhVCT0TMT0TDRAT0Q2TjEGSCEZ"
+    "FlAHU9TLGXSYHEJUVJTNQyGbJ4OcK6FOOOHOSvVFCMJ4GXLfESJuHEHCROGrRgBSSDHoT0BM"
+    "HvHvA1SHHvHkRNHZQyERERIXGjSEPVIqHRMUJsMqPmE6AIVcMmNnNVApDvJsOBHHHkRQTDT2"
+    "NNJETYVVIGEPIePZNNHZTdTdHZVfIoD5NMCwFXHjHsTdV1G/PpTjCPKnOZAINxQyGjQyETHS"
+    "KOE6CvROTKGQT3MtIeKTGjTjCnSFHkD5BfEmGRTjT3SPR8PdGRCaQmSMOpJeHAFiHHQSGGC1"
+    "C1TdTUTLG/JGQ2ILQxQxTdROKASYFLQ2CFHARTU1ARTTTaMHCPVAJgToJ5A4PyVcTySDHsTf"
+    "QyP9HOTdGnA4TjQJGwEhHOJQTLFLHiSQSQROKEV1T0TjJsRTSQS9TdMsCbJ2SHTbG/UTTyUm"
+    "TYTNMsLsGlKgTjKbDpT8T0I8BSJqGRJiPyT8TjFtN2JEJuLkHfG/T2KvPdMHTDBfAnU5FhD5"
+    "JqTDSYTMJZCMN2T2S9RfP9VAEZFlSvGXVFFOJuGbSDBMJEHoFjERT0SQQySEOBKnAIIeApMm"
+    "NVCwFXT2QJGjGQETFjNxC1KTSFTdTUR8JeHATdHHGRTaTjU1JgJQHOHiT0JsGsUmTjGlKbFt"
+    "PyJrHWJZHISQDLHIHITJDLJsTsC8HBMaC8MaVMHuVLHHKgKgTzJeCFHuJWLbNNJsHiHuHZJG"
+    "SUSQHDKgJGPUUqJWHZNNJZTJC8KFKFGQB/E5KlKlE5McN4N1K6E5SSIoN1KlCQExE5N1KlJ/"
+    "KSK1GzKgVoL+EuGwGwHWFuQ1RLGbGoIZGbPoJELfCMGSGSTdNWDYSKRaK3K3NWDVCcTuDtTa"
+    "SMTKN1KUTKNrT8JEDbEABdTITJTKDYALU4DVBdTaKTUoTKEAJqU/EvE6E7KkKtT3C+N4B+Ri"
+    "VJU9KbARBARfA4T3B+RfD2KiLGD2VfFjFjD5EuQqT2MqB4FLNPT2QlQuPoPoEuEsR4AVDvRf"
+    "VCN2PZPeTvPeRDSDHkHZG5HkTKRNP9SHSSTKI7A2TUNyGDSFSFGeSgETUeSyR+UeL1LONNUi"
+    "HCVfG/G/NNG/COCHCHGQTETfSgAlUTSgBxCMTKHlQ6JZJZCZN7SgIDLoHiTTCzT/TzCbTcLb"
+    "UTVoN3T/TKMIETSBTdC0VoDsCbHYTGCOCHGQTfHlJZAlQ6VfIDTzCzN3SBJiMWFaMWTKJiJj"
+    "FaH1DPJZDPJiFaH1FyNxBAFyT8CsGQHsSeT0AAAAAAAAUmAARwAAAAAAVpAAAAAAAAPjAAAA"
+    "AAAAAAJuAAAAAAAAAAAAAAPHJLAAAAU6AAAAAAAAJLFKQZKFAAAAAAAAFODXAAAAAAAAAAAA"
+    "AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAATQ2LcAAAAGEAUI0RhD5VAIvALRhKiKFBTHDAAIxSp"
+    )
+
+TRADITIONAL = (
+    u"㑯㑳㑶㓨㘚㜄㜏㠏㥮㩜㩳㩵䁻䃮䊷䋙䋚䋹䋻䍦䎱䙡䜀䝼䥇䥑䥱䦛䦟䯀䰾䱷䱽䲁䲘䴉丟並乾亂亙亞佇佈佔併來侖侶侷俁係俔俠俥俬倀倆倈倉個們倖倫倲偉偑側偵偽傌傑"
+    u"傖傘備傢傭傯傳傴債傷傾僂僅僉僑僕僞僥僨僱價儀儁儂億儈儉儎儐儔儕儘償優儲儷儸儺儻儼兇兌兒兗內兩冊冑冪凈凍凜凱別刪剄則剋剎剗剛剝剮剴創剷劃劇劉劊劌劍"
+    u"劏劑劚勁動務勛勝勞勢勩勱勳勵勸勻匭匯匱區協卹卻卽厙厠厤厭厲厴參叄叢吒吳吶呂咼員唄唸問啓啞啟啢喎喚喪喫喬單喲嗆嗇嗊嗎嗚嗩嗶嘆嘍嘓嘔嘖嘗嘜嘩嘮嘯嘰嘵"
+    u"嘸嘽噁噓噚噝噠噥噦噯噲噴噸噹嚀嚇嚌嚐嚕嚙嚥嚦嚨嚮嚲嚳嚴嚶囀囁囂囅囈囉囌囑囪圇國圍園圓圖團垻埡埰執堅堊堖堝堯報場塊塋塏塒塗塚塢塤塵塹墊墜墮墰墳墶墻"
+    u"墾壇壋壎壓壘壙壚壜壞壟壠壢壩壪壯壺壼壽夠夢夥夾奐奧奩奪奬奮奼妝姍姦娛婁婦婭媧媯媰媼媽嫋嫗嫵嫺嫻嫿嬀嬃嬈嬋嬌嬙嬡嬤嬪嬰嬸孃孋孌孫學孿宮寀寢實寧審寫"
+    u"寬寵寶將專尋對導尷屆屍屓屜屢層屨屬岡峯峴島峽崍崑崗崙崢崬嵐嵗嵾嶁嶄嶇嶔嶗嶠嶢嶧嶨嶮嶸嶺嶼嶽巋巒巔巖巰巹帥師帳帶幀幃幓幗幘幟幣幫幬幹幾庫廁廂廄廈廎"
+    u"廕廚廝廟廠廡廢廣廩廬廳弒弔弳張強彆彈彌彎彔彙彠彥彫彲彿後徑從徠復徵徹恆恥悅悞悵悶悽惡惱惲惻愛愜愨愴愷愾慄態慍慘慚慟慣慤慪慫慮慳慶慺慼慾憂憊憐憑憒"
+    u"憖憚憤憫憮憲憶懇應懌懍懞懟懣懤懨懲懶懷懸懺懼懾戀戇戔戧戩戰戱戲戶拋挩挱挾捨捫捱捲掃掄掆掗掙掛採揀揚換揮揯損搖搗搵搶摑摜摟摯摳摶摺摻撈撏撐撓撝撟撣"
+    u"撥撫撲撳撻撾撿擁擄擇擊擋擓擔據擠擣擬擯擰擱擲擴擷擺擻擼擽擾攄攆攏攔攖攙攛攜攝攢攣攤攪攬敎敓敗敘敵數斂斃斆斕斬斷於旂旣昇時晉晝暈暉暘暢暫曄曆曇曉曏"
+    u"曖曠曨曬書會朧朮東枴柵柺査桿梔梘條梟梲棄棊棖棗棟棡棧棲棶椏椲楊楓楨業極榘榦榪榮榲榿構槍槓槤槧槨槮槳槶槼樁樂樅樑樓標樞樢樣樧樫樳樸樹樺樿橈橋機橢橫"
+    u"檁檉檔檜檟檢檣檮檯檳檸檻櫃櫓櫚櫛櫝櫞櫟櫥櫧櫨櫪櫫櫬櫱櫳櫸櫻欄欅權欏欒欖欞欽歎歐歟歡歲歷歸歿殘殞殤殨殫殭殮殯殰殲殺殻殼毀毆毿氂氈氌氣氫氬氳氾汎汙決"
+    u"沒沖況泝洩洶浹涇涗涼淒淚淥淨淩淪淵淶淺渙減渢渦測渾湊湞湧湯溈準溝溫溮溳溼滄滅滌滎滙滬滯滲滷滸滻滾滿漁漊漚漢漣漬漲漵漸漿潁潑潔潙潚潛潤潯潰潷潿澀澆"
+    u"澇澐澗澠澤澦澩澮澱澾濁濃濄濕濘濚濛濜濟濤濧濫濰濱濺濼濾瀂瀅瀆瀇瀉瀋瀏瀕瀘瀝瀟瀠瀦瀧瀨瀰瀲瀾灃灄灑灕灘灝灡灣灤灧灩災為烏烴無煉煒煙煢煥煩煬煱熅熒熗"
+    u"熱熲熾燁燈燉燒燙燜營燦燬燭燴燶燻燼燾爍爐爛爭爲爺爾牀牆牘牽犖犛犢犧狀狹狽猙猶猻獁獃獄獅獎獨獪獫獮獰獱獲獵獷獸獺獻獼玀現琱琺琿瑋瑒瑣瑤瑩瑪瑲璉璡璣"
+    u"璦璫璯環璵璸璽璿瓊瓏瓔瓚甌甕產産甦甯畝畢畫異畵當疇疊痙痠痾瘂瘋瘍瘓瘞瘡瘧瘮瘲瘺瘻療癆癇癉癒癘癟癡癢癤癥癧癩癬癭癮癰癱癲發皁皚皰皸皺盃盜盞盡監盤盧"
+    u"盪眞眥眾睏睜睞瞘瞜瞞瞶瞼矇矓矚矯硃硜硤硨硯碕碩碭碸確碼碽磑磚磠磣磧磯磽磾礄礆礎礙礦礪礫礬礱祕祿禍禎禕禡禦禪禮禰禱禿秈稅稈稏稜稟種稱穀穇穌積穎穠穡"
+    u"穢穩穫穭窩窪窮窯窵窶窺竄竅竇竈竊竪競筆筍筧筴箇箋箏節範築篋篔篠篤篩篳簀簍簑簞簡簣簫簹簽簾籃籌籔籙籛籜籟籠籤籩籪籬籮籲粵糉糝糞糧糰糲糴糶糹糾紀紂約"
+    u"紅紆紇紈紉紋納紐紓純紕紖紗紘紙級紛紜紝紡紬紮細紱紲紳紵紹紺紼紿絀終絃組絅絆絎結絕絛絝絞絡絢給絨絰統絲絳絶絹綁綃綆綈綉綌綏綐綑經綜綞綠綢綣綫綬維綯"
+    u"綰綱網綳綴綵綸綹綺綻綽綾綿緄緇緊緋緑緒緓緔緗緘緙線緝緞締緡緣緦編緩緬緯緱緲練緶緹緻緼縈縉縊縋縐縑縕縗縛縝縞縟縣縧縫縭縮縱縲縳縴縵縶縷縹總績繃繅繆"
+    u"繒織繕繚繞繡繢繩繪繫繭繮繯繰繳繸繹繼繽繾繿纇纈纊續纍纏纓纔纖纘纜缽罃罈罌罎罰罵罷羅羆羈羋羣羥羨義羶習翫翬翹翽耬耮聖聞聯聰聲聳聵聶職聹聽聾肅脅脈脛"
+    u"脣脩脫脹腎腖腡腦腫腳腸膃膕膚膞膠膩膽膾膿臉臍臏臘臚臟臠臢臥臨臺與興舉舊舘艙艤艦艫艱艷芻苧茲荊莊莖莢莧華菴菸萇萊萬萴萵葉葒葤葦葯葷蒐蒓蒔蒕蒞蒼蓀蓆"
+    u"蓋蓮蓯蓴蓽蔔蔘蔞蔣蔥蔦蔭蕁蕆蕎蕒蕓蕕蕘蕢蕩蕪蕭蕷薀薈薊薌薑薔薘薟薦薩薳薴薵薹薺藍藎藝藥藪藭藴藶藹藺蘀蘄蘆蘇蘊蘋蘚蘞蘢蘭蘺蘿虆處虛虜號虧虯蛺蛻蜆蝕"
+    u"蝟蝦蝨蝸螄螞螢螮螻螿蟄蟈蟎蟣蟬蟯蟲蟶蟻蠁蠅蠆蠍蠐蠑蠔蠟蠣蠨蠱蠶蠻衆衊術衕衚衛衝袞裊裏補裝裡製複褌褘褲褳褸褻襇襉襏襖襝襠襤襪襬襯襲襴覈見覎規覓視覘"
+    u"覡覥覦親覬覯覲覷覺覽覿觀觴觶觸訁訂訃計訊訌討訐訒訓訕訖託記訛訝訟訢訣訥訩訪設許訴訶診註証詁詆詎詐詒詔評詖詗詘詛詞詠詡詢詣試詩詫詬詭詮詰話該詳詵詼"
+    u"詿誄誅誆誇誌認誑誒誕誘誚語誠誡誣誤誥誦誨說説誰課誶誹誼誾調諂諄談諉請諍諏諑諒論諗諛諜諝諞諡諢諤諦諧諫諭諮諱諳諶諷諸諺諼諾謀謁謂謄謅謊謎謐謔謖謗謙"
+    u"謚講謝謠謡謨謫謬謭謳謹謾譁證譎譏譖識譙譚譜譟譫譭譯議譴護譸譽譾讀讅變讋讌讎讒讓讕讖讚讜讞豈豎豐豔豬豶貓貙貝貞貟負財貢貧貨販貪貫責貯貰貲貳貴貶買貸"
+    u"貺費貼貽貿賀賁賂賃賄賅資賈賊賑賒賓賕賙賚賜賞賠賡賢賣賤賦賧質賫賬賭賰賴賵賺賻購賽賾贄贅贇贈贊贋贍贏贐贓贔贖贗贛贜赬趕趙趨趲跡踐踰踴蹌蹕蹟蹠蹣蹤蹺"
+    u"躂躉躊躋躍躎躑躒躓躕躚躡躥躦躪軀車軋軌軍軑軒軔軛軟軤軫軲軸軹軺軻軼軾較輅輇輈載輊輒輓輔輕輛輜輝輞輟輥輦輩輪輬輯輳輸輻輼輾輿轀轂轄轅轆轉轍轎轔轟轡"
+    u"轢轤辦辭辮辯農迴逕這連週進遊運過達違遙遜遞遠遡適遲遷選遺遼邁還邇邊邏邐郟郵鄆鄉鄒鄔鄖鄧鄭鄰鄲鄴鄶鄺酇酈醃醖醜醞醟醣醫醬醱釀釁釃釅釋釐釒釓釔釕釗釘"
+    u"釙針釣釤釦釧釩釵釷釹釺釾鈀鈁鈃鈄鈅鈈鈉鈍鈎鈐鈑鈒鈔鈕鈞鈡鈣鈥鈦鈧鈮鈰鈳鈴鈷鈸鈹鈺鈽鈾鈿鉀鉅鉆鉈鉉鉋鉍鉑鉕鉗鉚鉛鉞鉢鉤鉦鉬鉭鉳鉶鉸鉺鉻鉿銀銃銅銍銑"
+    u"銓銖銘銚銛銜銠銣銥銦銨銩銪銫銬銱銳銷銹銻銼鋁鋃鋅鋇鋌鋏鋒鋙鋝鋟鋣鋤鋥鋦鋨鋩鋪鋭鋮鋯鋰鋱鋶鋸鋼錁錄錆錇錈錏錐錒錕錘錙錚錛錟錠錡錢錦錨錩錫錮錯録錳錶"
+    u"錸錼鍀鍁鍃鍅鍆鍇鍈鍊鍋鍍鍔鍘鍚鍛鍠鍤鍥鍩鍬鍰鍵鍶鍺鍼鍾鎂鎄鎇鎊鎌鎔鎖鎘鎚鎛鎡鎢鎣鎦鎧鎩鎪鎬鎭鎮鎰鎲鎳鎵鎶鎸鎿鏃鏇鏈鏌鏍鏐鏑鏗鏘鏜鏝鏞鏟鏡鏢鏤鏨鏰"
+    u"鏵鏷鏹鏺鏽鐃鐋鐐鐒鐓鐔鐘鐙鐝鐠鐥鐦鐧鐨鐫鐮鐯鐲鐳鐵鐶鐸鐺鐿鑄鑊鑌鑑鑒鑔鑕鑞鑠鑣鑥鑭鑰鑱鑲鑷鑹鑼鑽鑾鑿钁钂長門閂閃閆閈閉開閌閎閏閑閒間閔閘閡閣閤閥"
+    u"閨閩閫閬閭閱閲閶閹閻閼閽閾閿闃闆闇闈闊闋闌闍闐闒闓闔闕闖關闞闠闡闢闤闥陘陝陞陣陰陳陸陽隉隊階隕際隨險隯隱隴隸隻雋雖雙雛雜雞離難雲電霑霢霧霽靂靄靆"
+    u"靈靉靚靜靝靦靨鞏鞝鞦鞽韁韃韆韉韋韌韍韓韙韜韝韞韻響頁頂頃項順頇須頊頌頎頏預頑頒頓頗領頜頡頤頦頭頮頰頲頴頷頸頹頻頽顆題額顎顏顒顓顔願顙顛類顢顥顧顫"
+    u"顬顯顰顱顳顴風颭颮颯颱颳颶颸颺颻颼飀飄飆飈飛飠飢飣飥飩飪飫飭飯飱飲飴飼飽飾飿餃餄餅餈餉養餌餎餏餑餒餓餕餖餘餚餛餜餞餡館餬餱餳餵餶餷餺餼餾餿饁饃饅"
+    u"饈饉饊饋饌饑饒饗饜饞饢馬馭馮馱馳馴馹駁駐駑駒駔駕駘駙駛駝駟駡駢駭駰駱駸駿騁騂騅騌騍騎騏騖騙騤騧騫騭騮騰騶騷騸騾驀驁驂驃驄驅驊驌驍驏驕驗驚驛驟驢驤"
+    u"驥驦驪驫骯髏髒體髕髖髮鬆鬍鬚鬢鬥鬧鬨鬩鬮鬱鬹魎魘魚魛魢魨魯魴魷魺鮁鮃鮊鮋鮍鮎鮐鮑鮒鮓鮚鮜鮝鮞鮣鮦鮪鮫鮭鮮鮳鮶鮺鯀鯁鯇鯉鯊鯒鯔鯕鯖鯗鯛鯝鯡鯢鯤鯧鯨"
+    u"鯪鯫鯰鯴鯷鯽鯿鰁鰂鰃鰆鰈鰉鰌鰍鰏鰐鰒鰓鰛鰜鰟鰠鰣鰥鰧鰨鰩鰭鰮鰱鰲鰳鰵鰷鰹鰺鰻鰼鰾鱂鱅鱈鱉鱒鱔鱖鱗鱘鱝鱟鱠鱣鱤鱧鱨鱭鱯鱷鱸鱺鳥鳧鳩鳬鳲鳳鳴鳶鳾鴆鴇"
+    u"鴉鴒鴕鴛鴝鴞鴟鴣鴦鴨鴯鴰鴴鴷鴻鴿鵁鵂鵃鵐鵑鵒鵓鵜鵝鵠鵡鵪鵬鵮鵯鵰鵲鵷鵾鶄鶇鶉鶊鶓鶖鶘鶚鶡鶥鶩鶪鶬鶯鶲鶴鶹鶺鶻鶼鶿鷀鷁鷂鷄鷉鷊鷓鷖鷗鷙鷚鷥鷦鷫鷯鷲"
+    u"鷳鷴鷸鷹鷺鷽鸂鸇鸊鸌鸏鸕鸘鸚鸛鸝鸞鹵鹹鹺鹼鹽麗麥麩麪麫麯麴麵麼麽黃黌點黨黲黴黶黷黽黿鼂鼉鼕鼴齊齋齎齏齒齔齕齗齙齜齟齠齡齣齦齧齪齬齲齶齷龍龎龐龑龔"
+    u"龕龜鿁鿓"
+    )
+
+SIMPLIFIED = (
+    u"㑔㑇㐹刾㘎㚯㛣㟆㤘㨫㧐擜䀥鿎䌶䌺䌻䌿䌾䍠䎬䙌䜧䞍䦂鿏䥾䦶䦷䯅鲃䲣䲝鳚鳤鹮丢并干乱亘亚伫布占并来仑侣局俣系伣侠伡私伥俩俫仓个们幸伦㑈伟㐽侧侦伪㐷杰"
+    u"伧伞备家佣偬传伛债伤倾偻仅佥侨仆伪侥偾雇价仪俊侬亿侩俭傤傧俦侪尽偿优储俪㑩傩傥俨凶兑儿兖内两册胄幂净冻凛凯别删刭则克刹刬刚剥剐剀创铲划剧刘刽刿剑"
+    u"㓥剂㔉劲动务勋胜劳势勚劢勋励劝匀匦汇匮区协恤却即厍厕历厌厉厣参叁丛咤吴呐吕呙员呗念问启哑启唡㖞唤丧吃乔单哟呛啬唝吗呜唢哔叹喽啯呕啧尝唛哗唠啸叽哓"
+    u"呒啴恶嘘㖊咝哒哝哕嗳哙喷吨当咛吓哜尝噜啮咽呖咙向亸喾严嘤啭嗫嚣冁呓啰苏嘱囱囵国围园圆图团坝垭采执坚垩垴埚尧报场块茔垲埘涂冢坞埙尘堑垫坠堕坛坟垯墙"
+    u"垦坛垱埙压垒圹垆坛坏垄垅坜坝塆壮壶壸寿够梦伙夹奂奥奁夺奖奋姹妆姗奸娱娄妇娅娲妫㛀媪妈袅妪妩娴娴婳妫媭娆婵娇嫱嫒嬷嫔婴婶娘㛤娈孙学孪宫采寝实宁审写"
+    u"宽宠宝将专寻对导尴届尸屃屉屡层屦属冈峰岘岛峡崃昆岗仑峥岽岚岁㟥嵝崭岖嵚崂峤峣峄峃崄嵘岭屿岳岿峦巅岩巯卺帅师帐带帧帏㡎帼帻帜币帮帱干几库厕厢厩厦庼"
+    u"荫厨厮庙厂庑废广廪庐厅弑吊弪张强别弹弥弯录汇彟彦雕彨佛后径从徕复征彻恒耻悦悮怅闷凄恶恼恽恻爱惬悫怆恺忾栗态愠惨惭恸惯悫怄怂虑悭庆㥪戚欲忧惫怜凭愦"
+    u"慭惮愤悯怃宪忆恳应怿懔蒙怼懑㤽恹惩懒怀悬忏惧慑恋戆戋戗戬战戯戏户抛捝挲挟舍扪挨卷扫抡㧏挜挣挂采拣扬换挥搄损摇捣揾抢掴掼搂挚抠抟折掺捞挦撑挠㧑挢掸"
+    u"拨抚扑揿挞挝捡拥掳择击挡㧟担据挤捣拟摈拧搁掷扩撷摆擞撸㧰扰摅撵拢拦撄搀撺携摄攒挛摊搅揽教敚败叙敌数敛毙敩斓斩断于旗既升时晋昼晕晖旸畅暂晔历昙晓向"
+    u"暧旷昽晒书会胧术东拐栅拐查杆栀枧条枭棁弃棋枨枣栋㭎栈栖梾桠㭏杨枫桢业极矩干杩荣榅桤构枪杠梿椠椁椮桨椢椝桩乐枞梁楼标枢㭤样榝㭴桪朴树桦椫桡桥机椭横"
+    u"檩柽档桧槚检樯梼台槟柠槛柜橹榈栉椟橼栎橱槠栌枥橥榇蘖栊榉樱栏榉权椤栾榄棂钦叹欧欤欢岁历归殁残殒殇㱮殚僵殓殡㱩歼杀壳壳毁殴毵牦毡氇气氢氩氲泛泛污决"
+    u"没冲况溯泄汹浃泾涚凉凄泪渌净凌沦渊涞浅涣减沨涡测浑凑浈涌汤沩准沟温浉涢湿沧灭涤荥汇沪滞渗卤浒浐滚满渔溇沤汉涟渍涨溆渐浆颍泼洁沩㴋潜润浔溃滗涠涩浇"
+    u"涝沄涧渑泽滪泶浍淀㳠浊浓㳡湿泞溁蒙浕济涛㳔滥潍滨溅泺滤澛滢渎㲿泻沈浏濒泸沥潇潆潴泷濑弥潋澜沣滠洒漓滩灏㳕湾滦滟滟灾为乌烃无炼炜烟茕焕烦炀㶽煴荧炝"
+    u"热颎炽烨灯炖烧烫焖营灿毁烛烩㶶熏烬焘烁炉烂争为爷尔床墙牍牵荦牦犊牺状狭狈狰犹狲犸呆狱狮奖独狯猃狝狞㺍获猎犷兽獭献猕猡现雕珐珲玮玚琐瑶莹玛玱琏琎玑"
+    u"瑷珰㻅环玙瑸玺璇琼珑璎瓒瓯瓮产产苏宁亩毕画异画当畴叠痉酸疴痖疯疡痪瘗疮疟瘆疭瘘瘘疗痨痫瘅愈疠瘪痴痒疖症疬癞癣瘿瘾痈瘫癫发皂皑疱皲皱杯盗盏尽监盘卢"
+    u"荡真眦众困睁睐眍䁖瞒瞆睑蒙眬瞩矫朱硁硖砗砚埼硕砀砜确码䂵硙砖硵碜碛矶硗䃅硚硷础碍矿砺砾矾砻秘禄祸祯祎祃御禅礼祢祷秃籼税秆䅉棱禀种称谷䅟稣积颖秾穑"
+    u"秽稳获穞窝洼穷窑窎窭窥窜窍窦灶窃竖竞笔笋笕䇲个笺筝节范筑箧筼筿笃筛筚箦篓蓑箪简篑箫筜签帘篮筹䉤箓篯箨籁笼签笾簖篱箩吁粤粽糁粪粮团粝籴粜纟纠纪纣约"
+    u"红纡纥纨纫纹纳纽纾纯纰纼纱纮纸级纷纭纴纺䌷扎细绂绁绅纻绍绀绋绐绌终弦组䌹绊绗结绝绦绔绞络绚给绒绖统丝绛绝绢绑绡绠绨绣绤绥䌼捆经综缍绿绸绻线绶维绹"
+    u"绾纲网绷缀彩纶绺绮绽绰绫绵绲缁紧绯绿绪绬绱缃缄缂线缉缎缔缗缘缌编缓缅纬缑缈练缏缇致缊萦缙缢缒绉缣缊缞缚缜缟缛县绦缝缡缩纵缧䌸纤缦絷缕缥总绩绷缫缪"
+    u"缯织缮缭绕绣缋绳绘系茧缰缳缲缴䍁绎继缤缱䍀颣缬纩续累缠缨才纤缵缆钵䓨坛罂坛罚骂罢罗罴羁芈群羟羡义膻习玩翚翘翙耧耢圣闻联聪声耸聩聂职聍听聋肃胁脉胫"
+    u"唇修脱胀肾胨脶脑肿脚肠腽腘肤䏝胶腻胆脍脓脸脐膑腊胪脏脔臜卧临台与兴举旧馆舱舣舰舻艰艳刍苎兹荆庄茎荚苋华庵烟苌莱万荝莴叶荭荮苇药荤搜莼莳蒀莅苍荪席"
+    u"盖莲苁莼荜卜参蒌蒋葱茑荫荨蒇荞荬芸莸荛蒉荡芜萧蓣蕰荟蓟芗姜蔷荙莶荐萨䓕苧䓓苔荠蓝荩艺药薮䓖蕴苈蔼蔺萚蕲芦苏蕴苹藓蔹茏兰蓠萝蔂处虚虏号亏虬蛱蜕蚬蚀"
+    u"猬虾虱蜗蛳蚂萤䗖蝼螀蛰蝈螨虮蝉蛲虫蛏蚁蚃蝇虿蝎蛴蝾蚝蜡蛎蟏蛊蚕蛮众蔑术同胡卫冲衮袅里补装里制复裈袆裤裢褛亵裥裥袯袄裣裆褴袜摆衬袭襕核见觃规觅视觇"
+    u"觋觍觎亲觊觏觐觑觉览觌观觞觯触讠订讣计讯讧讨讦讱训讪讫托记讹讶讼䜣诀讷讻访设许诉诃诊注证诂诋讵诈诒诏评诐诇诎诅词咏诩询诣试诗诧诟诡诠诘话该详诜诙"
+    u"诖诔诛诓夸志认诳诶诞诱诮语诚诫诬误诰诵诲说说谁课谇诽谊訚调谄谆谈诿请诤诹诼谅论谂谀谍谞谝谥诨谔谛谐谏谕咨讳谙谌讽诸谚谖诺谋谒谓誊诌谎谜谧谑谡谤谦"
+    u"谥讲谢谣谣谟谪谬谫讴谨谩哗证谲讥谮识谯谭谱噪谵毁译议谴护诪誉谫读谉变詟䜩雠谗让谰谶赞谠谳岂竖丰艳猪豮猫䝙贝贞贠负财贡贫货贩贪贯责贮贳赀贰贵贬买贷"
+    u"贶费贴贻贸贺贲赂赁贿赅资贾贼赈赊宾赇赒赉赐赏赔赓贤卖贱赋赕质赍账赌䞐赖赗赚赙购赛赜贽赘赟赠赞赝赡赢赆赃赑赎赝赣赃赪赶赵趋趱迹践逾踊跄跸迹跖蹒踪跷"
+    u"跶趸踌跻跃䟢踯跞踬蹰跹蹑蹿躜躏躯车轧轨军轪轩轫轭软轷轸轱轴轵轺轲轶轼较辂辁辀载轾辄挽辅轻辆辎辉辋辍辊辇辈轮辌辑辏输辐辒辗舆辒毂辖辕辘转辙轿辚轰辔"
+    u"轹轳办辞辫辩农回迳这连周进游运过达违遥逊递远溯适迟迁选遗辽迈还迩边逻逦郏邮郓乡邹邬郧邓郑邻郸邺郐邝酂郦腌酝丑酝蒏糖医酱酦酿衅酾酽释厘钅钆钇钌钊钉"
+    u"钋针钓钐扣钏钒钗钍钕钎䥺钯钫钘钭钥钚钠钝钩钤钣钑钞钮钧钟钙钬钛钪铌铈钶铃钴钹铍钰钸铀钿钾巨钻铊铉铇铋铂钷钳铆铅钺钵钩钲钼钽锫铏铰铒铬铪银铳铜铚铣"
+    u"铨铢铭铫铦衔铑铷铱铟铵铥铕铯铐铞锐销锈锑锉铝锒锌钡铤铗锋铻锊锓铘锄锃锔锇铓铺锐铖锆锂铽锍锯钢锞录锖锫锩铔锥锕锟锤锱铮锛锬锭锜钱锦锚锠锡锢错录锰表"
+    u"铼镎锝锨锪钫钔锴锳炼锅镀锷铡钖锻锽锸锲锘锹锾键锶锗针钟镁锿镅镑镰镕锁镉锤镈镃钨蓥镏铠铩锼镐镇镇镒镋镍镓鿔镌镎镞旋链镆镙镠镝铿锵镗镘镛铲镜镖镂錾镚"
+    u"铧镤镪䥽锈铙铴镣铹镦镡钟镫镢镨䦅锎锏镄镌镰䦃镯镭铁镮铎铛镱铸镬镔鉴鉴镲锧镴铄镳镥镧钥镵镶镊镩锣钻銮凿镢镋长门闩闪闫闬闭开闶闳闰闲闲间闵闸阂阁合阀"
+    u"闺闽阃阆闾阅阅阊阉阎阏阍阈阌阒板暗闱阔阕阑阇阗阘闿阖阙闯关阚阓阐辟阛闼陉陕升阵阴陈陆阳陧队阶陨际随险陦隐陇隶只隽虽双雏杂鸡离难云电沾霡雾霁雳霭叇"
+    u"灵叆靓静靔腼靥巩绱秋鞒缰鞑千鞯韦韧韨韩韪韬鞲韫韵响页顶顷项顺顸须顼颂颀颃预顽颁顿颇领颌颉颐颏头颒颊颋颕颔颈颓频颓颗题额颚颜颙颛颜愿颡颠类颟颢顾颤"
+    u"颥显颦颅颞颧风飐飑飒台刮飓飔飏飖飕飗飘飙飚飞饣饥饤饦饨饪饫饬饭飧饮饴饲饱饰饳饺饸饼糍饷养饵饹饻饽馁饿馂饾余肴馄馃饯馅馆糊糇饧喂馉馇馎饩馏馊馌馍馒"
+    u"馐馑馓馈馔饥饶飨餍馋馕马驭冯驮驰驯驲驳驻驽驹驵驾骀驸驶驼驷骂骈骇骃骆骎骏骋骍骓骔骒骑骐骛骗骙䯄骞骘骝腾驺骚骟骡蓦骜骖骠骢驱骅骕骁骣骄验惊驿骤驴骧"
+    u"骥骦骊骉肮髅脏体髌髋发松胡须鬓斗闹哄阋阄郁鬶魉魇鱼鱽鱾鲀鲁鲂鱿鲄鲅鲆鲌鲉鲏鲇鲐鲍鲋鲊鲒鲘鲞鲕䲟鲖鲔鲛鲑鲜鲓鲪鲝鲧鲠鲩鲤鲨鲬鲻鲯鲭鲞鲷鲴鲱鲵鲲鲳鲸"
+    u"鲮鲰鲶鲺鳀鲫鳊鳈鲗鳂䲠鲽鳇䲡鳅鲾鳄鳆鳃鳁鳒鳑鳋鲥鳏䲢鳎鳐鳍鳁鲢鳌鳓鳘鲦鲣鲹鳗鳛鳔鳉鳙鳕鳖鳟鳝鳜鳞鲟鲼鲎鲙鳣鳡鳢鲿鲚鳠鳄鲈鲡鸟凫鸠凫鸤凤鸣鸢䴓鸩鸨"
+    u"鸦鸰鸵鸳鸲鸮鸱鸪鸯鸭鸸鸹鸻䴕鸿鸽䴔鸺鸼鹀鹃鹆鹁鹈鹅鹄鹉鹌鹏鹐鹎雕鹊鹓鹍䴖鸫鹑鹒鹋鹙鹕鹗鹖鹛鹜䴗鸧莺鹟鹤鹠鹡鹘鹣鹚鹚鹢鹞鸡䴘鹝鹧鹥鸥鸷鹨鸶鹪鹔鹩鹫"
+    u"鹇鹇鹬鹰鹭鸴㶉鹯䴙鹱鹲鸬鹴鹦鹳鹂鸾卤咸鹾碱盐丽麦麸面面曲曲面么么黄黉点党黪霉黡黩黾鼋鼌鼍冬鼹齐斋赍齑齿龀龁龂龅龇龃龆龄出龈啮龊龉龋腭龌龙厐庞䶮龚"
+    u"龛龟䜤鿒"
+    )
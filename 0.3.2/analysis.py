@@ -0,0 +1,488 @@
+# Copyright (C) 2008-2010 Adam Olsen
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 675 Mass Ave, Cambridge, MA 02139, USA.
+#
+#
+# The developers of the Exaile media player hereby grant permission
+# for non-GPL compatible GStreamer and Exaile plugins to be used and
+# distributed together with GStreamer and Exaile. This permission is
+# above and beyond the permissions granted by the GPL license by which
+# Exaile is covered. If you modify this code, you may extend this
+# exception to your version of the code, but you are not obligated to
+# do so. If you do not wish to do so, delete this exception statement
+# from your version.
+
+"""
+    Offline analysis of the decoded audio of local files.
+
+    Tracks are decoded in helper processes (see analysisworker.py),
+    away from the GIL and the streaming threads of the player, and the
+    results are cached per uri and modification time. Every analysis a
+    file still lacks is run over the same decode, so it is decoded only
+    once. The number of processes is ``player/analysis_workers``.
+
+    There are three analyses: where the audio of a track starts and
+    ends (SILENCE), how loud it is (LOUDNESS) and an overview of its
+    waveform for the progress bar (WAVEFORM). The loudness is turned
+    into a ReplayGain style gain, stored in the ``__loudness_gain`` and
+    ``__loudness_peak`` tags, which the engines apply through their
+    volume elements, see get_gain().
+
+    Playback only looks results up, it never asks for an analysis.
+    The collection is scanned once Exaile has loaded, in the idle
+    time of the main loop: for silence with ``player/trim_silence``
+    set and for loudness with ``player/loudness_scan``. Only the
+    waveform of the track shown in the progress bar is analysed on
+    demand.
+
+    Needs NumPy. Without it nothing gets analysed, and every lookup
+    comes back empty.
+"""
+
+import cPickle as pickle
+import logging
+import os
+import Queue
+import subprocess
+import sys
+import threading
+import time
+
+import gio
+import glib
+
+from xl import common, event, settings, xdg
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+logger = logging.getLogger(__name__)
+
+
+def get_mtime(uri):
+    """
+        Returns the modification time of a local uri, or None.
+    """
+    path = gio.File(uri).get_path()
+    if not path:
+        return None
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return None
+
+
+class AnalysisCache(object):
+    """
+        Analysis results of up to `maxentries` files, saved to `path`.
+    """
+    def __init__(self, path, maxentries=20000):
+        self.path = path
+        self.maxentries = maxentries
+        self._lock = threading.Lock()
+        self._results = {}
+        self._dirty = False
+        self._save_id = 0
+        self.load()
+
+    def load(self):
+        try:
+            f = open(self.path, 'rb')
+        except IOError:
+            return
+        try:
+            try:
+                self._results = pickle.load(f)
+            except Exception:
+                logger.warning("Discarding unreadable analysis cache %s" %
+                        self.path)
+                self._results = {}
+        finally:
+            f.close()
+
+    def save(self):
+        self._lock.acquire()
+        try:
+            if self._save_id:
+                glib.source_remove(self._save_id)
+                self._save_id = 0
+            if not self._dirty:
+                return False
+            results = dict(self._results)
+            self._dirty = False
+        finally:
+            self._lock.release()
+        try:
+            f = open(self.path + '.new', 'wb')
+            try:
+                pickle.dump(results, f, pickle.HIGHEST_PROTOCOL)
+            finally:
+                f.close()
+            os.rename(self.path + '.new', self.path)
+        except (IOError, OSError):
+            common.log_exception(log=logger)
+        return False
+
+    def get(self, uri, mtime):
+        """
+            Returns the result for `uri` if it was computed for the file
+            as modified at `mtime`, otherwise None.
+        """
+        self._lock.acquire()
+        try:
+            entry = self._results.get(uri)
+            if entry is None or entry[0] != mtime:
+                return None
+            return entry[2]
+        finally:
+            self._lock.release()
+
+    def set(self, uri, mtime, result):
+        self._lock.acquire()
+        try:
+            if uri not in self._results and \
+                    len(self._results) >= self.maxentries:
+                # forget the one analysed longest ago
+                oldest = min(self._results.iteritems(),
+                        key=lambda i: i[1][1])[0]
+                del self._results[oldest]
+            self._results[uri] = (mtime, time.time(), result)
+            self._dirty = True
+            if not self._save_id:
+                self._save_id = glib.timeout_add_seconds(300, self.save)
+        finally:
+            self._lock.release()
+
+
+class Analyzer(object):
+    """
+        Keeps the results of one kind of analysis. The analyses share
+        their decodes: a track queued by one is analysed for every
+        analysis that does not know it yet.
+    """
+    # tracks scan() queues per idle call
+    _SCAN_STEP = 50
+
+    def __init__(self, name, maxentries=20000):
+        """
+            :param name: name of the analysis, as understood by
+                analyze(), also names the cache file
+            :param maxentries: number of results to keep
+        """
+        self.name = name
+        self.cache = AnalysisCache(os.path.join(xdg.get_data_dirs()[0],
+            '%s.db' % name), maxentries)
+
+    def get(self, track):
+        """
+            Returns the result for `track`, or None if it was not
+            analysed yet. Failed analyses give an empty dict.
+        """
+        uri = track.get_loc_for_io()
+        mtime = get_mtime(uri)
+        if mtime is None:
+            return None
+        return self.cache.get(uri, mtime)
+
+    def add(self, track):
+        """
+            Queues `track` for analysis unless the result is known.
+        """
+        if numpy is None:
+            return
+        uri = track.get_loc_for_io()
+        mtime = get_mtime(uri)
+        if mtime is None:
+            return
+        result = self.cache.get(uri, mtime)
+        if result is not None:
+            self.apply(track, result)
+            return
+        job = _PENDING.get(uri)
+        if job is not None:
+            # the decode under way runs this analysis too
+            job[1][self] = track
+            return
+        names = [a.name for a in _ANALYZERS
+                if a is self or a.cache.get(uri, mtime) is None]
+        _PENDING[uri] = (mtime, {self: track})
+        _get_pool().apply_async(uri, names,
+                lambda results: glib.idle_add(_done, uri, mtime, results))
+
+    def wants(self, track):
+        """
+            Whether scan() should queue `track`.
+        """
+        return track.is_local()
+
+    def scan(self, tracks):
+        """
+            Queues the tracks of `tracks` that were not analysed yet,
+            a few at a time while the main loop is idle.
+        """
+        if numpy is None:
+            return
+        tracks = [track for track in tracks if self.wants(track)]
+        if tracks:
+            logger.debug("Scanning %d tracks for %s" %
+                    (len(tracks), self.name))
+            glib.idle_add(self._scan, iter(tracks),
+                    priority=glib.PRIORITY_LOW)
+
+    def _scan(self, tracks):
+        count = 0
+        for track in tracks:
+            self.add(track)
+            count += 1
+            if count == self._SCAN_STEP:
+                return True
+        return False
+
+    def pending(self):
+        """
+            Returns how many tracks are waiting to be analysed.
+        """
+        return len([job for job in _PENDING.itervalues() if self in job[1]])
+
+    def apply(self, track, result):
+        """
+            Called with every result, fresh or from the cache, for
+            subclasses to make use of.
+        """
+        pass
+
+    def _done(self, uri, mtime, result, track):
+        self.cache.set(uri, mtime, result)
+        if track is not None:
+            try:
+                self.apply(track, result)
+            except Exception:
+                common.log_exception(log=logger)
+        event.log_event('audio_analysis_done', self, uri)
+
+
+# uri -> (mtime, {analyzer: track}) of the files being analysed
+_PENDING = {}
+
+def _done(uri, mtime, results):
+    tracks = _PENDING.pop(uri, (None, {}))[1]
+    for analyzer in _ANALYZERS:
+        if analyzer.name in results:
+            analyzer._done(uri, mtime, results[analyzer.name],
+                    tracks.get(analyzer))
+    return False
+
+
+class LoudnessAnalyzer(Analyzer):
+    """
+        Stores the loudness of the tracks it analyses in their tags.
+    """
+    def apply(self, track, result):
+        if not result:
+            return
+        if track.get_tag_raw('__loudness_gain') == result['gain']:
+            return
+        track.set_tag_raw('__loudness_gain', result['gain'])
+        track.set_tag_raw('__loudness_peak', result['peak'])
+
+    def wants(self, track):
+        return track.get_tag_raw('__loudness_gain') is None and \
+                track.is_local()
+
+
+def _parse_gain(value):
+    # ReplayGain tags look like "-6.54 dB"
+    if isinstance(value, list):
+        value = value and value[0]
+    try:
+        return float(unicode(value).split()[0])
+    except (IndexError, TypeError, ValueError):
+        return None
+
+
+def get_gain(track):
+    """
+        Returns the factor to scale the volume of `track` by, from its
+        ReplayGain tags or else the loudness measured here. Without
+        either, or with ``player/replaygain`` off, it is 1.
+    """
+    if track is None or not settings.get_option("player/replaygain", True):
+        return 1.0
+    gain = _parse_gain(track.get_tag_raw('replaygain_track_gain'))
+    peak = _parse_gain(track.get_tag_raw('replaygain_track_peak'))
+    if gain is None:
+        gain = track.get_tag_raw('__loudness_gain')
+        peak = track.get_tag_raw('__loudness_peak')
+    if gain is None:
+        return 1.0
+    gain += settings.get_option("player/replaygain_preamp", 0.0)
+    factor = 10 ** (gain / 20.0)
+    if peak and settings.get_option("player/replaygain_clipping_protection",
+            True):
+        factor = min(factor, 1.0 / peak)
+    # the volume element goes no further
+    return min(factor, 10.0)
+
+
+class WorkerPool(object):
+    """
+        Runs analyze() in up to `size` helper processes, each served by
+        a thread of its own. The helpers run analysisworker.py in a
+        fresh interpreter: a fork of Exaile would inherit locks held by
+        its GStreamer and GTK threads and could deadlock, and Python 2
+        has no other way to start the processes of a multiprocessing
+        pool.
+    """
+    WORKER = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+            'analysisworker.py')
+
+    def __init__(self, size):
+        self.size = size
+        self._jobs = Queue.Queue()
+        self._lock = threading.Lock()
+        self._threads = []
+        self._procs = set()
+
+    def apply_async(self, uri, names, callback):
+        """
+            Analyses `uri` for the analyses in `names`, and calls
+            `callback` with the results from a pool thread.
+        """
+        self._jobs.put((uri, names, callback))
+        self._lock.acquire()
+        try:
+            if len(self._threads) < self.size:
+                thread = threading.Thread(target=self._serve,
+                        name='AnalysisWorker')
+                thread.setDaemon(True)
+                self._threads.append(thread)
+                thread.start()
+        finally:
+            self._lock.release()
+
+    def _start_helper(self):
+        proc = subprocess.Popen([sys.executable, self.WORKER],
+                stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                close_fds=True)
+        self._lock.acquire()
+        try:
+            self._procs.add(proc)
+        finally:
+            self._lock.release()
+        return proc
+
+    def _stop_helper(self, proc, kill=False):
+        self._lock.acquire()
+        try:
+            self._procs.discard(proc)
+        finally:
+            self._lock.release()
+        try:
+            if kill:
+                proc.kill()
+            else:
+                proc.stdin.close()
+            proc.wait()
+        except (IOError, OSError):
+            pass
+
+    def _serve(self):
+        proc = None
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                break
+            uri, names, callback = job
+            try:
+                if proc is None:
+                    proc = self._start_helper()
+                pickle.dump((uri, names), proc.stdin,
+                        pickle.HIGHEST_PROTOCOL)
+                proc.stdin.flush()
+                results = pickle.load(proc.stdout)
+            except Exception:
+                # the helper died, most likely on a broken file
+                logger.warning("Analysis helper failed on %s" % uri)
+                if proc is not None:
+                    self._stop_helper(proc, kill=True)
+                    proc = None
+                results = dict((name, {}) for name in names)
+            try:
+                callback(results)
+            except Exception:
+                common.log_exception(log=logger)
+        if proc is not None:
+            self._stop_helper(proc)
+
+    def terminate(self):
+        """
+            Drops the queued analyses and stops the helpers.
+        """
+        try:
+            while True:
+                self._jobs.get_nowait()
+        except Queue.Empty:
+            pass
+        self._lock.acquire()
+        try:
+            threads, procs = list(self._threads), list(self._procs)
+            self._threads = []
+        finally:
+            self._lock.release()
+        for thread in threads:
+            self._jobs.put(None)
+        for proc in procs:
+            self._stop_helper(proc, kill=True)
+
+
+_POOL = None
+
+def _get_pool():
+    global _POOL
+    if _POOL is None:
+        _POOL = WorkerPool(
+                max(1, settings.get_option("player/analysis_workers", 2)))
+    return _POOL
+
+
+def _on_quit(type, exaile, data):
+    if _POOL is not None:
+        _POOL.terminate()
+    for analyzer in _ANALYZERS:
+        analyzer.cache.save()
+
+
+def _on_exaile_loaded(type, exaile, data):
+    tracks = exaile.collection.get_tracks()
+    if settings.get_option("player/trim_silence", False):
+        SILENCE.scan(tracks)
+    if settings.get_option("player/loudness_scan", False):
+        LOUDNESS.scan(tracks)
+
+
+if numpy is None:
+    logger.info("NumPy not found, audio analysis is disabled")
+
+SILENCE = Analyzer('silence')
+LOUDNESS = LoudnessAnalyzer('loudness')
+# a kilobyte each, keep enough for the tracks played lately
+WAVEFORM = Analyzer('waveform', 5000)
+_ANALYZERS = (SILENCE, LOUDNESS, WAVEFORM)
+event.add_callback(_on_quit, 'quit_application')
+event.add_callback(_on_exaile_loaded, 'exaile_loaded')
+
+# vim: et sts=4 sw=4
@@ -0,0 +1,305 @@
+# Copyright (C) 2008-2010 Adam Olsen
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 675 Mass Ave, Cambridge, MA 02139, USA.
+#
+#
+# The developers of the Exaile media player hereby grant permission
+# for non-GPL compatible GStreamer and Exaile plugins to be used and
+# distributed together with GStreamer and Exaile. This permission is
+# above and beyond the permissions granted by the GPL license by which
+# Exaile is covered. If you modify this code, you may extend this
+# exception to your version of the code, but you are not obligated to
+# do so. If you do not wish to do so, delete this exception statement
+# from your version.
+
+"""
+    The decoding side of xl.player.analysis, run in helper processes.
+
+    A helper is a fresh interpreter running this file, not a fork of
+    Exaile, and imports nothing from xl. It reads pickled (uri, names)
+    requests from stdin and writes the pickled results of analyze() to
+    stdout, one for each, until stdin is closed.
+
+    Needs NumPy.
+"""
+
+import cPickle as pickle
+import logging
+import os
+import sys
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+logger = logging.getLogger(__name__)
+
+# the audio is decoded once for all analyses, in stereo and at a rate
+# wide enough for the loudness measurement
+RATE = 22050
+# length of one envelope window, in samples
+WINDOW = RATE / 20
+# level below which audio counts as silence, in dBFS
+SILENCE_DB = -50
+# loudness the gains aim for, in LUFS (as ReplayGain 2.0)
+REFERENCE_LUFS = -18.0
+# number of columns in a waveform overview
+WAVEFORM_POINTS = 500
+
+
+def decode(uri, rate=RATE, channels=2):
+    """
+        Decodes `uri` and yields its samples as float32 NumPy arrays of
+        shape (frames, channels). Runs in the worker processes.
+    """
+    import pygst
+    pygst.require('0.10')
+    import gst
+
+    pipe = gst.parse_launch("uridecodebin name=dec ! audioconvert ! "
+            "audioresample ! audio/x-raw-float,width=32,rate=%d,"
+            "channels=%d ! appsink name=sink sync=false" % (rate, channels))
+    dec = pipe.get_by_name("dec")
+    sink = pipe.get_by_name("sink")
+    dec.set_property("uri", uri)
+    pipe.set_state(gst.STATE_PLAYING)
+    try:
+        while True:
+            buf = sink.emit("pull-buffer")
+            if buf is None:
+                break
+            yield numpy.frombuffer(buf.data, numpy.float32).reshape(
+                    -1, channels)
+        message = pipe.get_bus().pop_filtered(gst.MESSAGE_ERROR)
+        if message is not None:
+            raise IOError(message.parse_error()[0].message)
+    finally:
+        pipe.set_state(gst.STATE_NULL)
+
+
+class Envelope(object):
+    """
+        Collects the RMS level and the peak of every `window` samples
+        of the mix of the blocks it is fed.
+    """
+    def __init__(self, window=WINDOW):
+        self.window = window
+        self._levels = []
+        self._peaks = []
+        self._rest = numpy.zeros(0, numpy.float32)
+
+    def feed(self, block):
+        window = self.window
+        data = numpy.concatenate((self._rest, block.mean(axis=1)))
+        count = len(data) / window
+        frames = data[:count*window].reshape(count, window)
+        self._levels.append(numpy.sqrt((frames ** 2).mean(axis=1)))
+        self._peaks.append(numpy.abs(frames).max(axis=1))
+        self._rest = data[count*window:]
+
+    def get(self):
+        """
+            Returns the levels and peaks as two NumPy arrays.
+        """
+        if not self._levels:
+            empty = numpy.zeros(0, numpy.float32)
+            return empty, empty
+        return numpy.concatenate(self._levels), \
+                numpy.concatenate(self._peaks)
+
+
+def analyze_silence(levels, peaks):
+    """
+        Finds where the audio starts and ends from its envelope.
+        Returns a dict with the ``start`` and ``end`` of the audio
+        above SILENCE_DB and the ``length`` of the file, in seconds, or
+        an empty dict if it is silent throughout.
+    """
+    loud = numpy.flatnonzero(levels > 10 ** (SILENCE_DB / 20.0))
+    if not len(loud):
+        return {}
+    seconds = float(WINDOW) / RATE
+    return {'start': loud[0] * seconds,
+            'end': (loud[-1] + 1) * seconds,
+            'length': len(levels) * seconds}
+
+
+def analyze_waveform(levels, peaks):
+    """
+        Boils the envelope of the audio down to WAVEFORM_POINTS
+        columns. Returns a dict with the ``rms`` and ``peak`` of every
+        column as strings of bytes scaled to 0-255, or an empty dict
+        if the file is too short.
+    """
+    if len(levels) < WAVEFORM_POINTS:
+        return {}
+    # first window of every column
+    starts = (numpy.arange(WAVEFORM_POINTS) * len(levels)) / WAVEFORM_POINTS
+    rms = numpy.sqrt(numpy.add.reduceat(levels ** 2, starts) /
+            numpy.diff(numpy.append(starts, len(levels))))
+    peak = numpy.maximum.reduceat(peaks, starts)
+
+    def scale(values):
+        return (numpy.clip(values, 0, 1) * 255).astype(numpy.uint8).tostring()
+
+    return {'rms': scale(rms), 'peak': scale(peak)}
+
+
+def k_weighting(freqs, rate):
+    """
+        Returns the power response of the ITU-R BS.1770 K-weighting
+        filter at `freqs` Hz, for audio sampled at `rate` Hz.
+    """
+    # high shelf, coefficients for any rate as derived in libebur128
+    K = numpy.tan(numpy.pi * 1681.974450955533 / rate)
+    Q = 0.7071752369554196
+    Vh = 10 ** (3.999843853973347 / 20)
+    Vb = Vh ** 0.4996667741545416
+    a0 = 1 + K / Q + K * K
+    shelf = ((Vh + Vb * K / Q + K * K) / a0, 2 * (K * K - Vh) / a0,
+            (Vh - Vb * K / Q + K * K) / a0), \
+            (1.0, 2 * (K * K - 1) / a0, (1 - K / Q + K * K) / a0)
+    # high pass
+    K = numpy.tan(numpy.pi * 38.13547087602444 / rate)
+    Q = 0.5003270373238773
+    a0 = 1 + K / Q + K * K
+    highpass = (1.0, -2.0, 1.0), \
+            (1.0, 2 * (K * K - 1) / a0, (1 - K / Q + K * K) / a0)
+
+    z = numpy.exp(-2j * numpy.pi * freqs / rate)
+    response = numpy.ones(len(freqs))
+    for b, a in (shelf, highpass):
+        h = (b[0] + b[1] * z + b[2] * z * z) / \
+                (a[0] + a[1] * z + a[2] * z * z)
+        response *= numpy.abs(h) ** 2
+    return response
+
+
+class LoudnessMeter(object):
+    """
+        Measures the integrated loudness of the blocks it is fed as in
+        EBU R128, with the K-weighting applied in the frequency domain.
+    """
+    def __init__(self, rate=RATE):
+        # mean square per channel of every 100ms, four make a gating
+        # block
+        self.size = size = rate / 10
+        self.weights = k_weighting(numpy.arange(size / 2 + 1) *
+                float(rate) / size, rate)
+        # count every bin but DC and Nyquist twice, see Parseval
+        self.weights[1:(size + 1) / 2] *= 2
+        self._squares = []
+        self._peak = 0.0
+        self._rest = numpy.zeros((0, 2), numpy.float32)
+
+    def feed(self, block):
+        size = self.size
+        data = numpy.concatenate((self._rest, block))
+        count = len(data) / size
+        if count:
+            frames = data[:count*size].reshape(count, size, 2)
+            spectrum = numpy.abs(numpy.fft.rfft(frames, axis=1)) ** 2
+            self._squares.append((spectrum *
+                self.weights[:,None]).sum(axis=1) / (size * size))
+            self._peak = max(self._peak, float(numpy.abs(frames).max()))
+        self._rest = data[count*size:]
+
+    def get(self):
+        """
+            Returns a dict with the ``loudness`` in LUFS, the sample
+            ``peak`` and the ``gain`` in dB that brings it to
+            REFERENCE_LUFS, or an empty dict if it is silent.
+        """
+        if not self._squares:
+            return {}
+        squares = numpy.concatenate(self._squares)
+        if len(squares) < 4:
+            return {}
+        # 400ms blocks overlapping by 75%, both channels weighted alike
+        power = sum(squares[i:len(squares)-3+i]
+                for i in range(4)).sum(axis=1) / 4
+        loudness = -0.691 + 10 * numpy.log10(numpy.maximum(power, 1e-20))
+        gated = power[loudness > -70]
+        if not len(gated):
+            return {}
+        relative = -0.691 + 10 * numpy.log10(gated.mean()) - 10
+        gated = power[loudness > max(-70, relative)]
+        integrated = -0.691 + 10 * numpy.log10(gated.mean())
+        return {'loudness': float(integrated),
+                'peak': self._peak,
+                'gain': float(REFERENCE_LUFS - integrated)}
+
+
+def analyze(uri, names):
+    """
+        Decodes `uri` once and runs the analyses in `names` (any of
+        ``silence``, ``loudness`` and ``waveform``) over it. Returns a
+        dict of name -> result.
+    """
+    envelope = meter = None
+    if 'silence' in names or 'waveform' in names:
+        envelope = Envelope()
+    if 'loudness' in names:
+        meter = LoudnessMeter()
+    for block in decode(uri):
+        if envelope is not None:
+            envelope.feed(block)
+        if meter is not None:
+            meter.feed(block)
+    results = {}
+    if envelope is not None:
+        levels, peaks = envelope.get()
+        if 'silence' in names:
+            results['silence'] = analyze_silence(levels, peaks)
+        if 'waveform' in names:
+            results['waveform'] = analyze_waveform(levels, peaks)
+    if meter is not None:
+        results['loudness'] = meter.get()
+    return results
+
+
+def _run(uri, names):
+    try:
+        return analyze(uri, names)
+    except Exception:
+        logger.debug("Could not analyse %s" % uri, exc_info=True)
+        return dict((name, {}) for name in names)
+
+
+def main():
+    # analysis must never get in the way of playback
+    try:
+        os.nice(10)
+    except OSError:
+        pass
+    import gobject
+    gobject.threads_init()
+    # only the results go to the real stdout, anything else printed
+    # ends up on stderr
+    out = os.fdopen(os.dup(1), 'wb')
+    os.dup2(2, 1)
+    while True:
+        try:
+            uri, names = pickle.load(sys.stdin)
+        except EOFError:
+            break
+        pickle.dump(_run(uri, names), out, pickle.HIGHEST_PROTOCOL)
+        out.flush()
+
+if __name__ == '__main__':
+    main()
+
+# vim: et sts=4 sw=4
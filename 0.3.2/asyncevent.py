@@ -0,0 +1,281 @@
+# Copyright (C) 2008-2010 Adam Olsen
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 675 Mass Ave, Cambridge, MA 02139, USA.
+#
+#
+# The developers of the Exaile media player hereby grant permission
+# for non-GPL compatible GStreamer and Exaile plugins to be used and
+# distributed together with GStreamer and Exaile. This permission is
+# above and beyond the permissions granted by the GPL license by which
+# Exaile is covered. If you modify this code, you may extend this
+# exception to your version of the code, but you are not obligated to
+# do so. If you do not wish to do so, delete this exception statement
+# from your version.
+
+"""
+    Asynchronous delivery of events to slow subscribers.
+
+    xl.event calls every callback right where the event is logged. The
+    playback events are logged from inside the engines, while they hold
+    their locks, so a subscriber that reads files or goes to the
+    network holds up playback with it. Subscribing through here instead
+    queues the events on a lane, and returns at once::
+
+        asyncevent.add_callback(self.on_track_start,
+                'playback_track_start', coalesce=True)
+
+    Each lane delivers its events one at a time and in the order they
+    were logged. The ``main`` lane delivers from the GTK main loop, at
+    idle priority, so its subscribers may touch widgets; any other lane
+    name gets a thread of its own. With `coalesce`, an event that is
+    still waiting is replaced, in its place in the queue, when a newer
+    one of the same type and object comes in, so a subscriber that
+    falls behind catches up with the latest state rather than
+    replaying every track change or seek.
+
+    Like xl.event, callbacks are held weakly if they are bound methods.
+"""
+
+import logging
+import threading
+import weakref
+from collections import deque
+
+import glib
+
+from xl import common, event
+
+logger = logging.getLogger(__name__)
+
+MAIN = 'main'
+
+
+class Subscription(object):
+    """
+        One callback on one lane, registered with xl.event.
+    """
+    def __init__(self, function, type, obj, lane, coalesce):
+        if hasattr(function, 'im_self') and function.im_self is not None:
+            self._self = weakref.ref(function.im_self)
+            self._func = function.im_func
+        else:
+            self._self = None
+            self._func = function
+        self.type = type
+        self.obj = obj
+        self.lane = lane
+        self.coalesce = coalesce
+
+    def matches(self, function):
+        if self._self is None:
+            return self._func is function
+        return getattr(function, 'im_self', None) is self._self() and \
+                getattr(function, 'im_func', None) is self._func
+
+    def get_function(self):
+        """
+            Returns the callback, or None if its object is gone.
+        """
+        if self._self is None:
+            return self._func
+        target = self._self()
+        if target is None:
+            return None
+        return self._func.__get__(target, target.__class__)
+
+    def dispatch(self, type, obj, data):
+        # called by xl.event, wherever the event happens
+        self.lane.put(self, type, obj, data)
+
+
+class Lane(object):
+    """
+        A queue of events, delivered in order.
+    """
+    def __init__(self, name):
+        self.name = name
+        self._queue = deque()
+        self._cond = threading.Condition()
+
+    def put(self, sub, type, obj, data):
+        self._cond.acquire()
+        try:
+            entry = (sub, type, obj, data)
+            if sub.coalesce:
+                # keep the place of the event it supersedes
+                for i, e in enumerate(self._queue):
+                    if e[0] is sub and e[1] == type and e[2] is obj:
+                        self._queue[i] = entry
+                        return
+            self._queue.append(entry)
+            self._wake()
+        finally:
+            self._cond.release()
+
+    def drop(self, sub):
+        """
+            Forgets the waiting events of `sub`.
+        """
+        self._cond.acquire()
+        try:
+            for entry in [e for e in self._queue if e[0] is sub]:
+                self._queue.remove(entry)
+        finally:
+            self._cond.release()
+
+    def _wake(self):
+        """
+            Called with the lock held when an event was queued; wakes
+            the threads waiting for one.
+        """
+        self._cond.notify()
+
+    def _take(self):
+        self._cond.acquire()
+        try:
+            if self._queue:
+                return self._queue.popleft()
+            return None
+        finally:
+            self._cond.release()
+
+    def _deliver(self, entry):
+        sub, type, obj, data = entry
+        function = sub.get_function()
+        if function is None:
+            _remove(sub)
+            return
+        try:
+            function(type, obj, data)
+        except Exception:
+            common.log_exception(log=logger)
+
+
+class MainLoopLane(Lane):
+    """
+        Delivers from the main loop, one event per idle callback so the
+        UI stays responsive in between.
+    """
+    def __init__(self, name):
+        Lane.__init__(self, name)
+        self._idle_id = 0
+
+    def _wake(self):
+        if not self._idle_id:
+            self._idle_id = glib.idle_add(self._run)
+
+    def _run(self):
+        entry = self._take()
+        if entry is not None:
+            self._deliver(entry)
+        self._cond.acquire()
+        try:
+            if self._queue:
+                return True
+            self._idle_id = 0
+            return False
+        finally:
+            self._cond.release()
+
+
+class ThreadLane(Lane):
+    """
+        Delivers from a thread of its own.
+    """
+    def __init__(self, name):
+        Lane.__init__(self, name)
+        self._thread = threading.Thread(target=self._run,
+                name="event lane %s" % name)
+        self._thread.setDaemon(True)
+        self._thread.start()
+
+    def _run(self):
+        while True:
+            self._cond.acquire()
+            try:
+                while not self._queue:
+                    self._cond.wait()
+            finally:
+                self._cond.release()
+            entry = self._take()
+            if entry is not None:
+                self._deliver(entry)
+
+
+_LANES = {}
+_SUBSCRIPTIONS = []
+_LOCK = threading.Lock()
+
+
+def get_lane(name=MAIN):
+    """
+        Returns the lane called `name`, creating it if needed.
+    """
+    _LOCK.acquire()
+    try:
+        lane = _LANES.get(name)
+        if lane is None:
+            if name == MAIN:
+                lane = MainLoopLane(name)
+            else:
+                lane = ThreadLane(name)
+            _LANES[name] = lane
+        return lane
+    finally:
+        _LOCK.release()
+
+
+def add_callback(function, type=None, obj=None, lane=MAIN, coalesce=False):
+    """
+        Like xl.event.add_callback(), but `function` is called on
+        `lane` some time after the event. See the module docs.
+    """
+    sub = Subscription(function, type, obj, get_lane(lane), coalesce)
+    _LOCK.acquire()
+    try:
+        _SUBSCRIPTIONS.append(sub)
+    finally:
+        _LOCK.release()
+    event.add_callback(sub.dispatch, type, obj)
+    return sub
+
+
+def _remove(sub):
+    _LOCK.acquire()
+    try:
+        if sub not in _SUBSCRIPTIONS:
+            return
+        _SUBSCRIPTIONS.remove(sub)
+    finally:
+        _LOCK.release()
+    event.remove_callback(sub.dispatch, sub.type, sub.obj)
+    sub.lane.drop(sub)
+
+
+def remove_callback(function, type=None, obj=None):
+    """
+        Unsubscribes `function`; events still waiting for it are
+        dropped.
+    """
+    _LOCK.acquire()
+    try:
+        subs = [s for s in _SUBSCRIPTIONS if s.matches(function) and
+                s.type == type and s.obj is obj]
+    finally:
+        _LOCK.release()
+    for sub in subs:
+        _remove(sub)
+
+# vim: et sts=4 sw=4
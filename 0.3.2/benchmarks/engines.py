@@ -0,0 +1,204 @@
+#!/usr/bin/env python
+# Copyright (C) 2008-2010 Adam Olsen
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 675 Mass Ave, Cambridge, MA 02139, USA.
+
+"""
+    Headless playback latency benchmark for the normal and unified
+    engines.
+
+    Needs an Exaile 0.3.2 source tree with engine_normal.py,
+    engine_unified.py and metrics.py from Exaile-cn copied to
+    xl/player::
+
+        python benchmarks/engines.py --exaile /usr/lib/exaile
+
+    Test tones are generated with audiotestsrc and played through a
+    fakesink. Each track is seeked to just before its end, so every
+    track contributes one start, one seek and (except the first) one
+    gap measurement. Settings are kept in a temporary directory, the
+    user's configuration is never touched.
+"""
+
+import os
+import resource
+import shutil
+import sys
+import tempfile
+import time
+from optparse import OptionParser
+
+ENGINES = ('normal', 'unified')
+
+
+class BenchQueue(object):
+    """
+        Just enough of xl.queue.PlayQueue to drive an engine through a
+        fixed list of tracks.
+    """
+    def __init__(self, player, tracks):
+        self.player = player
+        self.tracks = list(tracks)
+        self.pos = -1
+        player._queue = self
+
+    def next(self, player=True, track=None):
+        self.pos += 1
+        try:
+            tr = self.tracks[self.pos]
+        except IndexError:
+            tr = None
+        if player:
+            if tr is None:
+                self.player.stop()
+            else:
+                self.player.play(tr)
+        return tr
+
+
+def generate_tracks(directory, count, length):
+    """
+        Writes `count` WAV files of `length` seconds and returns their
+        uris.
+    """
+    import gst
+    uris = []
+    for i in range(count):
+        path = os.path.join(directory, "tone%02d.wav" % i)
+        desc = ("audiotestsrc num-buffers=%d samplesperbuffer=4410 "
+                "freq=%d ! audio/x-raw-int,rate=44100,channels=2 ! "
+                "audioconvert ! wavenc ! filesink location=%s" %
+                (length * 10, 220 + 110 * i, path))
+        pipeline = gst.parse_launch(desc)
+        pipeline.set_state(gst.STATE_PLAYING)
+        pipeline.get_bus().poll(gst.MESSAGE_EOS | gst.MESSAGE_ERROR, -1)
+        pipeline.set_state(gst.STATE_NULL)
+        uris.append("file://" + path)
+    return uris
+
+
+def run_engine(name, uris, length, timeout):
+    import glib
+    from xl import event, trax
+
+    if name == 'normal':
+        from xl.player.engine_normal import NormalPlayer as Player
+    else:
+        from xl.player.engine_unified import UnifiedPlayer as Player
+
+    player = Player()
+    queue = BenchQueue(player, [trax.Track(uri) for uri in uris])
+    loop = glib.MainLoop()
+
+    def start():
+        queue.next()
+        return False
+
+    def seek_to_end():
+        player.seek(length - 2)
+        return False
+
+    def schedule_seek():
+        glib.timeout_add(500, seek_to_end)
+        return False
+
+    def on_latency(type, obj, data):
+        # spans end in streaming threads, get back to the main loop
+        if obj is player and data[0] == 'start':
+            glib.idle_add(schedule_seek)
+
+    def on_end(type, obj, data):
+        if obj is player:
+            glib.idle_add(loop.quit)
+
+    event.add_callback(on_latency, 'playback_latency')
+    event.add_callback(on_end, 'playback_player_end')
+    glib.timeout_add_seconds(timeout, loop.quit)
+
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    cpu = usage.ru_utime + usage.ru_stime
+    wall = time.time()
+    glib.idle_add(start)
+    loop.run()
+    wall = time.time() - wall
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    cpu = usage.ru_utime + usage.ru_stime - cpu
+
+    player.stop()
+    event.remove_callback(on_latency, 'playback_latency')
+    event.remove_callback(on_end, 'playback_player_end')
+    return player.latency.get_stats(), cpu, wall
+
+
+def report(results):
+    print "%-8s %-6s %6s %9s %9s %9s" % \
+            ('engine', 'span', 'count', 'mean', 'p95', 'max')
+    for name, (stats, cpu, wall) in results:
+        for span in ('start', 'seek', 'gap'):
+            s = stats.get(span)
+            if not s:
+                print "%-8s %-6s %6d" % (name, span, 0)
+                continue
+            print "%-8s %-6s %6d %7.1fms %7.1fms %7.1fms" % (name, span,
+                    s['count'], s['mean'], s['p95'], s['max'])
+        print "%-8s %-6s %.2fs over %.1fs (%.1f%%)" % (name, 'cpu', cpu,
+                wall, 100.0 * cpu / wall)
+
+
+def main():
+    parser = OptionParser()
+    parser.add_option("--exaile", dest="exaile",
+            default="/usr/lib/exaile",
+            help="Exaile source tree to load the engines from")
+    parser.add_option("--engine", dest="engines", action="append",
+            choices=ENGINES,
+            help="engine to benchmark, may be repeated (default: both)")
+    parser.add_option("--tracks", dest="tracks", type="int", default=5)
+    parser.add_option("--length", dest="length", type="int", default=8,
+            help="length of each generated track in seconds")
+    parser.add_option("--timeout", dest="timeout", type="int", default=120,
+            help="give up on an engine after this many seconds")
+    options, args = parser.parse_args()
+
+    tmpdir = tempfile.mkdtemp(prefix="exaile-bench-")
+    try:
+        # keep xl.settings away from the real configuration
+        for var in ('XDG_CONFIG_HOME', 'XDG_DATA_HOME', 'XDG_CACHE_HOME'):
+            os.environ[var] = os.path.join(tmpdir, var.lower())
+        sys.path.insert(0, os.path.abspath(options.exaile))
+
+        import pygst
+        pygst.require('0.10')
+        import gobject
+        gobject.threads_init()
+
+        from xl import settings
+        settings.set_option('player/audiosink', 'custom')
+        settings.set_option('player/custompipe', 'fakesink sync=true')
+        settings.set_option('player/crossfading', False)
+        settings.set_option('player/user_fade_enabled', False)
+        settings.set_option('player/command_coalesce_window', 0)
+
+        uris = generate_tracks(tmpdir, options.tracks, options.length)
+        results = []
+        for name in options.engines or ENGINES:
+            results.append((name, run_engine(name, uris, options.length,
+                options.timeout)))
+        report(results)
+    finally:
+        shutil.rmtree(tmpdir, ignore_errors=True)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,135 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (C) 2008-2010 Adam Olsen
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 675 Mass Ave, Cambridge, MA 02139, USA.
+
+"""
+    ID3 tag reading benchmark, as done for every file of a collection
+    scan.
+
+    Needs an Exaile 0.3.2 source tree with _id3.py from Exaile-cn copied
+    to xl/metadata::
+
+        python benchmarks/id3read.py --exaile /usr/lib/exaile
+
+    A corpus of files with ID3v2 tags is generated in a temporary
+    directory: a third with UTF-8 frames, a third with GBK and a third
+    with Big5 text stored as latin-1, the way old Chinese taggers wrote
+    them. Each file is read once with a _get_tag() call per mapped tag,
+    the way BaseFormat does it, and once with the single pass of
+    ID3Format.read_tags().
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+from optparse import OptionParser
+
+# artist, album and title in the charsets the corpus is written in
+SAMPLES = (
+    ('utf-8', u'周杰伦', u'七里香',
+        u'晴天'),
+    ('gbk', u'王菲', u'唯爱', u'红豆'),
+    ('big5', u'張學友', u'吻別',
+        u'一路上有你'),
+    )
+
+
+def generate_corpus(directory, count):
+    """
+        Writes `count` files with ID3 tags, returns their paths.
+    """
+    from mutagen import id3
+    paths = []
+    for i in range(count):
+        charset, artist, album, title = SAMPLES[i % len(SAMPLES)]
+        tags = id3.ID3()
+        for frame, text in (('TPE1', artist), ('TALB', album),
+                ('TIT2', u'%s %d' % (title, i)), ('TCON', u'Pop'),
+                ('TRCK', u'%d/12' % (i % 12 + 1)), ('TDRC', u'2004')):
+            if charset == 'utf-8':
+                tags.add(id3.Frames[frame](encoding=3, text=text))
+            else:
+                legacy = text.encode(charset).decode('iso-8859-1')
+                tags.add(id3.Frames[frame](encoding=0, text=legacy))
+        subdir = os.path.join(directory, "album%03d" % (i / 12))
+        if not os.path.isdir(subdir):
+            os.mkdir(subdir)
+        path = os.path.join(subdir, "track%05d.mp3" % i)
+        f = open(path, 'wb')
+        f.write('\0' * 4096)
+        f.close()
+        tags.save(path)
+        paths.append(path)
+    return paths
+
+
+def read_per_tag(fmt):
+    raw = fmt._get_raw()
+    td = {}
+    for tag, frame in fmt.tag_mapping.iteritems():
+        values = fmt._get_tag(raw, frame)
+        if values:
+            td[tag] = values
+    return td
+
+
+def read_single_pass(fmt):
+    return fmt.read_tags(fmt.tag_mapping.keys())
+
+
+def run(paths, reader):
+    from xl.metadata import _id3
+    _id3._CACHE.clear()
+    formats = [_id3.ID3Format(path) for path in paths]
+    start = time.time()
+    results = [reader(fmt) for fmt in formats]
+    return time.time() - start, results
+
+
+def main():
+    parser = OptionParser()
+    parser.add_option("--exaile", dest="exaile",
+            default="/usr/lib/exaile",
+            help="Exaile source tree to load xl.metadata from")
+    parser.add_option("--files", dest="files", type="int", default=3000)
+    options, args = parser.parse_args()
+
+    tmpdir = tempfile.mkdtemp(prefix="exaile-bench-")
+    try:
+        for var in ('XDG_CONFIG_HOME', 'XDG_DATA_HOME', 'XDG_CACHE_HOME'):
+            os.environ[var] = os.path.join(tmpdir, var.lower())
+        sys.path.insert(0, os.path.abspath(options.exaile))
+
+        corpus = os.path.join(tmpdir, 'corpus')
+        os.mkdir(corpus)
+        paths = generate_corpus(corpus, options.files)
+
+        old, old_results = run(paths, read_per_tag)
+        new, new_results = run(paths, read_single_pass)
+        if old_results != new_results:
+            print "warning: the two readers disagree"
+        print "%-12s %8s %10s" % ('reader', 'total', 'per file')
+        for name, seconds in (('per tag', old), ('single pass', new)):
+            print "%-12s %7.2fs %8.1fus" % (name, seconds,
+                    seconds / len(paths) * 1000000)
+    finally:
+        shutil.rmtree(tmpdir, ignore_errors=True)
+
+if __name__ == '__main__':
+    main()
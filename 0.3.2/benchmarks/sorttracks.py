@@ -0,0 +1,130 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (C) 2008-2010 Adam Olsen
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 675 Mass Ave, Cambridge, MA 02139, USA.
+
+"""
+    Collection sorting benchmark.
+
+    Needs an Exaile 0.3.2 source tree with track.py from Exaile-cn
+    copied to xl/trax::
+
+        python benchmarks/sorttracks.py --exaile /usr/lib/exaile
+
+    A synthetic library is built in memory, with artist, album and
+    title values mixing plain, accented, "The ..." and Chinese names,
+    and sorted the way the collection panel and playlists sort it. The
+    first sort has to work out every sort key, later ones find them
+    cached; changing the strip list throws them all away again.
+"""
+
+import gc
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+from optparse import OptionParser
+
+SORT_TAGS = ('artist', 'date', 'album', 'discnumber', 'tracknumber',
+        'title')
+
+WORDS = (u'love', u'night', u'Ángel', u'rain', u'Über', u'city',
+        u'blue', u'heart', u'road', u'fire', u'Ænima', u'dream',
+        u'周杰伦', u'王菲', u'晴天', u'七里香', u'红豆', u'张学友')
+
+
+def make_name(rng, words):
+    name = u' '.join([rng.choice(WORDS) for i in range(words)])
+    if rng.random() < 0.2:
+        name = u'The ' + name
+    return name.capitalize()
+
+
+def generate_library(count, seed=0):
+    """
+        Returns `count` Tracks with made up tags.
+    """
+    from xl import trax
+    rng = random.Random(seed)
+    artists = [make_name(rng, 2) for i in range(max(count / 50, 1))]
+    tracks = []
+    for i in range(count):
+        tr = trax.Track("file:///music/%08d.mp3" % i, scan=False)
+        artist = artists[i / 50 % len(artists)]
+        tr.set_tag_raw('artist', artist, notify_changed=False)
+        tr.set_tag_raw('album', make_name(rng, 3), notify_changed=False)
+        tr.set_tag_raw('title', make_name(rng, 3), notify_changed=False)
+        tr.set_tag_raw('date', unicode(1970 + i % 40), notify_changed=False)
+        tr.set_tag_raw('tracknumber', u'%d/12' % (i % 12 + 1),
+                notify_changed=False)
+        tr.set_tag_raw('discnumber', u'1', notify_changed=False)
+        tracks.append(tr)
+    return tracks
+
+
+def time_sort(tracks, runs):
+    from xl import trax
+    times = []
+    for i in range(runs):
+        gc.collect()
+        start = time.time()
+        trax.sort_tracks(SORT_TAGS, tracks)
+        times.append(time.time() - start)
+    return times
+
+
+def main():
+    parser = OptionParser()
+    parser.add_option("--exaile", dest="exaile",
+            default="/usr/lib/exaile",
+            help="Exaile source tree to load xl.trax from")
+    parser.add_option("--tracks", dest="tracks", type="int",
+            default=100000)
+    parser.add_option("--runs", dest="runs", type="int", default=3,
+            help="number of sorts once the keys are cached")
+    options, args = parser.parse_args()
+
+    tmpdir = tempfile.mkdtemp(prefix="exaile-bench-")
+    try:
+        # keep xl.settings away from the real configuration
+        for var in ('XDG_CONFIG_HOME', 'XDG_DATA_HOME', 'XDG_CACHE_HOME'):
+            os.environ[var] = os.path.join(tmpdir, var.lower())
+        sys.path.insert(0, os.path.abspath(options.exaile))
+        from xl import settings
+
+        start = time.time()
+        tracks = generate_library(options.tracks)
+        print "built %d tracks in %.2fs" % (len(tracks), time.time() - start)
+
+        results = [('cold', time_sort(tracks, 1))]
+        results.append(('cached', time_sort(tracks, options.runs)))
+        settings.set_option('collection/strip_list', ['the', 'a', 'an'])
+        results.append(('strip list', time_sort(tracks, 1)))
+        for tr in tracks[::100]:
+            tr.set_tag_raw('title', u'Changed', notify_changed=False)
+        results.append(('1% edited', time_sort(tracks, 1)))
+
+        print "%-11s %5s %9s %9s" % ('sort', 'runs', 'mean', 'best')
+        for name, times in results:
+            print "%-11s %5d %8.3fs %8.3fs" % (name, len(times),
+                    sum(times) / len(times), min(times))
+    finally:
+        shutil.rmtree(tmpdir, ignore_errors=True)
+
+if __name__ == '__main__':
+    main()
@@ -271,6 +271,9 @@ class DoubanRadioPlugin(object):
         track.set_tag_raw('artist', song['artist'])
         track.set_tag_raw('album', song['albumtitle'])
         track.set_tag_raw('cover_url', song['picture'])
+        # lets the engines buffer the whole song, see player/download_buffer
+        if song.get('length'):
+            track.set_tag_raw('__length', float(song['length']))
 
         return track
 
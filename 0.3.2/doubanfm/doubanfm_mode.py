@@ -31,6 +31,10 @@ import os
 from xl import xdg, event, settings
 from xlgui import cover, guiutil, tray
 from xlgui.main import PlaybackProgressBar
+try:
+    from xlgui import waveform
+except ImportError:
+    waveform = None
 
 def get_resource_path(filename):
     basedir = os.path.dirname(os.path.realpath(__file__))
@@ -76,9 +80,14 @@ class DoubanfmMode():
         self.bookmark_button = self.builder.get_object('bookmark_button')
 
         progress_box = self.builder.get_object('playback_progressbar')
-        self.progress_bar = PlaybackProgressBar(
-            progress_box, self.exaile.player
-        )
+        self.progress_bar = None
+        if waveform and settings.get_option('gui/waveform_progressbar', True):
+            self.progress_bar = waveform.replace(progress_box,
+                self.exaile.player)
+        if self.progress_bar is None:
+            self.progress_bar = PlaybackProgressBar(
+                progress_box, self.exaile.player
+            )
 
         self.visible = False
         self.active = False
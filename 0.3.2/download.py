@@ -0,0 +1,139 @@
+# Copyright (C) 2008-2010 Adam Olsen
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 675 Mass Ave, Cambridge, MA 02139, USA.
+#
+#
+# The developers of the Exaile media player hereby grant permission
+# for non-GPL compatible GStreamer and Exaile plugins to be used and
+# distributed together with GStreamer and Exaile. This permission is
+# above and beyond the permissions granted by the GPL license by which
+# Exaile is covered. If you modify this code, you may extend this
+# exception to your version of the code, but you are not obligated to
+# do so. If you do not wish to do so, delete this exception statement
+# from your version.
+
+"""
+    Progressive download buffering for finite HTTP streams.
+
+    Normally GStreamer keeps only a few seconds of a network stream in
+    memory, so pausing for long lets the connection time out, and every
+    seek is a new request. With ``player/download_buffer`` on, files
+    served over HTTP whose length is known are downloaded to a
+    temporary file by queue2 instead, filling ahead of the play
+    position. Pausing, resuming and seeking within what is downloaded
+    then need no network at all.
+
+    ``player/download_buffer_size`` limits the temporary file in bytes
+    (0 keeps the whole file), and ``player/download_buffer_ahead`` is
+    how many seconds have to be there before playback starts.
+    Progress is announced with the ``playback_download`` event, whose
+    data is the percentage downloaded.
+"""
+
+import logging
+import urlparse
+
+import pygst
+pygst.require('0.10')
+import gst
+
+from xl import event, settings
+
+logger = logging.getLogger(__name__)
+
+# GST_PLAY_FLAG_DOWNLOAD of playbin2
+PLAY_FLAG_DOWNLOAD = 1 << 7
+
+
+def wanted(track):
+    """
+        Returns whether `track` should be played from a download
+        buffer.
+    """
+    if track is None or \
+            not settings.get_option("player/download_buffer", False):
+        return False
+    scheme = urlparse.urlsplit(track.get_loc_for_io())[0]
+    if scheme not in ('http', 'https'):
+        return False
+    # endless streams, like radio, would fill the disk
+    try:
+        return float(track.get_tag_raw('__length') or 0) > 0
+    except (TypeError, ValueError):
+        return False
+
+
+def _set(element, name, value):
+    try:
+        element.set_property(name, value)
+    except TypeError:
+        # older GStreamer, go without
+        logger.debug("%s has no %s property" % (element.get_name(), name))
+
+
+def configure(element, download):
+    """
+        Sets up playbin2 or uridecodebin `element` for the next uri,
+        with or without a download buffer.
+    """
+    if element.get_factory().get_name() == 'playbin2':
+        flags = element.get_property('flags')
+        if download:
+            flags |= PLAY_FLAG_DOWNLOAD
+        else:
+            flags &= ~PLAY_FLAG_DOWNLOAD
+        element.set_property('flags', flags)
+    else:
+        # not every source has one, and older uridecodebins do not
+        _set(element, 'download', download)
+    if download:
+        _set(element, 'ring-buffer-max-size',
+                settings.get_option("player/download_buffer_size", 0))
+        _set(element, 'buffer-duration', settings.get_option(
+            "player/download_buffer_ahead", 5) * gst.SECOND)
+
+
+def handle_buffering(player, message, downloading):
+    """
+        Reports a buffering message. While downloading, the percentage
+        is how much of the file is on disk, which does not hold up
+        playback; otherwise it is how full the stream buffer is.
+    """
+    percent = message.parse_buffering()
+    if downloading:
+        event.log_event('playback_download', player, percent)
+        if percent >= 100:
+            logger.info('Download complete')
+        return
+    if not percent < 100:
+        logger.info('Buffering complete')
+    if percent % 5 == 0:
+        event.log_event('playback_buffering', player, percent)
+
+
+def get_buffered(element):
+    """
+        Returns the (start, stop) of the downloaded part around the play
+        position, in percent of the file, or None.
+    """
+    query = gst.query_new_buffering(gst.FORMAT_PERCENT)
+    if not element.query(query):
+        return None
+    format, start, stop, estimated = query.parse_buffering_range()
+    if start < 0 or stop < 0:
+        return None
+    return (start / 10000.0, stop / 10000.0)
+
+# vim: et sts=4 sw=4
@@ -34,25 +34,54 @@ pygst.require('0.10')
 import gst, gobject, glib
 
 from xl.nls import gettext as _
-from xl import common, event
-from xl.player import pipe, _base
+from xl import common, event, settings
+from xl.player import pipe, _base, analysis, download, metrics, \
+        pcmtap, playstats, prober
 
 logger = logging.getLogger(__name__)
 
 
 class NormalPlayer(_base.ExailePlayer):
+    # tag messages arriving within this many ms are handed to tag_func
+    # together, and a missing duration is queried at most this many
+    # times per track
+    _TAG_WINDOW = 500
+    _DURATION_PROBES = 3
+    # delay (in ms) before moving on after the second failure in a row,
+    # doubling with every further one up to _ERROR_BACKOFF_MAX
+    _ERROR_BACKOFF = 100
+    _ERROR_BACKOFF_MAX = 5000
+
     def __init__(self):
         _base.ExailePlayer.__init__(self,
                 pre_elems=[pipe.ProviderBin("stream_element")])
 
         self._current = None
+        self._downloading = False
         self.playbin = None
         self.bus = None
 
+        self.latency = metrics.LatencyTracker(self)
+        self._last_buffer = None
+        self._new_segment = False
+        self._gap_pending = False
+        self._pending_tags = None
+        self._pending_track = None
+        self._tags_id = 0
+        self._probed_track = None
+        self._probes = 0
+
+        self.failures = metrics.FailureStats()
+        self._error_streak = 0
+        self._error_track = None
+        self._error_retries = 0
+        self._error_id = 0
+
         self.fakevideo = gst.element_factory_make("fakesink")
         self.fakevideo.set_property("sync", True)
 
         self.setup_pipe()
+        self.setup_probes()
 
     def setup_pipe(self):
         self.setup_playbin()
@@ -72,7 +101,6 @@ class NormalPlayer(_base.ExailePlayer):
         """
         self.bus = self.playbin.get_bus()
         self.bus.add_signal_watch()
-        self.bus.enable_sync_message_emission()
         self.bus.connect('message', self.on_message)
 
     def setup_gst_elements(self):
@@ -82,16 +110,49 @@ class NormalPlayer(_base.ExailePlayer):
         self.playbin.set_property("audio-sink", self.mainbin)
         self.playbin.set_property("video-sink", self.fakevideo)
 
+    def setup_probes(self):
+        """
+            watches the data entering the audio sink, to time how long
+            it takes for tracks and seeks to become audible, and hands
+            it to the PCM tap
+        """
+        pad = self.mainbin.get_static_pad("sink")
+        pad.add_event_probe(self._on_sink_event)
+        pad.add_buffer_probe(self._on_sink_buffer)
+        pcmtap.attach(pad)
+
+    def _on_sink_event(self, pad, ev):
+        if ev.type == gst.EVENT_NEWSEGMENT:
+            self._new_segment = True
+        return True
+
+    def _on_sink_buffer(self, pad, buf):
+        now = time.time()
+        if self._new_segment:
+            # first buffer of a new track or after a seek
+            self._new_segment = False
+            self.latency.end('start', now)
+            self.latency.end('seek', now)
+            self._error_streak = 0
+            if self._gap_pending and self._last_buffer is not None:
+                self.latency.record('gap',
+                        max(0.0, (now - self._last_buffer) * 1000.0))
+            self._gap_pending = False
+        self._last_buffer = now
+        return True
+
     def eof_func(self, *args):
         """
             called at the end of a stream
         """
+        self._gap_pending = True
         self._queue.next()
 
     def on_about_to_finish(self, pbin):
         #print "ABOUT TO FINISH!"
         tr = self._queue.next(player=False)
         if tr:
+            self._gap_pending = True
             self.play(tr, stop_last=False)
         else:
             glib.idle_add(self.stop)
@@ -101,39 +162,130 @@ class NormalPlayer(_base.ExailePlayer):
             Called when a message is received from gstreamer
         """
         if message.type == gst.MESSAGE_TAG and self.tag_func:
-            self.tag_func(message.parse_tag())
-            if not self.current.get_tag_raw('__length'):
-                try:
-                    duration = float(self.playbin.query_duration(
-                            gst.FORMAT_TIME, None)[0])/1000000000
-                    if duration > 0:
-                        self.current.set_tag_raw('__length', duration)
-                except gst.QueryError:
-                    logger.error("Couldn't query duration")
+            self._queue_tags(message.parse_tag())
         elif message.type == gst.MESSAGE_EOS and not self.is_paused():
             self.eof_func()
         elif message.type == gst.MESSAGE_ERROR:
             logger.error("%s %s" %(message, dir(message)) )
             a = message.parse_error()[0]
             glib.idle_add(self._on_playback_error, a.message)
-
-            # TODO: merge this into stop() and make it engine-agnostic somehow
-            curr = self.current
-            self._current = None
-            self.playbin.set_state(gst.STATE_NULL)
-            self.setup_pipe()
-            event.log_event("playback_track_end", self, curr)
-            event.log_event("playback_player_end", self, curr)
+            self._recover_from_error(a.message)
         elif message.type == gst.MESSAGE_BUFFERING:
-            percent = message.parse_buffering()
-            if not percent < 100:
-                logger.info('Buffering complete')
-            if percent % 5 == 0:
-                event.log_event('playback_buffering', self, percent)
+            download.handle_buffering(self, message, self._downloading)
         #elif message.type not in (gst.MESSAGE_STATE_CHANGED,):
         #    logger.debug("GSTREAMER: " + repr(message))
         return True
 
+    def _recover_from_error(self, message):
+        """
+            Resets the playbin after an error and moves on: network
+            tracks are retried up to player/error_retries times, anything
+            else is skipped. Each failure in a row waits a little longer,
+            and after player/error_skip_limit of them playback stops.
+        """
+        self.latency.cancel('start')
+        self.latency.cancel('seek')
+        self._gap_pending = False
+
+        # TODO: merge this into stop() and make it engine-agnostic somehow
+        curr = self.current
+        self._current = None
+        self.playbin.set_state(gst.STATE_NULL)
+        event.log_event("playback_track_end", self, curr)
+        if curr is None:
+            return
+
+        uri = curr.get_loc_for_io()
+        count = self.failures.add(uri, message)
+        logger.warning("Failed to play %s (%d failures so far)" % (uri, count))
+        event.log_event("playback_track_failed", self, curr)
+
+        if curr is not self._error_track:
+            self._error_track = curr
+            self._error_retries = 0
+        self._error_streak += 1
+        if self._error_streak > settings.get_option(
+                "player/error_skip_limit", 20):
+            logger.error("Too many playback errors in a row, stopping")
+            self._error_streak = 0
+            event.log_event("playback_player_end", self, curr)
+            return
+
+        retry = False
+        if not curr.is_local() and self._error_retries < \
+                settings.get_option("player/error_retries", 2):
+            self._error_retries += 1
+            retry = True
+
+        delay = 0
+        if self._error_streak > 1:
+            delay = min(self._ERROR_BACKOFF * 2**(self._error_streak - 2),
+                    self._ERROR_BACKOFF_MAX)
+        if self._error_id:
+            glib.source_remove(self._error_id)
+        self._error_id = glib.timeout_add(delay, self._advance_after_error,
+                curr, retry)
+
+    def _advance_after_error(self, track, retry):
+        self._error_id = 0
+        if self.current is not None:
+            return False # the user picked something else meanwhile
+        if not retry:
+            track = self._queue.next(player=False)
+        if track is None:
+            self._error_streak = 0
+            event.log_event("playback_player_end", self, None)
+        else:
+            self.play(track)
+        return False
+
+    def _queue_tags(self, tags):
+        """
+            Collects the tag messages of the current track, so that
+            streams sending several a second cause one tag_func call
+            per _TAG_WINDOW.
+        """
+        track = self.current
+        if self._pending_tags is None or self._pending_track is not track:
+            self._pending_tags = tags
+            self._pending_track = track
+        else:
+            self._pending_tags = self._pending_tags.merge(tags,
+                    gst.TAG_MERGE_REPLACE)
+        if not self._tags_id:
+            self._tags_id = glib.timeout_add(self._TAG_WINDOW,
+                    self._flush_tags)
+
+    def _flush_tags(self):
+        self._tags_id = 0
+        tags, self._pending_tags = self._pending_tags, None
+        track, self._pending_track = self._pending_track, None
+        # drop tags of a track that is no longer playing
+        if track is None or track is not self.current or not self.tag_func:
+            return False
+        self.tag_func(tags)
+        if not track.get_tag_raw('__length'):
+            self._probe_duration(track)
+        return False
+
+    def _probe_duration(self, track):
+        if self._probed_track is not track:
+            self._probed_track = track
+            self._probes = 0
+        if self._probes >= self._DURATION_PROBES:
+            return
+        self._probes += 1
+        if self._probes == self._DURATION_PROBES:
+            # last try here, leave it to a pipeline of its own
+            prober.add([track], urgent=True)
+        try:
+            duration = float(self.playbin.query_duration(
+                    gst.FORMAT_TIME, None)[0])/1000000000
+            if duration > 0:
+                track.set_tag_raw('__length', duration)
+        except gst.QueryError:
+            logger.debug("Couldn't query duration")
+
     def _get_current(self):
         return self._current
 
@@ -161,20 +313,12 @@ class NormalPlayer(_base.ExailePlayer):
             updates the total playtime for the currently playing track
         """
         if self.current and self._playtime_stamp:
-            last = self.current.get_tag_raw('__playtime')
-            if type(last) == str:
-                try:
-                    last = int(last)
-                except:
-                    last = 0
-            elif type(last) != int:
-                last = 0
-            self.current.set_tag_raw('__playtime', last + int(time.time() - \
-                    self._playtime_stamp))
+            playstats.add_playtime(self.current,
+                    time.time() - self._playtime_stamp)
             self._playtime_stamp = None
 
     def reset_playtime_stamp(self):
-        self._playtime_stamp = int(time.time())
+        self._playtime_stamp = time.time()
 
     def __notify_source(self, *args):
         # this is for handling multiple CD devices properly
@@ -190,9 +334,11 @@ class NormalPlayer(_base.ExailePlayer):
             if the track cannot be played, playback stops completely
         """
         if track is None:
+            self._gap_pending = False
             self.stop()
             return False
-        elif stop_last:
+        self.latency.begin('start')
+        if stop_last:
             self.stop(fire=False)
         else:
             self.stop(fire=False, onlyfire=True)
@@ -208,7 +354,13 @@ class NormalPlayer(_base.ExailePlayer):
         logger.info("Playing %s" % uri)
         self.reset_playtime_stamp()
 
+        self._downloading = download.wanted(track)
+        download.configure(self.playbin, self._downloading)
         self.playbin.set_property("uri", uri)
+        # playbin2's own volume element, the user's volume is elsewhere.
+        # On gapless transitions this takes effect as the new track
+        # enters the output queue, a moment early.
+        self.playbin.set_property("volume", analysis.get_gain(track))
         if urlparse.urlsplit(uri)[0] == "cdda":
             self.notify_id = self.playbin.connect('notify::source',
                     self.__notify_source)
@@ -225,6 +377,10 @@ class NormalPlayer(_base.ExailePlayer):
         """
             stop playback
         """
+        if self._error_id:
+            # don't move on from a failed track any more
+            glib.source_remove(self._error_id)
+            self._error_id = 0
         if self.is_playing() or self.is_paused():
             self.update_playtime()
             current = self.current
@@ -257,8 +413,9 @@ class NormalPlayer(_base.ExailePlayer):
             self.reset_playtime_stamp()
 
             # gstreamer does not buffer paused network streams, so if the user
-            # is unpausing a stream, just restart playback
-            if not (self.current.is_local() or
+            # is unpausing a stream, just restart playback; downloads go on
+            # while paused
+            if not (self.current.is_local() or self._downloading or
                     self.current.get_tag_raw('__length')):
                 self.playbin.set_state(gst.STATE_READY)
 
@@ -267,11 +424,22 @@ class NormalPlayer(_base.ExailePlayer):
             return True
         return False
 
+    def get_buffered(self):
+        """
+            Returns the (start, stop) percentages of the current track
+            that are downloaded around the play position, or None if
+            it is not played from a download buffer.
+        """
+        if not self._downloading:
+            return None
+        return download.get_buffered(self.playbin)
+
     def seek(self, value):
         """
             seek to the given position in the current stream
         """
         value = int(gst.SECOND * value)
+        self.latency.begin('seek')
         event.log_event('seek', self, value)
         seekevent = gst.event_new_seek(1.0, gst.FORMAT_TIME,
             gst.SEEK_FLAG_FLUSH,
@@ -34,15 +34,50 @@ import gst, gobject, glib
 
 from xl.nls import gettext as _
 from xl import event, settings, common
-from xl.player import _base, pipe
+from xl.player import _base, pipe, analysis, download, metrics, \
+        pcmtap, playstats, prober
 
 logger = logging.getLogger(__name__)
 
 class UnifiedPlayer(_base.ExailePlayer):
+    # how often (in ms) to look again for a duration that the decoder
+    # cannot report yet, and the longest we trust a single timer before
+    # re-checking the position against the stream clock
+    _CROSSFADE_POLL = 1000
+    _CROSSFADE_RECHECK = 5000
+    # how often (in ms) the output queue is sampled, how long (in s)
+    # after the user changes tracks or seeks an empty queue is expected,
+    # and how long (in s) without underruns before the queue may shrink
+    _HEALTH_INTERVAL = 1000
+    _UNDERRUN_GRACE = 1.0
+    _QUEUE_SHRINK_AFTER = 600
+    # tag messages arriving within this many ms are handed to tag_func
+    # together, and a missing duration is queried at most this many
+    # times per track
+    _TAG_WINDOW = 500
+    _DURATION_PROBES = 3
+
     def __init__(self):
         _base.ExailePlayer.__init__(self)
         self._current_stream = 1
         self._timer_id = 0
+        self._next_track = None
+        self._next_queued = False
+        self._prepare_wanted = False
+        self._commands = []
+        self._command_id = 0
+        self._last_unlinked = None
+        self._pending_tags = None
+        self._pending_track = None
+        self._tags_id = 0
+        self._probed_track = None
+        self._probes = 0
+
+        self.latency = metrics.LatencyTracker(self)
+        self.health = metrics.PipelineMetrics(self)
+        self._health_id = 0
+        self._underrun_grace = 0
+        self._tuned_at = 0
 
         # have to fix the caps because gst cant deal with having them change.
         # TODO: make this a preference and/or autodetect optimal based on the
@@ -64,6 +99,7 @@ class UnifiedPlayer(_base.ExailePlayer):
         self.streams = [None, None]
 
         self._load_queue_values()
+        self.audio_queue.connect("underrun", self._on_queue_underrun)
         self._setup_pipeline()
         self.setup_bus()
 
@@ -74,9 +110,79 @@ class UnifiedPlayer(_base.ExailePlayer):
         # is small enough to be unnoticeable while still maintaining
         # a decent buffer. This is done as a setting so users whose
         # collections are on slower media can increase it to preserve
-        # gapless, at the expense of UI lag.
-        self.audio_queue.set_property("max-size-time",
-                settings.get_option("player/queue_duration", 1000000))
+        # gapless, at the expense of UI lag. On top of that the queue
+        # grows by itself when it runs dry, see _tune_queue.
+        size = settings.get_option("player/queue_duration", 1000000)
+        if settings.get_option("player/queue_autotune", True):
+            size = max(size, settings.get_option(
+                "player/queue_duration_auto", 0))
+        self.audio_queue.set_property("max-size-time", size)
+        self.health.queue_size = size / gst.MSECOND
+
+    def _on_queue_underrun(self, queue):
+        # called from the streaming thread, so no state queries here
+        if self.streams[self._current_stream] is None:
+            return
+        if time.time() < self._underrun_grace:
+            return
+        logger.debug("Output queue ran dry")
+        self.health.add_underrun()
+
+    def _sample_health(self):
+        """
+            Records the output queue level and, with
+            player/latency_tracing, the pipeline latency, then lets the
+            queue size follow the underruns seen.
+        """
+        if not self.is_playing():
+            return True
+        level = self.audio_queue.get_property("current-level-time")
+        self.health.add_level(level / gst.MSECOND)
+        if settings.get_option("player/latency_tracing", False):
+            query = gst.query_new_latency()
+            if self.pipe.query(query):
+                live, minlat, maxlat = query.parse_latency()
+                self.health.add_latency(minlat / gst.MSECOND)
+        self._tune_queue()
+        return True
+
+    def _tune_queue(self):
+        """
+            Grows the output queue after underruns, up to
+            player/queue_duration_max, and shrinks it back towards
+            player/queue_duration after a long time without any.
+        """
+        if not settings.get_option("player/queue_autotune", True):
+            return
+        now = time.time()
+        size = self.audio_queue.get_property("max-size-time")
+        lower = settings.get_option("player/queue_duration", 1000000)
+        upper = settings.get_option("player/queue_duration_max",
+                1000*gst.MSECOND)
+        if self.health.count_underruns(self._tuned_at):
+            newsize = min(max(size*2, size + 50*gst.MSECOND), upper)
+        elif now - self._tuned_at > self._QUEUE_SHRINK_AFTER:
+            newsize = max(size/2, lower)
+        else:
+            return
+        self._tuned_at = now
+        if newsize == size:
+            return
+        logger.info("Output queue resized to %dms" % (newsize/gst.MSECOND))
+        self.audio_queue.set_property("max-size-time", newsize)
+        self.health.queue_size = newsize / gst.MSECOND
+        settings.set_option("player/queue_duration_auto", newsize)
+
+    def _start_health_timer(self):
+        if not self._health_id:
+            self._tuned_at = time.time()
+            self._health_id = glib.timeout_add(self._HEALTH_INTERVAL,
+                    self._sample_health)
+
+    def _stop_health_timer(self):
+        if self._health_id:
+            glib.source_remove(self._health_id)
+            self._health_id = 0
 
     def _setup_pipeline(self):
         self.pipe.add(
@@ -86,20 +192,24 @@ class UnifiedPlayer(_base.ExailePlayer):
                 )
         self.adder.link(self.audio_queue)
         self.audio_queue.link(self.mainbin)
+        # the mix, as it is heard
+        pcmtap.attach(self.mainbin.get_static_pad("sink"))
 
     def _on_drained(self, dec, stream):
         logger.debug("%s drained"%stream.get_name())
-        #if stream.track != self.current:
-        #    return
-        if not settings.get_option("player/crossfading", False):
-            tr = self._queue.next(player=False)
+        if stream is not self.streams[self._current_stream]:
+            # a stream that was being faded out ran dry, the next track
+            # is already playing
             self.unlink_stream(stream)
-            if tr is None:
-                self.stop()
-            else:
-                self.play(tr, user=False)
+            return
+        # either crossfading is off, or the crossfade never triggered
+        # because the duration could not be determined (eg. radio)
+        tr = self._take_next_track()
+        self.unlink_stream(stream)
+        if tr is None:
+            self._stop()
         else:
-            self.unlink_stream(stream)
+            self.play(tr, user=False)
 
     def setup_bus(self):
         """
@@ -107,28 +217,83 @@ class UnifiedPlayer(_base.ExailePlayer):
         """
         self.bus = self.pipe.get_bus()
         self.bus.add_signal_watch()
-        self.bus.enable_sync_message_emission()
         self.bus.connect('message', self.on_message)
 
     def on_message(self, bus, message, reading_tag = False):
         if message.type == gst.MESSAGE_EOS and not self.is_paused():
             logger.warning("EOS: ", message)
         elif message.type == gst.MESSAGE_TAG and self.tag_func:
-            self.tag_func(message.parse_tag())
-            if not self.current.get_tag_raw('__length'):
-                try:
-                    duration = float(self.mainbin.query_duration(
-                        gst.FORMAT_TIME, None)[0])/1000000000
-                    if duration > 0:
-                        self.current.set_tag_raw('__length', duration)
-                except gst.QueryError:
-                    logger.debug("Couldn't query duration via GStreamer")
+            stream = self._get_stream_of(message.src)
+            # ignore the tags of a stream that is fading out or prerolling
+            if stream is None or stream is self.streams[self._current_stream]:
+                self._queue_tags(message.parse_tag())
+        elif message.type == gst.MESSAGE_BUFFERING:
+            stream = self._get_stream_of(message.src)
+            if stream is not None and \
+                    stream is self.streams[self._current_stream]:
+                download.handle_buffering(self, message, stream.downloading)
         elif message.type == gst.MESSAGE_ERROR:
             logger.error("%s %s" %(message, dir(message)) )
             a = message.parse_error()[0]
             self._on_playback_error(a.message)
         return True
 
+    def _get_stream_of(self, element):
+        """
+            Returns the AudioStream an element belongs to, if any.
+        """
+        while element is not None and not isinstance(element, AudioStream):
+            element = element.get_parent()
+        return element
+
+    def _queue_tags(self, tags):
+        """
+            Collects the tag messages of the current track, so that
+            streams sending several a second cause one tag_func call
+            per _TAG_WINDOW.
+        """
+        track = self.current
+        if self._pending_tags is None or self._pending_track is not track:
+            self._pending_tags = tags
+            self._pending_track = track
+        else:
+            self._pending_tags = self._pending_tags.merge(tags,
+                    gst.TAG_MERGE_REPLACE)
+        if not self._tags_id:
+            self._tags_id = glib.timeout_add(self._TAG_WINDOW,
+                    self._flush_tags)
+
+    def _flush_tags(self):
+        self._tags_id = 0
+        tags, self._pending_tags = self._pending_tags, None
+        track, self._pending_track = self._pending_track, None
+        # drop tags of a track that is no longer playing
+        if track is None or track is not self.current or not self.tag_func:
+            return False
+        self.tag_func(tags)
+        if not track.get_tag_raw('__length'):
+            self._probe_duration(track)
+        return False
+
+    def _probe_duration(self, track):
+        if self._probed_track is not track:
+            self._probed_track = track
+            self._probes = 0
+        if self._probes >= self._DURATION_PROBES:
+            return
+        self._probes += 1
+        if self._probes == self._DURATION_PROBES:
+            # last try here, leave it to a pipeline of its own
+            prober.add([track], urgent=True)
+        stream = self.streams[self._current_stream]
+        if stream is None:
+            return
+        duration = stream.get_duration()
+        if duration > 0:
+            track.set_tag_raw('__length', float(duration)/gst.SECOND)
+        else:
+            logger.debug("Couldn't query duration via GStreamer")
+
     def _get_current(self):
         if self.streams[self._current_stream]:
             return self.streams[self._current_stream].get_current()
@@ -146,8 +311,80 @@ class UnifiedPlayer(_base.ExailePlayer):
         except AttributeError:
             return 0
 
+    def _open_command_window(self):
+        """
+            Starts a player/command_coalesce_window ms window in which
+            user plays are held back rather than run at once.
+        """
+        if self._command_id:
+            glib.source_remove(self._command_id)
+        self._command_id = glib.timeout_add(
+                settings.get_option("player/command_coalesce_window", 200),
+                self._run_commands)
+
+    def _queue_command(self, command, *args):
+        """
+            Queues a player command to run when the current command
+            window closes. A play supersedes everything queued before
+            it, and a seek replaces a seek right before it.
+        """
+        if command == 'play':
+            for name, oldargs in self._commands:
+                if name == 'play':
+                    event.log_event('playback_track_skipped', self,
+                            oldargs[0])
+            self._commands = []
+        elif command == 'seek' and self._commands and \
+                self._commands[-1][0] == 'seek':
+            self._commands.pop()
+        self._commands.append((command, args))
+        return True
+
+    @common.synchronized
+    def _run_commands(self):
+        self._command_id = 0
+        commands, self._commands = self._commands, []
+        for command, args in commands:
+            getattr(self, "_%s"%command)(*args)
+        if commands:
+            # the burst may go on, keep holding back what follows
+            self._open_command_window()
+        return False
+
+    @common.synchronized
+    def _cancel_commands(self):
+        if self._command_id:
+            glib.source_remove(self._command_id)
+            self._command_id = 0
+        for name, args in self._commands:
+            if name == 'play':
+                event.log_event('playback_track_skipped', self, args[0])
+                self.latency.cancel('start')
+        self._commands = []
+
     @common.synchronized
     def play(self, track, user=True):
+        """
+            plays the specified track. A track picked by the user
+            starts at once, but opens a player/command_coalesce_window
+            ms window: tracks picked within it are held back until it
+            closes, so that skipping through several tracks in a row
+            only starts the last one, and the others are reported as
+            skipped. Returns True for a held back track, which has not
+            started yet.
+        """
+        if not track:
+            return # we cant play nothing
+        self.latency.begin('start')
+        if user and settings.get_option("player/command_coalesce_window",
+                200) > 0:
+            if self._command_id:
+                return self._queue_command('play', track, user)
+            self._open_command_window()
+        return self._play(track, user)
+
+    @common.synchronized
+    def _play(self, track, user=True):
         if not track:
             return # we cant play nothing
 
@@ -156,8 +393,12 @@ class UnifiedPlayer(_base.ExailePlayer):
         logger.debug("Attmepting to play \"%s\""%track)
         next = 1-self._current_stream
 
-        if self.streams[next]:
-            self.unlink_stream(self.streams[next])
+        # reuse the stream prepared ahead of a crossfade if it is for
+        # this track, otherwise throw away whatever is in the slot
+        stream = self.streams[next]
+        if stream and not (stream.prepared and stream.get_track() is track):
+            self.unlink_stream(stream)
+            stream = None
 
         fading = False
         duration = 0
@@ -179,15 +420,32 @@ class UnifiedPlayer(_base.ExailePlayer):
         if not playing:
             event.log_event_sync('playback_reconfigure_bins', self, None)
 
-        self.streams[next] = AudioStream("Stream%s"%(next), caps=self.caps)
-        self.streams[next].dec.connect("drained", self._on_drained,
-                self.streams[next])
+        if user:
+            self._underrun_grace = time.time() + self._UNDERRUN_GRACE
+        if stream is None:
+            self.streams[next] = AudioStream("Stream%s"%(next),
+                    caps=self.caps, latency=self.latency)
+            self.streams[next].dec.connect("drained", self._on_drained,
+                    self.streams[next])
+
+            if not self.link_stream(self.streams[next], track):
+                self.latency.cancel('start')
+                return False
+        else:
+            stream.link(self.adder)
+            stream.unblock()
 
-        if not self.link_stream(self.streams[next], track):
-            return False
+        if not user:
+            # time the gap from whatever played last; for crossfades
+            # that stream is still running and the gap comes out as 0
+            self.streams[next].previous = \
+                    self.streams[self._current_stream] or self._last_unlinked
+        self._last_unlinked = None
 
         if fading:
             self.streams[next].set_volume(0)
+        else:
+            self.streams[next].set_volume(1)
 
         self.pipe.set_state(gst.STATE_PLAYING)
         self.streams[next]._settle_flag = 1
@@ -200,14 +458,16 @@ class UnifiedPlayer(_base.ExailePlayer):
                 glib.timeout_add(timeout, self._fade_stream,
                         self.streams[next], 1)
             if self.streams[self._current_stream]:
+                self.streams[self._current_stream].fading_out = True
                 glib.timeout_add(timeout, self._fade_stream,
                         self.streams[self._current_stream], -1, True)
-            if settings.get_option("player/crossfading", False):
-                time = int(track.get_tag_raw("__length")*1000 - duration)
-                glib.timer_id = glib.timeout_add(time,
-                        self._start_crossfade)
 
         self._current_stream = next
+        self._next_track = None
+        self._next_queued = False
+        self._prepare_wanted = False
+        self._reset_crossfade_timer()
+        self._start_health_timer()
         if not playing:
             event.log_event('playback_player_start', self, track)
         event.log_event('playback_track_start', self, track)
@@ -222,40 +482,167 @@ class UnifiedPlayer(_base.ExailePlayer):
             return True
 
     def _fade_stream(self, stream, direction, delete=False):
+        if stream not in self.streams:
+            return False # unlinked in the meantime
         current = stream.get_volume()
         current += direction/100.0
         stream.set_volume(current)
         if delete and current < 0.01:
             self.unlink_stream(stream)
+            if self._prepare_wanted:
+                self._prepare_wanted = False
+                self._prepare_next()
             return False
         return 0.01 <= current <= 1
 
+    def _take_next_track(self):
+        """
+            Returns the track to go to after the current one, advancing
+            the queue. It is only advanced once per transition, however
+            many times this gets called.
+        """
+        if not self._next_queued:
+            self._next_track = self._queue.next(player=False)
+            self._next_queued = True
+        return self._next_track
+
+    def _peek_next_track(self):
+        """
+            Returns the track the queue will most likely give next,
+            without advancing it, or None if that cannot be told (eg.
+            in shuffle mode).
+        """
+        queued = self._queue.get_ordered_tracks()
+        if queued:
+            return queued[0]
+        playlist = getattr(self._queue, 'current_playlist', None)
+        if playlist is None or getattr(playlist, 'random_enabled', True):
+            return None
+        tracks = playlist.get_ordered_tracks()
+        pos = playlist.get_current_pos() + 1
+        if pos < len(tracks):
+            return tracks[pos]
+        if tracks and getattr(playlist, 'repeat_enabled', False):
+            return tracks[0]
+        return None
+
+    def _prepare_next(self):
+        """
+            Starts decoding the track that is likely to come next,
+            blocked in front of the adder, so that the crossfade does
+            not wait for it to preroll. The queue is only advanced when
+            the crossfade starts; if it gives another track then, the
+            prepared stream is thrown away by _play().
+        """
+        next = 1-self._current_stream
+        stream = self.streams[next]
+        if stream and stream.prepared:
+            return
+        if stream and stream.fading_out:
+            # the slot still holds the last track, fading out after a
+            # short track or a long crossfade; _fade_stream calls us
+            # again once it is done with it
+            self._prepare_wanted = True
+            return
+        try:
+            tr = self._peek_next_track()
+        except Exception:
+            common.log_exception(log=logger)
+            tr = None
+        if tr is None:
+            return
+        if self.streams[next]:
+            self.unlink_stream(self.streams[next])
+        stream = AudioStream("Stream%s"%(next), caps=self.caps,
+                latency=self.latency)
+        stream.dec.connect("drained", self._on_drained, stream)
+        self.pipe.add(stream)
+        if not stream.set_track(tr):
+            # leave it to play() to report the failure when it is due
+            self.pipe.remove(stream)
+            return
+        stream.set_volume(0)
+        stream.preroll()
+        self.streams[next] = stream
+
+    def _check_crossfade(self):
+        """
+            Works out when the crossfade is due from the duration and
+            position the decoder reports, minus any silence at the end
+            of the track, and schedules the next step.
+        """
+        self._timer_id = 0
+        stream = self.streams[self._current_stream]
+        if stream is None:
+            return False
+        duration = stream.get_duration()
+        if not duration or self.is_paused():
+            # not prerolled yet, or an endless stream; look again later
+            self._timer_id = glib.timeout_add(self._CROSSFADE_POLL,
+                    self._check_crossfade)
+            return False
+
+        fade = 0
+        if settings.get_option("player/crossfading", False):
+            fade = settings.get_option("player/crossfade_duration", 3000)
+        end = self._get_audio_end(stream.get_track(), duration)
+        if end is None:
+            if not fade:
+                # no silence to skip, at least not yet; without a
+                # crossfade _on_drained moves on
+                self._timer_id = glib.timeout_add(self._CROSSFADE_RECHECK,
+                        self._check_crossfade)
+                return False
+            end = duration
+        lead = settings.get_option("player/crossfade_lead_time", 2000)
+        remaining = (end - stream.get_position()) / gst.MSECOND - fade
+        if remaining <= 0: # start crossfade now, we're late!
+            self._start_crossfade()
+        elif remaining <= lead:
+            self._prepare_next()
+            self._timer_id = glib.timeout_add(int(remaining),
+                    self._start_crossfade)
+        else:
+            self._timer_id = glib.timeout_add(
+                    int(min(remaining - lead, self._CROSSFADE_RECHECK)),
+                    self._check_crossfade)
+        return False
+
+    def _get_audio_end(self, track, duration):
+        """
+            Returns where the audio of `track` turns into silence for
+            good, in ns, or None if that is unknown or it does not.
+        """
+        if track is None or \
+                not settings.get_option("player/trim_silence", False):
+            return None
+        silence = analysis.SILENCE.get(track)
+        if not silence:
+            return None
+        end = int(silence['end'] * gst.SECOND)
+        if end >= duration:
+            return None
+        return end
+
     def _start_crossfade(self, *args):
-        tr = self._queue.next(player=False)
+        self._timer_id = 0
+        tr = self._take_next_track()
         if tr is not None:
             self.play(tr, user=False)
-        if self._timer_id:
-            glib.source_remove(self._timer_id)
-        if tr is None:
-            self._timer_id = glib.timeout_add(1000 * \
-                    (self.current.get_tag_raw('__length') - self.get_time()),
-                    self.stop)
+        # with nothing left to play the current stream runs until it is
+        # drained, and _on_drained stops playback
         return False
 
     def _reset_crossfade_timer(self):
         if self._timer_id:
             glib.source_remove(self._timer_id)
-        if not self.is_playing():
+            self._timer_id = 0
+        if self.is_paused():
             return
-        if not settings.get_option("player/crossfading", False):
+        if not settings.get_option("player/crossfading", False) and \
+                not settings.get_option("player/trim_silence", False):
             return
-        duration = settings.get_option("player/crossfade_duration", 3000)
-        time = int( self.current.get_tag_raw('__length')*1000 - \
-                (self.get_time()*1000 + duration) )
-        if time < duration: # start crossfade now, we're late!
-            glib.idle_add(self._start_crossfade)
-        else:
-            self._timer_id = glib.timeout_add(time, self._start_crossfade)
+        self._timer_id = glib.idle_add(self._check_crossfade)
 
     def unlink_stream(self, stream):
         try:
@@ -272,8 +659,14 @@ class UnifiedPlayer(_base.ExailePlayer):
             except gst.RemoveError:
                 logger.debug("Failed to remove stream %s"%stream)
             if stream in self.streams:
+                if stream is self.streams[self._current_stream]:
+                    self._last_unlinked = stream
                 self.streams[self.streams.index(stream)] = None
-            event.log_event("playback_track_end", self, current)
+            if not stream.prepared:
+                # count the time played before announcing the end, the
+                # state change above only happens later
+                stream.update_playtime()
+                event.log_event("playback_track_end", self, current)
             return True
         except AttributeError:
             return True
@@ -286,21 +679,31 @@ class UnifiedPlayer(_base.ExailePlayer):
         stream.link(self.adder)
         if not stream.set_track(track):
             logger.error("Failed to start playing \"%s\""%track)
-            self.stop()
+            self._stop()
             return False
         return True
 
     @common.synchronized
     def stop(self):
         """
-            stop playback
+            stop playback, dropping any queued commands
         """
+        self._cancel_commands()
+        return self._stop()
+
+    @common.synchronized
+    def _stop(self):
         if self.is_playing() or self.is_paused():
             current = self.current
             self.pipe.set_state(gst.STATE_NULL)
             for stream in self.streams:
                 self.unlink_stream(stream)
+            self._next_track = None
+            self._next_queued = False
+            self._prepare_wanted = False
+            self._last_unlinked = None
             self._reset_crossfade_timer()
+            self._stop_health_timer()
             event.log_event('playback_player_end', self, current)
             return True
         return False
@@ -310,6 +713,12 @@ class UnifiedPlayer(_base.ExailePlayer):
         """
             pause playback. DOES NOT TOGGLE
         """
+        if self._commands:
+            return self._queue_command('pause')
+        return self._pause()
+
+    @common.synchronized
+    def _pause(self):
         if self.is_playing():
             self.pipe.set_state(gst.STATE_PAUSED)
             self._reset_crossfade_timer()
@@ -322,34 +731,73 @@ class UnifiedPlayer(_base.ExailePlayer):
         """
             unpause playback
         """
+        if self._commands:
+            return self._queue_command('unpause')
+        return self._unpause()
+
+    @common.synchronized
+    def _unpause(self):
         if self.is_paused():
             # gstreamer does not buffer paused network streams, so if the user
-            # is unpausing a stream, just restart playback
-            if not self.current.is_local():
+            # is unpausing a stream, just restart playback; downloads go on
+            # while paused
+            stream = self.streams[self._current_stream]
+            if not (self.current.is_local() or stream.downloading):
                 self.pipe.set_state(gst.STATE_READY)
 
+            self._underrun_grace = time.time() + self._UNDERRUN_GRACE
             self.pipe.set_state(gst.STATE_PLAYING)
             self._reset_crossfade_timer()
             event.log_event('playback_player_resume', self, self.current)
             return True
         return False
 
+    def get_buffered(self):
+        """
+            Returns the (start, stop) percentages of the current track
+            that are downloaded around the play position, or None if
+            it is not played from a download buffer.
+        """
+        stream = self.streams[self._current_stream]
+        if stream is None or not stream.downloading:
+            return None
+        return download.get_buffered(stream.dec)
+
     @common.synchronized
     def seek(self, value):
         """
             seek to the given position in the current stream
         """
+        if self._commands:
+            return self._queue_command('seek', value)
+        return self._seek(value)
+
+    @common.synchronized
+    def _seek(self, value):
+        self._underrun_grace = time.time() + self._UNDERRUN_GRACE
         self.streams[self._current_stream].seek(value)
         self._reset_crossfade_timer()
 
 
 class AudioStream(gst.Bin):
-    def __init__(self, name, caps=None):
+    def __init__(self, name, caps=None, latency=None):
         gst.Bin.__init__(self, name)
         self.notify_id = None
         self.track = None
+        self.duration = 0
+        self.prepared = False
+        self.fading_out = False
+        self.downloading = False
+        self.gain = 1.0
         self._playtime_stamp = None
 
+        # timing, see metrics.LatencyTracker
+        self.latency = latency
+        self.previous = None
+        self.first_buffer = None
+        self.last_buffer = None
+        self._new_segment = False
+
         self.last_position = 0
         self._settle_flag = 0
         self._settle_trap = 0
@@ -380,6 +828,29 @@ class AudioStream(gst.Bin):
 
         self.src = gst.GhostPad("src", self.vol.get_static_pad("src"))
         self.add_pad(self.src)
+        if self.latency:
+            self.src.add_event_probe(self._on_src_event)
+            self.src.add_buffer_probe(self._on_src_buffer)
+
+    def _on_src_event(self, pad, ev):
+        if ev.type == gst.EVENT_NEWSEGMENT and self.first_buffer:
+            self._new_segment = True
+        return True
+
+    def _on_src_buffer(self, pad, buf):
+        now = time.time()
+        if self.first_buffer is None:
+            self.first_buffer = now
+            self.latency.end('start', now)
+            previous, self.previous = self.previous, None
+            if previous is not None and previous.last_buffer is not None:
+                self.latency.record('gap',
+                        max(0.0, (now - previous.last_buffer) * 1000.0))
+        elif self._new_segment:
+            self._new_segment = False
+            self.latency.end('seek', now)
+        self.last_buffer = now
+        return True
 
     def _dec_pad_cb(self, dec, v):
         try:
@@ -387,11 +858,32 @@ class AudioStream(gst.Bin):
         except:
             pass
 
+    def _blocked_cb(self, pad, blocked):
+        pass
+
+    def preroll(self):
+        """
+            Decodes up to the first buffer with the src pad blocked, so
+            the stream can be linked and started later without delay.
+        """
+        self.prepared = True
+        self.src.set_blocked_async(True, self._blocked_cb)
+        gst.Bin.set_state(self, gst.STATE_PAUSED)
+
+    def unblock(self):
+        """
+            Lets a prerolled stream push data again. It must already be
+            linked.
+        """
+        self.prepared = False
+        self.src.set_blocked_async(False, self._blocked_cb)
+
     def set_volume(self, vol):
-        self.vol.set_property("volume", vol)
+        # vol is the fade level, the track's gain comes on top
+        self.vol.set_property("volume", vol * self.gain)
 
     def get_volume(self):
-        return self.vol.get_property("volume")
+        return self.vol.get_property("volume") / self.gain
 
     def get_track(self):
         return self.track
@@ -406,12 +898,16 @@ class AudioStream(gst.Bin):
                 return False
 
         self.track = track
+        self.duration = 0
+        self.gain = analysis.get_gain(track)
 
         uri = track.get_loc_for_io()
 
         logger.info("Playing %s" % uri)
         self.reset_playtime_stamp()
 
+        self.downloading = download.wanted(track)
+        download.configure(self.dec, self.downloading)
         self.dec.set_property("uri", uri)
 
         # TODO: abstract this into generic uri handling via providers
@@ -433,20 +929,12 @@ class AudioStream(gst.Bin):
             updates the total playtime for the currently playing track
         """
         if self.track and self._playtime_stamp:
-            last = self.track.get_tag_raw('__playtime')
-            if type(last) == str:
-                try:
-                    last = int(last)
-                except:
-                    last = 0
-            elif type(last) != int:
-                last = 0
-            self.track.set_tag_raw('__playtime',
-                    last + int(time.time() - self._playtime_stamp) )
+            playstats.add_playtime(self.track,
+                    time.time() - self._playtime_stamp)
             self._playtime_stamp = None
 
     def reset_playtime_stamp(self):
-        self._playtime_stamp = int(time.time())
+        self._playtime_stamp = time.time()
 
     def set_state(self, state):
         logger.debug("Setting state on %s %s"%(self.get_name(), state))
@@ -487,6 +975,26 @@ class AudioStream(gst.Bin):
         else:
             return None
 
+    def get_duration(self):
+        """
+            Returns the duration of the stream in nanoseconds as reported
+            by the decoder, falling back to the __length tag while the
+            decoder cannot tell. Returns 0 if neither is known.
+        """
+        if self.duration:
+            return self.duration
+        try:
+            duration = self.dec.query_duration(gst.FORMAT_TIME)[0]
+        except gst.QueryError:
+            duration = 0
+        if duration > 0:
+            self.duration = duration
+            return duration
+        try:
+            return int(float(self.track.get_tag_raw('__length')) * gst.SECOND)
+        except (AttributeError, TypeError, ValueError):
+            return 0
+
     def get_position(self):
         if self.is_paused():
             return self.last_position
@@ -533,6 +1041,8 @@ class AudioStream(gst.Bin):
             self._seek_event.wait()
 
         value = int(gst.SECOND * value)
+        if self.latency:
+            self.latency.begin('seek')
         event.log_event('seek', self, value)
         seekevent = gst.event_new_seek(1.0, gst.FORMAT_TIME,
             gst.SEEK_FLAG_FLUSH,gst.SEEK_TYPE_SET, value,
@@ -0,0 +1,361 @@
+# Copyright (C) 2008-2010 Adam Olsen
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 675 Mass Ave, Cambridge, MA 02139, USA.
+#
+#
+# The developers of the Exaile media player hereby grant permission
+# for non-GPL compatible GStreamer and Exaile plugins to be used and
+# distributed together with GStreamer and Exaile. This permission is
+# above and beyond the permissions granted by the GPL license by which
+# Exaile is covered. If you modify this code, you may extend this
+# exception to your version of the code, but you are not obligated to
+# do so. If you do not wish to do so, delete this exception statement
+# from your version.
+
+import logging
+import threading
+import time
+from collections import deque
+
+from xl import event
+
+logger = logging.getLogger(__name__)
+
+
+class LatencyTracker(object):
+    """
+        Measures timing spans of a player engine, such as the time from
+        play() to the first buffer of the new track.
+
+        The engines use these spans:
+
+        * ``start``: play() until the first buffer of the track
+        * ``seek``: seek() until the first buffer after the flush
+        * ``gap``: last buffer of a track until the first buffer of the
+          track that automatically follows it (0 when they overlap)
+
+        Every finished span is announced with the ``playback_latency``
+        event, whose data is a ``(span, milliseconds)`` tuple. Spans
+        are ended from GStreamer streaming threads, so everything here
+        is locked.
+    """
+    def __init__(self, player, samples=100):
+        """
+            :param player: the player the spans are reported for
+            :param samples: number of measurements kept per span
+        """
+        self.player = player
+        self.samples = samples
+        self._lock = threading.Lock()
+        self._open = {}
+        self._spans = {}
+
+    def begin(self, span, stamp=None):
+        """
+            Starts (or restarts) measuring a span.
+        """
+        if stamp is None:
+            stamp = time.time()
+        self._lock.acquire()
+        try:
+            self._open[span] = stamp
+        finally:
+            self._lock.release()
+
+    def cancel(self, span):
+        """
+            Forgets about a span that will never finish.
+        """
+        self._lock.acquire()
+        try:
+            self._open.pop(span, None)
+        finally:
+            self._lock.release()
+
+    def end(self, span, stamp=None):
+        """
+            Finishes a span started with begin().
+
+            Returns the measured time in milliseconds, or None if the
+            span was not running.
+        """
+        if stamp is None:
+            stamp = time.time()
+        self._lock.acquire()
+        try:
+            start = self._open.pop(span, None)
+        finally:
+            self._lock.release()
+        if start is None:
+            return None
+        ms = (stamp - start) * 1000.0
+        self.record(span, ms)
+        return ms
+
+    def record(self, span, ms):
+        """
+            Adds a measurement taken elsewhere.
+        """
+        self._lock.acquire()
+        try:
+            try:
+                values = self._spans[span]
+            except KeyError:
+                values = self._spans[span] = deque(maxlen=self.samples)
+            values.append(ms)
+        finally:
+            self._lock.release()
+        event.log_event('playback_latency', self.player, (span, ms))
+
+    def reset(self):
+        self._lock.acquire()
+        try:
+            self._open.clear()
+            self._spans.clear()
+        finally:
+            self._lock.release()
+
+    def get_stats(self):
+        """
+            Returns a dict of span name -> dict with the ``count``,
+            ``last``, ``mean``, ``min``, ``max`` and ``p95`` of the
+            measurements kept, in milliseconds.
+        """
+        self._lock.acquire()
+        try:
+            spans = [(k, list(v)) for k, v in self._spans.iteritems()]
+        finally:
+            self._lock.release()
+        stats = {}
+        for span, values in spans:
+            if not values:
+                continue
+            ordered = sorted(values)
+            stats[span] = {
+                    'count': len(values),
+                    'last': values[-1],
+                    'mean': sum(values) / len(values),
+                    'min': ordered[0],
+                    'max': ordered[-1],
+                    'p95': ordered[min(len(ordered)-1,
+                        int(len(ordered) * 0.95))],
+                    }
+        return stats
+
+    def format_stats(self):
+        """
+            Returns the stats as a human-readable table.
+        """
+        lines = ["%-8s %6s %9s %9s %9s %9s" %
+                ('span', 'count', 'mean', 'min', 'max', 'p95')]
+        for span, s in sorted(self.get_stats().iteritems()):
+            lines.append("%-8s %6d %7.1fms %7.1fms %7.1fms %7.1fms" %
+                    (span, s['count'], s['mean'], s['min'], s['max'],
+                        s['p95']))
+        return "\n".join(lines)
+
+    def dump(self):
+        """
+            Logs the stats.
+        """
+        logger.info("Playback latency for %s:\n%s" %
+                (self.player.__class__.__name__, self.format_stats()))
+
+
+class PipelineMetrics(object):
+    """
+        Rolling health figures for a playback pipeline: how full its
+        output queue is, how often it ran dry and, if latency tracing
+        is enabled, the latency the pipeline reports.
+
+        Only the last `window` seconds of samples are kept, apart from
+        the total number of underruns. Every underrun is announced with
+        the ``playback_underrun`` event.
+    """
+    def __init__(self, player, window=60):
+        """
+            :param player: the player the metrics are reported for
+            :param window: seconds of samples to keep
+        """
+        self.player = player
+        self.window = window
+        self.underruns_total = 0
+        self.queue_size = 0
+        self._lock = threading.Lock()
+        self._levels = deque()
+        self._latencies = deque()
+        self._underruns = deque()
+
+    def _expire(self, now):
+        thresh = now - self.window
+        for samples in (self._levels, self._latencies):
+            while samples and samples[0][0] < thresh:
+                samples.popleft()
+        while self._underruns and self._underruns[0] < thresh:
+            self._underruns.popleft()
+
+    def add_level(self, ms, stamp=None):
+        """
+            Records how many milliseconds of audio the queue holds.
+        """
+        if stamp is None:
+            stamp = time.time()
+        self._lock.acquire()
+        try:
+            self._levels.append((stamp, ms))
+            self._expire(stamp)
+        finally:
+            self._lock.release()
+
+    def add_latency(self, ms, stamp=None):
+        """
+            Records the minimum latency reported by the pipeline.
+        """
+        if stamp is None:
+            stamp = time.time()
+        self._lock.acquire()
+        try:
+            self._latencies.append((stamp, ms))
+            self._expire(stamp)
+        finally:
+            self._lock.release()
+
+    def add_underrun(self, stamp=None):
+        """
+            Records that the queue ran dry while playing.
+        """
+        if stamp is None:
+            stamp = time.time()
+        self._lock.acquire()
+        try:
+            self._underruns.append(stamp)
+            self.underruns_total += 1
+            self._expire(stamp)
+        finally:
+            self._lock.release()
+        event.log_event('playback_underrun', self.player, stamp)
+
+    def count_underruns(self, since=0):
+        """
+            Returns the number of underruns within the window that
+            happened after `since`.
+        """
+        self._lock.acquire()
+        try:
+            return len([u for u in self._underruns if u > since])
+        finally:
+            self._lock.release()
+
+    def get_metrics(self):
+        """
+            Returns a dict with the current ``queue_size`` and the
+            ``queue_level`` and ``latency`` (each a dict of ``min``,
+            ``mean`` and ``max``, or None without samples) over the
+            window, all in milliseconds, along with ``underruns`` in
+            the window and ``underruns_total``.
+        """
+        self._lock.acquire()
+        try:
+            self._expire(time.time())
+            levels = [v for s, v in self._levels]
+            latencies = [v for s, v in self._latencies]
+            underruns = len(self._underruns)
+        finally:
+            self._lock.release()
+
+        def summary(values):
+            if not values:
+                return None
+            return {'min': min(values), 'max': max(values),
+                    'mean': sum(values) / len(values)}
+
+        return {'queue_size': self.queue_size,
+                'queue_level': summary(levels),
+                'latency': summary(latencies),
+                'underruns': underruns,
+                'underruns_total': self.underruns_total}
+
+
+class FailureStats(object):
+    """
+        Counts playback failures per uri, so that the engines and the
+        user can tell bad files apart from bad luck.
+    """
+    def __init__(self, maxentries=1000):
+        """
+            :param maxentries: number of uris to remember; the ones
+                that failed longest ago are forgotten first
+        """
+        self.maxentries = maxentries
+        self._lock = threading.Lock()
+        self._failures = {}
+
+    def add(self, uri, message):
+        """
+            Records a failure to play `uri`, returns how often it has
+            failed so far.
+        """
+        self._lock.acquire()
+        try:
+            entry = self._failures.get(uri)
+            if entry is None:
+                entry = self._failures[uri] = {'count': 0}
+            entry['count'] += 1
+            entry['last'] = time.time()
+            entry['message'] = message
+            if len(self._failures) > self.maxentries:
+                oldest = min(self._failures.iteritems(),
+                        key=lambda i: i[1]['last'])[0]
+                del self._failures[oldest]
+            return entry['count']
+        finally:
+            self._lock.release()
+
+    def get(self, uri):
+        """
+            Returns a dict with the ``count``, ``last`` failure time and
+            error ``message`` for `uri`, or None if it never failed.
+        """
+        self._lock.acquire()
+        try:
+            entry = self._failures.get(uri)
+            return entry and dict(entry)
+        finally:
+            self._lock.release()
+
+    def clear(self, uri=None):
+        """
+            Forgets the failures of `uri`, or of every uri.
+        """
+        self._lock.acquire()
+        try:
+            if uri is None:
+                self._failures.clear()
+            else:
+                self._failures.pop(uri, None)
+        finally:
+            self._lock.release()
+
+    def get_stats(self):
+        """
+            Returns a dict of uri -> failure dict, see get().
+        """
+        self._lock.acquire()
+        try:
+            return dict((k, dict(v)) for k, v in self._failures.iteritems())
+        finally:
+            self._lock.release()
+
+# vim: et sts=4 sw=4
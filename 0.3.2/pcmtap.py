@@ -0,0 +1,387 @@
+# Copyright (C) 2008-2010 Adam Olsen
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 675 Mass Ave, Cambridge, MA 02139, USA.
+#
+#
+# The developers of the Exaile media player hereby grant permission
+# for non-GPL compatible GStreamer and Exaile plugins to be used and
+# distributed together with GStreamer and Exaile. This permission is
+# above and beyond the permissions granted by the GPL license by which
+# Exaile is covered. If you modify this code, you may extend this
+# exception to your version of the code, but you are not obligated to
+# do so. If you do not wish to do so, delete this exception statement
+# from your version.
+
+"""
+    Decoded audio for visualisers and analysis plugins.
+
+    The engines hand every buffer on its way to the audio sink to the
+    tap, which copies it into a ring buffer in shared memory. Readers
+    map the same memory and get NumPy views of it, so any number of
+    them, in Exaile or in other processes, see the audio without
+    decoding it again or copying it around::
+
+        reader = pcmtap.open_reader()
+        samples, timestamp = reader.latest(2048)
+        ...
+        reader.close()
+
+    The tap only runs while a reader is open, or all the time with
+    ``player/pcmtap``; the ring is ``player/pcmtap_size`` bytes large.
+    Other processes find it at the path logged on start, see get_path().
+"""
+
+import logging
+import mmap
+import os
+import struct
+import tempfile
+import threading
+
+import pygst
+pygst.require('0.10')
+import gst
+
+from xl import event, settings
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+logger = logging.getLogger(__name__)
+
+# magic, generation, rate, channels, NumPy dtype, capacity and mirror
+# size in frames, frames written so far, timestamp (ns) of the end of
+# the last buffer
+HEADER = struct.Struct("<8sIII4sIIQq")
+MAGIC = "EXPCMTAP"
+
+
+def _get_dtype(caps):
+    """
+        Returns the NumPy dtype string for the samples in `caps`, or
+        None if readers could not make sense of them.
+    """
+    s = caps[0]
+    order = '<'
+    if s.has_field('endianness') and s['endianness'] == 4321:
+        order = '>'
+    width = s['width']
+    if s.get_name() == 'audio/x-raw-float' and width in (32, 64):
+        return '%sf%d' % (order, width / 8)
+    if s.get_name() == 'audio/x-raw-int' and width in (8, 16, 32):
+        if width != s['depth']:
+            return None
+        return '%s%s%d' % (order, s['signed'] and 'i' or 'u', width / 8)
+    return None
+
+
+class RingBuffer(object):
+    """
+        The writing end of the shared memory. The first `margin` frames
+        of the ring are mirrored behind its end, so that any run of up
+        to `margin` frames can be read in one piece.
+    """
+    def __init__(self, path, size):
+        self.path = path
+        self.size = size
+        fd = os.open(path, os.O_RDWR | os.O_CREAT | os.O_TRUNC, 0600)
+        try:
+            os.ftruncate(fd, size)
+            self.map = mmap.mmap(fd, size)
+        finally:
+            os.close(fd)
+        self.generation = 0
+        self.format = None
+        self.framesize = 0
+        self.capacity = 0
+        self.margin = 0
+        self.written = 0
+        self.timestamp = -1
+
+    def close(self):
+        self.map.close()
+        try:
+            os.unlink(self.path)
+        except OSError:
+            pass
+
+    def set_format(self, rate, channels, dtype):
+        """
+            Starts over with audio of another format.
+        """
+        self.format = (rate, channels, dtype)
+        self.generation += 1
+        self.framesize = channels * int(dtype[2:])
+        room = (self.size - HEADER.size) / self.framesize
+        self.margin = room / 5
+        self.capacity = room - self.margin
+        self.written = 0
+        self.timestamp = -1
+        self._write_header()
+
+    def _write_header(self):
+        rate, channels, dtype = self.format
+        self.map[:HEADER.size] = HEADER.pack(MAGIC, self.generation, rate,
+                channels, dtype, self.capacity, self.margin, self.written,
+                self.timestamp)
+
+    def _copy(self, data, start, pos, frames):
+        fs = self.framesize
+        self.map.seek(HEADER.size + pos * fs)
+        self.map.write(buffer(data, start * fs, frames * fs))
+        if pos < self.margin:
+            mirrored = min(frames, self.margin - pos)
+            self.map.seek(HEADER.size + (self.capacity + pos) * fs)
+            self.map.write(buffer(data, start * fs, mirrored * fs))
+
+    def write(self, data, timestamp):
+        """
+            Appends the frames in the string `data`. `timestamp` is the
+            stream time at their end, or -1.
+        """
+        frames = len(data) / self.framesize
+        start = max(0, frames - self.capacity)
+        frames -= start
+        pos = self.written % self.capacity
+        first = min(frames, self.capacity - pos)
+        self._copy(data, start, pos, first)
+        if first < frames:
+            self._copy(data, start + first, 0, frames - first)
+        # the header goes last, readers trust everything it covers
+        self.written += frames + start
+        self.timestamp = timestamp
+        self._write_header()
+
+
+class Reader(object):
+    """
+        The reading end of the shared memory. Needs NumPy.
+
+        The views it returns are not copies; they stay valid until the
+        writer comes round the ring again, about ``capacity`` frames
+        later. Use check() or copy them if that matters.
+    """
+    def __init__(self, path):
+        f = open(path, 'rb')
+        try:
+            self.map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        finally:
+            f.close()
+        self.generation = None
+        self.position = 0
+        self.dropped = 0
+        self._data = None
+
+    def close(self):
+        self._data = None
+        self.map.close()
+        _TAP.release()
+
+    def header(self):
+        """
+            Returns a dict with the ``generation``, ``rate``,
+            ``channels``, ``dtype``, ``capacity``, ``margin``,
+            ``written`` and ``timestamp`` fields of the ring.
+        """
+        fields = HEADER.unpack(self.map[:HEADER.size])
+        if fields[0] != MAGIC:
+            return None
+        return dict(zip(('generation', 'rate', 'channels', 'dtype',
+            'capacity', 'margin', 'written', 'timestamp'), fields[1:]))
+
+    def _view(self, h):
+        if h['generation'] != self.generation:
+            self.generation = h['generation']
+            self.position = 0
+            dtype = numpy.dtype(h['dtype'].rstrip('\0'))
+            self._data = numpy.frombuffer(self.map, dtype,
+                    (h['capacity'] + h['margin']) * h['channels'],
+                    HEADER.size).reshape(-1, h['channels'])
+        return self._data
+
+    def _slice(self, h, start, frames):
+        data = self._view(h)
+        pos = start % h['capacity']
+        view = data[pos:pos+frames]
+        timestamp = -1
+        if h['timestamp'] >= 0:
+            timestamp = h['timestamp'] - (h['written'] - start) * \
+                    gst.SECOND / h['rate']
+        return view, timestamp
+
+    def latest(self, frames):
+        """
+            Returns a view of the last `frames` frames written, at most
+            ``margin`` of them, as an array of shape (frames, channels),
+            together with the stream time (ns) of the first one, or -1.
+            Returns (None, -1) while there is nothing to read.
+        """
+        h = self.header()
+        if h is None or not h['written']:
+            return None, -1
+        frames = min(frames, h['margin'], h['written'])
+        return self._slice(h, h['written'] - frames, frames)
+
+    def read(self, frames=None):
+        """
+            Returns a view of the frames written since the last read(),
+            at most `frames` or ``margin`` of them, and the stream time
+            of the first one. If the reader fell behind, the frames that
+            were overwritten are skipped, see ``dropped``.
+        """
+        h = self.header()
+        if h is None:
+            return None, -1
+        self._view(h)
+        self.dropped = 0
+        oldest = max(0, h['written'] - h['capacity'] + h['margin'])
+        if self.position < oldest:
+            self.dropped = oldest - self.position
+            self.position = oldest
+        count = min(h['written'] - self.position, h['margin'])
+        if frames is not None:
+            count = min(count, frames)
+        view = self._slice(h, self.position, count)
+        self.position += count
+        return view
+
+    def check(self, start):
+        """
+            Returns whether the frames from `start` on (counted like
+            ``written``) have not been overwritten yet.
+        """
+        h = self.header()
+        return h is not None and h['generation'] == self.generation and \
+                h['written'] - start <= h['capacity'] - h['margin']
+
+
+class PCMTap(object):
+    """
+        Feeds the ring buffer from the pads the engines attach.
+    """
+    def __init__(self):
+        self.path = None
+        self._ring = None
+        self._users = 0
+        self._lock = threading.Lock()
+
+    def attach(self, pad):
+        """
+            Taps the decoded audio flowing through `pad`.
+        """
+        pad.add_buffer_probe(self._on_buffer)
+
+    def acquire(self):
+        self._lock.acquire()
+        try:
+            if self._ring is None:
+                self._open()
+            self._users += 1
+        finally:
+            self._lock.release()
+
+    def release(self):
+        self._lock.acquire()
+        try:
+            self._users = max(0, self._users - 1)
+        finally:
+            self._lock.release()
+
+    def _open(self):
+        directory = '/dev/shm'
+        if not os.path.isdir(directory):
+            directory = tempfile.gettempdir()
+        self.path = os.path.join(directory, 'exaile-pcm-%d' % os.getpid())
+        self._ring = RingBuffer(self.path,
+                settings.get_option("player/pcmtap_size", 4 * 1024 * 1024))
+        logger.info("Publishing decoded audio at %s" % self.path)
+
+    def close(self):
+        self._lock.acquire()
+        try:
+            if self._ring is not None:
+                self._ring.close()
+            self._ring = None
+            self.path = None
+        finally:
+            self._lock.release()
+
+    def _on_buffer(self, pad, buf):
+        if not self._users:
+            return True
+        caps = buf.caps or pad.get_negotiated_caps()
+        if caps is None:
+            return True
+        self._lock.acquire()
+        try:
+            ring = self._ring
+            if ring is None:
+                return True
+            s = caps[0]
+            format = (s['rate'], s['channels'], _get_dtype(caps))
+            if format != ring.format:
+                if format[2] is None:
+                    return True
+                ring.set_format(*format)
+            timestamp = -1
+            if buf.timestamp != gst.CLOCK_TIME_NONE:
+                timestamp = buf.timestamp
+                if buf.duration != gst.CLOCK_TIME_NONE:
+                    timestamp += buf.duration
+            ring.write(buf.data, timestamp)
+        finally:
+            self._lock.release()
+        return True
+
+
+def open_reader():
+    """
+        Starts the tap if needed and returns a Reader for it. Close it
+        when done.
+    """
+    if numpy is None:
+        raise ImportError("the PCM tap readers need NumPy")
+    _TAP.acquire()
+    try:
+        return Reader(_TAP.path)
+    except Exception:
+        _TAP.release()
+        raise
+
+
+def get_path():
+    """
+        Returns the path of the shared memory, or None while the tap
+        is not running.
+    """
+    return _TAP.path
+
+
+def attach(pad):
+    _TAP.attach(pad)
+
+
+def _on_quit(type, exaile, data):
+    _TAP.close()
+
+
+_TAP = PCMTap()
+if settings.get_option("player/pcmtap", False):
+    _TAP.acquire()
+event.add_callback(_on_quit, 'quit_application')
+
+# vim: et sts=4 sw=4
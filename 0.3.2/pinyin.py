@@ -0,0 +1,223 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2008-2010 Adam Olsen
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 675 Mass Ave, Cambridge, MA 02139, USA.
+#
+#
+# The developers of the Exaile media player hereby grant permission
+# for non-GPL compatible GStreamer and Exaile plugins to be used and
+# distributed together with GStreamer and Exaile. This permission is
+# above and beyond the permissions granted by the GPL license by which
+# Exaile is covered. If you modify this code, you may extend this
+# exception to your version of the code, but you are not obligated to
+# do so. If you do not wish to do so, delete this exception statement
+# from your version.
+
+
+"""
+    Pinyin for Chinese tag values, so that they can be sorted and
+    searched by how they are read rather than by code point.
+
+    The readings of all characters from U+3400 to U+9FFF, and the
+    Traditional to Simplified folding, come from a table generated by
+    tools/mkpinyin.py. Characters with several readings get their most
+    common one, except in the words of _PHRASES and, at the start of a
+    name, the surnames of _SURNAMES.
+"""
+
+import re
+
+from xl.trax import _pinyintable as _table
+
+_han = re.compile(u'[\u3400-\u9fff]')
+
+# ord(traditional) -> ord(simplified), for unicode.translate()
+_FOLD = dict(zip([ord(c) for c in _table.TRADITIONAL],
+    [ord(c) for c in _table.SIMPLIFIED]))
+# character -> syllable, without and with tones; decoded on first use
+_READINGS = None
+
+# words in which a character is not read the common way
+_PHRASES = {
+    u'重庆': 'chong2 qing4',
+    u'重来': 'chong2 lai2',
+    u'重逢': 'chong2 feng2',
+    u'银行': 'yin2 hang2',
+    u'音乐': 'yin1 yue4',
+    u'乐队': 'yue4 dui4',
+    u'乐团': 'yue4 tuan2',
+    u'长城': 'chang2 cheng2',
+    u'长江': 'chang2 jiang1',
+    u'长发': 'chang2 fa4',
+    u'漫长': 'man4 chang2',
+    u'成都': 'cheng2 du1',
+    u'首都': 'shou3 du1',
+    u'都市': 'du1 shi4',
+    u'少年': 'shao4 nian2',
+    u'睡觉': 'shui4 jiao4',
+    u'传记': 'zhuan4 ji4',
+    u'曾经': 'ceng2 jing1',
+}
+# characters read otherwise as the surname that begins a name
+_SURNAMES = {
+    u'曾': 'zeng1',
+}
+
+
+def _split(syllables):
+    toned = syllables.split()
+    return ([s[:-1] for s in toned], toned)
+
+# first character -> [(phrase, (syllables, toned syllables))], longest
+# phrase first
+_PHRASE_STARTS = {}
+for _phrase, _syllables in sorted(_PHRASES.iteritems(),
+        key=lambda item: -len(item[0])):
+    _PHRASE_STARTS.setdefault(_phrase[0], []).append(
+            (_phrase, _split(_syllables)))
+_SURNAME_READINGS = dict((c, _split(s)) for c, s in _SURNAMES.iteritems())
+del _phrase, _syllables
+
+
+def _get_readings(tones):
+    global _READINGS
+    readings = _READINGS
+    if readings is None:
+        # filled before it is published, as other threads may look
+        # at it meanwhile
+        plain = {}
+        toned = {}
+        digits = dict((c, i) for i, c in enumerate(_table.DIGITS))
+        toneless = dict((s, s and s[:-1]) for s in _table.SYLLABLES)
+        data = _table.READINGS
+        for i in xrange(0, len(data), 2):
+            syllable = _table.SYLLABLES[digits[data[i]] * 64 +
+                    digits[data[i+1]]]
+            if syllable is not None:
+                char = unichr(_table.FIRST + i / 2)
+                toned[char] = syllable
+                plain[char] = toneless[syllable]
+        readings = _READINGS = (plain, toned)
+    return readings[bool(tones)]
+
+
+def has_han(text):
+    """
+        Whether `text` contains a Chinese character.
+    """
+    return _han.search(text) is not None
+
+
+def fold(text):
+    """
+        Returns `text` with Traditional characters replaced by their
+        Simplified forms.
+    """
+    if not has_han(text):
+        return text # much faster than translate()
+    return text.translate(_FOLD)
+
+
+def reading(char, tones=False):
+    """
+        Returns the pinyin of the character `char`, such as 'zhou' or,
+        with `tones`, 'zhou1' (5 is the neutral tone). Returns None for
+        anything that is not a Chinese character.
+    """
+    return _get_readings(tones).get(char)
+
+
+def _override(folded, i, readings):
+    """
+        Returns the syllables from _PHRASES or _SURNAMES for the
+        characters of `folded` from `i` on, or None.
+    """
+    char = folded[i]
+    for phrase, found in _PHRASE_STARTS.get(char, ()):
+        if folded.startswith(phrase, i):
+            return found
+    if i == 0 or folded[i-1] not in readings:
+        return _SURNAME_READINGS.get(char)
+    return None
+
+
+def syllables(text, tones=False):
+    """
+        Splits `text` into a list of words, with every Chinese
+        character replaced by its own syllable.
+    """
+    readings = _get_readings(tones)
+    folded = fold(text)
+    words = []
+    word = []
+    i = 0
+    while i < len(text):
+        char = text[i]
+        syllable = readings.get(char)
+        if syllable is None:
+            if char.isspace():
+                if word:
+                    words.append(u''.join(word))
+                    word = []
+            else:
+                word.append(char)
+            i += 1
+            continue
+        if word:
+            words.append(u''.join(word))
+            word = []
+        found = _override(folded, i, readings)
+        if found is None:
+            words.append(syllable)
+            i += 1
+        else:
+            found = found[bool(tones)]
+            words.extend(found)
+            i += len(found)
+    if word:
+        words.append(u''.join(word))
+    return words
+
+
+def romanize(text, tones=False):
+    """
+        Returns `text` with its Chinese characters written in pinyin,
+        e.g. u'周杰伦' -> u'zhou jie lun'.
+    """
+    return u' '.join(syllables(text, tones))
+
+
+def initials(text):
+    """
+        Returns the first letters of the words and syllables of
+        `text`, e.g. u'周杰伦' -> u'zjl'.
+    """
+    return u''.join([word[0] for word in syllables(text)])
+
+
+def sort_key(text, tones=False, folding=True):
+    """
+        Returns a key that sorts Chinese `text` by pinyin, between the
+        Latin values around it. With `folding`, Traditional and
+        Simplified spellings of a name sort as one. Text without
+        Chinese characters is returned as it is.
+    """
+    if not has_han(text):
+        return text
+    if folding:
+        text = fold(text)
+    return u"%s %s" % (romanize(text, tones), text)
+
+# vim: et sts=4 sw=4
@@ -0,0 +1,343 @@
+# Copyright (C) 2008-2010 Adam Olsen
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 675 Mass Ave, Cambridge, MA 02139, USA.
+#
+#
+# The developers of the Exaile media player hereby grant permission
+# for non-GPL compatible GStreamer and Exaile plugins to be used and
+# distributed together with GStreamer and Exaile. This permission is
+# above and beyond the permissions granted by the GPL license by which
+# Exaile is covered. If you modify this code, you may extend this
+# exception to your version of the code, but you are not obligated to
+# do so. If you do not wish to do so, delete this exception statement
+# from your version.
+
+"""
+    Play statistics, collected in memory and written to the track tags
+    in batches.
+
+    Pausing or stopping used to rewrite ``__playtime`` straight away,
+    firing ``track_tags_changed`` and dirtying the collection every
+    time. Now the engines only report the seconds played, and the
+    totals reach the tags every ``player/playstats_flush_interval``
+    seconds and at shutdown. Until then every change is appended to a
+    small journal, which is replayed on the next start if Exaile did
+    not get to flush.
+
+    Every flush is a batch with an id that only grows, and a track
+    remembers the last batch it got in ``__playstats_batch``. Replayed
+    changes of batches a track already has are skipped, so a crash
+    between applying a batch and emptying the journal, or after the
+    collection was saved, counts nothing twice. Statistics only go to
+    tracks Exaile has loaded, never to new Track objects.
+"""
+
+import logging
+import os
+import threading
+import time
+
+import glib
+
+from xl import common, event, settings, trax, xdg
+
+logger = logging.getLogger(__name__)
+
+# statistic -> tag it is stored in
+TAGS = {
+        'playtime': '__playtime',
+        'playcount': '__playcount',
+        'skipcount': '__skipcount',
+        'last_played': '__last_played',
+        }
+
+# the last batch of statistics a track got
+BATCH_TAG = '__playstats_batch'
+
+# a track counts as played once this much of it was heard: half its
+# length, but never more than this many seconds
+_PLAYED_MAX = 240
+
+
+def _add(stats, stat, value):
+    if stat == 'last_played':
+        stats[stat] = max(stats.get(stat, 0), value)
+    else:
+        stats[stat] = stats.get(stat, 0) + value
+
+
+class PlayStats(object):
+    """
+        Accumulates play time, play and skip counts and the last played
+        time per uri until they are flushed to the tracks.
+    """
+    def __init__(self, journal):
+        """
+            :param journal: path of the journal file
+        """
+        self.journal = journal
+        self._lock = threading.Lock()
+        # uri -> batch -> statistic -> value
+        self._pending = {}
+        self._sessions = {}
+        self._flush_id = 0
+        self._journal = None
+        self._batch = 0
+        self._collection = None
+        self._loaded = False
+
+        self._replay()
+        self._batch = self._next_batch()
+        event.add_callback(self._on_track_start, 'playback_track_start')
+        event.add_callback(self._on_track_end, 'playback_track_end')
+        event.add_callback(self._on_track_skipped, 'playback_track_skipped')
+        event.add_callback(self._on_exaile_loaded, 'exaile_loaded')
+        event.add_callback(self._on_quit, 'quit_application')
+
+    def _next_batch(self):
+        # the time it begins, so that ids keep growing across restarts
+        # even if the journal is lost
+        return max(time.time(), self._batch + 0.001)
+
+    def _replay(self):
+        try:
+            f = open(self.journal)
+        except IOError:
+            return
+        try:
+            for line in f:
+                fields = line.rstrip('\n').split('\t')
+                if len(fields) == 3:
+                    fields.insert(0, 0) # before batches
+                try:
+                    batch, uri, stat, value = fields
+                    batch, value = float(batch), float(value)
+                except ValueError:
+                    continue # cut short by a crash
+                if stat in TAGS:
+                    self._merge(uri, batch, stat, value)
+                    self._batch = max(self._batch, batch)
+        finally:
+            f.close()
+        if self._pending:
+            logger.info("Recovered play statistics for %d tracks" %
+                    len(self._pending))
+            self._schedule_flush()
+
+    def _merge(self, uri, batch, stat, value):
+        _add(self._pending.setdefault(uri, {}).setdefault(batch, {}),
+                stat, value)
+
+    def _write(self, uri, batch, stat, value):
+        if self._journal is None:
+            self._journal = open(self.journal, 'a')
+        self._journal.write("%r\t%s\t%s\t%r\n" % (batch, uri, stat, value))
+
+    def _record(self, track, stat, value):
+        uri = track.get_loc_for_io()
+        self._lock.acquire()
+        try:
+            self._merge(uri, self._batch, stat, value)
+            try:
+                self._write(uri, self._batch, stat, value)
+                self._journal.flush()
+            except IOError:
+                common.log_exception(log=logger)
+            self._schedule_flush()
+        finally:
+            self._lock.release()
+
+    def _schedule_flush(self):
+        if not self._flush_id:
+            self._flush_id = glib.timeout_add_seconds(settings.get_option(
+                "player/playstats_flush_interval", 60), self.flush)
+
+    def add_playtime(self, track, seconds):
+        """
+            Adds to the time `track` has been played.
+        """
+        if seconds <= 0:
+            return
+        uri = track.get_loc_for_io()
+        self._lock.acquire()
+        try:
+            if uri in self._sessions:
+                self._sessions[uri] += seconds
+        finally:
+            self._lock.release()
+        self._record(track, 'playtime', seconds)
+
+    def get_pending(self, track):
+        """
+            Returns the statistics of `track` that were not flushed to
+            its tags yet, as a dict of statistic -> value.
+        """
+        stats = {}
+        self._lock.acquire()
+        try:
+            batches = self._pending.get(track.get_loc_for_io(), {})
+            for values in batches.itervalues():
+                for stat, value in values.iteritems():
+                    _add(stats, stat, value)
+        finally:
+            self._lock.release()
+        return stats
+
+    def _find_track(self, uri):
+        """
+            Returns the Track Exaile has loaded for `uri`, from the
+            registry of Tracks or else the collection, or None.
+        """
+        get_loaded = getattr(trax.Track, 'get_loaded', None)
+        if get_loaded is not None:
+            track = get_loaded(uri)
+            if track is not None:
+                return track
+        if self._collection is not None:
+            return self._collection.get_track_by_loc(uri)
+        return None
+
+    def flush(self):
+        """
+            Writes everything collected so far to the track tags and
+            empties the journal.
+        """
+        self._lock.acquire()
+        try:
+            if self._flush_id:
+                glib.source_remove(self._flush_id)
+                self._flush_id = 0
+            pending, self._pending = self._pending, {}
+            self._batch = self._next_batch()
+        finally:
+            self._lock.release()
+
+        unknown = {}
+        for uri, batches in pending.iteritems():
+            try:
+                track = self._find_track(uri)
+                if track is None:
+                    if not self._loaded:
+                        # the collection may not be there yet
+                        unknown[uri] = batches
+                    continue
+                self._apply(track, batches)
+            except Exception:
+                common.log_exception(log=logger)
+
+        # keep whatever was recorded while we were busy
+        self._lock.acquire()
+        try:
+            for uri, batches in unknown.iteritems():
+                for batch, values in batches.iteritems():
+                    for stat, value in values.iteritems():
+                        self._merge(uri, batch, stat, value)
+            try:
+                if self._journal is not None:
+                    self._journal.close()
+                    self._journal = None
+                self._journal = open(self.journal, 'w')
+                for uri, batches in self._pending.iteritems():
+                    for batch, values in batches.iteritems():
+                        for stat, value in values.iteritems():
+                            self._write(uri, batch, stat, value)
+                self._journal.flush()
+            except IOError:
+                common.log_exception(log=logger)
+        finally:
+            self._lock.release()
+        return False
+
+    def _apply(self, track, batches):
+        """
+            Adds the statistics of `batches` (batch -> statistic ->
+            value) that `track` does not have yet to its tags.
+        """
+        try:
+            done = float(track.get_tag_raw(BATCH_TAG) or 0)
+        except (TypeError, ValueError):
+            done = 0
+        stats = {}
+        for batch, values in batches.iteritems():
+            if batch <= done:
+                continue # replayed, but already in the tags
+            for stat, value in values.iteritems():
+                _add(stats, stat, value)
+        for stat, value in stats.iteritems():
+            tag = TAGS[stat]
+            if stat == 'last_played':
+                last = track.get_tag_raw(tag) or 0
+                track.set_tag_raw(tag, max(last, value))
+                continue
+            last = track.get_tag_raw(tag)
+            try:
+                last = int(last)
+            except (TypeError, ValueError):
+                last = 0
+            track.set_tag_raw(tag, last + int(round(value)))
+        track.set_tag_raw(BATCH_TAG, max(max(batches), done))
+
+    def _on_track_start(self, type, player, track):
+        if track is None:
+            return
+        self._lock.acquire()
+        try:
+            self._sessions[track.get_loc_for_io()] = 0
+        finally:
+            self._lock.release()
+        self._record(track, 'last_played', time.time())
+
+    def _on_track_end(self, type, player, track):
+        if track is None:
+            return
+        self._lock.acquire()
+        try:
+            played = self._sessions.pop(track.get_loc_for_io(), None)
+        finally:
+            self._lock.release()
+        if played is None:
+            return
+        try:
+            length = float(track.get_tag_raw('__length'))
+        except (TypeError, ValueError):
+            length = 0
+        needed = _PLAYED_MAX
+        if length:
+            needed = min(length / 2, _PLAYED_MAX)
+        if played >= needed:
+            self._record(track, 'playcount', 1)
+        else:
+            self._record(track, 'skipcount', 1)
+
+    def _on_track_skipped(self, type, player, track):
+        if track is not None:
+            self._record(track, 'skipcount', 1)
+
+    def _on_exaile_loaded(self, type, exaile, data):
+        self._collection = exaile.collection
+        self._loaded = True
+
+    def _on_quit(self, type, exaile, data):
+        self.flush()
+
+
+_PLAYSTATS = PlayStats(os.path.join(xdg.get_data_dirs()[0],
+    'playstats.journal'))
+
+add_playtime = _PLAYSTATS.add_playtime
+get_pending = _PLAYSTATS.get_pending
+flush = _PLAYSTATS.flush
+
+# vim: et sts=4 sw=4
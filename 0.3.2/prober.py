@@ -0,0 +1,228 @@
+# Copyright (C) 2008-2010 Adam Olsen
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 675 Mass Ave, Cambridge, MA 02139, USA.
+#
+#
+# The developers of the Exaile media player hereby grant permission
+# for non-GPL compatible GStreamer and Exaile plugins to be used and
+# distributed together with GStreamer and Exaile. This permission is
+# above and beyond the permissions granted by the GPL license by which
+# Exaile is covered. If you modify this code, you may extend this
+# exception to your version of the code, but you are not obligated to
+# do so. If you do not wish to do so, delete this exception statement
+# from your version.
+
+"""
+    Fills in ``__length`` for tracks that lack it.
+
+    The crossfade timers, NormalPlayer's restart of paused streams and
+    the progress bars all need the length of a track, which used to be
+    known only once the track had been playing for a moment. The prober
+    prerolls a few small decoding pipelines at a time in the background,
+    asks them for the duration and writes the results to the tracks in
+    batches. Tracks of the collection are queued once Exaile has loaded,
+    unless ``player/probe_durations`` is switched off; anything else can
+    be queued with add().
+
+    Progress is announced with the ``duration_probe_progress`` event,
+    whose data is a ``(done, total)`` tuple.
+"""
+
+import logging
+from collections import deque
+
+import glib
+import pygst
+pygst.require('0.10')
+import gst
+
+from xl import common, event, settings
+
+logger = logging.getLogger(__name__)
+
+
+def needs_probe(track):
+    """
+        Returns whether `track` is a local file without a length.
+    """
+    try:
+        if float(track.get_tag_raw('__length') or 0) > 0:
+            return False
+    except (TypeError, ValueError):
+        pass
+    return track.is_local()
+
+
+class DurationProber(object):
+    """
+        Runs up to ``player/probe_workers`` pipelines at once over the
+        queued tracks.
+    """
+    # give up on a file that does not preroll within this many seconds
+    TIMEOUT = 10
+    # results written to the tracks at once
+    BATCH = 50
+
+    def __init__(self):
+        self._queue = deque()
+        self._queued = set()
+        self._running = {}
+        self._results = []
+        self._fill_id = 0
+        self.done = 0
+        self.total = 0
+
+    def add(self, tracks, urgent=False):
+        """
+            Queues the tracks in `tracks` that need probing. With
+            `urgent` they go before everything queued so far.
+        """
+        tracks = [tr for tr in tracks
+                if tr not in self._queued and needs_probe(tr)]
+        if not tracks:
+            return
+        self._queued.update(tracks)
+        self.total += len(tracks)
+        if urgent:
+            self._queue.extendleft(reversed(tracks))
+        else:
+            self._queue.extend(tracks)
+        self._schedule()
+
+    def stop(self):
+        """
+            Forgets the queued tracks and stops the running pipelines.
+        """
+        self._queue.clear()
+        self._queued.clear()
+        for pipe in self._running.keys():
+            self._finish(pipe, None)
+        self._commit()
+
+    def _schedule(self):
+        if not self._fill_id:
+            self._fill_id = glib.idle_add(self._fill,
+                    priority=glib.PRIORITY_LOW)
+
+    def _fill(self):
+        self._fill_id = 0
+        workers = max(1, settings.get_option("player/probe_workers", 2))
+        while self._queue and len(self._running) < workers:
+            track = self._queue.popleft()
+            if not needs_probe(track):
+                # got its length by playing in the meantime
+                self._queued.discard(track)
+                self.done += 1
+                continue
+            try:
+                self._start(track)
+            except Exception:
+                common.log_exception(log=logger)
+                self._queued.discard(track)
+                self.done += 1
+        if not self._running:
+            self._commit()
+        return False
+
+    def _start(self, track):
+        pipe = gst.Pipeline()
+        dec = gst.element_factory_make("uridecodebin")
+        dec.set_property("uri", track.get_loc_for_io())
+        dec.connect("pad-added", self._on_pad_added, pipe)
+        pipe.add(dec)
+        bus = pipe.get_bus()
+        bus.add_signal_watch()
+        bus.connect("message", self._on_message, pipe)
+        timeout_id = glib.timeout_add_seconds(self.TIMEOUT,
+                self._on_timeout, pipe)
+        self._running[pipe] = (track, timeout_id)
+        pipe.set_state(gst.STATE_PAUSED)
+
+    def _on_pad_added(self, dec, pad, pipe):
+        # every stream needs a sink, or the pipeline never prerolls
+        sink = gst.element_factory_make("fakesink")
+        pipe.add(sink)
+        sink.set_state(gst.STATE_PAUSED)
+        pad.link(sink.get_static_pad("sink"))
+
+    def _on_message(self, bus, message, pipe):
+        if pipe not in self._running:
+            return True
+        if message.type == gst.MESSAGE_ASYNC_DONE:
+            try:
+                duration = pipe.query_duration(gst.FORMAT_TIME)[0]
+            except gst.QueryError:
+                duration = 0
+            self._finish(pipe, duration)
+        elif message.type == gst.MESSAGE_ERROR:
+            logger.debug("Could not probe %s: %s" %
+                    (self._running[pipe][0].get_loc_for_io(),
+                        message.parse_error()[0].message))
+            self._finish(pipe, None)
+        return True
+
+    def _on_timeout(self, pipe):
+        if pipe in self._running:
+            logger.debug("Timed out probing %s" %
+                    self._running[pipe][0].get_loc_for_io())
+            self._running[pipe] = (self._running[pipe][0], 0)
+            self._finish(pipe, None)
+        return False
+
+    def _finish(self, pipe, duration):
+        track, timeout_id = self._running.pop(pipe)
+        if timeout_id:
+            glib.source_remove(timeout_id)
+        pipe.get_bus().remove_signal_watch()
+        pipe.set_state(gst.STATE_NULL)
+        self._queued.discard(track)
+        self.done += 1
+        if duration > 0:
+            self._results.append((track, float(duration)/gst.SECOND))
+        if self.done % self.BATCH == 0:
+            self._commit()
+        self._schedule()
+
+    def _commit(self):
+        """
+            Writes the lengths found so far and reports progress.
+        """
+        results, self._results = self._results, []
+        for track, length in results:
+            # the engines may have filled it in while we were busy
+            if needs_probe(track):
+                track.set_tag_raw('__length', length)
+        if results or self.done:
+            event.log_event('duration_probe_progress', self,
+                    (self.done, self.total))
+        if not self._queue and not self._running:
+            if self.total:
+                logger.info("Checked the length of %d tracks" % self.done)
+            self.done = self.total = 0
+
+
+def _on_exaile_loaded(type, exaile, data):
+    if not settings.get_option("player/probe_durations", True):
+        return
+    _PROBER.add(exaile.collection.get_tracks())
+
+
+_PROBER = DurationProber()
+event.add_callback(_on_exaile_loaded, 'exaile_loaded')
+
+add = _PROBER.add
+stop = _PROBER.stop
+
+# vim: et sts=4 sw=4
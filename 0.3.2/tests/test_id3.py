@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2008-2010 Adam Olsen
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 675 Mass Ave, Cambridge, MA 02139, USA.
+
+import os
+import struct
+import tempfile
+import unittest
+
+try:
+    from xl.metadata import _id3
+except ImportError:
+    _id3 = None
+
+TRADITIONAL = u'''愛情轉移 簡單愛 國語 張學友 吻別 月亮代表我的心 甜蜜蜜 夜來香
+    聽海 後來 十年 東風破 七里香 晴天 童話 勇氣 寧夏 說謊 當愛已成往事 忘情水
+    千千闕歌 海闊天空 光輝歲月 紅豆 流年 傳奇 獨家記憶 愛很簡單 聽見下雨的聲音
+    小幸運 告白氣球 稻香 江南 小酒窩 一千年以後 煎熬 倔強 溫柔 知足 周杰倫 王菲
+    陳奕迅 林俊傑 鄧麗君 張惠妹 五月天 孫燕姿 蔡依林 劉德華 梁靜茹'''.split()
+
+SIMPLIFIED = u'''爱情转移 简单爱 国语 张学友 吻别 月亮代表我的心 夜来香 听海 后来
+    东风破 七里香 童话 勇气 宁夏 说谎 忘情水 海阔天空 光辉岁月 红豆 传奇
+    独家记忆 听见下雨的声音 小幸运 告白气球 稻香 小酒窝 周杰伦 陈奕迅 林俊杰
+    邓丽君 孙燕姿 刘德华 梁静茹'''.split()
+
+JAPANESE = u'''千と千尋の神隠し いつも何度でも 桜坂 残酷な天使のテーゼ 宇多田ヒカル
+    浜崎あゆみ 中島みゆき 天体観測 世界に一つだけの花 涙そうそう 夜に駆ける
+    紅蓮華 君の名は 雪の華 ハナミズキ 恋するフォーチュンクッキー 美空ひばり
+    川の流れのように'''.split()
+
+
+@unittest.skipIf(_id3 is None, "needs mutagen and Exaile's xl package")
+class DetectTestCase(unittest.TestCase):
+    def assertDetects(self, samples, encoding):
+        for text in samples:
+            data = text.encode(encoding)
+            charset, confidence = _id3.detect(data)
+            if _id3.ambiguous(data):
+                # left to the directory, never a confident guess
+                self.assert_(confidence < _id3.DIR_CONFIDENCE, text)
+                continue
+            self.assert_(confidence >= _id3.MIN_CONFIDENCE, text)
+            self.assertEqual(data.decode(charset), text)
+
+    def testBig5(self):
+        self.assertDetects(TRADITIONAL, 'big5')
+
+    def testGBKTraditional(self):
+        self.assertDetects(TRADITIONAL, 'gbk')
+
+    def testGBKSimplified(self):
+        self.assertDetects(SIMPLIFIED, 'gbk')
+
+    def testShiftJIS(self):
+        self.assertDetects(JAPANESE, 'shift_jis')
+
+    def testBig5NotGBK(self):
+        # trail bytes below 0xa1 are not GB2312
+        for text in (u'愛情轉移', u'簡單愛', u'國語'):
+            data = text.encode('big5')
+            self.failIf(_id3.ambiguous(data))
+            self.assertEqual(_id3.detect(data)[0], 'big5')
+
+    def testGBKTraditionalConfidence(self):
+        charset, confidence = _id3.detect(u'張學友'.encode('gbk'))
+        self.assertEqual(charset, 'gbk')
+        self.assert_(confidence >= _id3.DIR_CONFIDENCE)
+
+    def testAmbiguous(self):
+        # common hanzi in GB2312 and in Big5 alike
+        data = u'童話'.encode('big5')
+        self.assert_(_id3.ambiguous(data))
+        self.assert_(_id3.detect(data)[1] < _id3.DIR_CONFIDENCE)
+
+    def testWholeTag(self):
+        for title in TRADITIONAL:
+            data = u'\n'.join([title, u'周杰倫', u'葉惠美']).encode('big5')
+            self.assertEqual(_id3.detect(data)[0], 'big5')
+
+    def testLatin1(self):
+        for data in ('Caf\xe9', 'Bj\xf6rk', 'Sigur R\xf3s', 'Beyonc\xe9'):
+            charset, confidence = _id3.detect(data)
+            self.assert_(charset is None or
+                    confidence < _id3.MIN_CONFIDENCE, data)
+
+    def testUTF8(self):
+        data = u'周杰倫'.encode('utf-8')
+        self.assertEqual(_id3.detect(data), ('utf-8', 1.0))
+
+
+IMAGE = '\x89PNG\r\n\x1a\n' + ''.join([chr(i) for i in range(256)])
+
+
+def _syncsafe(value):
+    return ''.join([chr((value >> shift) & 0x7f) for shift in (21, 14, 7, 0)])
+
+
+def _frame(version, frame_id, body, group=None):
+    flags = 0
+    if group is not None:
+        flags = version == 3 and 0x20 or 0x40
+        body = chr(group) + body
+    if version == 4:
+        size = _syncsafe(len(body))
+    else:
+        size = struct.pack('>I', len(body))
+    return frame_id + size + '\0' + chr(flags) + body
+
+
+def _tag(version, frames):
+    data = ''.join(frames) + '\0' * 64 # padding
+    return 'ID3' + chr(version) + '\0\0' + _syncsafe(len(data)) + \
+            data
+
+
+@unittest.skipIf(_id3 is None, "needs mutagen and Exaile's xl package")
+class FindPicturesTestCase(unittest.TestCase):
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp('.mp3')
+        os.close(fd)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def find(self, version, group=None):
+        body = '\0image/png\0\x03cover\0' + IMAGE
+        f = open(self.path, 'wb')
+        f.write(_tag(version, [
+            _frame(version, 'TIT2', '\0title'),
+            _frame(version, 'APIC', body, group)]))
+        f.write('\xff\xfb' + '\0' * 100) # audio
+        f.close()
+        return _id3.find_pictures(self.path)
+
+    def testPicture(self):
+        for version in (3, 4):
+            pictures = self.find(version)
+            self.assertEqual(len(pictures), 1)
+            self.assertEqual(pictures[0].mime, 'image/png')
+            self.assertEqual(pictures[0].desc, u'cover')
+            self.assertEqual(pictures[0].read(), IMAGE)
+
+    def testCompressedV22(self):
+        f = open(self.path, 'wb')
+        f.write('ID3\x02\x00\x40' + _syncsafe(64) + '\0' * 64)
+        f.close()
+        self.assert_(_id3.find_pictures(self.path) is None)
+
+    def testGroupedPicture(self):
+        for version in (3, 4):
+            pictures = self.find(version, group=0x81)
+            self.assertEqual(len(pictures), 1)
+            self.assertEqual(pictures[0].desc, u'cover')
+            self.assertEqual(pictures[0].read(), IMAGE)
+            self.assertEqual(''.join(pictures[0].iter_chunks(100)), IMAGE)
+
+if __name__ == '__main__':
+    unittest.main()
+
+# vim: et sts=4 sw=4
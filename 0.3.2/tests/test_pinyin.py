@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2008-2010 Adam Olsen
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 675 Mass Ave, Cambridge, MA 02139, USA.
+
+
+import unittest
+
+try:
+    from xl.trax import pinyin
+except ImportError:
+    pinyin = None
+
+
+@unittest.skipIf(pinyin is None, "needs Exaile's xl package")
+class SyllablesTestCase(unittest.TestCase):
+    def testCharacters(self):
+        self.assertEqual(pinyin.romanize(u'周杰伦'), u'zhou jie lun')
+        self.assertEqual(pinyin.romanize(u'周杰倫'), u'zhou jie lun')
+        self.assertEqual(pinyin.romanize(u'周杰伦 Live'),
+                u'zhou jie lun Live')
+        self.assertEqual(pinyin.initials(u'周杰伦'), u'zjl')
+
+    def testPhrases(self):
+        for text, expected in ((u'重庆', u'chong qing'),
+                (u'重慶森林', u'chong qing sen lin'),
+                (u'银行', u'yin hang'), (u'音乐', u'yin yue'),
+                (u'音樂', u'yin yue'), (u'长城', u'chang cheng'),
+                (u'我的长城', u'wo de chang cheng'),
+                (u'重要', u'zhong yao'), (u'快乐', u'kuai le')):
+            self.assertEqual(pinyin.romanize(text), expected, text)
+        self.assertEqual(pinyin.romanize(u'音乐', tones=True),
+                u'yin1 yue4')
+        self.assertEqual(pinyin.initials(u'重庆'), u'cq')
+
+    def testSurnames(self):
+        self.assertEqual(pinyin.romanize(u'曾轶可'), u'zeng yi ke')
+        self.assertEqual(pinyin.romanize(u'Live 曾轶可'),
+                u'Live zeng yi ke')
+        # not at the start of a name
+        self.assertEqual(pinyin.romanize(u'未曾'), u'wei ceng')
+        self.assertEqual(pinyin.romanize(u'曾经'), u'ceng jing')
+
+    def testSortKey(self):
+        values = [u'长城', u'coldplay', u'陈奕迅', u'重庆', u'cui']
+        values.sort(key=pinyin.sort_key)
+        self.assertEqual(values,
+                [u'长城', u'陈奕迅', u'重庆', u'coldplay', u'cui'])
+
+if __name__ == '__main__':
+    unittest.main()
+
+# vim: et sts=4 sw=4
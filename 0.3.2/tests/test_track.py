@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2008-2010 Adam Olsen
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 675 Mass Ave, Cambridge, MA 02139, USA.
+
+import unittest
+
+try:
+    import gio
+    from xl import settings
+    from xl.trax import track
+except ImportError:
+    gio = None
+
+
+@unittest.skipIf(gio is None, "needs gio and Exaile's xl package")
+class CanonicalUriTestCase(unittest.TestCase):
+    def testPrintableAscii(self):
+        for code in range(0x20, 0x7f):
+            char = chr(code)
+            for uri in ('file:///a%sb' % char, 'file:///a%%%02Xb' % code,
+                    'file:///a%%%02xb' % code):
+                expected = gio.File(uri).get_uri()
+                self.assertEqual(track.canonical_uri(uri), expected, uri)
+            path = '/a%sb' % char
+            self.assertEqual(track.canonical_uri(path),
+                    gio.File(path).get_uri(), path)
+
+    def testSemicolon(self):
+        self.failIf(track._is_canonical('file:///a;b'))
+        self.assertEqual(track.canonical_uri('file:///a;b'),
+                'file:///a%3Bb')
+
+
+class _Clock(object):
+    # stands in for the time module in track
+    def __init__(self):
+        self.now = 1000.0
+
+    def time(self):
+        return self.now
+
+
+class _Tags(object):
+    def __init__(self, size):
+        self.size = size
+
+
+class _Format(object):
+    # a metadata Format object whose tags take up `size` bytes
+    def __init__(self, size):
+        self.mutagen = _Tags(size)
+        self.mutagen.tags = _Tags(size)
+
+
+@unittest.skipIf(gio is None, "needs gio and Exaile's xl package")
+class MetadataCacherTestCase(unittest.TestCase):
+    def setUp(self):
+        self.clock = _Clock()
+        self._time, track.time = track.time, self.clock
+
+    def tearDown(self):
+        track.time = self._time
+
+    def assertCached(self, cacher, keys):
+        for key in 'abcde':
+            found = cacher.get(key) is not None
+            self.assertEqual(found, key in keys, key)
+
+    def testEvictionOrder(self):
+        cacher = track._MetadataCacher(maxentries=3)
+        for key in 'abc':
+            cacher.add(key, _Format(1024))
+            self.clock.now += 1
+        cacher.get('a') # b is the least recently used now
+        cacher.add('d', _Format(1024))
+        self.assertEqual(cacher.get_stats()['evictions'], 1)
+        self.assertCached(cacher, 'acd')
+
+    def testMaxBytes(self):
+        cacher = track._MetadataCacher(maxbytes=3000)
+        for key in 'abc':
+            cacher.add(key, _Format(1000))
+        self.assertEqual(cacher.get_stats()['bytes'], 3000)
+        cacher.add('d', _Format(1000))
+        self.assertEqual(cacher.get_stats()['bytes'], 3000)
+        self.assertCached(cacher, 'bcd')
+        # one entry over the budget is still kept, on its own
+        cacher.add('e', _Format(5000))
+        self.assertEqual(cacher.get_stats()['entries'], 1)
+        self.assertEqual(cacher.get_stats()['bytes'], 5000)
+        self.assertCached(cacher, 'e')
+
+    def testExpiry(self):
+        cacher = track._MetadataCacher(timeout=10)
+        formatobj = _Format(1024)
+        cacher.add('a', formatobj)
+        self.clock.now += 9
+        self.assert_(cacher.get('a') is formatobj)
+        # the get above counts as a use
+        self.clock.now += 9
+        self.assert_(cacher.get('a') is formatobj)
+        self.clock.now += 11
+        self.assert_(cacher.get('a') is None)
+        stats = cacher.get_stats()
+        self.assertEqual(stats['expirations'], 1)
+        self.assertEqual(stats['entries'], 0)
+        self.assertEqual(stats['bytes'], 0)
+        self.assertEqual((stats['hits'], stats['misses']), (2, 1))
+
+    def testRemove(self):
+        cacher = track._MetadataCacher()
+        cacher.add('a', _Format(1024))
+        cacher.add('b', _Format(2048))
+        cacher.remove('a')
+        cacher.remove('c') # not cached
+        self.assertEqual(cacher.get_stats()['bytes'], 2048)
+        self.assertCached(cacher, 'b')
+
+
+# u'周杰伦'
+JAY = u'\u5468\u6770\u4f26'
+
+
+@unittest.skipIf(gio is None, "needs gio and Exaile's xl package")
+class SortCacheTestCase(unittest.TestCase):
+    DEFAULTS = {'collection/strip_list': [],
+            'collection/pinyin_collation': ''}
+
+    def setUp(self):
+        self.saved = dict((option, settings.get_option(option, default))
+                for option, default in self.DEFAULTS.iteritems())
+        self.track = track.Track('file:///tmp/exaile-cn-sort-test.mp3',
+                scan=False)
+        self.track.set_tag_raw('artist', u'The Beatles')
+        self.track.set_tag_raw('title', JAY)
+
+    def tearDown(self):
+        for option, value in self.saved.iteritems():
+            self.set_option(option, value)
+
+    def set_option(self, option, value):
+        settings.set_option(option, value)
+        # as on collection_option_set
+        track.Track._the_cuts_cb('collection_option_set', None, option)
+
+    def testStripList(self):
+        self.set_option('collection/strip_list', [])
+        key = self.track.get_tag_sort('artist')
+        self.assert_(key.startswith(u'the beatles'), key)
+        self.assertEqual(self.track.get_tag_sort('artist'), key)
+        self.set_option('collection/strip_list', ['the'])
+        key = self.track.get_tag_sort('artist')
+        self.assert_(key.startswith(u'beatles'), key)
+
+    def testPinyinCollation(self):
+        self.set_option('collection/pinyin_collation', '')
+        key = self.track.get_tag_sort('title')
+        self.assert_(key.startswith(JAY), key)
+        self.set_option('collection/pinyin_collation', 'pinyin')
+        key = self.track.get_tag_sort('title')
+        self.assert_(key.startswith(u'zhou jie lun'), key)
+        self.set_option('collection/pinyin_collation', 'pinyin_tones')
+        key = self.track.get_tag_sort('title')
+        self.assert_(key.startswith(u'zhou1 jie2 lun2'), key)
+
+if __name__ == '__main__':
+    unittest.main()
+
+# vim: et sts=4 sw=4
@@ -0,0 +1,348 @@
+#!/usr/bin/env python
+# Copyright (C) 2008-2010 Adam Olsen
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 675 Mass Ave, Cambridge, MA 02139, USA.
+
+"""
+    Rewrites ID3v2 frames that hold GBK, Big5 or Shift-JIS text
+    disguised as latin-1 as real Unicode frames: UTF-8 in ID3v2.4
+    tags, and UTF-16 in ID3v2.3 tags, which stay v2.3 since many
+    players cannot read v2.4.
+
+    The charset of each file is detected the same way Exaile-cn's
+    _id3.py does it while reading. Files whose text reads as well in
+    GBK as in Big5 are left alone rather than guessed at. Once a library is converted, the
+    ``metadata/id3_charset_detection`` option can be switched off, and
+    files play fine in an unpatched Exaile and any other player::
+
+        python tools/id3convert.py --exaile /usr/lib/exaile -n ~/Music
+        python tools/id3convert.py --exaile /usr/lib/exaile ~/Music
+
+    The first command only reports what would change. Before a file is
+    changed its whole original tag is appended to a journal, so that a
+    run can be reverted::
+
+        python tools/id3convert.py --exaile /usr/lib/exaile \
+            --undo ~/.local/share/exaile/id3convert/<run>
+
+    Needs python-mutagen. Directories are spread over a pool of
+    processes; all files of a directory go to the same process, so
+    that short tags can fall back to the charset of their neighbours.
+"""
+
+import cPickle as pickle
+import imp
+import os
+import shutil
+import struct
+import sys
+import time
+from optparse import OptionParser
+
+EXTENSIONS = ('.mp3', '.mp2')
+
+# loaded in main(), before the pool forks
+_id3 = None
+
+
+def find_files(paths):
+    """
+        Returns a dict of directory -> sorted list of files to look at.
+    """
+    dirs = {}
+    for path in paths:
+        path = os.path.abspath(path)
+        if os.path.isfile(path):
+            dirs.setdefault(os.path.dirname(path), []).append(path)
+            continue
+        for root, subdirs, files in os.walk(path):
+            subdirs.sort()
+            found = [os.path.join(root, f) for f in sorted(files)
+                    if os.path.splitext(f)[1].lower() in EXTENSIONS]
+            if found:
+                dirs.setdefault(root, []).extend(found)
+    return dirs
+
+
+def tag_size(f):
+    """
+        Returns the size of the ID3v2 tag at the start of `f`, header
+        and footer included, or 0.
+    """
+    f.seek(0)
+    header = f.read(10)
+    if len(header) < 10 or header[:3] != 'ID3':
+        return 0
+    size = 10 + _id3._syncsafe(header[6:10])
+    if ord(header[5]) & 0x10:
+        size += 10
+    return size
+
+
+def _convert(text, charset):
+    return text.encode('iso-8859-1').decode(charset)
+
+
+def convert_frame(frame, charset, encoding=3):
+    """
+        Turns `frame` into a frame of `encoding` (UTF-8 by default)
+        if it holds legacy text. Returns a list of (old, new) text
+        pairs, empty if nothing changed.
+    """
+    if getattr(frame, 'encoding', None) != 0:
+        return []
+    changes = []
+    try:
+        text = getattr(frame, 'text', None)
+        if isinstance(text, unicode):
+            new = _convert(text, charset)
+            changes.append((text, new))
+            text = new
+        elif isinstance(text, list) and text and \
+                all(isinstance(t, unicode) for t in text):
+            new = [_convert(t, charset) for t in text]
+            changes.extend(zip(text, new))
+            text = new
+        desc = getattr(frame, 'desc', None)
+        if isinstance(desc, unicode):
+            new = _convert(desc, charset)
+            changes.append((desc, new))
+            desc = new
+    except UnicodeError:
+        return []
+    changes = [c for c in changes if c[0] != c[1]]
+    if not changes:
+        return []
+    if hasattr(frame, 'text'):
+        frame.text = text
+    if hasattr(frame, 'desc'):
+        frame.desc = desc
+    frame.encoding = encoding
+    return changes
+
+
+def convert_directory(args):
+    """
+        Converts the files of one directory. Runs in the pool.
+
+        Returns a list of (path, charset, changes, skipped, error)
+        tuples, `skipped` being why a file was left alone.
+    """
+    files, dry_run, journal = args
+    from mutagen import id3
+    results = []
+    for path in files:
+        try:
+            try:
+                tags = id3.ID3(path)
+            except id3.ID3NoHeaderError:
+                continue
+            charset = _id3.detect_charset(path, tags)
+            legacy = _id3._legacy_bytes(tags)
+            if charset is None:
+                if legacy.strip():
+                    # non-ASCII, but nothing plausible: leave it
+                    results.append((path, None, [], 'charset unknown',
+                        None))
+                continue
+            if _id3.ambiguous(legacy):
+                results.append((path, None, [], 'either GBK or Big5',
+                    None))
+                continue
+            # mutagen reads every tag as v2.4; v2.2 is written as v2.3
+            v23 = tags.version < (2, 4, 0)
+            if v23 and not hasattr(tags, 'update_to_v23'):
+                results.append((path, None, [],
+                    'mutagen too old to keep ID3v2.3', None))
+                continue
+            changes = []
+            for frame in tags.values():
+                for old, new in convert_frame(frame, charset,
+                        v23 and 1 or 3):
+                    changes.append((frame.FrameID, old, new))
+            if not changes:
+                continue
+            if not dry_run:
+                backup(journal, path)
+                if v23:
+                    tags.update_to_v23()
+                    tags.save(path, v2_version=3)
+                else:
+                    tags.save(path)
+            results.append((path, charset, changes, None, None))
+        except Exception, e:
+            results.append((path, None, [], None, str(e)))
+    return results
+
+
+def backup(journal, path):
+    """
+        Appends the current tag of `path` to the journal of this
+        process, and makes sure it is on disk.
+    """
+    f = open(path, 'rb')
+    try:
+        size = tag_size(f)
+        f.seek(0)
+        data = f.read(size)
+    finally:
+        f.close()
+    j = open(os.path.join(journal, 'journal-%d' % os.getpid()), 'ab')
+    try:
+        pickle.dump((path, data), j, pickle.HIGHEST_PROTOCOL)
+        j.flush()
+        os.fsync(j.fileno())
+    finally:
+        j.close()
+
+
+def restore(path, data):
+    """
+        Puts the tag `data` back in front of the audio of `path`.
+    """
+    f = open(path, 'rb')
+    tmp = path + '.id3convert'
+    try:
+        f.seek(tag_size(f))
+        out = open(tmp, 'wb')
+        try:
+            out.write(data)
+            shutil.copyfileobj(f, out)
+        finally:
+            out.close()
+    finally:
+        f.close()
+    shutil.copymode(path, tmp)
+    os.rename(tmp, path)
+
+
+def undo(journal):
+    entries = []
+    for name in sorted(os.listdir(journal)):
+        if not name.startswith('journal-'):
+            continue
+        f = open(os.path.join(journal, name), 'rb')
+        try:
+            while True:
+                try:
+                    entries.append(pickle.load(f))
+                except EOFError:
+                    break
+                except Exception:
+                    print "warning: %s is cut short" % name
+                    break
+        finally:
+            f.close()
+    restored = {}
+    # the first backup of a file is its state before the run
+    for path, data in entries:
+        restored.setdefault(path, data)
+    for path, data in sorted(restored.iteritems()):
+        try:
+            restore(path, data)
+            print "restored %s" % path
+        except (IOError, OSError), e:
+            print "could not restore %s: %s" % (path, e)
+
+
+def report(results, dry_run, verbose):
+    counts = {}
+    for path, charset, changes, skipped, error in results:
+        if error is not None:
+            print "error   %s: %s" % (path, error)
+            counts['error'] = counts.get('error', 0) + 1
+        elif skipped is not None:
+            print "skipped %s: %s" % (path, skipped)
+            counts['skipped'] = counts.get('skipped', 0) + 1
+        else:
+            print "%-7s %s" % (charset, path)
+            counts[charset] = counts.get(charset, 0) + 1
+            if verbose:
+                for frame_id, old, new in changes:
+                    print "        %s %r -> %s" % (frame_id, old,
+                            new.encode('utf-8'))
+    print
+    for key, count in sorted(counts.iteritems()):
+        print "%-8s %6d files" % (key, count)
+    if dry_run:
+        print "dry run, nothing was changed"
+
+
+def main():
+    global _id3
+    parser = OptionParser(usage="%prog [options] DIRECTORY|FILE...")
+    parser.add_option("--exaile", dest="exaile",
+            default="/usr/lib/exaile",
+            help="Exaile source tree to load xl from")
+    parser.add_option("-n", "--dry-run", dest="dry_run",
+            action="store_true", default=False,
+            help="only report what would be changed")
+    parser.add_option("-v", "--verbose", dest="verbose",
+            action="store_true", default=False,
+            help="list every frame that changes")
+    parser.add_option("-j", "--jobs", dest="jobs", type="int", default=0,
+            help="number of processes (default: one per CPU)")
+    parser.add_option("--journal", dest="journal",
+            help="directory to keep the backups of this run in")
+    parser.add_option("--undo", dest="undo", metavar="JOURNAL",
+            help="restore the tags saved in the journal of a run")
+    options, args = parser.parse_args()
+    if not args and not options.undo:
+        parser.error("no files given")
+
+    sys.path.insert(0, os.path.abspath(options.exaile))
+    # the _id3.py next to this script, whether it is installed or not
+    _id3 = imp.load_source('exaile_cn_id3',
+            os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                os.pardir, '_id3.py'))
+    if options.undo:
+        undo(options.undo)
+        return
+    from xl import xdg
+
+    journal = options.journal
+    if not options.dry_run:
+        if journal is None:
+            journal = os.path.join(xdg.get_data_dirs()[0], 'id3convert',
+                    time.strftime('%Y%m%d-%H%M%S'))
+        if not os.path.isdir(journal):
+            os.makedirs(journal)
+
+    dirs = find_files(args)
+    jobs = [(files, options.dry_run, journal)
+            for directory, files in sorted(dirs.iteritems())]
+    results = []
+    if options.jobs == 1:
+        for job in jobs:
+            results.extend(convert_directory(job))
+    else:
+        import multiprocessing
+        pool = multiprocessing.Pool(options.jobs or None)
+        try:
+            for result in pool.imap_unordered(convert_directory, jobs):
+                results.extend(result)
+        finally:
+            pool.close()
+            pool.join()
+    results.sort()
+    report(results, options.dry_run, options.verbose)
+    if not options.dry_run:
+        print "backups are in %s, undo with --undo %s" % (journal, journal)
+        if results:
+            print "set metadata/id3_charset_detection to False once " \
+                "every file is converted"
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+# Copyright (C) 2008-2010 Adam Olsen
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 675 Mass Ave, Cambridge, MA 02139, USA.
+
+"""
+    Regenerates _pinyintable.py, the pinyin and Traditional to
+    Simplified Chinese tables used by pinyin.py.
+
+    Readings come from pypinyin, the folding table from OpenCC's
+    TSCharacters.txt::
+
+        python tools/mkpinyin.py path/to/TSCharacters.txt > _pinyintable.py
+
+    Every character from U+3400 to U+9FFF gets its most common reading,
+    as an index into a list of syllables written as two base 64 digits.
+"""
+
+import sys
+
+from pypinyin import pinyin, Style
+
+FIRST = 0x3400
+LAST = 0x9fff
+DIGITS = ('ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz'
+        '0123456789+/')
+
+
+def readings():
+    """
+        Returns the syllables and the reading of each character, as an
+        index into them (0 for none).
+    """
+    found = []
+    for code in xrange(FIRST, LAST + 1):
+        reading = pinyin(unichr(code), style=Style.TONE3,
+                neutral_tone_with_five=True, errors='ignore')
+        found.append(reading and str(reading[0][0]) or None)
+    syllables = [None] + sorted(set(r for r in found if r))
+    index = dict((s, i) for i, s in enumerate(syllables))
+    return syllables, [index[r] for r in found]
+
+
+def folding(path):
+    """
+        Returns the pairs of single Traditional and Simplified
+        characters in the OpenCC table at `path`.
+    """
+    pairs = []
+    for line in open(path):
+        line = line.decode('utf-8').strip()
+        if not line or line.startswith('#'):
+            continue
+        trad, simp = line.split('\t')
+        simp = simp.split()[0]
+        # single characters in the BMP, which narrow builds handle
+        if len(trad) == 1 and len(simp) == 1 and trad != simp and \
+                trad <= u'\uffff' and simp <= u'\uffff':
+            pairs.append((trad, simp))
+    return sorted(pairs)
+
+
+def wrap(text, width=72):
+    return ['    "%s"' % text[i:i+width]
+            for i in xrange(0, len(text), width)]
+
+
+def main():
+    syllables, indexes = readings()
+    assert len(syllables) <= len(DIGITS) ** 2
+    pairs = folding(sys.argv[1])
+
+    out = ['# -*- coding: utf-8 -*-',
+           '# Generated by tools/mkpinyin.py from the data of pypinyin',
+           '# (MIT license) and OpenCC (Apache license 2.0). Do not edit.',
+           '',
+           'FIRST = 0x%x' % FIRST,
+           'LAST = 0x%x' % LAST,
+           'DIGITS = "%s"' % DIGITS,
+           '',
+           'SYLLABLES = (None,']
+    line = '   '
+    for syllable in syllables[1:]:
+        item = " '%s'," % syllable
+        if len(line) + len(item) > 76:
+            out.append(line)
+            line = '   '
+        line += item
+    out.append(line + ')')
+    out.append('')
+    out.append('READINGS = (')
+    out.extend(wrap(''.join([DIGITS[i / 64] + DIGITS[i % 64]
+        for i in indexes])))
+    out.append('    )')
+    for name, chars in (('TRADITIONAL', [p[0] for p in pairs]),
+            ('SIMPLIFIED', [p[1] for p in pairs])):
+        out.append('')
+        out.append('%s = (' % name)
+        out.extend(['    u' + l.strip() for l in
+            wrap(u''.join(chars).encode('utf-8'), 72 * 3)])
+        out.append('    )')
+    print '\n'.join(out)
+
+if __name__ == '__main__':
+    main()
@@ -26,7 +26,12 @@
 # from your version.
 
 import logging
+import os
+import re
+import struct
+import threading
 import time
+import urllib
 import weakref
 import unicodedata
 from copy import deepcopy
@@ -35,6 +40,8 @@ import glib
 import glib
 from xl.nls import gettext as _
 from xl import common, settings, event, metadata
+from xl.metadata import _id3
+from xl.trax import pinyin
 logger = logging.getLogger(__name__)
 
 # map chars to appropriate subsitutes for sorting
@@ -61,58 +68,240 @@ _UNKNOWNSTR = _("Unknown")
 _JOINSTR = _(u' / ')
 
 
+# characters g_filename_to_uri() leaves unescaped in a path
+_URI_SAFE = frozenset("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
+        "0123456789-._~!$&'()*+,=:@/")
+_file_uri_chars = re.compile(r"^file:///[A-Za-z0-9\-._~!$&'()*+,=:@/%]*$")
+
+
+def _is_canonical(uri):
+    """
+        Whether `uri` is a local file uri exactly as gio would write
+        it, so that it need not go through gio.File to be compared.
+    """
+    if not _file_uri_chars.match(uri):
+        return False
+    path = uri[7:]
+    if '//' in path or '/./' in path or '/../' in path or \
+            path.endswith('/.') or path.endswith('/..') or \
+            (path.endswith('/') and path != '/'):
+        return False
+    if '%' in path:
+        # only what has to be escaped is, in upper case hex
+        for escape in path.split('%')[1:]:
+            code = escape[:2]
+            if len(code) < 2 or code.upper() != code:
+                return False
+            try:
+                char = chr(int(code, 16))
+            except ValueError:
+                return False
+            if char in _URI_SAFE or char == '\0':
+                return False
+    return True
+
+
+def canonical_uri(loc):
+    """
+        Returns `loc`, a uri or path, as the uri Tracks are known by.
+    """
+    if _is_canonical(loc):
+        return str(loc)
+    return gio.File(loc).get_uri()
+
+
+class _UriInfo(object):
+    """
+        Remembers the local path and basename of recently used uris,
+        which would take a gio.File each to work out.
+    """
+    def __init__(self, maxentries=5000):
+        self.maxentries = maxentries
+        self._info = {}
+
+    def get(self, uri):
+        """
+            Returns (path, basename) of `uri`; path is None if it is
+            not a local file.
+        """
+        try:
+            return self._info[uri]
+        except KeyError:
+            pass
+        if _is_canonical(uri):
+            path = urllib.unquote(uri[7:])
+            info = (path, os.path.basename(path) or path)
+        else:
+            gloc = gio.File(uri)
+            info = (gloc.get_path(), gloc.get_basename())
+        if len(self._info) >= self.maxentries:
+            self._info.clear()
+        self._info[uri] = info
+        return info
+
+
+_URIINFO = _UriInfo()
+
+
+def _estimate_size(formatobj):
+    """
+        Roughly how many bytes the tags of a metadata Format object
+        take up.
+    """
+    raw = getattr(formatobj, 'mutagen', None)
+    tags = getattr(raw, 'tags', None)
+    size = getattr(tags, 'size', None) # ID3 knows the size of its tag
+    if isinstance(size, (int, long)):
+        return size
+    size = 0
+    try:
+        for key, values in tags.items():
+            if not isinstance(values, list):
+                values = [values]
+            size += len(key) + sum([len(unicode(v)) for v in values])
+    except Exception:
+        pass
+    for picture in getattr(raw, 'pictures', None) or ():
+        size += len(picture.data)
+    return max(size, 1024)
+
+
 class _MetadataCacher(object):
     """
         Cache metadata Format objects to speed up get_tag_disk
+
+        A dict indexes a linked list kept in order of last use, so
+        every operation takes constant time. The least recently used
+        entries are dropped when there are more than `maxentries` of
+        them or they take up more than `maxbytes`; entries unused for
+        `timeout` seconds are dropped from the end of the list, which
+        is where the oldest are.
     """
-    def __init__(self, timeout=10, maxentries=20):
+    # fields of the list links
+    PREV, NEXT, KEY, VALUE, TIME, SIZE = range(6)
+
+    def __init__(self, timeout=10, maxentries=200, maxbytes=16*1024*1024):
         """
             :param timeout: time (in s) until the cached obj gets removed.
             :param maxentries: maximum number of format objs to cache
+            :param maxbytes: maximum estimated size of the cached tags
         """
-        self._cache = []
         self.timeout = timeout
         self.maxentries = maxentries
+        self.maxbytes = maxbytes
+        self.hits = self.misses = self.evictions = self.expirations = 0
+        self._lock = threading.RLock()
+        self._map = {}
+        self._root = root = []
+        root[:] = [root, root, None, None, 0, 0]
+        self._bytes = 0
         self._cleanup_id = 0
 
+    def _unlink(self, link):
+        link[self.PREV][self.NEXT] = link[self.NEXT]
+        link[self.NEXT][self.PREV] = link[self.PREV]
+
+    def _link_first(self, link):
+        root = self._root
+        link[self.PREV] = root
+        link[self.NEXT] = root[self.NEXT]
+        root[self.NEXT][self.PREV] = link
+        root[self.NEXT] = link
+
+    def _drop(self, link):
+        self._unlink(link)
+        del self._map[link[self.KEY]]
+        self._bytes -= link[self.SIZE]
+
+    def _expire(self, now):
+        root = self._root
+        thresh = now - self.timeout
+        while root[self.PREV] is not root and \
+                root[self.PREV][self.TIME] < thresh:
+            self._drop(root[self.PREV])
+            self.expirations += 1
+
     def __cleanup(self):
-        if self._cleanup_id:
-            glib.source_remove(self._cleanup_id)
-        current = time.time()
-        thresh = current - self.timeout
-        for item in self._cache[:]:
-            if item[2] < thresh:
-                self._cache.remove(item)
-        if self._cache:
-            next_expiry = min([i[2] for i in self._cache])
-            timeout = int((next_expiry + self.timeout) - current)
-            self._cleanup_id = glib.timeout_add_seconds(timeout,
-                    self.__cleanup)
+        self._lock.acquire()
+        try:
+            self._cleanup_id = 0
+            current = time.time()
+            self._expire(current)
+            oldest = self._root[self.PREV]
+            if oldest is not self._root:
+                timeout = int(oldest[self.TIME] + self.timeout - current) + 1
+                self._cleanup_id = glib.timeout_add_seconds(timeout,
+                        self.__cleanup)
+        finally:
+            self._lock.release()
+        return False
 
     def add(self, trackobj, formatobj):
-        for item in self._cache:
-            if item[0] == trackobj:
+        self._lock.acquire()
+        try:
+            if trackobj in self._map:
                 return
-        item = [trackobj, formatobj, time.time()]
-        self._cache.append(item)
-        if len(self._cache) > self.maxentries:
-            least = min([(i[2], i) for i in self._cache])[1]
-            self._cache.remove(least)
-        if not self._cleanup_id:
-            self._cleanup_id = glib.timeout_add_seconds(self.timeout,
-                    self.__cleanup)
+            now = time.time()
+            self._expire(now)
+            link = [None, None, trackobj, formatobj, now,
+                    _estimate_size(formatobj)]
+            self._link_first(link)
+            self._map[trackobj] = link
+            self._bytes += link[self.SIZE]
+            root = self._root
+            while len(self._map) > self.maxentries or \
+                    (self._bytes > self.maxbytes and len(self._map) > 1):
+                self._drop(root[self.PREV])
+                self.evictions += 1
+            if not self._cleanup_id:
+                self._cleanup_id = glib.timeout_add_seconds(self.timeout,
+                        self.__cleanup)
+        finally:
+            self._lock.release()
 
     def remove(self, trackobj):
-        for item in self._cache:
-            if item[0] == trackobj:
-                self._cache.remove(item)
-                break
+        self._lock.acquire()
+        try:
+            link = self._map.get(trackobj)
+            if link is not None:
+                self._drop(link)
+        finally:
+            self._lock.release()
 
     def get(self, trackobj):
-        for item in self._cache:
-            if item[0] == trackobj:
-                item[2] = time.time()
-                return item[1]
+        self._lock.acquire()
+        try:
+            link = self._map.get(trackobj)
+            now = time.time()
+            if link is not None and link[self.TIME] < now - self.timeout:
+                self._drop(link)
+                self.expirations += 1
+                link = None
+            if link is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            link[self.TIME] = now
+            self._unlink(link)
+            self._link_first(link)
+            return link[self.VALUE]
+        finally:
+            self._lock.release()
+
+    def get_stats(self):
+        """
+            Returns a dict with the number of ``entries`` and their
+            estimated ``bytes``, and the ``hits``, ``misses``,
+            ``evictions`` and ``expirations`` so far.
+        """
+        self._lock.acquire()
+        try:
+            return {'entries': len(self._map), 'bytes': self._bytes,
+                    'hits': self.hits, 'misses': self.misses,
+                    'evictions': self.evictions,
+                    'expirations': self.expirations}
+        finally:
+            self._lock.release()
 
 
 _CACHER = _MetadataCacher()
@@ -123,12 +312,18 @@ class Track(object):
     """
     # save a little memory this way
     __slots__ = ["__tags", "_scan_valid",
-            "_dirty", "__weakref__", "_init"]
+            "_dirty", "__weakref__", "_init", "_sort_cache"]
     # this is used to enforce the one-track-per-uri rule
     __tracksdict = weakref.WeakValueDictionary()
     # store a copy of the settings values here - much faster (0.25 cpu
     # seconds) (see _the_cuts_cb)
     __the_cuts = settings.get_option('collection/strip_list', [])
+    # '' (the default) to sort Chinese by code point, 'pinyin' or
+    # 'pinyin_tones'
+    __collation = settings.get_option('collection/pinyin_collation', '')
+    __fold = settings.get_option('collection/fold_traditional', True)
+    # bumped whenever all cached sort keys become invalid
+    __sort_generation = 0
 
     def __new__(cls, *args, **kwargs):
         """
@@ -163,7 +358,14 @@ class Track(object):
                 uri = unpickles.get("__loc")
 
         if uri is not None:
-            uri = gio.File(uri).get_uri()
+            try:
+                # known uris are canonical already
+                tr = cls.__tracksdict[uri]
+                tr._init = False
+                return tr
+            except KeyError:
+                pass
+            uri = canonical_uri(uri)
             try:
                 tr = cls.__tracksdict[uri]
                 tr._init = False
@@ -179,6 +381,18 @@ class Track(object):
             tr._init = True
             return tr
 
+    @classmethod
+    def get_loaded(cls, uri):
+        """
+            Returns the Track for `uri` if one is loaded, or None.
+            Unlike Track(uri) it never creates one.
+        """
+        try:
+            return cls.__tracksdict[uri]
+        except KeyError:
+            pass
+        return cls.__tracksdict.get(canonical_uri(uri))
+
     def __init__(self, uri=None, scan=True, _unpickles=None):
         """
             :param uri:  The path to the track.
@@ -196,6 +410,7 @@ class Track(object):
         self.__tags = {}
         self._scan_valid = None # whether our last tag read attempt worked
         self._dirty = False
+        self._sort_cache = None
 
         if _unpickles:
             self._unpickles(_unpickles)
@@ -231,8 +446,8 @@ class Track(object):
             :param loc: the location, as either a uri or a file path.
         """
         self.__unregister()
-        gloc = gio.File(loc)
-        self.__tags['__loc'] = gloc.get_uri()
+        self.__tags['__loc'] = canonical_uri(loc)
+        self._sort_cache = None
         self.__register()
 
     def exists(self):
@@ -240,6 +455,9 @@ class Track(object):
             Returns whether the file exists
             This can be very slow, use with caution!
         """
+        path = self.local_file_name()
+        if path is not None:
+            return os.path.exists(path)
         return gio.File(self.get_loc_for_io()).query_exists()
 
     def local_file_name(self):
@@ -251,7 +469,7 @@ class Track(object):
             If a path is returned, it is safe to use for IO operations.
             Existence of a path does *not* guarantee file existence.
         """
-        return gio.File(self.__tags['__loc']).get_path()
+        return _URIINFO.get(self.__tags['__loc'])[0]
 
     def get_loc_for_io(self):
         """
@@ -266,7 +484,10 @@ class Track(object):
         """
             Get the URI schema the file uses, e.g. file, http, smb.
         """
-        return gio.File(self.get_loc_for_io()).get_uri_scheme()
+        loc = self.get_loc_for_io()
+        if loc.startswith('file:'):
+            return 'file'
+        return gio.File(loc).get_uri_scheme()
 
     def write_tags(self):
         """
@@ -376,6 +597,7 @@ class Track(object):
             internal use only please
         """
         self.__tags = deepcopy(pickle_obj)
+        self._sort_cache = None
 
     def list_tags(self):
         """
@@ -414,6 +636,7 @@ class Track(object):
         else:
             self.__tags[tag] = values
 
+        self._sort_cache = None
         self._dirty = True
         if notify_changed:
             event.log_event("track_tags_changed", self, tag)
@@ -446,6 +669,26 @@ class Track(object):
             :param extend_title: If the title tag is unknown, try to
                 add some identifying information to it.
         """
+        # keys are worked out once, until a tag or the strip list
+        # changes
+        key = (tag, join, artist_compilations, extend_title)
+        cache = self.__get_sort_cache()
+        try:
+            retval = cache[key]
+        except KeyError:
+            retval = cache[key] = self.__get_tag_sort(tag, join,
+                    artist_compilations, extend_title)
+        if isinstance(retval, list):
+            return list(retval)
+        return retval
+
+    def __get_sort_cache(self):
+        cache = self._sort_cache
+        if cache is None or cache[0] != Track.__sort_generation:
+            cache = self._sort_cache = (Track.__sort_generation, {})
+        return cache[1]
+
+    def __get_tag_sort(self, tag, join, artist_compilations, extend_title):
         # The two magic values here are to ensure that compilations
         # and unknown values are always sorted below all normal
         # values.
@@ -475,8 +718,8 @@ class Track(object):
         if not retval:
             retval = u"\uffff\uffff\uffff\uffff" # unknown
             if tag == 'title':
-                gloc = gio.File(self.__tags['__loc'])
-                basename = glib.filename_display_name(gloc.get_basename())
+                basename = glib.filename_display_name(
+                        _URIINFO.get(self.__tags['__loc'])[1])
                 retval = u"%s (%s)" % (retval, basename)
         elif not tag.startswith("__") and \
                 tag not in ('tracknumber', 'discnumber'):
@@ -507,6 +750,12 @@ class Track(object):
                 add some identifying information to it.
         """
         if tag == '__loc':
+            path = self.local_file_name()
+            if path is not None:
+                try:
+                    return path.decode('utf-8')
+                except UnicodeError:
+                    pass
             uri = gio.File(self.__tags['__loc']).get_parse_name()
             return uri.decode('utf-8')
 
@@ -540,8 +789,8 @@ class Track(object):
             else:
                 retval = _UNKNOWNSTR
                 if tag == 'title':
-                    gloc = gio.File(self.__tags['__loc'])
-                    basename = glib.filename_display_name(gloc.get_basename())
+                    basename = glib.filename_display_name(
+                            _URIINFO.get(self.__tags['__loc'])[1])
                     retval = u"%s (%s)" % (retval, basename)
 
         if isinstance(retval, list):
@@ -623,6 +872,13 @@ class Track(object):
             Intended for use with large fields like covers and
             lyrics that shouldn't be loaded to the in-mem db.
         """
+        if tag == 'cover':
+            pictures = self.get_pictures_disk()
+            if pictures is not None:
+                try:
+                    return [p.read() for p in pictures] or None
+                except (IOError, OSError, ValueError):
+                    pass
         f = _CACHER.get(self)
         if not f:
             try:
@@ -631,12 +887,31 @@ class Track(object):
                 return None
             if not f:
                 return None
-        _CACHER.add(self, f)
+        # a format holding every embedded image is too big to keep
+        if tag != 'cover':
+            _CACHER.add(self, f)
         try:
             return f.read_tags([tag])[tag]
         except KeyError:
             return None
 
+    def get_pictures_disk(self):
+        """
+            Locate the embedded cover images of the file without
+            reading them.
+
+            Returns a list of `xl.metadata._id3.Picture`, which read
+            their data on demand, or None if the images cannot be
+            located this way; use get_tag_disk('cover') then.
+        """
+        path = self.local_file_name()
+        if not path:
+            return None
+        try:
+            return _id3.find_pictures(path)
+        except (IOError, OSError, struct.error):
+            return None
+
     def list_tags_disk(self):
         """
             List all the tags directly from file metadata. Can be slow,
@@ -695,6 +970,9 @@ class Track(object):
             return [cls.format_sort(v) for v in values]
         # order of these is important, both for speed and behavior!
         values = cls.strip_leading(values)
+        if cls.__collation:
+            values = pinyin.sort_key(values,
+                    cls.__collation == 'pinyin_tones', cls.__fold)
         values = cls.strip_marks(values)
         values = cls.lower(values)
         values = cls.the_cutter(values)
@@ -820,10 +1098,19 @@ class Track(object):
         """
             PRIVATE
 
-            update the cached the_cutter values
+            update the cached the_cutter and collation values
         """
         if data == "collection/strip_list":
             cls.__the_cuts = settings.get_option('collection/strip_list', [])
+        elif data == "collection/pinyin_collation":
+            cls.__collation = settings.get_option(
+                    'collection/pinyin_collation', '')
+        elif data == "collection/fold_traditional":
+            cls.__fold = settings.get_option('collection/fold_traditional',
+                    True)
+        else:
+            return
+        cls.__sort_generation += 1
 
 
 
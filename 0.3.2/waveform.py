@@ -0,0 +1,280 @@
+# Copyright (C) 2008-2010 Adam Olsen
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 675 Mass Ave, Cambridge, MA 02139, USA.
+#
+#
+# The developers of the Exaile media player hereby grant permission
+# for non-GPL compatible GStreamer and Exaile plugins to be used and
+# distributed together with GStreamer and Exaile. This permission is
+# above and beyond the permissions granted by the GPL license by which
+# Exaile is covered. If you modify this code, you may extend this
+# exception to your version of the code, but you are not obligated to
+# do so. If you do not wish to do so, delete this exception statement
+# from your version.
+
+"""
+    A progress bar that shows the waveform of the playing track.
+
+    The overview comes from xl.player.analysis, which decodes each
+    local file once in its worker processes and caches the result, so
+    nothing here ever touches the audio. Until the overview is there,
+    and for streams, it is a plain progress bar. Clicking or dragging
+    seeks to the exact spot under the pointer.
+"""
+
+import logging
+
+import glib
+import gtk
+
+from xl import event
+from xl.nls import gettext as _
+from xl.player import analysis
+from xlgui import guiutil
+
+logger = logging.getLogger(__name__)
+
+
+class WaveformProgressBar(gtk.EventBox):
+    """
+        Shows the position of `player` in its current track.
+    """
+    # how often (in ms) the position is updated while playing
+    UPDATE_INTERVAL = 250
+
+    def __init__(self, player):
+        gtk.EventBox.__init__(self)
+        self.player = player
+        self.track = None
+        self.overview = None
+        self._timer_id = 0
+        self._seek_fraction = None
+
+        self.area = gtk.DrawingArea()
+        self.area.set_size_request(-1, 24)
+        self.area.connect('expose-event', self._on_expose)
+        self.add(self.area)
+        self.add_events(gtk.gdk.BUTTON_PRESS_MASK |
+                gtk.gdk.BUTTON_RELEASE_MASK |
+                gtk.gdk.POINTER_MOTION_MASK)
+        self.connect('button-press-event', self._on_button_press)
+        self.connect('button-release-event', self._on_button_release)
+        self.connect('motion-notify-event', self._on_motion_notify)
+        self.connect('destroy', self._on_destroy)
+
+        event.add_callback(self._on_playback_start, 'playback_track_start',
+                player)
+        event.add_callback(self._on_playback_end, 'playback_player_end',
+                player)
+        event.add_callback(self._on_analysis_done, 'audio_analysis_done')
+        if player.current is not None:
+            self._set_track(player.current)
+
+    def _on_destroy(self, *e):
+        self._stop_timer()
+        event.remove_callback(self._on_playback_start,
+                'playback_track_start', self.player)
+        event.remove_callback(self._on_playback_end, 'playback_player_end',
+                self.player)
+        event.remove_callback(self._on_analysis_done, 'audio_analysis_done')
+
+    def _set_track(self, track):
+        self.track = track
+        self.overview = None
+        if track is not None and track.is_local():
+            overview = analysis.WAVEFORM.get(track)
+            if overview is None:
+                analysis.WAVEFORM.add(track)
+            else:
+                self._set_overview(overview)
+        if track is None:
+            self._stop_timer()
+        else:
+            self._start_timer()
+        self.area.queue_draw()
+
+    def _set_overview(self, overview):
+        if overview:
+            self.overview = (map(ord, overview['peak']),
+                    map(ord, overview['rms']))
+        else:
+            self.overview = None
+
+    @guiutil.idle_add()
+    def _on_playback_start(self, type, player, track):
+        self._set_track(track)
+
+    @guiutil.idle_add()
+    def _on_playback_end(self, type, player, track):
+        self._set_track(None)
+
+    def _on_analysis_done(self, type, analyzer, uri):
+        if analyzer is not analysis.WAVEFORM or self.track is None or \
+                self.track.get_loc_for_io() != uri:
+            return
+        self._set_overview(analysis.WAVEFORM.get(self.track))
+        self.area.queue_draw()
+
+    def _start_timer(self):
+        if not self._timer_id:
+            self._timer_id = glib.timeout_add(self.UPDATE_INTERVAL,
+                    self._on_timer)
+
+    def _stop_timer(self):
+        if self._timer_id:
+            glib.source_remove(self._timer_id)
+            self._timer_id = 0
+
+    def _on_timer(self):
+        self.area.queue_draw()
+        return True
+
+    def get_duration(self):
+        """
+            Returns the length of the current track in seconds, or 0.
+        """
+        if self.track is None:
+            return 0
+        try:
+            return float(self.track.get_tag_raw('__length') or 0)
+        except (TypeError, ValueError):
+            return 0
+
+    def get_fraction(self):
+        duration = self.get_duration()
+        if not duration:
+            return 0
+        return min(1.0, self.player.get_time() / duration)
+
+    def _fraction_at(self, x):
+        width = self.area.allocation.width
+        if width <= 0:
+            return 0
+        return min(1.0, max(0.0, float(x) / width))
+
+    def _on_button_press(self, widget, event):
+        if event.button != 1 or not self.get_duration():
+            return False
+        self._seek_fraction = self._fraction_at(event.x)
+        self.area.queue_draw()
+        return True
+
+    def _on_motion_notify(self, widget, event):
+        if self._seek_fraction is None:
+            return False
+        self._seek_fraction = self._fraction_at(event.x)
+        self.area.queue_draw()
+        return True
+
+    def _on_button_release(self, widget, event):
+        if event.button != 1 or self._seek_fraction is None:
+            return False
+        fraction = self._fraction_at(event.x)
+        self._seek_fraction = None
+        duration = self.get_duration()
+        if duration and self.player.current is self.track:
+            self.player.seek(fraction * duration)
+        self.area.queue_draw()
+        return True
+
+    def _format_time(self, seconds):
+        seconds = int(seconds)
+        return "%d:%02d" % (seconds / 60, seconds % 60)
+
+    def _draw_columns(self, cr, values, width, height):
+        count = len(values)
+        middle = height / 2.0
+        for x in xrange(width):
+            value = values[x * count / width] / 255.0
+            cr.rectangle(x, middle - value * middle, 1,
+                    max(1, 2 * value * middle))
+
+    def _on_expose(self, area, event):
+        cr = area.window.cairo_create()
+        cr.rectangle(event.area.x, event.area.y,
+                event.area.width, event.area.height)
+        cr.clip()
+        width = area.allocation.width
+        height = area.allocation.height
+        style = area.get_style()
+
+        fraction = self.get_fraction()
+        if self._seek_fraction is not None:
+            fraction = self._seek_fraction
+        played = int(width * fraction)
+
+        cr.set_source_color(style.bg[gtk.STATE_NORMAL])
+        cr.paint()
+
+        if self.overview is not None:
+            peaks, levels = self.overview
+            for values, color, played_color in (
+                    (peaks, style.mid, style.base),
+                    (levels, style.dark, style.bg)):
+                self._draw_columns(cr, values, width, height)
+                cr.set_source_color(color[gtk.STATE_NORMAL])
+                cr.fill()
+                cr.save()
+                cr.rectangle(0, 0, played, height)
+                cr.clip()
+                self._draw_columns(cr, values, width, height)
+                cr.set_source_color(played_color[gtk.STATE_SELECTED])
+                cr.fill()
+                cr.restore()
+        else:
+            cr.set_source_color(style.base[gtk.STATE_SELECTED])
+            cr.rectangle(0, 0, played, height)
+            cr.fill()
+
+        duration = self.get_duration()
+        if self.track is None:
+            text = _("Not Playing")
+        elif duration:
+            text = "%s / %s" % (self._format_time(fraction * duration),
+                    self._format_time(duration))
+        else:
+            text = self._format_time(self.player.get_time())
+        layout = area.create_pango_layout(text)
+        tw, th = layout.get_pixel_size()
+        cr.move_to((width - tw) / 2, (height - th) / 2)
+        cr.set_source_color(style.text[gtk.STATE_NORMAL])
+        cr.show_layout(layout)
+        return True
+
+
+def replace(bar, player):
+    """
+        Puts a WaveformProgressBar for `player` where the widget `bar`
+        is, typically the progress bar of a gtk.Builder UI, and returns
+        it. Returns None if `bar` is not in a container.
+    """
+    parent = bar.get_parent()
+    if parent is None:
+        return None
+    widget = WaveformProgressBar(player)
+    if isinstance(parent, gtk.Box):
+        packing = parent.query_child_packing(bar)
+        position = parent.get_children().index(bar)
+        parent.remove(bar)
+        parent.pack_start(widget, *packing[:3])
+        parent.set_child_packing(widget, *packing)
+        parent.reorder_child(widget, position)
+    else:
+        parent.remove(bar)
+        parent.add(widget)
+    widget.show_all()
+    return widget
+
+# vim: et sts=4 sw=4